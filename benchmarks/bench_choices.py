@@ -0,0 +1,53 @@
+"""Cost of validating a ``SearchEndpoint`` with a long ``court`` list.
+
+Courts are given by value (``"ca1"``) and by display name (``"Court of
+Appeals for the First Circuit"``). Each choice-validated field looks its
+values up in a ``ChoiceIndex`` built once per (model, field); the
+``cold`` rows clear that cache before every validation to show what
+rebuilding it would cost.
+
+    python benchmarks/bench_choices.py [--courts 500] [--number 200]
+"""
+
+import argparse
+import timeit
+
+from courtlistener.models import ENDPOINTS
+from courtlistener.utils import get_choice_index
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--courts", type=int, default=500)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    model = ENDPOINTS["search"]
+    courts = list(get_choice_index(model, "court").choices.items())
+    courts = courts[: args.courts]
+    values = [value for value, _ in courts]
+    names = [name for _, name in courts]
+
+    def cold(build):
+        def run():
+            get_choice_index.cache_clear()
+            build()
+
+        return run
+
+    by_value = lambda: model(type="o", court=values)  # noqa: E731
+    by_name = lambda: model(type="o", court=names)  # noqa: E731
+    timings = {
+        "values": by_value,
+        "display names": by_name,
+        "values (cold)": cold(by_value),
+        "display names (cold)": cold(by_name),
+    }
+    print(f"{len(courts)} courts per query, {args.number} validations")
+    for label, build in timings.items():
+        seconds = min(timeit.repeat(build, number=args.number, repeat=5))
+        print(f"  {label:<20} {seconds / args.number * 1e6:9.1f} us/query")
+
+
+if __name__ == "__main__":
+    main()
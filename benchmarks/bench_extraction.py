@@ -0,0 +1,93 @@
+"""Event-loop latency while the MCP server extracts citations.
+
+Runs ``--concurrency`` extractions of a long synthetic opinion at once,
+through each ``MCP_EXTRACTION_EXECUTOR``, while a probe task sleeps in
+10 ms steps and records how late each wake-up is. ``inline`` is what
+the citation tools did before extraction moved off the event loop: no
+other request on the worker is served until every extraction finishes.
+
+    python benchmarks/bench_extraction.py [--concurrency 4] [--repeat 100]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from courtlistener.mcp import settings
+from courtlistener.mcp.extraction import (
+    extract_and_resolve,
+    get_extraction_executor,
+    set_extraction_executor,
+)
+
+PARAGRAPH = (
+    "See Brown v. Board of Education, 347 U.S. 483, 495 (1954); id. at "
+    "496. In Obergefell v. Hodges, 576 U.S. 644 (2015), the Court relied "
+    "on Loving v. Virginia, 388 U.S. 1, 12 (1967). Brown, supra, at 490. "
+    "Claims arise under 42 U.S.C. § 1983. "
+)
+PROBE_SECONDS = 0.01
+
+
+async def probe(lags: list[float], done: asyncio.Event) -> None:
+    while not done.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(PROBE_SECONDS)
+        lags.append(time.perf_counter() - start - PROBE_SECONDS)
+
+
+async def measure(text: str, concurrency: int) -> tuple[float, list[float]]:
+    lags: list[float] = []
+    done = asyncio.Event()
+    probe_task = asyncio.create_task(probe(lags, done))
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            extract_and_resolve(text, tool_name="bench")
+            for _ in range(concurrency)
+        )
+    )
+    elapsed = time.perf_counter() - start
+    done.set()
+    await probe_task
+    return elapsed, lags
+
+
+async def run(concurrency: int, repeat: int) -> None:
+    text = PARAGRAPH * repeat
+    settings.EXTRACTION_WORKERS = concurrency
+    settings.EXTRACTION_TIMEOUT_SECONDS = 600
+    print(
+        f"{concurrency} concurrent extractions of {len(text):,} chars, "
+        f"probe every {PROBE_SECONDS * 1e3:.0f} ms"
+    )
+    print(f"  {'executor':<8} {'wall':>8} {'max lag':>10} {'p50 lag':>10}")
+    for executor in ("inline", "thread", "process"):
+        settings.EXTRACTION_EXECUTOR = executor
+        set_extraction_executor(None)
+        # Start the pool (and its worker processes) before timing.
+        await extract_and_resolve(PARAGRAPH, tool_name="bench")
+        elapsed, lags = await measure(text, concurrency)
+        max_lag = max(lags, default=elapsed)
+        p50_lag = statistics.median(lags) if lags else elapsed
+        print(
+            f"  {executor:<8} {elapsed:7.2f}s {max_lag * 1e3:8.1f}ms "
+            f"{p50_lag * 1e3:8.1f}ms"
+        )
+        pool = get_extraction_executor()
+        if pool is not None:
+            pool.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(run(args.concurrency, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
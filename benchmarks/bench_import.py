@@ -0,0 +1,50 @@
+"""Wall time of ``import courtlistener`` in a fresh interpreter.
+
+Each run starts a new Python process, so nothing is cached in memory
+(bytecode caches on disk are still used, as in production). The baseline
+is interpreter startup alone; the other rows add the import and then
+touching one endpoint or all of them.
+
+    python benchmarks/bench_import.py [--runs 15]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+SCENARIOS = {
+    "interpreter only": "pass",
+    "import courtlistener": "import courtlistener",
+    "+ one endpoint": (
+        "import courtlistener\n"
+        "courtlistener.CourtListener(api_token='x').dockets"
+    ),
+    "+ every endpoint": (
+        "from courtlistener.models import ENDPOINTS\n"
+        "for name in ENDPOINTS: ENDPOINTS[name]"
+    ),
+}
+
+
+def run(code: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15)
+    args = parser.parse_args()
+
+    run("import courtlistener")  # warm the bytecode cache
+    print(f"median of {args.runs} fresh interpreters")
+    for label, code in SCENARIOS.items():
+        median = statistics.median(run(code) for _ in range(args.runs))
+        print(f"  {label:<22} {median * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
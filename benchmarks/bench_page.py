@@ -0,0 +1,72 @@
+"""Per-page cost of building a ``Page`` from an API response.
+
+Compares full pydantic validation (``Page(**data)``, still used by
+``load()``) with the unvalidated ``Page.from_api`` used while paginating.
+
+    python benchmarks/bench_page.py [--results 100] [--number 2000]
+"""
+
+import argparse
+import timeit
+
+from courtlistener.models import Page
+
+
+def cluster(n: int) -> dict:
+    """A cluster-shaped result with nested opinions and citations."""
+    return {
+        "id": n,
+        "absolute_url": f"/opinion/{n}/case-name/",
+        "case_name": f"Plaintiff {n} v. Defendant",
+        "date_filed": "2001-01-01",
+        "judges": "Roberts, Thomas, Alito",
+        "citations": [
+            {"volume": 500 + i, "reporter": "U.S.", "page": str(n + i)}
+            for i in range(3)
+        ],
+        "sub_opinions": [
+            {
+                "id": n * 10 + i,
+                "type": "010combined",
+                "author_str": "Roberts",
+                "joined_by": [1, 2, 3],
+                "opinions_cited": [
+                    f"https://www.courtlistener.com/api/rest/v4/opinions/{j}/"
+                    for j in range(20)
+                ],
+            }
+            for i in range(2)
+        ],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--results", type=int, default=100)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    data = {
+        "count": 1_000_000,
+        "next": "https://www.courtlistener.com/api/rest/v4/clusters/?cursor=x",
+        "previous": None,
+        "results": [cluster(n) for n in range(args.results)],
+    }
+    timings = {
+        "Page(**data)": lambda: Page(**data),
+        "Page.from_api": lambda: Page.from_api(data),
+    }
+    print(f"{args.results} results per page, {args.number} pages")
+    baseline = None
+    for label, build in timings.items():
+        seconds = min(timeit.repeat(build, number=args.number, repeat=5))
+        per_page = seconds / args.number * 1e6
+        baseline = baseline or per_page
+        print(
+            f"  {label:<14} {per_page:9.1f} us/page  "
+            f"({baseline / per_page:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
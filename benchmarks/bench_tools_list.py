@@ -0,0 +1,55 @@
+"""Latency of an MCP ``tools/list`` request.
+
+Every connecting client lists the tools. The ``cold`` row rebuilds all
+tool definitions (endpoint JSON schemas, choice summaries) before each
+request, which is what every request cost before they were cached; the
+other row is the cached path, answered over an in-memory MCP session.
+
+    python benchmarks/bench_tools_list.py [--number 50]
+"""
+
+import argparse
+import asyncio
+import time
+
+from fastmcp import Client
+
+from courtlistener.mcp.server import create_mcp_server
+from courtlistener.mcp.tools import MCP_TOOLS
+
+
+def forget_tools() -> None:
+    for mcp_tool in MCP_TOOLS.values():
+        for name in ("tool", "input_schema", "input_validator"):
+            mcp_tool.__dict__.pop(name, None)
+
+
+async def time_requests(client: Client, number: int, cold: bool) -> float:
+    best = float("inf")
+    for _ in range(number):
+        if cold:
+            forget_tools()
+        start = time.perf_counter()
+        await client.list_tools()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+async def run(number: int) -> None:
+    async with Client(create_mcp_server(warm_up=True)) as client:
+        tools = await client.list_tools()
+        print(f"{len(tools)} tools, best of {number} requests")
+        for label, cold in (("cold", True), ("cached", False)):
+            seconds = await time_requests(client, number, cold)
+            print(f"  {label:<7} {seconds * 1e3:8.2f} ms/request")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run(args.number))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,21 @@ from courtlistener.async_client.resource import (
     AsyncResource,
     AsyncResourceIterator,
 )
+from courtlistener.cache import (
+    MemoryCache,
+    RedisCache,
+    ResponseCache,
+    SQLiteCache,
+)
+from courtlistener.citation_cache import (
+    CitationCache,
+    MemoryCitationCache,
+    RedisCitationCache,
+    SQLiteCitationCache,
+)
 from courtlistener.exceptions import CourtListenerAPIError, InvalidFieldsError
+from courtlistener.rate_limit import RateLimiter
+from courtlistener.retry import RetryPolicy
 from courtlistener.sync_client.alerts import DocketAlerts, SearchAlerts
 from courtlistener.sync_client.citation_lookup import CitationLookup
 from courtlistener.sync_client.client import CourtListener
@@ -21,12 +35,22 @@ __all__ = [
     "AsyncResource",
     "AsyncResourceIterator",
     "AsyncSearchAlerts",
+    "CitationCache",
     "CitationLookup",
     "CourtListener",
     "CourtListenerAPIError",
     "DocketAlerts",
     "InvalidFieldsError",
+    "MemoryCache",
+    "MemoryCitationCache",
+    "RateLimiter",
+    "RedisCache",
+    "RedisCitationCache",
     "Resource",
     "ResourceIterator",
+    "ResponseCache",
+    "RetryPolicy",
+    "SQLiteCache",
+    "SQLiteCitationCache",
     "SearchAlerts",
 ]
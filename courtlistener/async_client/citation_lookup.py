@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Any
 
+from courtlistener.citations import (
+    build_compact_string,
+    expand_results,
+    extract_citations,
+    match_batch_results,
+)
+from courtlistener.concurrency import abounded_map
 from courtlistener.exceptions import CourtListenerAPIError
+from courtlistener.retry import parse_wait_until
 
 if TYPE_CHECKING:
     from courtlistener.async_client.client import AsyncCourtListener
@@ -12,6 +20,7 @@ if TYPE_CHECKING:
 MAX_TEXT_LENGTH = 64_000
 THROTTLE_STATUS = 429
 MAX_RETRY_WAIT_SECONDS = 90.0
+MAX_BATCH_THROTTLE_RETRIES = 5
 
 
 class AsyncCitationLookup:
@@ -95,9 +104,19 @@ class AsyncCitationLookup:
             reporter: Reporter abbreviation (e.g., "U.S.", "F.3d").
             page: Page number or string (e.g., "644").
 
+        If the client has a ``citation_cache``, a cached result is
+        returned without calling the API, and a single fresh result is
+        added to the cache.
+
         Returns:
             List of citation results with matched cluster objects.
         """
+        cache = self._client.citation_cache
+        citation = f"{volume} {reporter} {page}"
+        if cache is not None:
+            cached = await cache.aget(citation)
+            if cached is not None:
+                return [cached]
         result = await self._client._request(
             "POST",
             self.ENDPOINT,
@@ -108,33 +127,63 @@ class AsyncCitationLookup:
             },
         )
         assert isinstance(result, list)
+        if cache is not None and len(result) == 1:
+            await cache.aset(citation, result[0])
         return result
 
-    async def lookup_text_batched(self, text: str) -> list[dict[str, Any]]:
+    async def lookup_text_batched(
+        self,
+        text: str,
+        *,
+        concurrency: int = 4,
+        extract_locally: bool = False,
+    ) -> list[dict[str, Any]]:
         """Look up citations with automatic handling for large texts.
 
         Handles texts that exceed either the 64,000 character limit or
         the 250 citation-per-request throttle. Texts longer than 64,000
-        characters are split at whitespace boundaries. When the API
-        throttles citations beyond the 250th (status 429), the
-        remaining text is re-submitted automatically.
+        characters are split at whitespace boundaries and the chunks are
+        verified concurrently. When the API throttles citations beyond
+        the 250th (status 429), the remaining text is re-submitted
+        automatically. When it throttles a whole request, every chunk
+        waits until the ``wait_until`` in the error body (capped at
+        ``MAX_RETRY_WAIT_SECONDS``) and the request is retried, up to
+        ``MAX_BATCH_THROTTLE_RETRIES`` times.
+
+        With ``extract_locally``, citations are instead extracted with
+        eyecite on this machine and each distinct one is sent once, in
+        compact batches of up to 250. Every occurrence in ``text`` gets
+        its own copy of the result. Only full case citations are looked
+        up, as when the API extracts them. Citations found in the
+        client's ``citation_cache`` aren't sent, and fresh results are
+        added to it.
 
         Args:
             text: Legal text of any length.
+            concurrency: Chunks (or compact batches) verified at the
+                same time.
+            extract_locally: Extract and deduplicate citations locally
+                before calling the API. Requires the ``eyecite`` package.
 
         Returns:
-            Combined list of all citation results across batches.
+            Combined list of all citation results across batches, in
+            text order, with indices relative to ``text``.
         """
-        all_results: list[dict[str, Any]] = []
-
-        for chunk_offset, chunk in _split_text(text):
-            chunk_results = await self._lookup_chunk(chunk, chunk_offset)
-            all_results.extend(chunk_results)
-
-        return all_results
+        gate = _ThrottleGate()
+        if extract_locally:
+            return await self._lookup_extracted(text, concurrency, gate)
+        chunk_results = await abounded_map(
+            lambda item: self._lookup_chunk(item[1], item[0], gate),
+            _split_text(text),
+            concurrency,
+        )
+        return [r for results in chunk_results for r in results]
 
     async def _lookup_chunk(
-        self, chunk: str, base_offset: int
+        self,
+        chunk: str,
+        base_offset: int,
+        gate: _ThrottleGate | None = None,
     ) -> list[dict[str, Any]]:
         """Look up citations in a single chunk, re-submitting on 429s.
 
@@ -142,16 +191,19 @@ class AsyncCitationLookup:
             chunk: Text chunk within the 64,000 char limit.
             base_offset: Character offset of this chunk in the
                 original text, used to adjust start/end indices.
+            gate: Shared by the chunks of one text, so a whole-request
+                429 pauses all of them.
 
         Returns:
             Citation results with indices adjusted to the original text.
         """
+        gate = gate or _ThrottleGate()
         all_results: list[dict[str, Any]] = []
         remaining = chunk
         running_offset = 0
 
         while remaining:
-            results = await self.lookup_text(remaining)
+            results = await self._lookup_gated(remaining, gate)
             throttled: list[dict[str, Any]] = []
             resolved: list[dict[str, Any]] = []
 
@@ -180,26 +232,98 @@ class AsyncCitationLookup:
 
         return all_results
 
+    async def _lookup_extracted(
+        self, text: str, concurrency: int, gate: _ThrottleGate
+    ) -> list[dict[str, Any]]:
+        """Verify the distinct citations in ``text`` in compact batches."""
+        extracted = extract_citations(text)
+        cache = self._client.citation_cache
+        verified: dict[str, dict[str, Any]] = {}
+        if cache is not None:
+            verified.update(await cache.aget_many(extracted.keys))
+        missing = [key for key in extracted.keys if key not in verified]
+        batch_results = await abounded_map(
+            lambda batch: self._lookup_batch(batch, gate),
+            extracted.batches(missing),
+            concurrency,
+        )
+        for matched in batch_results:
+            verified.update(matched)
+            if cache is not None:
+                for key, result in matched.items():
+                    await cache.aset(key, result)
+        return expand_results(text, extracted, verified)
+
+    async def _lookup_batch(
+        self, batch: list[str], gate: _ThrottleGate
+    ) -> dict[str, dict[str, Any]]:
+        """Verify a batch of citation keys, re-submitting throttled ones.
+
+        Returns the result for each key the API answered. Keys still
+        throttled when a request makes no progress keep their 429.
+        """
+        verified: dict[str, dict[str, Any]] = {}
+        remaining = batch
+        while remaining:
+            results = await self._lookup_gated(
+                build_compact_string(remaining), gate
+            )
+            matched = match_batch_results(results, remaining)
+            verified.update(matched)
+            throttled = [
+                key
+                for key, result in matched.items()
+                if result["status"] == THROTTLE_STATUS
+            ]
+            if len(throttled) == len(remaining):
+                break
+            remaining = throttled
+        return verified
 
-def parse_wait_until(detail: Any) -> datetime | None:
-    """Parse the ``wait_until`` timestamp from a 429 error body.
-
-    Returns a timezone-aware datetime, or None if the body shape is
-    unexpected or the value can't be parsed. Naive timestamps are
-    interpreted as UTC.
-    """
-    if not isinstance(detail, dict):
-        return None
-    wait_until = detail.get("wait_until")
-    if not isinstance(wait_until, str):
-        return None
-    try:
-        target = datetime.fromisoformat(wait_until)
-    except ValueError:
-        return None
-    if target.tzinfo is None:
-        target = target.replace(tzinfo=timezone.utc)
-    return target
+    async def _lookup_gated(
+        self, text: str, gate: _ThrottleGate
+    ) -> list[dict[str, Any]]:
+        """Call :meth:`lookup_text` once ``gate`` opens, retrying 429s."""
+        retries = 0
+        while True:
+            await gate.wait()
+            try:
+                return await self.lookup_text(text)
+            except CourtListenerAPIError as e:
+                if (
+                    e.status_code != THROTTLE_STATUS
+                    or retries >= MAX_BATCH_THROTTLE_RETRIES
+                ):
+                    raise
+                wait = _wait_until_seconds(e.detail)
+                if wait is None:
+                    raise
+                gate.close_for(wait)
+                retries += 1
+
+
+class _ThrottleGate:
+    """Holds requests back until a ``wait_until`` shared by all chunks."""
+
+    def __init__(self) -> None:
+        self.resume_at: datetime | None = None
+
+    def close_for(self, seconds: float) -> None:
+        resume_at = datetime.now(timezone.utc) + timedelta(seconds=seconds)
+        if self.resume_at is None or resume_at > self.resume_at:
+            self.resume_at = resume_at
+
+    async def wait(self) -> None:
+        while self.resume_at is not None:
+            resume_at = self.resume_at
+            now = datetime.now(timezone.utc)
+            seconds = (resume_at - now).total_seconds()
+            if seconds <= 0:
+                return
+            await asyncio.sleep(seconds)
+            # Wait again if another chunk was throttled meanwhile.
+            if self.resume_at == resume_at:
+                return
 
 
 def _wait_until_seconds(detail: Any) -> float | None:
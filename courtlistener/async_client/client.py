@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import os
 from typing import TYPE_CHECKING, Any
 
 import httpx
 
 from courtlistener.async_client.resource import AsyncResource
+from courtlistener.async_client.transport import AsyncBorrowedTransport
+from courtlistener.cache import CachedResponse, ResponseCache, cache_key
+from courtlistener.citation_cache import CitationCache
 from courtlistener.exceptions import CourtListenerAPIError
 from courtlistener.models import ENDPOINTS
+from courtlistener.rate_limit import RateLimiter
+from courtlistener.retry import RetryPolicy
+from courtlistener.serialization import loads
 from courtlistener.settings import get_api_base_url
 
 if TYPE_CHECKING:
@@ -27,6 +34,11 @@ class AsyncCourtListener:
         access_token: str | None = None,
         base_url: str | None = None,
         timeout: float = 300.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        citation_cache: CitationCache | None = None,
     ) -> None:
         """Initialize the CourtListener client.
 
@@ -40,6 +52,24 @@ class AsyncCourtListener:
                 takes precedence over ``api_token`` and the env var.
             base_url: Base URL for the CourtListener API.
             timeout: Request timeout in seconds.
+            transport: Shared httpx transport (e.g. from
+                ``create_pooled_transport``) to send requests through.
+                The client borrows it: closing the client leaves the
+                transport open for other clients to reuse.
+            retry: Policy for retrying throttled, failed, and dropped
+                requests. Requests are not retried when unset.
+            rate_limiter: Limiter every request, including retries,
+                waits on before it is sent. Share one instance between
+                clients that draw on the same API rate budget.
+            cache: Store for GET responses that carry an ``ETag`` or
+                ``Last-Modified`` header. Cached URLs are revalidated
+                with a conditional request, and a ``304`` is answered
+                from the cache. Entries are keyed by credential, so one
+                cache can be shared between users.
+            citation_cache: Store for citation verification results.
+                ``citation_lookup.lookup_citation()`` and
+                ``lookup_text_batched(..., extract_locally=True)`` only
+                send citations it doesn't hold to the API.
         """
         self.api_token = api_token or (
             None if access_token else os.environ.get("COURTLISTENER_API_TOKEN")
@@ -57,6 +87,11 @@ class AsyncCourtListener:
 
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.transport = transport
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.citation_cache = citation_cache
         self._http_client: httpx.AsyncClient | None = None
         self._resources: dict[str, AsyncResource] = {}
 
@@ -118,6 +153,11 @@ class AsyncCourtListener:
                     "Authorization": auth_header,
                 },
                 timeout=self.timeout,
+                transport=(
+                    AsyncBorrowedTransport(self.transport)
+                    if self.transport is not None
+                    else None
+                ),
             )
         return self._http_client
 
@@ -152,7 +192,20 @@ class AsyncCourtListener:
         )
         if overlap:
             path = path[overlap:]
-        response = await self.client.request(method, path, **kwargs)
+        key = None
+        cached = None
+        if self.cache is not None and method == "GET":
+            url = self.client.build_request(method, path, **kwargs).url
+            key = cache_key(self.client.headers["Authorization"], str(url))
+            cached = await self.cache.aget(key)
+            if cached is not None:
+                kwargs["headers"] = {
+                    **kwargs.get("headers", {}),
+                    **cached.conditional_headers(),
+                }
+        response = await self._send_with_retries(method, path, **kwargs)
+        if cached is not None and response.status_code == 304:
+            return loads(cached.body)
         try:
             response.raise_for_status()
         except httpx.HTTPStatusError:
@@ -167,4 +220,39 @@ class AsyncCourtListener:
             ) from None
         if response.status_code == 204:
             return {}
-        return response.json()
+        if self.cache is not None and key is not None:
+            entry = CachedResponse.from_response(response)
+            if entry is not None:
+                await self.cache.aset(key, entry)
+        return loads(response.content)
+
+    async def _send_with_retries(
+        self, method: str, path: str, **kwargs: Any
+    ) -> httpx.Response:
+        """Send a request, retrying per ``self.retry`` while it allows."""
+        attempt = 0
+        waited = 0.0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.aacquire()
+            try:
+                response = await self.client.request(method, path, **kwargs)
+            except httpx.TransportError as exc:
+                if self.retry is None:
+                    raise
+                delay = self.retry.get_delay(
+                    method, attempt, waited, error=exc
+                )
+                if delay is None:
+                    raise
+            else:
+                if self.retry is None or response.is_success:
+                    return response
+                delay = self.retry.get_delay(
+                    method, attempt, waited, response=response
+                )
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
+            waited += delay
+            attempt += 1
@@ -1,16 +1,44 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+import weakref
+from collections.abc import AsyncIterator, Iterable
+from functools import partial
 from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import urlparse
 
+from courtlistener.concurrency import abounded_map
+from courtlistener.exceptions import CourtListenerAPIError
+from courtlistener.filter_cache import filter_cache
 from courtlistener.models import Endpoint, Page
-from courtlistener.utils import flatten_filters, validate_model_fields
+from courtlistener.prefetch import AsyncPagePrefetcher
+from courtlistener.sharding import AsyncShardedIterator, split_range_filters
+from courtlistener.utils import (
+    flatten_filters,
+    supports_in_lookup,
+    validate_model_fields,
+)
 
 if TYPE_CHECKING:
     from courtlistener.async_client.client import AsyncCourtListener
 
 
+async def _fetch_page_at(client: AsyncCourtListener, url: str) -> Page:
+    """Fetch the page at a ``next``/``previous`` cursor URL."""
+    parsed = urlparse(url)
+    path = parsed.path
+    if parsed.query:
+        path = f"{path}?{parsed.query}"
+    data = cast(dict[str, Any], await client._request("GET", path))
+    return Page.from_api(data)
+
+
+def _normalize_id(id: int | float | str) -> int | float | str:
+    """Turn whole-number floats into ints, as JSON numbers may arrive."""
+    if isinstance(id, float) and id.is_integer():
+        return int(id)
+    return id
+
+
 class AsyncResourceIterator:
     """Iterator for paginated API results."""
 
@@ -18,37 +46,36 @@ class AsyncResourceIterator:
         self,
         resource: AsyncResource,
         filters: dict[str, Any],
+        prefetch: int = 0,
     ) -> None:
         self._client = resource._client
         self._endpoint = resource._endpoint
         self._filters = filters
         self._current_page: Page | None = None
+        self._page_url: str | None = None
+        self._page_url_known = True
         self._count: int | None = None
+        self._count_url: str | None = None
         self._page_result_index: int = 0
+        self._prefetch = prefetch
+        self._prefetcher: AsyncPagePrefetcher | None = None
 
     async def _fetch_page(self, url: str | None = None) -> Page:
         """Fetch a page of results."""
         if url:
-            parsed = urlparse(url)
-            path = parsed.path
-            if parsed.query:
-                path = f"{path}?{parsed.query}"
-            data = cast(
-                dict[str, Any], await self._client._request("GET", path)
-            )
-        else:
-            data = cast(
-                dict[str, Any],
-                await self._client._request(
-                    "GET", self._endpoint, params=self._filters
-                ),
-            )
-        return Page(**data)
+            return await _fetch_page_at(self._client, url)
+        data = cast(
+            dict[str, Any],
+            await self._client._request(
+                "GET", self._endpoint, params=self._filters
+            ),
+        )
+        return Page.from_api(data)
 
     async def get_current_page(self) -> Page:
         """Get the current page."""
         if self._current_page is None:
-            self._current_page = await self._fetch_page()
+            self._current_page = await self._fetch_page(self._page_url)
         return self._current_page
 
     async def has_next(self) -> bool:
@@ -66,21 +93,32 @@ class AsyncResourceIterator:
         if not await self.has_next():
             raise ValueError("No next page")
         current_page = await self.get_current_page()
-        self._current_page = await self._fetch_page(current_page.next)
+        if self._prefetch and current_page.next is not None:
+            prefetcher = self._prefetch_from(current_page.next)
+            self._current_page = await prefetcher.get()
+        else:
+            self._current_page = await self._fetch_page(current_page.next)
+        self._page_url = current_page.next
+        self._page_url_known = True
         self._page_result_index = 0
 
     async def previous(self) -> None:
         """Get the previous page."""
         if not await self.has_previous():
             raise ValueError("No previous page")
+        self._stop_prefetching()
         current_page = await self.get_current_page()
         self._current_page = await self._fetch_page(current_page.previous)
+        self._page_url = current_page.previous
+        self._page_url_known = True
         self._page_result_index = 0
 
     async def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
         """Iterate over all results across pages, respecting the page result index."""
         while True:
             current_page = await self.get_current_page()
+            if self._prefetch and current_page.next is not None:
+                self._prefetch_from(current_page.next)
             for item in current_page.results[self._page_result_index :]:
                 self._page_result_index += 1
                 yield item
@@ -88,16 +126,37 @@ class AsyncResourceIterator:
                 break
             await self.next()
 
+    def _prefetch_from(self, url: str) -> AsyncPagePrefetcher:
+        """Return a prefetcher whose next page is *url*, starting one if needed.
+
+        The prefetcher is cancelled when the iterator is garbage
+        collected, so abandoning an iterator mid-way stops its fetches.
+        """
+        if self._prefetcher is None or self._prefetcher.url != url:
+            self._stop_prefetching()
+            self._prefetcher = AsyncPagePrefetcher(
+                partial(_fetch_page_at, self._client), url, self._prefetch
+            )
+            weakref.finalize(self, self._prefetcher.cancel)
+        return self._prefetcher
+
+    def _stop_prefetching(self) -> None:
+        if self._prefetcher is not None:
+            self._prefetcher.cancel()
+            self._prefetcher = None
+
     async def get_count(self) -> int:
         """Total count of results across all pages."""
         if self._count is None:
-            current_page = await self.get_current_page()
-            if current_page.count is None:
+            count: int | str | None = self._count_url
+            if count is None:
+                count = (await self.get_current_page()).count
+            if count is None:
                 raise ValueError("No count URL")
-            elif isinstance(current_page.count, int):
-                self._count = current_page.count
+            elif isinstance(count, int):
+                self._count = count
             else:
-                parsed = urlparse(current_page.count)
+                parsed = urlparse(count)
                 path = parsed.path
                 if parsed.query:
                     path = f"{path}?{parsed.query}"
@@ -117,16 +176,39 @@ class AsyncResourceIterator:
         current_page = await self.get_current_page()
         return current_page.results
 
-    async def dump(self) -> dict[str, Any]:
-        """Serialize the iterator state to a dict for later restoration."""
-        current_page = await self.get_current_page()
-        return {
-            "current_page": current_page.model_dump(),
-            "filters": self._filters,
+    async def dump(self, include_page: bool = False) -> dict[str, Any]:
+        """Serialize the iterator state to a dict for later restoration.
+
+        By default only the position is kept: the endpoint, filters, the
+        current page's URL, the index into it and the count. ``load()``
+        then fetches the page again when it is next needed.
+
+        Args:
+            include_page: Also keep the current page's results, so a
+                loaded iterator needs no request to resume. The result
+                dicts are shared with the iterator, not copied.
+        """
+        count: int | str | None = (
+            self._count if self._count is not None else self._count_url
+        )
+        if self._current_page is not None and count is None:
+            count = self._current_page.count
+        data: dict[str, Any] = {
             "endpoint": self._endpoint,
+            "filters": self._filters,
+            "page_url": self._page_url,
             "page_result_index": self._page_result_index,
-            "count": self._count,
+            "count": count if isinstance(count, int) else None,
+            "count_url": count if isinstance(count, str) else None,
         }
+        # Dumps from before page URLs were tracked can't be re-fetched.
+        if include_page or not self._page_url_known:
+            current_page = await self.get_current_page()
+            data["current_page"] = {
+                **dict(current_page),
+                "results": list(current_page.results),
+            }
+        return data
 
     @classmethod
     def load(
@@ -137,9 +219,16 @@ class AsyncResourceIterator:
         iterator._client = client
         iterator._endpoint = data["endpoint"]
         iterator._filters = data["filters"]
-        iterator._current_page = Page(**data["current_page"])
+        iterator._current_page = (
+            Page(**data["current_page"]) if "current_page" in data else None
+        )
+        iterator._page_url = data.get("page_url")
+        iterator._page_url_known = "page_url" in data
         iterator._page_result_index = data["page_result_index"]
         iterator._count = data["count"]
+        iterator._count_url = data.get("count_url")
+        iterator._prefetch = 0
+        iterator._prefetcher = None
         return iterator
 
 
@@ -156,6 +245,16 @@ class AsyncResource:
         self._endpoint = model.endpoint
 
     def validate_filters(self, filters: dict[str, Any]) -> dict[str, Any]:
+        """Validate ``filters`` into query parameters.
+
+        Results are memoized in ``courtlistener.filter_cache``, so
+        repeating a query skips pydantic validation.
+        """
+        return filter_cache.validate(
+            self._model, filters, self._validate_filters
+        )
+
+    def _validate_filters(self, filters: dict[str, Any]) -> dict[str, Any]:
         filters = self._model(**filters).model_dump(by_alias=True)
         filters = flatten_filters(filters)
         filters = {k: v for k, v in filters.items() if v is not None}
@@ -165,8 +264,7 @@ class AsyncResource:
         self, id: int | float | str, fields: list[str] | str | None = None
     ) -> dict[str, Any]:
         """Get a resource by its ID."""
-        if isinstance(id, float) and id.is_integer():
-            id = int(id)
+        id = _normalize_id(id)
         params = {}
         if fields:
             fields = validate_model_fields(self._model, fields)
@@ -179,7 +277,138 @@ class AsyncResource:
             ),
         )
 
-    def list(self, **filters: Any) -> AsyncResourceIterator:
-        """List resources with optional filtering."""
+    async def get_many(
+        self,
+        ids: Iterable[int | float | str],
+        fields: list[str] | str | None = None,
+        *,
+        chunk_size: int = 100,
+        concurrency: int = 8,
+    ) -> tuple[
+        dict[int | float | str, dict[str, Any]], list[int | float | str]
+    ]:
+        """Get several resources by ID in as few requests as possible.
+
+        On endpoints that filter ``id`` by ``in``, ids are fetched with one
+        ``id__in`` list query per ``chunk_size`` ids. Elsewhere this falls
+        back to single :meth:`get` calls. Either way, up to ``concurrency``
+        requests run at once.
+
+        Args:
+            ids: Resource IDs. Duplicates are fetched once.
+            fields: Fields to return. ``id`` is added to ``id__in``
+                queries so their results can be matched to the ids.
+            chunk_size: Ids per ``id__in`` query.
+            concurrency: Requests in flight at the same time.
+
+        Returns:
+            The resources keyed by the requested id, and the requested ids
+            that were not found, in request order.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1.")
+        wanted = list(dict.fromkeys(_normalize_id(id) for id in ids))
+        if fields:
+            fields = validate_model_fields(self._model, fields)
+        found: dict[int | float | str, dict[str, Any]] = {}
+        if supports_in_lookup(self._model, "id"):
+            if fields and "id" not in fields:
+                fields = [*fields, "id"]
+            requested = {str(id): id for id in wanted}
+            chunks = [
+                wanted[start : start + chunk_size]
+                for start in range(0, len(wanted), chunk_size)
+            ]
+            pages = await abounded_map(
+                partial(self._list_ids, fields=fields), chunks, concurrency
+            )
+            for page in pages:
+                for item in page:
+                    key = requested.get(str(item.get("id")))
+                    if key is not None:
+                        found[key] = item
+        else:
+            results = await abounded_map(
+                partial(self._get_or_none, fields=fields), wanted, concurrency
+            )
+            found = {
+                id: result
+                for id, result in zip(wanted, results)
+                if result is not None
+            }
+        missing = [id for id in wanted if id not in found]
+        return found, missing
+
+    async def _list_ids(
+        self, ids: list[int | float | str], fields: list[str] | str | None
+    ) -> list[dict[str, Any]]:
+        """Every result of one ``id__in`` query, across its pages."""
+        filters: dict[str, Any] = {"id": ids}
+        if fields:
+            filters["fields"] = fields
+        results = []
+        async for item in self.list(**filters):
+            results.append(item)
+        return results
+
+    async def _get_or_none(
+        self, id: int | float | str, fields: list[str] | str | None
+    ) -> dict[str, Any] | None:
+        """:meth:`get`, or ``None`` if the resource doesn't exist."""
+        try:
+            return await self.get(id, fields=fields)
+        except CourtListenerAPIError as exc:
+            if exc.status_code == 404:
+                return None
+            raise
+
+    def list(
+        self, *, prefetch: int = 0, **filters: Any
+    ) -> AsyncResourceIterator:
+        """List resources with optional filtering.
+
+        Args:
+            prefetch: Pages to fetch ahead in the background while the
+                current page is consumed. ``0`` fetches each page only
+                when iteration reaches it.
+            **filters: Endpoint filters.
+        """
+        if prefetch < 0:
+            raise ValueError("prefetch must be zero or positive.")
+        valid_filters = self.validate_filters(filters)
+        return AsyncResourceIterator(self, valid_filters, prefetch=prefetch)
+
+    def list_parallel(
+        self,
+        *,
+        shard_by: str,
+        shards: int,
+        concurrency: int | None = None,
+        **filters: Any,
+    ) -> AsyncShardedIterator:
+        """List resources by paging through range shards concurrently.
+
+        The range given for ``shard_by`` in ``filters`` is split into
+        ``shards`` disjoint sub-ranges, each listed by its own iterator,
+        and their results are merged into one stream. Order is kept
+        within a shard, not across shards.
+
+        Args:
+            shard_by: An int, date or datetime field to split on, e.g.
+                ``"date_filed"``. ``filters`` must bound it from below
+                (``__gte``/``__gt``) and above (``__lt``/``__lte``).
+            shards: Number of sub-ranges to split the query into.
+            concurrency: Shards paged at the same time. Defaults to
+                ``shards``.
+            **filters: Endpoint filters.
+        """
         valid_filters = self.validate_filters(filters)
-        return AsyncResourceIterator(self, valid_filters)
+        iterators = [
+            AsyncResourceIterator(self, shard_filters)
+            for shard_filters in split_range_filters(
+                valid_filters, shard_by, shards
+            )
+        ]
+        return AsyncShardedIterator(
+            iterators, concurrency if concurrency is not None else shards
+        )
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+if TYPE_CHECKING:
+    import redis
+    import redis.asyncio
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(credential: str, url: str) -> str:
+    """Storage key for a GET of ``url`` made with ``credential``.
+
+    The credential is part of the key, so one user's responses are
+    never served to another user sharing the cache.
+    """
+    digest = hashlib.sha256(f"{credential}\0{url}".encode())
+    return digest.hexdigest()
+
+
+class CachedResponse:
+    """A stored response body and the validators to revalidate it with."""
+
+    __slots__ = ("body", "etag", "last_modified")
+
+    def __init__(
+        self,
+        body: bytes,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> CachedResponse | None:
+        """Build an entry, or ``None`` if the response can't be revalidated."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code != 200 or not (etag or last_modified):
+            return None
+        if "no-store" in response.headers.get("Cache-Control", ""):
+            return None
+        return cls(response.content, etag, last_modified)
+
+    @property
+    def size(self) -> int:
+        """Approximate bytes held by this entry."""
+        return (
+            len(self.body)
+            + len(self.etag or "")
+            + len(self.last_modified or "")
+        )
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that ask the server for a 304 if nothing changed."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Storage for revalidatable API responses.
+
+    Pass a backend as ``cache=`` to ``CourtListener`` or
+    ``AsyncCourtListener``. GET responses that carry an ``ETag`` or
+    ``Last-Modified`` header are stored; later GETs of the same URL with
+    the same credential send ``If-None-Match``/``If-Modified-Since`` and
+    a ``304 Not Modified`` reply is answered from the cache.
+
+    Subclasses implement :meth:`get` and :meth:`set`. The async client
+    calls :meth:`aget` and :meth:`aset`, which run the sync methods
+    directly unless a backend overrides them.
+    """
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the entry stored under ``key``, if any."""
+        raise NotImplementedError
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Store ``entry`` under ``key``, replacing any previous one."""
+        raise NotImplementedError
+
+    async def aget(self, key: str) -> CachedResponse | None:
+        """Async version of :meth:`get`."""
+        return self.get(key)
+
+    async def aset(self, key: str, entry: CachedResponse) -> None:
+        """Async version of :meth:`set`."""
+        self.set(key, entry)
+
+
+class MemoryCache(ResponseCache):
+    """In-process LRU cache holding at most ``max_bytes`` of responses."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be positive.")
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= previous.size
+            if entry.size > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self.size += entry.size
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= evicted.size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache(ResponseCache):
+    """On-disk cache in a SQLite database, shared across runs.
+
+    The async methods run queries in a worker thread so disk I/O never
+    blocks the event loop.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, "
+                "body BLOB NOT NULL)"
+            )
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified FROM responses "
+                "WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(bytes(row[0]), row[1], row[2])
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, etag, last_modified, body) VALUES (?, ?, ?, ?)",
+                (key, entry.etag, entry.last_modified, entry.body),
+            )
+
+    async def aget(self, key: str) -> CachedResponse | None:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, entry: CachedResponse) -> None:
+        await asyncio.to_thread(self.set, key, entry)
+
+    def clear(self) -> None:
+        """Delete every stored response."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+@contextmanager
+def _redis_errors_as_miss(op: str) -> Iterator[None]:
+    """Let a Redis outage cost a cache miss rather than the request."""
+    import redis
+
+    try:
+        yield
+    except (redis.ConnectionError, redis.TimeoutError) as exc:
+        logger.warning("response cache %s failed: %s", op, exc)
+
+
+class RedisCache(ResponseCache):
+    """Cache in Redis, shared by every process pointed at ``url``.
+
+    Entries expire ``ttl`` seconds after they were last stored. Requires
+    the ``redis`` package. Connection failures are logged and treated as
+    misses.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        ttl: int = 86400,
+        prefix: str = "courtlistener:response:",
+    ) -> None:
+        self.url = url
+        self.ttl = ttl
+        self.prefix = prefix
+        self._client: redis.Redis | None = None
+        self._async_client: redis.asyncio.Redis | None = None
+
+    @property
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            import redis
+
+            self._client = redis.Redis.from_url(self.url)
+        return self._client
+
+    @property
+    def async_client(self) -> redis.asyncio.Redis:
+        if self._async_client is None:
+            import redis.asyncio
+
+            self._async_client = redis.asyncio.Redis.from_url(self.url)
+        return self._async_client
+
+    @staticmethod
+    def _decode(fields: dict[Any, Any]) -> CachedResponse | None:
+        if not fields or b"body" not in fields:
+            return None
+        etag = fields.get(b"etag")
+        last_modified = fields.get(b"last_modified")
+        return CachedResponse(
+            fields[b"body"],
+            etag.decode() if etag else None,
+            last_modified.decode() if last_modified else None,
+        )
+
+    @staticmethod
+    def _encode(entry: CachedResponse) -> Mapping[Any, Any]:
+        fields: dict[str, bytes | str] = {"body": entry.body}
+        if entry.etag:
+            fields["etag"] = entry.etag
+        if entry.last_modified:
+            fields["last_modified"] = entry.last_modified
+        return fields
+
+    def get(self, key: str) -> CachedResponse | None:
+        with _redis_errors_as_miss("get"):
+            return self._decode(self.client.hgetall(self.prefix + key))
+        return None
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        with _redis_errors_as_miss("set"):
+            pipe = self.client.pipeline()
+            pipe.delete(self.prefix + key)
+            pipe.hset(self.prefix + key, mapping=self._encode(entry))
+            pipe.expire(self.prefix + key, self.ttl)
+            pipe.execute()
+
+    async def aget(self, key: str) -> CachedResponse | None:
+        with _redis_errors_as_miss("get"):
+            fields = await self.async_client.hgetall(self.prefix + key)
+            return self._decode(fields)
+        return None
+
+    async def aset(self, key: str, entry: CachedResponse) -> None:
+        with _redis_errors_as_miss("set"):
+            pipe = self.async_client.pipeline()
+            pipe.delete(self.prefix + key)
+            pipe.hset(self.prefix + key, mapping=self._encode(entry))
+            pipe.expire(self.prefix + key, self.ttl)
+            await pipe.execute()
@@ -0,0 +1,313 @@
+"""Cache of citation-lookup results keyed by normalized citation.
+
+Popular citations are verified over and over. With a cache passed as
+``citation_cache=`` to ``CourtListener`` or ``AsyncCourtListener``,
+``citation_lookup.lookup_citation()`` and
+``citation_lookup.lookup_text_batched(..., extract_locally=True)``
+answer citations they have seen from the cache and only send the rest
+to the API.
+
+Entries are keyed by ``volume reporter page`` with the spaces removed
+from the reporter, so ``347 U. S. 483`` and ``347 U.S. 483`` share one.
+Found and ambiguous results are kept for ``ttl`` seconds and not-found
+results for the shorter ``negative_ttl``, since the case may be added.
+Invalid and throttled results are never cached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+from courtlistener.serialization import dumps, loads
+
+if TYPE_CHECKING:
+    import redis
+    import redis.asyncio
+
+logger = logging.getLogger(__name__)
+
+FOUND_STATUSES = frozenset({200, 300})
+NOT_FOUND_STATUS = 404
+
+
+def normalize_citation(citation: str) -> str:
+    """The cache key for a ``volume reporter page`` citation."""
+    parts = citation.split()
+    if len(parts) < 3:
+        return " ".join(parts)
+    return f"{parts[0]} {''.join(parts[1:-1])} {parts[-1]}"
+
+
+class CitationCache:
+    """Storage for citation-lookup results, by normalized citation.
+
+    Subclasses implement :meth:`_load` and :meth:`_store`. The async
+    lookup helper calls :meth:`aget_many` and :meth:`aset`, which run the
+    sync methods directly unless a backend overrides ``_aload`` and
+    ``_astore``.
+    """
+
+    def __init__(self, ttl: int = 86400, negative_ttl: int = 3600) -> None:
+        if ttl < 1 or negative_ttl < 1:
+            raise ValueError("ttl and negative_ttl must be positive.")
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+
+    def ttl_for(self, result: dict[str, Any]) -> int | None:
+        """Seconds to keep ``result``, or ``None`` if it isn't cacheable."""
+        status = result.get("status")
+        if status in FOUND_STATUSES:
+            return self.ttl
+        if status == NOT_FOUND_STATUS:
+            return self.negative_ttl
+        return None
+
+    def _load(self, keys: Sequence[str]) -> list[str | None]:
+        raise NotImplementedError
+
+    def _store(self, key: str, value: str, ttl: int) -> None:
+        raise NotImplementedError
+
+    async def _aload(self, keys: Sequence[str]) -> list[str | None]:
+        return self._load(keys)
+
+    async def _astore(self, key: str, value: str, ttl: int) -> None:
+        self._store(key, value, ttl)
+
+    @staticmethod
+    def _decode(
+        citations: Sequence[str], values: list[str | None]
+    ) -> dict[str, dict[str, Any]]:
+        return {
+            citation: loads(value)
+            for citation, value in zip(citations, values, strict=True)
+            if value is not None
+        }
+
+    def get(self, citation: str) -> dict[str, Any] | None:
+        """Return the cached result for ``citation``, if any."""
+        return self.get_many([citation]).get(citation)
+
+    def get_many(self, citations: Sequence[str]) -> dict[str, dict[str, Any]]:
+        """Return the cached results among ``citations``, by citation."""
+        keys = [normalize_citation(c) for c in citations]
+        return self._decode(citations, self._load(keys))
+
+    def set(self, citation: str, result: dict[str, Any]) -> None:
+        """Cache ``result`` for ``citation`` if its status allows it."""
+        ttl = self.ttl_for(result)
+        if ttl is not None:
+            self._store(normalize_citation(citation), dumps(result), ttl)
+
+    async def aget(self, citation: str) -> dict[str, Any] | None:
+        """Async version of :meth:`get`."""
+        return (await self.aget_many([citation])).get(citation)
+
+    async def aget_many(
+        self, citations: Sequence[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Async version of :meth:`get_many`."""
+        keys = [normalize_citation(c) for c in citations]
+        return self._decode(citations, await self._aload(keys))
+
+    async def aset(self, citation: str, result: dict[str, Any]) -> None:
+        """Async version of :meth:`set`."""
+        ttl = self.ttl_for(result)
+        if ttl is not None:
+            await self._astore(
+                normalize_citation(citation), dumps(result), ttl
+            )
+
+
+class MemoryCitationCache(CitationCache):
+    """In-process LRU cache holding at most ``max_entries`` results."""
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl: int = 86400,
+        negative_ttl: int = 3600,
+    ) -> None:
+        super().__init__(ttl, negative_ttl)
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive.")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _load(self, keys: Sequence[str]) -> list[str | None]:
+        now = time.monotonic()
+        values: list[str | None] = []
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and now >= entry[1]:
+                    del self._entries[key]
+                    entry = None
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                values.append(entry[0] if entry is not None else None)
+        return values
+
+    def _store(self, key: str, value: str, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCitationCache(CitationCache):
+    """On-disk cache in a SQLite database, shared across runs.
+
+    The async methods run queries in a worker thread so disk I/O never
+    blocks the event loop.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        ttl: int = 86400,
+        negative_ttl: int = 3600,
+    ) -> None:
+        super().__init__(ttl, negative_ttl)
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS citations ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL)"
+            )
+
+    def _load(self, keys: Sequence[str]) -> list[str | None]:
+        found: dict[str, str] = {}
+        now = time.time()
+        # Stay under SQLite's limit on bound parameters per query.
+        for i in range(0, len(keys), 500):
+            chunk = keys[i : i + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT key, value FROM citations "
+                    f"WHERE key IN ({placeholders}) AND expires_at > ?",
+                    (*chunk, now),
+                ).fetchall()
+            found.update(rows)
+        return [found.get(key) for key in keys]
+
+    def _store(self, key: str, value: str, ttl: int) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO citations (key, value, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl),
+            )
+
+    async def _aload(self, keys: Sequence[str]) -> list[str | None]:
+        return await asyncio.to_thread(self._load, keys)
+
+    async def _astore(self, key: str, value: str, ttl: int) -> None:
+        await asyncio.to_thread(self._store, key, value, ttl)
+
+    def clear(self) -> None:
+        """Delete every stored result."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM citations")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+@contextmanager
+def _redis_errors_as_miss(op: str) -> Iterator[None]:
+    """Let a Redis outage cost a cache miss rather than the lookup."""
+    import redis
+
+    try:
+        yield
+    except (redis.ConnectionError, redis.TimeoutError) as exc:
+        logger.warning("citation cache %s failed: %s", op, exc)
+
+
+class RedisCitationCache(CitationCache):
+    """Cache in Redis, shared by every process pointed at ``url``.
+
+    Requires the ``redis`` package. Connection failures are logged and
+    treated as misses.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        ttl: int = 86400,
+        negative_ttl: int = 3600,
+        prefix: str = "courtlistener:citation:",
+    ) -> None:
+        super().__init__(ttl, negative_ttl)
+        self.url = url
+        self.prefix = prefix
+        self._client: redis.Redis | None = None
+        self._async_client: redis.asyncio.Redis | None = None
+
+    @property
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            import redis
+
+            self._client = redis.Redis.from_url(
+                self.url, decode_responses=True
+            )
+        return self._client
+
+    @property
+    def async_client(self) -> redis.asyncio.Redis:
+        if self._async_client is None:
+            import redis.asyncio
+
+            self._async_client = redis.asyncio.Redis.from_url(
+                self.url, decode_responses=True
+            )
+        return self._async_client
+
+    def _load(self, keys: Sequence[str]) -> list[str | None]:
+        if not keys:
+            return []
+        with _redis_errors_as_miss("get"):
+            values = self.client.mget([self.prefix + key for key in keys])
+            # decode_responses=True, so values are str.
+            return cast(list[str | None], values)
+        return [None] * len(keys)
+
+    def _store(self, key: str, value: str, ttl: int) -> None:
+        with _redis_errors_as_miss("set"):
+            self.client.set(self.prefix + key, value, ex=ttl)
+
+    async def _aload(self, keys: Sequence[str]) -> list[str | None]:
+        if not keys:
+            return []
+        with _redis_errors_as_miss("get"):
+            values = await self.async_client.mget(
+                [self.prefix + key for key in keys]
+            )
+            return cast(list[str | None], values)
+        return [None] * len(keys)
+
+    async def _astore(self, key: str, value: str, ttl: int) -> None:
+        with _redis_errors_as_miss("set"):
+            await self.async_client.set(self.prefix + key, value, ex=ttl)
@@ -0,0 +1,154 @@
+"""Local citation extraction for compact citation lookups.
+
+The citation-lookup API extracts citations from the text it is sent and
+throttles past 250 citations per request. Extracting them locally with
+eyecite first lets the lookup helpers send each distinct citation once,
+as a short ``; ``-delimited string, and copy the verification back to
+every place the citation occurs. Requires the ``eyecite`` package.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from eyecite.models import FullCitation
+
+# Delimiter used between citations in the compact string sent to the
+# citation-lookup API.  Semicolon-space is a natural Bluebook list
+# separator that eyecite reliably parses without cleanup.
+CITATION_DELIMITER = "; "
+
+# Maximum citations per API request before 429 throttling.
+MAX_CITATIONS_PER_REQUEST = 250
+
+
+def canonical_key(cite: FullCitation) -> str:
+    """Canonical key for deduplication: 'volume reporter page'."""
+    g = cite.groups
+    return f"{g['volume']} {g['reporter']} {g['page']}"
+
+
+def build_compact_string(unique_citations: list[str]) -> str:
+    """Join unique citation strings with our delimiter for the API."""
+    return CITATION_DELIMITER.join(unique_citations)
+
+
+class ExtractedCitations:
+    """The distinct full case citations in a text and where they occur.
+
+    ``keys`` are canonical keys in order of first appearance;
+    ``occurrences`` maps each key to its ``(start, end)`` spans in the
+    text. ``unpaged`` holds the spans of citations without a page number
+    (slip opinions), which the API can't verify.
+    """
+
+    __slots__ = ("keys", "occurrences", "unpaged")
+
+    def __init__(self) -> None:
+        self.keys: list[str] = []
+        self.occurrences: dict[str, list[tuple[int, int]]] = {}
+        self.unpaged: list[tuple[int, int]] = []
+
+    def batches(self, keys: list[str] | None = None) -> list[list[str]]:
+        """``keys`` (all of them by default) split into requests of at
+        most 250 citations."""
+        keys = self.keys if keys is None else keys
+        return [
+            keys[i : i + MAX_CITATIONS_PER_REQUEST]
+            for i in range(0, len(keys), MAX_CITATIONS_PER_REQUEST)
+        ]
+
+
+def extract_citations(text: str) -> ExtractedCitations:
+    """Find the full case citations in ``text`` with eyecite."""
+    try:
+        from eyecite import get_citations
+        from eyecite.models import FullCaseCitation
+    except ImportError as exc:
+        raise ImportError(
+            "Local citation extraction requires the eyecite package "
+            "(pip install eyecite)."
+        ) from exc
+
+    extracted = ExtractedCitations()
+    for cite in get_citations(text):
+        if not isinstance(cite, FullCaseCitation):
+            continue
+        span = cite.span()
+        if cite.groups.get("page") is None:
+            extracted.unpaged.append(span)
+            continue
+        key = canonical_key(cite)
+        if key not in extracted.occurrences:
+            extracted.keys.append(key)
+            extracted.occurrences[key] = []
+        extracted.occurrences[key].append(span)
+    return extracted
+
+
+def match_batch_results(
+    results: list[dict[str, Any]], batch: list[str]
+) -> dict[str, dict[str, Any]]:
+    """Map the API's results for a compact batch to the batch's keys.
+
+    Results are matched by where they start in the compact string, or
+    failing that by their citation text.
+    """
+    starts: dict[int, str] = {}
+    offset = 0
+    for key in batch:
+        starts[offset] = key
+        offset += len(key) + len(CITATION_DELIMITER)
+    by_text = {key.strip().lower(): key for key in batch}
+
+    matched: dict[str, dict[str, Any]] = {}
+    for result in results:
+        matched_key = starts.get(result.get("start_index", -1))
+        if matched_key is None:
+            citation = str(result.get("citation", ""))
+            matched_key = by_text.get(citation.strip().lower())
+        if matched_key is not None:
+            matched[matched_key] = result
+    return matched
+
+
+def expand_results(
+    text: str,
+    extracted: ExtractedCitations,
+    verified: dict[str, dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """One result per occurrence in ``text``, ordered by position.
+
+    Each occurrence gets a copy of its key's result with ``citation``,
+    ``start_index`` and ``end_index`` taken from the original text.
+    Citations without a page number get a status 400 result.
+    """
+    expanded: list[dict[str, Any]] = []
+    for key, spans in extracted.occurrences.items():
+        result = verified.get(key)
+        if result is None:
+            continue
+        for start, end in spans:
+            expanded.append(
+                {
+                    **result,
+                    "citation": text[start:end],
+                    "start_index": start,
+                    "end_index": end,
+                }
+            )
+    for start, end in extracted.unpaged:
+        expanded.append(
+            {
+                "citation": text[start:end],
+                "normalized_citations": [],
+                "start_index": start,
+                "end_index": end,
+                "status": 400,
+                "error_message": "Citation has no page number.",
+                "clusters": [],
+            }
+        )
+    expanded.sort(key=lambda result: result["start_index"])
+    return expanded
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def abounded_map(
+    fn: Callable[[T], Awaitable[R]], items: Iterable[T], concurrency: int
+) -> list[R]:
+    """Await ``fn`` over ``items``, at most ``concurrency`` at a time.
+
+    Results come back in input order. The first error cancels the calls
+    still pending and is re-raised.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+    slots = asyncio.Semaphore(concurrency)
+
+    async def run(item: T) -> R:
+        async with slots:
+            return await fn(item)
+
+    tasks = [asyncio.ensure_future(run(item)) for item in items]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+def bounded_map(
+    fn: Callable[[T], R], items: Iterable[T], concurrency: int
+) -> list[R]:
+    """Call ``fn`` over ``items`` in up to ``concurrency`` worker threads.
+
+    Results come back in input order. The first error cancels the calls
+    not yet started and is re-raised.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [pool.submit(fn, item) for item in items]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
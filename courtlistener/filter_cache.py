@@ -0,0 +1,113 @@
+"""Memo of validated filters for repeated identical queries.
+
+``Resource.list()`` validates its filters through the endpoint's
+pydantic model, dumps them by alias and flattens them into query
+parameters. Callers such as the MCP server repeat the same filters
+constantly, so the result is kept in a bounded LRU keyed by the
+endpoint model and a canonical form of the filters.
+
+Validation doesn't depend on the clock: relative dates like
+``"3 days ago"`` are passed to the API verbatim and resolved there, so
+cached results stay correct however long they are kept.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from courtlistener.models import Endpoint
+
+
+def canonical_filters(filters: dict[str, Any]) -> tuple[Any, ...]:
+    """A hashable form of ``filters`` that ignores key order.
+
+    Scalars are tagged with their type, so ``1``, ``1.0``, ``True`` and
+    ``"1"`` stay distinct. Raises ``TypeError`` for values that can't be
+    hashed.
+    """
+    return _freeze(filters)
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return (
+            dict,
+            tuple(
+                sorted(
+                    ((str(k), _freeze(v)) for k, v in value.items()),
+                    key=lambda item: item[0],
+                )
+            ),
+        )
+    if isinstance(value, list | tuple):
+        return (list, tuple(_freeze(v) for v in value))
+    hash(value)
+    return (type(value), value)
+
+
+class FilterCache:
+    """Bounded LRU of validated filters per endpoint model.
+
+    ``hits`` and ``misses`` count lookups since the last :meth:`clear`.
+    Set ``maxsize`` to ``0`` to turn the cache off.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be zero or positive.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Any, tuple[tuple[str, Any], ...]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def validate(
+        self,
+        model: type[Endpoint],
+        filters: dict[str, Any],
+        validate: Callable[[dict[str, Any]], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Return ``validate(filters)``, cached per model and filters.
+
+        Each call returns a new dict, so callers may modify it. Invalid
+        filters aren't cached; ``validate`` raises again on every call.
+        """
+        if self.maxsize == 0:
+            return validate(filters)
+        try:
+            key = (model, canonical_filters(filters))
+        except TypeError:
+            return validate(filters)
+        with self._lock:
+            items = self._entries.get(key)
+            if items is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return dict(items)
+            self.misses += 1
+        result = validate(filters)
+        with self._lock:
+            self._entries[key] = tuple(result.items())
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+filter_cache = FilterCache()
+"""The cache shared by every ``Resource`` and ``AsyncResource``."""
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from courtlistener.citation_cache import (
+    CitationCache,
+    MemoryCitationCache,
+    RedisCitationCache,
+)
+from courtlistener.mcp import settings
+
+_cache: CitationCache | None = None
+
+
+def get_citation_cache() -> CitationCache | None:
+    """Return the process-wide citation verification cache, if enabled.
+
+    Redis-backed when ``REDIS_URL`` is set, so every worker shares the
+    verified citations; otherwise an in-process LRU.
+    """
+    global _cache
+    if _cache is None and settings.CITATION_CACHE_ENABLED:
+        if settings.REDIS_URL:
+            _cache = RedisCitationCache(
+                settings.REDIS_URL,
+                ttl=settings.CITATION_CACHE_TTL_SECONDS,
+                negative_ttl=settings.CITATION_CACHE_NEGATIVE_TTL_SECONDS,
+                prefix="mcp:citation:",
+            )
+        else:
+            _cache = MemoryCitationCache(
+                ttl=settings.CITATION_CACHE_TTL_SECONDS,
+                negative_ttl=settings.CITATION_CACHE_NEGATIVE_TTL_SECONDS,
+            )
+    return _cache
+
+
+def set_citation_cache(cache: CitationCache | None) -> None:
+    """Replace the process-wide citation verification cache (for tests)."""
+    global _cache
+    _cache = cache
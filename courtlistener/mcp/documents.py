@@ -0,0 +1,245 @@
+"""Compression for document texts cached in the session store.
+
+Opinion HTML and RECAP plain text are the largest values the MCP server
+caches. Texts of at least ``DOCUMENT_COMPRESSION_MIN_BYTES`` are stored
+compressed, with zstd when the ``zstandard`` package is installed and
+zlib otherwise, then base64-encoded because session values are strings.
+A short prefix that can't begin a document (it starts with a NUL) marks
+the codec, so uncompressed entries written before compression existed
+still read as-is.
+
+Texts longer than ``DOCUMENT_SEGMENT_CHARS`` are split into segments of
+that many characters, each stored (and compressed) under its own
+``{key}:{n}`` sub-key. The document's own key then holds an index with
+its length, so a reader can fetch just the segments covering the
+characters it wants.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import logging
+import threading
+import zlib
+from collections.abc import Sequence
+from typing import Any
+
+from courtlistener.mcp import settings
+from courtlistener.serialization import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+ZLIB_PREFIX = "\x00zlib:"
+ZSTD_PREFIX = "\x00zstd:"
+SEGMENTS_PREFIX = "\x00segments:"
+
+CODECS = ("auto", "zstd", "zlib", "none")
+
+
+def _zstandard() -> Any:
+    """The ``zstandard`` module, or ``None`` if it isn't installed."""
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+class DocumentStats:
+    """Counters for documents written to the cache by this process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero every counter."""
+        with self._lock:
+            self.stored = 0
+            self.compressed = 0
+            self.too_large = 0
+            self.text_bytes = 0
+            self.stored_bytes = 0
+
+    def record(self, text_bytes: int, stored_bytes: int | None) -> None:
+        """Count one document; ``stored_bytes`` is None if it was skipped."""
+        with self._lock:
+            if stored_bytes is None:
+                self.too_large += 1
+                return
+            self.stored += 1
+            if stored_bytes != text_bytes:
+                self.compressed += 1
+            self.text_bytes += text_bytes
+            self.stored_bytes += stored_bytes
+
+    @property
+    def compression_ratio(self) -> float:
+        """Text bytes per stored byte over all stored documents."""
+        return (
+            self.text_bytes / self.stored_bytes if self.stored_bytes else 1.0
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """The counters and compression ratio, e.g. for logging."""
+        with self._lock:
+            return {
+                "stored": self.stored,
+                "compressed": self.compressed,
+                "too_large": self.too_large,
+                "text_bytes": self.text_bytes,
+                "stored_bytes": self.stored_bytes,
+                "compression_ratio": self.compression_ratio,
+            }
+
+
+DOCUMENT_STATS = DocumentStats()
+
+
+def _codec() -> str:
+    codec = settings.DOCUMENT_COMPRESSION
+    if codec not in CODECS:
+        raise ValueError(
+            f"MCP_DOCUMENT_COMPRESSION must be one of {', '.join(CODECS)}, "
+            f"not {codec!r}."
+        )
+    if codec == "auto":
+        return "zstd" if _zstandard() is not None else "zlib"
+    if codec == "zstd" and _zstandard() is None:
+        raise RuntimeError(
+            "MCP_DOCUMENT_COMPRESSION=zstd requires the zstandard package."
+        )
+    return codec
+
+
+def _compress(raw: bytes, codec: str) -> str:
+    if codec == "zstd":
+        compressed = _zstandard().ZstdCompressor().compress(raw)
+        prefix = ZSTD_PREFIX
+    else:
+        compressed = zlib.compress(raw)
+        prefix = ZLIB_PREFIX
+    return prefix + base64.b64encode(compressed).decode("ascii")
+
+
+def _encode(text: str, codec: str) -> tuple[str, int]:
+    """The stored form of ``text`` and its size in bytes."""
+    raw = text.encode()
+    value, stored_bytes = text, len(raw)
+    if codec != "none" and len(raw) >= settings.DOCUMENT_COMPRESSION_MIN_BYTES:
+        encoded = _compress(raw, codec)
+        # Base64 is ASCII, so its length is its size in bytes.
+        if len(encoded) < stored_bytes:
+            value, stored_bytes = encoded, len(encoded)
+    return value, stored_bytes
+
+
+def encode_document(text: str) -> dict[str, str] | None:
+    """The session values to store for ``text``, by key suffix.
+
+    The value under the empty suffix belongs under the document's own
+    key: the whole text, or for segmented texts an index, with segment
+    ``n`` under ``":{n}"``. Returns ``None`` when the stored values would
+    exceed ``DOCUMENT_MAX_BYTES`` in total, so oversized documents aren't
+    cached.
+
+    Raises:
+        ValueError: If ``MCP_DOCUMENT_COMPRESSION`` isn't a known codec.
+    """
+    codec = _codec()
+    size = settings.DOCUMENT_SEGMENT_CHARS
+    text_bytes = len(text.encode())
+    values: dict[str, str] = {}
+    stored_bytes = 0
+    if len(text) <= size:
+        values[""], stored_bytes = _encode(text, codec)
+    else:
+        for n, start in enumerate(range(0, len(text), size)):
+            value, value_bytes = _encode(text[start : start + size], codec)
+            values[f":{n}"] = value
+            stored_bytes += value_bytes
+        # Written last, so readers never see an index whose segments
+        # aren't stored yet.
+        values[""] = SEGMENTS_PREFIX + dumps(
+            {
+                "total_chars": len(text),
+                "segment_chars": size,
+                "segments": len(values),
+            }
+        )
+    if stored_bytes > settings.DOCUMENT_MAX_BYTES:
+        DOCUMENT_STATS.record(text_bytes, None)
+        return None
+    DOCUMENT_STATS.record(text_bytes, stored_bytes)
+    return values
+
+
+async def aencode_document(text: str) -> dict[str, str] | None:
+    """:func:`encode_document` without blocking the event loop.
+
+    Texts of at least ``DOCUMENT_COMPRESSION_THREAD_CHARS`` characters
+    are compressed in a worker thread; zlib and zstd release the GIL
+    while they run. Shorter ones are encoded in place, where a thread
+    hop would cost more than it saves.
+    """
+    if len(text) >= settings.DOCUMENT_COMPRESSION_THREAD_CHARS:
+        return await asyncio.to_thread(encode_document, text)
+    return encode_document(text)
+
+
+def read_index(value: str) -> dict[str, int] | None:
+    """The segment index stored as ``value``, or ``None`` if it isn't one."""
+    if not value.startswith(SEGMENTS_PREFIX):
+        return None
+    try:
+        return loads(value[len(SEGMENTS_PREFIX) :])
+    except ValueError as exc:
+        logger.warning("unreadable cached document index: %s", exc)
+        return None
+
+
+def segments_for(
+    ranges: Sequence[tuple[int, int]], index: dict[str, int]
+) -> list[int]:
+    """The segment numbers covering the ``[start, end)`` ``ranges``."""
+    size = index["segment_chars"]
+    needed: set[int] = set()
+    for start, end in ranges:
+        end = min(end, index["total_chars"])
+        if start < end:
+            needed.update(range(start // size, (end - 1) // size + 1))
+    return sorted(needed)
+
+
+def slice_segments(
+    segments: dict[int, str], start: int, end: int, index: dict[str, int]
+) -> str:
+    """The text in ``[start, end)``, read from the covering ``segments``."""
+    size = index["segment_chars"]
+    end = min(end, index["total_chars"])
+    if start >= end:
+        return ""
+    first, last = start // size, (end - 1) // size
+    text = "".join(segments[n] for n in range(first, last + 1))
+    offset = first * size
+    return text[start - offset : end - offset]
+
+
+def decode_document(value: str) -> str | None:
+    """The text stored as ``value``, or ``None`` if it can't be read."""
+    if not value.startswith("\x00"):
+        return value
+    try:
+        if value.startswith(ZLIB_PREFIX):
+            data = base64.b64decode(value[len(ZLIB_PREFIX) :])
+            return zlib.decompress(data).decode()
+        zstandard = _zstandard()
+        if value.startswith(ZSTD_PREFIX) and zstandard is not None:
+            data = base64.b64decode(value[len(ZSTD_PREFIX) :])
+            return zstandard.ZstdDecompressor().decompress(data).decode()
+    except Exception as exc:
+        logger.warning("unreadable cached document: %s", exc)
+        return None
+    logger.warning("cached document uses an unavailable codec")
+    return None
@@ -45,6 +45,14 @@ class UpstreamCourtListenerError(ToolError):
         self.status = status
 
 
+class ExtractionTimeoutError(ToolError):
+    """Local eyecite extraction ran past ``MCP_EXTRACTION_TIMEOUT``."""
+
+    def __init__(self, message: str, tool_name: str) -> None:
+        super().__init__(message)
+        self.tool_name = tool_name
+
+
 def validation_error_fields(exc: ValidationError) -> list[str]:
     """Top-level field names that failed validation."""
     return sorted(
@@ -64,6 +72,7 @@ def before_send(event, hint):
     - UnauthorizedToolErrors tagged by tool.
     - UpstreamCourtListenerErrors keyed by status, tagged by tool and status.
     - SessionDataNotFoundErrors tagged by tool and field.
+    - ExtractionTimeoutErrors tagged by tool.
     """
     exc_info = hint.get("exc_info")
     exc = exc_info[1] if exc_info is not None else None
@@ -88,6 +97,9 @@ def before_send(event, hint):
                 "upstream_status": exc.status,
             }
         )
+    elif isinstance(exc, ExtractionTimeoutError):
+        event["fingerprint"] = ["citation-extraction-timeout"]
+        event.setdefault("tags", {}).update({"tool": exc.tool_name})
     elif isinstance(exc, ToolArgumentValidationError):
         event["fingerprint"] = ["tool-argument-validation"]
         event.setdefault("tags", {}).update(
@@ -0,0 +1,116 @@
+"""Citation extraction off the event loop.
+
+eyecite's ``get_citations`` and ``resolve_citations`` are CPU-bound: a
+long opinion takes seconds, and a tool handler calling them directly
+stalls every other request on the worker meanwhile. The citation tools
+call :func:`extract_and_resolve` instead, which runs both in a pool chosen
+by ``MCP_EXTRACTION_EXECUTOR``.
+
+With the default process pool, the text is pickled to a worker once and
+the citations and their resolutions come back in a single pickle, so
+the objects they share (including eyecite's parsed document) are copied
+once and keep their identity. The functions the workers run live in
+:mod:`courtlistener.mcp.eyecite_worker`, so starting a worker doesn't
+import the MCP server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import (
+    BrokenExecutor,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import TYPE_CHECKING, Any
+
+from courtlistener.mcp import settings
+from courtlistener.mcp.exceptions import ExtractionTimeoutError
+from courtlistener.mcp.eyecite_worker import extract_citations, warm_up
+
+if TYPE_CHECKING:
+    from eyecite.models import CitationBase
+
+logger = logging.getLogger(__name__)
+
+EXECUTORS = ("process", "thread", "inline")
+
+
+_executor: Executor | None = None
+
+
+def get_extraction_executor() -> Executor | None:
+    """Return the process-wide extraction pool, creating it on first use.
+
+    ``None`` when ``MCP_EXTRACTION_EXECUTOR`` is ``inline``. Worker
+    processes are spawned rather than forked, since forking a process
+    that runs an event loop and threads isn't safe.
+    """
+    global _executor
+    kind = settings.EXTRACTION_EXECUTOR
+    if kind not in EXECUTORS:
+        raise ValueError(
+            f"MCP_EXTRACTION_EXECUTOR must be one of {', '.join(EXECUTORS)}, "
+            f"not {kind!r}."
+        )
+    if _executor is None and kind == "process":
+        _executor = ProcessPoolExecutor(
+            settings.EXTRACTION_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=warm_up,
+        )
+    elif _executor is None and kind == "thread":
+        _executor = ThreadPoolExecutor(
+            settings.EXTRACTION_WORKERS, thread_name_prefix="eyecite"
+        )
+    return _executor
+
+
+def set_extraction_executor(executor: Executor | None) -> None:
+    """Replace the process-wide extraction pool (for tests)."""
+    global _executor
+    _executor = executor
+
+
+async def extract_and_resolve(
+    text: str, *, resolve: bool = True, tool_name: str
+) -> tuple[list[CitationBase], Any]:
+    """Extract ``text``'s citations, and their resolutions if ``resolve``.
+
+    Returns ``(cites, resolutions)``, as from eyecite's ``get_citations``
+    and ``resolve_citations``; ``resolutions`` is ``None`` when not
+    resolving or when there are no citations.
+
+    Raises:
+        ExtractionTimeoutError: If extraction takes longer than
+            ``MCP_EXTRACTION_TIMEOUT``. The pool drops the job if it
+            hasn't started; one already running finishes in the
+            background and its result is discarded.
+    """
+    executor = get_extraction_executor()
+    if executor is None:
+        return extract_citations(text, resolve)
+    loop = asyncio.get_running_loop()
+    try:
+        return await asyncio.wait_for(
+            loop.run_in_executor(executor, extract_citations, text, resolve),
+            settings.EXTRACTION_TIMEOUT_SECONDS,
+        )
+    except asyncio.TimeoutError:
+        raise ExtractionTimeoutError(
+            "Citation extraction took longer than "
+            f"{settings.EXTRACTION_TIMEOUT_SECONDS:g} seconds. Try a "
+            "shorter text.",
+            tool_name=tool_name,
+        ) from None
+    except BrokenExecutor:
+        # A worker process died (e.g. out of memory), which breaks the
+        # whole pool; start a fresh one on the next call.
+        logger.warning("citation extraction pool broke; replacing it")
+        if _executor is executor:
+            set_extraction_executor(None)
+            executor.shutdown(wait=False)
+        raise
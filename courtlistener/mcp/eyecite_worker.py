@@ -0,0 +1,29 @@
+"""The eyecite calls that run in the extraction pool's worker processes.
+
+Spawned workers import this module to unpickle each job's function, so
+it imports nothing from the MCP server (fastmcp, the session store,
+the tools) and only pulls in eyecite.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from eyecite.models import CitationBase
+
+
+def extract_citations(
+    text: str, resolve: bool
+) -> tuple[list[CitationBase], Any]:
+    """Run eyecite on ``text``; runs in the pool."""
+    from eyecite import get_citations, resolve_citations
+
+    cites = get_citations(text)
+    resolutions = resolve_citations(cites) if resolve and cites else None
+    return cites, resolutions
+
+
+def warm_up() -> None:
+    """Import eyecite when a worker process starts, not on its first job."""
+    import eyecite  # noqa: F401
@@ -19,12 +19,12 @@ from courtlistener.mcp.exceptions import (
     UpstreamCourtListenerError,
 )
 from courtlistener.mcp.session import get_session, json_default
-from courtlistener.mcp.tools import MCP_TOOLS
+from courtlistener.mcp.tools import MCP_TOOLS, list_tools
 
 
 class ToolHandlerMiddleware(Middleware):
     async def on_list_tools(self, context: MiddlewareContext, call_next):
-        return [mcp_tool.get_tool() for mcp_tool in MCP_TOOLS.values()]
+        return list_tools()
 
     async def on_call_tool(self, context: MiddlewareContext, call_next):
         name = context.message.name
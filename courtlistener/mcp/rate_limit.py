@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+
+from redis.commands.core import Script
+
+from courtlistener import AsyncCourtListener, RateLimiter
+from courtlistener.mcp import settings
+from courtlistener.mcp.session import (
+    RedisSession,
+    TieredSession,
+    degrade_on_connection_error,
+    get_session,
+    user_hash,
+)
+
+# Atomically refill the bucket from Redis' clock, take one token and
+# return the wait in seconds. The balance may go negative: that is the
+# queue of callers that already reserved a future token.
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local tokens = tonumber(redis.call('HGET', KEYS[1], 'tokens')) or burst
+local updated_at = tonumber(redis.call('HGET', KEYS[1], 'ts')) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated_at) * rate)
+tokens = tokens - 1
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil((burst - tokens) / rate) + 1)
+if tokens >= 0 then
+    return '0'
+end
+return tostring(-tokens / rate)
+"""
+
+_limiters: OrderedDict[str, RateLimiter] = OrderedDict()
+
+
+class RedisRateLimiter(RateLimiter):
+    """Token bucket kept in Redis so every worker shares one budget.
+
+    ``aacquire`` goes through the session's async client and ``acquire``
+    through its blocking one, so both draw on the same bucket. The script
+    is registered once per client and then run by its SHA.
+    """
+
+    def __init__(
+        self,
+        session: RedisSession,
+        key: str,
+        requests: float,
+        per: float = 1.0,
+        burst: int | None = None,
+    ) -> None:
+        super().__init__(requests, per=per, burst=burst)
+        self._session = session
+        self._key = key
+        self._script = session.client.register_script(TOKEN_BUCKET_SCRIPT)
+        # Registered on first use, so async-only workers never open a
+        # blocking connection pool.
+        self._sync_script: Script | None = None
+
+    def _args(self) -> list[str]:
+        return [str(self.rate), str(self.burst)]
+
+    def reserve(self) -> float:
+        if self._sync_script is None:
+            self._sync_script = self._session.sync_client.register_script(
+                TOKEN_BUCKET_SCRIPT
+            )
+        with degrade_on_connection_error("rate limit"):
+            return float(
+                self._sync_script(keys=[self._key], args=self._args())
+            )
+        return 0.0
+
+    async def aacquire(self) -> None:
+        delay = 0.0
+        with degrade_on_connection_error("rate limit"):
+            delay = float(
+                await self._script(keys=[self._key], args=self._args())
+            )
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def get_rate_limiter(client: AsyncCourtListener) -> RateLimiter | None:
+    """Return the limiter for the current user, or None when disabled.
+
+    The budget is per user, matching how CourtListener rate-limits. With
+    Redis it is shared by all workers; otherwise by this process. Each
+    worker keeps the limiters of the ``MCP_RATE_LIMIT_MAX_USERS`` most
+    recently active users.
+    """
+    if not settings.RATE_LIMIT_PER_MINUTE:
+        return None
+    key = f"mcp:ratelimit:{user_hash(client)}"
+    limiter = _limiters.get(key)
+    if limiter is not None:
+        _limiters.move_to_end(key)
+        return limiter
+    session = get_session()
+    if isinstance(session, TieredSession):
+        session = session.backend
+    if isinstance(session, RedisSession):
+        limiter = RedisRateLimiter(
+            session,
+            key,
+            settings.RATE_LIMIT_PER_MINUTE,
+            per=60,
+            burst=settings.RATE_LIMIT_BURST,
+        )
+    else:
+        limiter = RateLimiter(
+            settings.RATE_LIMIT_PER_MINUTE,
+            per=60,
+            burst=settings.RATE_LIMIT_BURST,
+        )
+    _limiters[key] = limiter
+    while len(_limiters) > settings.RATE_LIMIT_MAX_USERS:
+        _limiters.popitem(last=False)
+    return limiter
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from courtlistener.cache import MemoryCache, RedisCache, ResponseCache
+from courtlistener.mcp import settings
+
+_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache | None:
+    """Return the process-wide API response cache, if enabled.
+
+    Redis-backed when ``REDIS_URL`` is set, so every worker revalidates
+    against the same entries; otherwise an in-process LRU.
+    """
+    global _cache
+    if _cache is None and settings.RESPONSE_CACHE_ENABLED:
+        if settings.REDIS_URL:
+            _cache = RedisCache(
+                settings.REDIS_URL,
+                ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+                prefix="mcp:response:",
+            )
+        else:
+            _cache = MemoryCache(settings.RESPONSE_CACHE_MAX_BYTES)
+    return _cache
+
+
+def set_response_cache(cache: ResponseCache | None) -> None:
+    """Replace the process-wide API response cache (for tests)."""
+    global _cache
+    _cache = cache
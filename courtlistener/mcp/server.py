@@ -1,4 +1,5 @@
 import base64
+from contextlib import asynccontextmanager
 
 from fastmcp import FastMCP
 from fastmcp.server.middleware.caching import ResponseCachingMiddleware
@@ -27,10 +28,34 @@ from courtlistener.mcp.settings import (
     OAUTH_ISSUER,
     OPENAI_APPS_CHALLENGE_TOKEN,
     REDIS_URL,
+    WARM_UP_TOOLS,
 )
+from courtlistener.mcp.tools import warm_up_tools
+from courtlistener.mcp.tools.citation_worker import get_citation_worker
 
 
-def create_mcp_server(**kwargs):
+@asynccontextmanager
+async def lifespan(server):
+    """Stop background citation jobs when the server shuts down."""
+    try:
+        yield {}
+    finally:
+        worker = get_citation_worker()
+        if worker is not None:
+            await worker.aclose()
+
+
+def create_mcp_server(*, warm_up: bool = False, **kwargs):
+    """Build the CourtListener MCP server.
+
+    Args:
+        warm_up: Build every tool's schema now rather than on the first
+            ``tools/list``.
+        **kwargs: Passed to ``FastMCP``.
+    """
+    if warm_up:
+        warm_up_tools()
+
     assets_dir = BASE_DIR / "mcp" / "assets"
     favicon_svg_path = assets_dir / "favicon.svg"
     favicon_ico_path = assets_dir / "favicon.ico"
@@ -61,6 +86,7 @@ def create_mcp_server(**kwargs):
                 sizes=["180x180"],
             ),
         ],
+        lifespan=lifespan,
         **kwargs,
     )
 
@@ -153,6 +179,7 @@ def create_http_app():
         raise ValueError("REDIS_URL is required for HTTP mode")
     redis_store = RedisStore(url=REDIS_URL)
     mcp = create_mcp_server(
+        warm_up=WARM_UP_TOOLS,
         session_state_store=redis_store,
         auth=CourtListenerAuthProvider(
             token_verifier=CourtListenerTokenVerifier(base_url=MCP_BASE_URL),
@@ -1,27 +1,38 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import hmac
-import json
 import logging
 import time
-from collections.abc import Iterator
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
 from datetime import date, datetime
-from typing import Any
+from typing import Any, cast
 
 import redis.asyncio as redis
 from fastmcp.server.dependencies import get_access_token
+from redis import Redis as SyncRedis
 
 from courtlistener import AsyncCourtListener
 from courtlistener.mcp import settings
 from courtlistener.mcp.auth_types import TokenInfo, TokenKind
+from courtlistener.mcp.documents import (
+    aencode_document,
+    decode_document,
+    read_index,
+    segments_for,
+    slice_segments,
+)
 from courtlistener.mcp.settings import (
     DOCUMENT_TTL_SECONDS,
     MCP_SECRET_BYTES,
     SESSION_TTL_SECONDS,
     TOKEN_CACHE_TTL_SECONDS,
 )
+from courtlistener.serialization import dumps, loads
 
 logger = logging.getLogger(__name__)
 
@@ -73,20 +84,28 @@ class Session:
     async def _delete(self, key: str) -> None:
         raise NotImplementedError("_delete must be implemented by subclass")
 
+    async def _get_many(self, keys: Sequence[str]) -> list[str | None]:
+        return [await self._get(key) for key in keys]
+
+    async def _set_many(self, items: dict[str, str], ttl_seconds: int) -> None:
+        """Store ``items`` in order; subclasses may batch the writes."""
+        for key, value in items.items():
+            await self._set(key, value, ttl_seconds)
+
     async def _get_user_scoped(
         self, client: AsyncCourtListener, suffix: str
     ) -> Any:
         raw = await self._get(f"mcp:{user_hash(client)}:{suffix}")
         if raw is None:
             return None
-        return json.loads(raw)
+        return loads(raw)
 
     async def _set_user_scoped(
         self, client: AsyncCourtListener, suffix: str, value: Any
     ) -> None:
         await self._set(
             f"mcp:{user_hash(client)}:{suffix}",
-            json.dumps(value, default=json_default),
+            dumps(value, default=json_default),
             SESSION_TTL_SECONDS,
         )
 
@@ -110,15 +129,84 @@ class Session:
     ) -> None:
         await self._set_user_scoped(client, f"citation:{job_id}", data)
 
+    async def get_citation_reported(
+        self, job_id: str, client: AsyncCourtListener
+    ) -> list[str] | None:
+        """Citations of a job already shown by ``resume_citation_analysis``.
+
+        Kept apart from the job record, which a background worker may be
+        writing at the same time.
+        """
+        return await self._get_user_scoped(
+            client, f"citation:{job_id}:reported"
+        )
+
+    async def store_citation_reported(
+        self, job_id: str, keys: list[str], client: AsyncCourtListener
+    ) -> None:
+        await self._set_user_scoped(
+            client, f"citation:{job_id}:reported", keys
+        )
+
     async def get_document(self, doc_type: str, doc_id: int) -> str | None:
-        return await self._get(f"mcp:doc:{doc_type}:{doc_id}")
+        found = await self.get_document_ranges(doc_type, doc_id)
+        if found is None:
+            return None
+        return found[1][0]
+
+    async def get_document_ranges(
+        self,
+        doc_type: str,
+        doc_id: int,
+        ranges: Sequence[tuple[int, int]] | None = None,
+    ) -> tuple[int, list[str]] | None:
+        """Return a cached document's length and the text in ``ranges``.
+
+        Each range is a ``[start, end)`` pair of character offsets and
+        may run past the end of the document; omit ``ranges`` for the
+        whole text. Only the segments covering the ranges are fetched.
+        Returns ``None`` on a miss, including when a segment has expired.
+        """
+        key = f"mcp:doc:{doc_type}:{doc_id}"
+        raw = await self._get(key)
+        if raw is None:
+            return None
+        index = read_index(raw)
+        if index is None:
+            text = decode_document(raw)
+            if text is None:
+                return None
+            if ranges is None:
+                return len(text), [text]
+            return len(text), [text[start:end] for start, end in ranges]
+
+        total_chars = index["total_chars"]
+        if ranges is None:
+            ranges = [(0, total_chars)]
+        needed = segments_for(ranges, index)
+        segments: dict[int, str] = {}
+        values = await self._get_many([f"{key}:{n}" for n in needed])
+        for n, value in zip(needed, values, strict=True):
+            segment = None if value is None else decode_document(value)
+            if segment is None:
+                return None
+            segments[n] = segment
+        return total_chars, [
+            slice_segments(segments, start, end, index)
+            for start, end in ranges
+        ]
 
     async def store_document(
         self, doc_type: str, doc_id: int, text: str
     ) -> None:
+        values = await aencode_document(text)
+        if values is None:
+            return
         # Not user-scoped so that fetched documents are shared across users.
-        await self._set(
-            f"mcp:doc:{doc_type}:{doc_id}", text, DOCUMENT_TTL_SECONDS
+        key = f"mcp:doc:{doc_type}:{doc_id}"
+        await self._set_many(
+            {f"{key}{suffix}": value for suffix, value in values.items()},
+            DOCUMENT_TTL_SECONDS,
         )
 
     async def get_token_info(
@@ -128,14 +216,14 @@ class Session:
         raw = await self._get(token_info_key(token, kind))
         if raw is None:
             return None
-        return json.loads(raw)
+        return loads(raw)
 
     async def store_token_info(
         self, token: str, kind: TokenKind, info: TokenInfo
     ) -> None:
         await self._set(
             token_info_key(token, kind),
-            json.dumps(info),
+            dumps(info),
             TOKEN_CACHE_TTL_SECONDS,
         )
 
@@ -162,6 +250,7 @@ class RedisSession(Session):
     def __init__(self, url: str) -> None:
         self._url = url
         self._client: redis.Redis | None = None
+        self._sync_client: SyncRedis | None = None
 
     @property
     def client(self) -> redis.Redis:
@@ -171,6 +260,15 @@ class RedisSession(Session):
             )
         return self._client
 
+    @property
+    def sync_client(self) -> SyncRedis:
+        """A blocking client on the same server, for sync callers."""
+        if self._sync_client is None:
+            self._sync_client = SyncRedis.from_url(
+                self._url, decode_responses=True, protocol=3
+            )
+        return self._sync_client
+
     async def _get(self, key: str) -> str | None:
         with degrade_on_connection_error("get"):
             return await self.client.get(key)
@@ -184,28 +282,269 @@ class RedisSession(Session):
         with degrade_on_connection_error("delete"):
             await self.client.delete(key)
 
+    async def _get_many(self, keys: Sequence[str]) -> list[str | None]:
+        if not keys:
+            return []
+        with degrade_on_connection_error("mget"):
+            # decode_responses=True, so values are str.
+            return cast(list[str | None], await self.client.mget(keys))
+        return [None] * len(keys)
 
-class InMemorySession(Session):
-    """Dict-backed session storage for local/stdio use without Redis."""
+    async def _set_many(self, items: dict[str, str], ttl_seconds: int) -> None:
+        with degrade_on_connection_error("set"):
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(key, value, ex=ttl_seconds)
+                await pipe.execute()
 
-    def __init__(self) -> None:
-        self._data: dict[str, tuple[str, float]] = {}
+
+class InMemorySession(Session):
+    """Dict-backed session storage for local/stdio use without Redis.
+
+    Entries are kept in LRU order and evicted once there are more than
+    ``max_entries`` of them or their keys and values exceed ``max_bytes``
+    characters in total (about a byte each: stored values are JSON,
+    document text, or base64). Either cap can be ``0`` to turn it off.
+    Expired entries are dropped when read and by a sweep every
+    ``sweep_interval`` seconds, run on the event loop of the first write.
+
+    ``hits``, ``misses``, ``evictions`` and ``size`` describe the store;
+    :meth:`stats` returns them together.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        sweep_interval: float | None = None,
+    ) -> None:
+        self.max_entries = (
+            settings.SESSION_MAX_ENTRIES
+            if max_entries is None
+            else max_entries
+        )
+        self.max_bytes = (
+            settings.SESSION_MAX_BYTES if max_bytes is None else max_bytes
+        )
+        self.sweep_interval = (
+            settings.SESSION_SWEEP_SECONDS
+            if sweep_interval is None
+            else sweep_interval
+        )
+        if self.max_entries < 0 or self.max_bytes < 0:
+            raise ValueError("Session caps must be zero or positive.")
+        self._data: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._sweeper: asyncio.Task | None = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
 
     async def _get(self, key: str) -> str | None:
         entry = self._data.get(key)
         if entry is None:
+            self.misses += 1
             return None
         value, expires_at = entry
         if time.monotonic() >= expires_at:
-            del self._data[key]
+            self._remove(key)
+            self.misses += 1
             return None
+        self._data.move_to_end(key)
+        self.hits += 1
         return value
 
     async def _set(self, key: str, value: str, ttl_seconds: int) -> None:
+        self._start_sweeper()
+        self._remove(key)
+        entry_size = len(key) + len(value)
+        if self.max_bytes and entry_size > self.max_bytes:
+            return
         self._data[key] = (value, time.monotonic() + ttl_seconds)
+        self.size += entry_size
+        while (self.max_entries and len(self._data) > self.max_entries) or (
+            self.max_bytes and self.size > self.max_bytes
+        ):
+            evicted, (evicted_value, _) = self._data.popitem(last=False)
+            self.size -= len(evicted) + len(evicted_value)
+            self.evictions += 1
+
+    async def _delete(self, key: str) -> None:
+        self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self.size -= len(key) + len(entry[0])
+
+    def sweep(self) -> int:
+        """Drop every expired entry and return how many there were."""
+        now = time.monotonic()
+        expired = [
+            key
+            for key, (_, expires_at) in self._data.items()
+            if now >= expires_at
+        ]
+        for key in expired:
+            self._remove(key)
+        return len(expired)
+
+    def stats(self) -> dict[str, int]:
+        """The counters, entry count and size, e.g. for logging."""
+        return {
+            "entries": len(self._data),
+            "size": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _start_sweeper(self) -> None:
+        if self.sweep_interval <= 0:
+            return
+        if self._sweeper is not None and not self._sweeper.done():
+            return
+        self._sweeper = asyncio.get_running_loop().create_task(
+            self._sweep_periodically()
+        )
+
+    async def _sweep_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            expired = self.sweep()
+            if expired:
+                logger.debug("swept %d expired session entries", expired)
+
+
+INVALIDATION_CHANNEL = "mcp:session:invalidate"
+
+# Values under these prefixes never change once written under a key, so
+# a per-process copy can't go stale except by deletion. Token info is not
+# one of them: a revoked token must stop working on every worker.
+IMMUTABLE_KEY_PREFIXES = ("mcp:doc:",)
+
+
+class TieredSession(Session):
+    """A bounded per-process cache in front of a ``RedisSession``.
+
+    Reads are served from the local cache (an :class:`InMemorySession`
+    whose entries live at most ``ttl_seconds``) and fall through to
+    Redis; writes go to Redis, then to the local cache. Deletes drop the
+    local copy. The wrapped session is ``backend``, for callers that
+    need Redis itself.
+
+    Without ``invalidation`` only documents are cached locally, since
+    another worker may update query or citation state, or invalidate a
+    token, at any time. With it, every write and delete is published on
+    ``INVALIDATION_CHANNEL`` and the other workers drop their copy, so
+    all keys are cached; a worker's local copy is cleared whenever its
+    subscription has to be restarted.
+    """
+
+    def __init__(
+        self,
+        backend: RedisSession,
+        ttl_seconds: float,
+        max_bytes: int,
+        invalidation: bool = False,
+    ) -> None:
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.invalidation = invalidation
+        self.local = InMemorySession(max_bytes=max_bytes)
+        self._id = uuid.uuid4().hex
+        self._listener: asyncio.Task | None = None
+
+    def _cacheable(self, key: str) -> bool:
+        return self.invalidation or key.startswith(IMMUTABLE_KEY_PREFIXES)
+
+    async def _remember(
+        self, key: str, value: str, ttl_seconds: float | None = None
+    ) -> None:
+        if ttl_seconds is not None:
+            ttl_seconds = min(ttl_seconds, self.ttl_seconds)
+        else:
+            ttl_seconds = self.ttl_seconds
+        await self.local._set(key, value, max(1, int(ttl_seconds)))
+
+    async def _get(self, key: str) -> str | None:
+        if not self._cacheable(key):
+            return await self.backend._get(key)
+        self._start_listener()
+        value = await self.local._get(key)
+        if value is None:
+            value = await self.backend._get(key)
+            if value is not None:
+                await self._remember(key, value)
+        return value
+
+    async def _get_many(self, keys: Sequence[str]) -> list[str | None]:
+        self._start_listener()
+        values: list[str | None] = [
+            await self.local._get(key) if self._cacheable(key) else None
+            for key in keys
+        ]
+        missing = [i for i, value in enumerate(values) if value is None]
+        if missing:
+            fetched = await self.backend._get_many([keys[i] for i in missing])
+            for i, value in zip(missing, fetched, strict=True):
+                values[i] = value
+                if value is not None and self._cacheable(keys[i]):
+                    await self._remember(keys[i], value)
+        return values
+
+    async def _set(self, key: str, value: str, ttl_seconds: int) -> None:
+        await self.backend._set(key, value, ttl_seconds)
+        if self._cacheable(key):
+            await self._remember(key, value, ttl_seconds)
+        await self._publish([key])
+
+    async def _set_many(self, items: dict[str, str], ttl_seconds: int) -> None:
+        await self.backend._set_many(items, ttl_seconds)
+        for key, value in items.items():
+            if self._cacheable(key):
+                await self._remember(key, value, ttl_seconds)
+        await self._publish(list(items))
 
     async def _delete(self, key: str) -> None:
-        self._data.pop(key, None)
+        await self.local._delete(key)
+        await self.backend._delete(key)
+        await self._publish([key])
+
+    async def _publish(self, keys: list[str]) -> None:
+        if not self.invalidation:
+            return
+        with degrade_on_connection_error("publish"):
+            await self.backend.client.publish(
+                INVALIDATION_CHANNEL, dumps([self._id, keys])
+            )
+
+    def _start_listener(self) -> None:
+        if not self.invalidation:
+            return
+        if self._listener is not None and not self._listener.done():
+            return
+        # Anything cached while unsubscribed may have missed an update.
+        self.local._data.clear()
+        self.local.size = 0
+        self._listener = asyncio.get_running_loop().create_task(self._listen())
+
+    async def _listen(self) -> None:
+        pubsub = self.backend.client.pubsub()
+        try:
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                sender, keys = loads(message["data"])
+                if sender == self._id:
+                    continue
+                for key in keys:
+                    await self.local._delete(key)
+        except (redis.ConnectionError, redis.TimeoutError) as exc:
+            logger.error("session invalidation subscription failed: %s", exc)
+        finally:
+            await pubsub.aclose()
 
 
 _session: Session | None = None
@@ -218,6 +557,13 @@ def get_session() -> Session:
         url = settings.REDIS_URL
         if url:
             _session = RedisSession(url)
+            if settings.SESSION_L1_TTL_SECONDS > 0:
+                _session = TieredSession(
+                    _session,
+                    ttl_seconds=settings.SESSION_L1_TTL_SECONDS,
+                    max_bytes=settings.SESSION_L1_MAX_BYTES,
+                    invalidation=settings.SESSION_L1_INVALIDATION,
+                )
         else:
             logger.warning(
                 "REDIS_URL is not set; using in-memory sessions. State "
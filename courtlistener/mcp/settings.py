@@ -47,12 +47,121 @@ TOKEN_CACHE_TTL_SECONDS = int(os.getenv("MCP_TOKEN_CACHE_TTL", "600"))
 # Session-scoped state (query pagination, citation jobs) lives this long.
 SESSION_TTL_SECONDS = 3600  # 1 hour
 
+# Caps on the in-memory session store used without Redis. The least
+# recently used entries are evicted past either cap (0 turns a cap off),
+# and expired entries are swept every SESSION_SWEEP_SECONDS.
+SESSION_MAX_ENTRIES = int(os.getenv("MCP_SESSION_MAX_ENTRIES", "10000"))
+SESSION_MAX_BYTES = int(
+    os.getenv("MCP_SESSION_MAX_BYTES", str(256 * 1024 * 1024))
+)
+SESSION_SWEEP_SECONDS = float(os.getenv("MCP_SESSION_SWEEP_SECONDS", "60"))
+
+# With Redis, each worker can keep recently read documents in a bounded
+# local cache for SESSION_L1_TTL_SECONDS (0 turns it off). With
+# SESSION_L1_INVALIDATION, writes and deletes are broadcast over Redis
+# pub/sub so other workers drop their copies, and query state and token
+# verifications are cached too.
+SESSION_L1_TTL_SECONDS = float(os.getenv("MCP_SESSION_L1_TTL", "0"))
+SESSION_L1_MAX_BYTES = int(
+    os.getenv("MCP_SESSION_L1_MAX_BYTES", str(64 * 1024 * 1024))
+)
+SESSION_L1_INVALIDATION = (
+    os.getenv("MCP_SESSION_L1_INVALIDATION", "false").lower() == "true"
+)
+
 # How long a cached document lives in the session store (shared across users).
 DOCUMENT_TTL_SECONDS = 86400  # 24 hours
 
+# Cached documents of at least DOCUMENT_COMPRESSION_MIN_BYTES are stored
+# compressed: "auto" uses zstd when the zstandard package is installed,
+# else zlib; "zstd", "zlib" or "none" force a choice. Documents stored
+# larger than DOCUMENT_MAX_BYTES are not cached at all. Documents of at
+# least DOCUMENT_COMPRESSION_THREAD_CHARS characters are compressed in a
+# worker thread rather than on the event loop.
+DOCUMENT_COMPRESSION = os.getenv("MCP_DOCUMENT_COMPRESSION", "auto").lower()
+DOCUMENT_COMPRESSION_MIN_BYTES = int(
+    os.getenv("MCP_DOCUMENT_COMPRESSION_MIN_BYTES", "4096")
+)
+DOCUMENT_MAX_BYTES = int(
+    os.getenv("MCP_DOCUMENT_MAX_BYTES", str(8 * 1024 * 1024))
+)
+DOCUMENT_COMPRESSION_THREAD_CHARS = int(
+    os.getenv("MCP_DOCUMENT_COMPRESSION_THREAD_CHARS", "262144")
+)
+
+# Cached documents longer than this many characters are stored as
+# segments, so reading a chunk only transfers the segments it overlaps.
+# A multiple of read_document's default chunk size (8000).
+DOCUMENT_SEGMENT_CHARS = int(os.getenv("MCP_DOCUMENT_SEGMENT_CHARS", "32000"))
+
 # Timeout for the upstream calls made during token verification.
 VERIFICATION_TIMEOUT_SECONDS = 20
 
+# Build every tool schema when an HTTP worker starts, instead of on the
+# first tools/list request.
+WARM_UP_TOOLS = os.getenv("MCP_WARM_UP_TOOLS", "true").lower() == "true"
+
+# Connection pool shared by every tool call in a worker process.
+HTTP_MAX_CONNECTIONS = int(os.getenv("MCP_HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(
+    os.getenv("MCP_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20")
+)
+HTTP_KEEPALIVE_EXPIRY_SECONDS = float(
+    os.getenv("MCP_HTTP_KEEPALIVE_EXPIRY", "30")
+)
+# Negotiate HTTP/2 with the API. Requires the `h2` package.
+HTTP2_ENABLED = os.getenv("MCP_HTTP2", "false").lower() == "true"
+
+# Client-side cap on CourtListener API requests per user per minute,
+# shared across workers through Redis. Unset or 0 disables throttling.
+RATE_LIMIT_PER_MINUTE = float(os.getenv("MCP_RATE_LIMIT_PER_MINUTE") or 0)
+# Requests a user may send back to back; defaults to the per-minute rate.
+RATE_LIMIT_BURST = int(os.getenv("MCP_RATE_LIMIT_BURST") or 0) or None
+# Users whose limiter each worker keeps; the least recently active are
+# dropped, which only refills their bucket when it is kept in-process.
+RATE_LIMIT_MAX_USERS = int(os.getenv("MCP_RATE_LIMIT_MAX_USERS", "10000"))
+
+# Revalidating cache of CourtListener API GET responses, keyed by
+# credential. Stored in Redis when REDIS_URL is set, otherwise in an
+# in-process LRU capped at RESPONSE_CACHE_MAX_BYTES.
+RESPONSE_CACHE_ENABLED = (
+    os.getenv("MCP_RESPONSE_CACHE", "false").lower() == "true"
+)
+RESPONSE_CACHE_MAX_BYTES = int(
+    os.getenv("MCP_RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+)
+RESPONSE_CACHE_TTL_SECONDS = int(os.getenv("MCP_RESPONSE_CACHE_TTL", "86400"))
+
+# Citation-lookup results keyed by normalized citation, so citations
+# verified once aren't sent to the API again. Stored in Redis when
+# REDIS_URL is set, otherwise in an in-process LRU. Not-found results
+# expire sooner, since the case may be added.
+CITATION_CACHE_ENABLED = (
+    os.getenv("MCP_CITATION_CACHE", "true").lower() == "true"
+)
+CITATION_CACHE_TTL_SECONDS = int(os.getenv("MCP_CITATION_CACHE_TTL", "86400"))
+CITATION_CACHE_NEGATIVE_TTL_SECONDS = int(
+    os.getenv("MCP_CITATION_CACHE_NEGATIVE_TTL", "3600")
+)
+
+# Keep verifying the pending citations of large analyze_citations jobs
+# in a background task, so resume_citation_analysis only collects the
+# results.
+CITATION_WORKER_ENABLED = (
+    os.getenv("MCP_CITATION_WORKER", "false").lower() == "true"
+)
+
+# Where eyecite extraction runs: "process" (a pool of worker processes,
+# so parsing a long opinion doesn't hold the event loop or the GIL),
+# "thread", or "inline" on the event loop. The pool runs at most
+# EXTRACTION_WORKERS extractions at once; each is abandoned after
+# EXTRACTION_TIMEOUT_SECONDS.
+EXTRACTION_EXECUTOR = os.getenv("MCP_EXTRACTION_EXECUTOR", "process").lower()
+EXTRACTION_WORKERS = int(os.getenv("MCP_EXTRACTION_WORKERS") or 0) or min(
+    4, os.cpu_count() or 1
+)
+EXTRACTION_TIMEOUT_SECONDS = float(os.getenv("MCP_EXTRACTION_TIMEOUT", "60"))
+
 # Result-count bounds for search/list tools.
 DEFAULT_NUM_RESULTS = 20
 MAX_NUM_RESULTS = 100
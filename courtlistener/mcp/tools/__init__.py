@@ -1,3 +1,7 @@
+import logging
+
+from fastmcp.tools import Tool
+
 from courtlistener.mcp.tools.analyze_citations_tool import (
     AnalyzeCitationsTool,
 )
@@ -32,6 +36,8 @@ from courtlistener.mcp.tools.unsubscribe_from_docket_alert_tool import (
     UnsubscribeFromDocketAlertTool,
 )
 
+logger = logging.getLogger(__name__)
+
 mcp_tool_registry: list[type[MCPTool]] = [
     SearchTool,
     GetEndpointSchemaTool,
@@ -52,3 +58,27 @@ mcp_tool_registry: list[type[MCPTool]] = [
 ]
 
 MCP_TOOLS = {mcp_tool.name: mcp_tool() for mcp_tool in mcp_tool_registry}
+
+
+def list_tools() -> list[Tool]:
+    """The tool definitions answered to every ``tools/list`` request.
+
+    Each definition, including its input schema, is built on first use
+    and reused for the life of the process.
+    """
+    return [mcp_tool.tool for mcp_tool in MCP_TOOLS.values()]
+
+
+def warm_up_tools() -> None:
+    """Build every tool definition and argument validator now.
+
+    Saves the first connecting client from paying for schema
+    generation. A tool that fails to build is logged and left to be
+    built, and fail, on first use as before.
+    """
+    for name, mcp_tool in MCP_TOOLS.items():
+        try:
+            _ = mcp_tool.tool
+            _ = mcp_tool.input_validator
+        except Exception:
+            logger.warning("Couldn't warm up tool %s", name, exc_info=True)
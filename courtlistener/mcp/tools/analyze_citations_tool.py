@@ -2,24 +2,32 @@ from __future__ import annotations
 
 from typing import Any
 
-from eyecite import get_citations, resolve_citations
 from eyecite.models import FullCaseCitation
 from fastmcp.server.context import Context
 from mcp.types import ToolAnnotations
 
+from courtlistener.citations import (
+    MAX_CITATIONS_PER_REQUEST,
+    build_compact_string,
+    canonical_key,
+)
 from courtlistener.exceptions import CourtListenerAPIError
 from courtlistener.mcp.exceptions import ToolArgumentValidationError
+from courtlistener.mcp.extraction import extract_and_resolve
 from courtlistener.mcp.session import get_session
 from courtlistener.mcp.tools.citation_utils import (
-    MAX_CITATIONS_PER_REQUEST,
-    build_compact_string,
-    canonical_key,
+    apply_cached_results,
+    cache_api_results,
     citation_type_label,
     format_analysis,
     format_rate_limit_note,
     input_case_name,
     process_api_results,
 )
+from courtlistener.mcp.tools.citation_worker import (
+    claim,
+    get_citation_worker,
+)
 from courtlistener.mcp.tools.mcp_tool import MCPTool
 from courtlistener.mcp.tools.utils import (
     make_id,
@@ -37,7 +45,9 @@ class AnalyzeCitationsTool(MCPTool):
 
     For documents with more than 250 unique case citations, the first
     batch is verified immediately and a job_id is returned. Use
-    resume_citation_analysis to continue verifying remaining citations.
+    resume_citation_analysis to continue verifying remaining citations
+    (or, when the server verifies them in the background, to collect
+    the results).
 
     Terminology in the output:
 
@@ -153,12 +163,12 @@ class AnalyzeCitationsTool(MCPTool):
 
             # Step 1: Local extraction and resolution
             assert text is not None  # for mypy
-            cites = get_citations(text)
+            cites, resolutions = await extract_and_resolve(
+                text, tool_name=self.name
+            )
             if not cites:
                 return note + "No citations found."
 
-            resolutions = resolve_citations(cites)
-
             # Build per-resource reference info for output
             resource_refs: dict[str, dict] = {}
             for resource, cite_list in resolutions.items():
@@ -217,9 +227,10 @@ class AnalyzeCitationsTool(MCPTool):
                     sendable.append(key)
 
             pending = list(sendable)
+            await apply_cached_results(pending, verified)
 
             rate_limit_detail: Any = None
-            if sendable:
+            if pending:
                 batch = pending[:MAX_CITATIONS_PER_REQUEST]
                 compact_text = build_compact_string(batch)
                 try:
@@ -232,20 +243,27 @@ class AnalyzeCitationsTool(MCPTool):
                     rate_limit_detail = e.detail
                 else:
                     process_api_results(results, batch, verified, pending)
+                    await cache_api_results(results, batch)
 
-            # Step 4: Store in user-scoped session store
+            # Step 4: Store in user-scoped session store, and hand what's
+            # left to the background worker if there is one
             analysis_id = make_id()
+            job: dict[str, Any] = {
+                "resource_refs": resource_refs,
+                "unique_citations": unique_citations,
+                "input_case_names": input_case_names,
+                "verified": verified,
+                "pending": pending,
+                "reported": list(verified),
+            }
+            worker = get_citation_worker() if pending else None
+            if worker is not None:
+                claim(job)
             await get_session().store_citation_analysis(
-                analysis_id,
-                {
-                    "resource_refs": resource_refs,
-                    "unique_citations": unique_citations,
-                    "input_case_names": input_case_names,
-                    "verified": verified,
-                    "pending": pending,
-                },
-                client,
+                analysis_id, job, client
             )
+            if worker is not None:
+                worker.schedule(analysis_id, self.get_client())
 
             # Step 5: Format output
             output = format_analysis(
@@ -257,6 +275,7 @@ class AnalyzeCitationsTool(MCPTool):
                 verified,
                 pending,
                 input_case_names,
+                background=worker is not None,
             )
             if rate_limit_detail is not None:
                 output += "\n\n" + format_rate_limit_note(
@@ -5,12 +5,11 @@ from __future__ import annotations
 import re
 from datetime import datetime, timezone
 from difflib import SequenceMatcher
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from eyecite.models import (
     CitationBase,
     FullCaseCitation,
-    FullCitation,
     FullLawCitation,
     IdCitation,
     ShortCaseCitation,
@@ -23,14 +22,16 @@ from eyecite.models import (
 from eyecite.utils import DISALLOWED_NAMES
 
 from courtlistener.async_client.citation_lookup import parse_wait_until
+from courtlistener.citations import (
+    MAX_CITATIONS_PER_REQUEST,
+    build_compact_string,
+    canonical_key,
+    match_batch_results,
+)
+from courtlistener.mcp.citation_cache import get_citation_cache
 
-# Delimiter used between citations in the compact string sent to the
-# citation-lookup API.  Semicolon-space is a natural Bluebook list
-# separator that eyecite reliably parses without cleanup.
-CITATION_DELIMITER = "; "
-
-# Maximum citations per API request before 429 throttling.
-MAX_CITATIONS_PER_REQUEST = 250
+if TYPE_CHECKING:
+    from courtlistener import AsyncCourtListener
 
 # Similarity below this is flagged as a possible hallucinated citation
 # (volume+reporter+page match, but the case name does not).
@@ -172,12 +173,6 @@ def citation_type_label(cite: CitationBase) -> str:
     return labels.get(type(cite), type(cite).__name__)
 
 
-def canonical_key(cite: FullCitation) -> str:
-    """Canonical key for deduplication: 'volume reporter page'."""
-    g = cite.groups
-    return f"{g['volume']} {g['reporter']} {g['page']}"
-
-
 def format_rate_limit_note(detail: Any, *, resumable_with: str) -> str:
     """Build a one-line note describing the upstream rate limit.
 
@@ -309,11 +304,6 @@ def format_resolved_citations(
     return "\n".join(parts)
 
 
-def build_compact_string(unique_citations: list[str]) -> str:
-    """Join unique citation strings with our delimiter for the API."""
-    return CITATION_DELIMITER.join(unique_citations)
-
-
 def process_api_results(
     results: list[dict],
     batch: list[str],
@@ -403,6 +393,56 @@ def process_api_results(
             pending.remove(key)
 
 
+async def apply_cached_results(
+    pending: list[str], verified: dict[str, dict]
+) -> None:
+    """Verify pending citations from the citation cache, where it can.
+
+    Cached citations are recorded in ``verified`` as if the API had just
+    returned them and removed from ``pending``.
+    """
+    cache = get_citation_cache()
+    if cache is None or not pending:
+        return
+    hits = await cache.aget_many(pending)
+    if hits:
+        results = [{**result, "citation": key} for key, result in hits.items()]
+        process_api_results(results, list(hits), verified, pending)
+
+
+async def cache_api_results(results: list[dict], batch: list[str]) -> None:
+    """Add the API's results for a compact ``batch`` to the citation cache."""
+    cache = get_citation_cache()
+    if cache is None:
+        return
+    for key, result in match_batch_results(results, batch).items():
+        await cache.aset(key, result)
+
+
+async def verify_next_batch(
+    client: AsyncCourtListener, job: dict, *, wait: bool = False
+) -> None:
+    """Verify the next batch of a citation-analysis job's pending citations.
+
+    Citations in the citation cache are verified first, then up to 250
+    of the rest are sent to the API. ``job`` is updated in place.
+
+    Raises:
+        CourtListenerAPIError: If the request fails, including a 429
+            for the whole request (retried once when ``wait`` is set).
+    """
+    pending = job["pending"]
+    await apply_cached_results(pending, job["verified"])
+    if not pending:
+        return
+    batch = pending[:MAX_CITATIONS_PER_REQUEST]
+    results = await client.citation_lookup.lookup_text(
+        build_compact_string(batch), retry_on_rate_limit=wait
+    )
+    process_api_results(results, batch, job["verified"], pending)
+    await cache_api_results(results, batch)
+
+
 def _auto_resolve_identical_clusters(
     clusters: list[dict],
 ) -> dict | None:
@@ -587,6 +627,7 @@ def format_analysis(
     verified: dict[str, dict],
     pending: list[str],
     input_case_names: dict[str, str] | None = None,
+    background: bool = False,
 ) -> str:
     """Format the full analysis output.
 
@@ -636,7 +677,13 @@ def format_analysis(
     verification_line = (
         f"Verification: {verified_count} of {total_unique} verified."
     )
-    if pending_count:
+    if pending_count and background:
+        verification_line += (
+            f" ({pending_count} pending — verifying in the background; "
+            "use resume_citation_analysis "
+            f'with job_id="{analysis_id}" to collect the results)'
+        )
+    elif pending_count:
         verification_line += (
             f" ({pending_count} pending — use resume_citation_analysis "
             f'with job_id="{analysis_id}")'
@@ -704,6 +751,7 @@ def format_resume(
     job_id: str,
     job: dict,
     newly_verified: set[str],
+    background: bool = False,
 ) -> str:
     """Format the resume output showing newly verified citations."""
     verified = job["verified"]
@@ -716,7 +764,13 @@ def format_resume(
     parts = [f"Citation Analysis (Job ID: {job_id}) — Resumed\n"]
 
     parts.append(f"Verification: {len(verified)} of {total} verified.")
-    if pending:
+    if pending and background:
+        parts.append(
+            f"({len(pending)} still pending — verifying in the background; "
+            f'call resume_citation_analysis again with job_id="{job_id}" '
+            "later to collect the results)"
+        )
+    elif pending:
         parts.append(
             f"({len(pending)} still pending — call "
             f'resume_citation_analysis again with job_id="{job_id}")'
@@ -743,6 +797,8 @@ def format_resume(
                     )
                 )
                 idx += 1
+    elif pending and background:
+        parts.append("\nNo new citations verified since the last call.")
     elif pending:
         parts.append(
             "\nNo new citations verified in this batch "
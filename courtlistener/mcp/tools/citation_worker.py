@@ -0,0 +1,161 @@
+"""Background verification of pending citation-analysis jobs.
+
+``analyze_citations`` verifies the first 250 citations of a document
+itself. With ``MCP_CITATION_WORKER`` on, it then hands the job to this
+process's worker, which keeps verifying pending batches as the rate
+limit allows and stores the job after each one, so
+``resume_citation_analysis`` can report progress without calling the
+API.
+
+While a worker holds a job, the job record carries a ``draining_until``
+lease, renewed with every write, and tools leave the job alone. If the
+worker's process stops, the lease lapses and ``resume_citation_analysis``
+verifies the job itself again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+
+from courtlistener import AsyncCourtListener
+from courtlistener.async_client.citation_lookup import (
+    MAX_BATCH_THROTTLE_RETRIES,
+    MAX_RETRY_WAIT_SECONDS,
+    THROTTLE_STATUS,
+)
+from courtlistener.exceptions import CourtListenerAPIError
+from courtlistener.mcp import settings
+from courtlistener.mcp.session import get_session
+from courtlistener.mcp.tools.citation_utils import verify_next_batch
+from courtlistener.retry import parse_wait_until
+
+logger = logging.getLogger(__name__)
+
+# How long a job stays claimed after the worker last stored it. Covers
+# one batch, including a rate-limit retry and a throttled pause.
+LEASE_SECONDS = 300
+
+# Pause after a batch that verified nothing when the API gave no
+# ``wait_until``.
+THROTTLE_PAUSE_SECONDS = 30.0
+
+
+def is_draining(job: dict) -> bool:
+    """Whether a background worker currently holds ``job``."""
+    return job.get("draining_until", 0) > time.time()
+
+
+def claim(job: dict) -> None:
+    """Mark ``job`` as held by a background worker for another lease."""
+    job["draining_until"] = time.time() + LEASE_SECONDS
+
+
+def _pause_seconds(detail: object) -> float:
+    target = parse_wait_until(detail)
+    if target is None:
+        return THROTTLE_PAUSE_SECONDS
+    seconds = (target - datetime.now(timezone.utc)).total_seconds()
+    return max(0.0, min(seconds, MAX_RETRY_WAIT_SECONDS))
+
+
+class CitationWorker:
+    """Drains pending citation-analysis jobs in asyncio tasks."""
+
+    def __init__(self) -> None:
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+
+    def schedule(self, job_id: str, client: AsyncCourtListener) -> None:
+        """Verify ``job_id``'s pending citations in the background.
+
+        The task owns ``client`` and closes it when done. The job must
+        already be stored with a lease from :func:`claim`.
+        """
+        if job_id in self._tasks:
+            return
+        task = asyncio.create_task(self._run(job_id, client))
+        self._tasks[job_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job_id, None))
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    async def join(self) -> None:
+        """Wait for every scheduled job to finish (for tests)."""
+        await asyncio.gather(*self._tasks.values())
+
+    async def aclose(self) -> None:
+        """Stop every job and wait for it to release its lease.
+
+        Called when the server shuts down, so ``resume_citation_analysis``
+        can pick the jobs up right away instead of when their leases
+        lapse.
+        """
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, job_id: str, client: AsyncCourtListener) -> None:
+        async with client:
+            await self.drain(job_id, client)
+
+    async def drain(self, job_id: str, client: AsyncCourtListener) -> None:
+        """Verify batches until nothing is pending, then release the job.
+
+        Gives up, leaving the rest for ``resume_citation_analysis``, after
+        ``MAX_BATCH_THROTTLE_RETRIES`` batches in a row verify nothing,
+        on any error other than a rate limit, or when cancelled.
+        """
+        session = get_session()
+        job = await session.get_citation_analysis(job_id, client)
+        if job is None:
+            return
+        throttled = 0
+        try:
+            try:
+                while (
+                    job["pending"] and throttled < MAX_BATCH_THROTTLE_RETRIES
+                ):
+                    before = len(job["pending"])
+                    pause = THROTTLE_PAUSE_SECONDS
+                    try:
+                        await verify_next_batch(client, job, wait=True)
+                    except CourtListenerAPIError as e:
+                        if e.status_code != THROTTLE_STATUS:
+                            raise
+                        pause = _pause_seconds(e.detail)
+                    claim(job)
+                    await session.store_citation_analysis(job_id, job, client)
+                    if len(job["pending"]) < before:
+                        throttled = 0
+                    else:
+                        throttled += 1
+                        await asyncio.sleep(pause)
+            finally:
+                # Also runs when the task is cancelled at shutdown.
+                job.pop("draining_until", None)
+                await session.store_citation_analysis(job_id, job, client)
+        except Exception:
+            logger.exception(
+                "background verification of citation job %s failed", job_id
+            )
+
+
+_worker: CitationWorker | None = None
+
+
+def get_citation_worker() -> CitationWorker | None:
+    """Return the process-wide citation worker, if enabled."""
+    global _worker
+    if _worker is None and settings.CITATION_WORKER_ENABLED:
+        _worker = CitationWorker()
+    return _worker
+
+
+def set_citation_worker(worker: CitationWorker | None) -> None:
+    """Replace the process-wide citation worker (for tests)."""
+    global _worker
+    _worker = worker
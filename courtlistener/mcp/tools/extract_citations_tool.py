@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from eyecite import get_citations, resolve_citations
 from fastmcp.server.context import Context
 from mcp.types import ToolAnnotations
 
+from courtlistener.mcp.extraction import extract_and_resolve
 from courtlistener.mcp.tools.citation_utils import (
     citation_type_label,
     format_resolved_citations,
@@ -58,7 +58,9 @@ class ExtractCitationsTool(MCPTool):
         text = arguments["text"]
         resolve = arguments.get("resolve", True)
 
-        cites = get_citations(text)
+        cites, resolutions = await extract_and_resolve(
+            text, resolve=resolve, tool_name=self.name
+        )
 
         if not cites:
             return "No citations found."
@@ -73,7 +75,6 @@ class ExtractCitationsTool(MCPTool):
                     lines.append(f'  {i}. [{label}] "{cite.matched_text()}"')
                 output = "\n".join(lines)
         else:
-            resolutions = resolve_citations(cites)
             output = format_resolved_citations(cites, resolutions)
 
         return output
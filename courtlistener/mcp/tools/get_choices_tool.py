@@ -7,7 +7,7 @@ from courtlistener.mcp.exceptions import ToolArgumentValidationError
 from courtlistener.mcp.tools.mcp_tool import MCPTool
 from courtlistener.mcp.tools.utils import endpoint_id_property
 from courtlistener.models import ENDPOINTS
-from courtlistener.utils import did_you_mean
+from courtlistener.utils import did_you_mean, get_choices
 
 
 def related_example(
@@ -83,7 +83,7 @@ class GetChoicesTool(MCPTool):
                 )
 
             extra = getattr(field_info, "json_schema_extra", {}) or {}
-            choices = extra.get("choices", [])
+            choices = get_choices(extra)
             if not choices and get_origin(field_info.annotation) is Literal:
                 # If literal, provide the fixed values
                 values = get_args(field_info.annotation)
@@ -121,9 +121,7 @@ class GetChoicesTool(MCPTool):
                 choice_fields = sorted(
                     name
                     for name, f in endpoint.model_fields.items()
-                    if (getattr(f, "json_schema_extra", None) or {}).get(
-                        "choices"
-                    )
+                    if get_choices(getattr(f, "json_schema_extra", None))
                 )
                 if choice_fields:
                     note += (
@@ -11,7 +11,11 @@ from mcp.types import ToolAnnotations
 
 from courtlistener import AsyncCourtListener
 from courtlistener.mcp.auth_types import TokenKind
+from courtlistener.mcp.citation_cache import get_citation_cache
 from courtlistener.mcp.exceptions import ToolArgumentValidationError
+from courtlistener.mcp.rate_limit import get_rate_limiter
+from courtlistener.mcp.response_cache import get_response_cache
+from courtlistener.mcp.transport import get_transport
 
 
 class MCPTool:
@@ -32,13 +36,30 @@ class MCPTool:
         stdio mode: there is no HTTP layer, so no access token exists;
         the credential is the ``COURTLISTENER_API_TOKEN`` env var,
         resolved by the ``AsyncCourtListener`` constructor.
+
+        Either way the client borrows the worker's shared connection
+        pool, so tool calls reuse open connections to CL instead of
+        paying TCP and TLS setup each time, waits on the user's rate
+        limiter when ``MCP_RATE_LIMIT_PER_MINUTE`` is set, and
+        revalidates cached responses when ``MCP_RESPONSE_CACHE`` is on.
         """
+        transport = get_transport()
         access_token = get_access_token()
         if access_token is not None:
             if access_token.claims.get("token_kind") == TokenKind.API:
-                return AsyncCourtListener(api_token=access_token.token)
-            return AsyncCourtListener(access_token=access_token.token)
-        return AsyncCourtListener()
+                client = AsyncCourtListener(
+                    api_token=access_token.token, transport=transport
+                )
+            else:
+                client = AsyncCourtListener(
+                    access_token=access_token.token, transport=transport
+                )
+        else:
+            client = AsyncCourtListener(transport=transport)
+        client.rate_limiter = get_rate_limiter(client)
+        client.cache = get_response_cache()
+        client.citation_cache = get_citation_cache()
+        return client
 
     def get_tool(self) -> Tool:
         if self.name is None:
@@ -48,10 +69,15 @@ class MCPTool:
         return Tool(
             name=self.name,
             description=self.get_description(),
-            parameters=self.get_input_schema(),
+            parameters=self.input_schema,
             annotations=self.annotations,
         )
 
+    @cached_property
+    def tool(self) -> Tool:
+        """Cached tool definition, as listed to MCP clients."""
+        return self.get_tool()
+
     def get_description(self) -> str:
         return self.__doc__ or ""
 
@@ -6,7 +6,7 @@ from mcp.types import ToolAnnotations
 from courtlistener.mcp.exceptions import ToolArgumentValidationError
 from courtlistener.mcp.tools.mcp_tool import MCPTool
 from courtlistener.mcp.tools.utils import (
-    fetch_document_text,
+    fetch_document_ranges,
     resolve_cluster_opinion_ids,
 )
 
@@ -122,6 +122,14 @@ class ReadDocumentTool(MCPTool):
         chunk_index = arguments.get("chunk_index")
         chunk_size = arguments.get("chunk_size", DEFAULT_CHUNK_SIZE)
 
+        # Only the requested windows are read from the document cache.
+        ranges: list[tuple[int, int]] | None = None
+        if chunk_index is not None:
+            indexes = (
+                chunk_index if isinstance(chunk_index, list) else [chunk_index]
+            )
+            ranges = [(i * chunk_size, (i + 1) * chunk_size) for i in indexes]
+
         siblings: list[int] = []
         async with self.get_client() as client:
             if cluster_id is not None:
@@ -137,7 +145,9 @@ class ReadDocumentTool(MCPTool):
                 doc_type, doc_id = "recap_document", recap_document_id
 
             try:
-                text = await fetch_document_text(doc_type, doc_id, client)
+                found = await fetch_document_ranges(
+                    doc_type, doc_id, client, ranges
+                )
             except Exception as exc:
                 # In cluster mode the resolution already succeeded, so
                 # keep the sibling ids usable instead of losing them to
@@ -157,17 +167,17 @@ class ReadDocumentTool(MCPTool):
         if siblings:
             result["sibling_opinion_ids"] = siblings
 
-        if not text:
+        if found is None:
             result["error"] = "No text is available for this document."
             return result
 
-        total_chars = len(text)
+        total_chars, texts = found
         total_chunks = math.ceil(total_chars / chunk_size)
 
         result["total_chars"] = total_chars
 
         if chunk_index is None:
-            result["text"] = text
+            result["text"] = texts[0]
         elif isinstance(chunk_index, list):
             out_of_range = [i for i in chunk_index if i >= total_chunks]
             if out_of_range:
@@ -181,11 +191,8 @@ class ReadDocumentTool(MCPTool):
             result["chunk_size"] = chunk_size
             result["total_chunks"] = total_chunks
             result["chunks"] = [
-                {
-                    "chunk_index": i,
-                    "text": text[i * chunk_size : (i + 1) * chunk_size],
-                }
-                for i in chunk_index
+                {"chunk_index": i, "text": chunk_text}
+                for i, chunk_text in zip(chunk_index, texts, strict=True)
             ]
         else:
             if chunk_index >= total_chunks:
@@ -196,10 +203,9 @@ class ReadDocumentTool(MCPTool):
                     tool_name=self.name,
                     argument_names=["chunk_index"],
                 )
-            start = chunk_index * chunk_size
             result["chunk_index"] = chunk_index
             result["chunk_size"] = chunk_size
             result["total_chunks"] = total_chunks
-            result["text"] = text[start : start + chunk_size]
+            result["text"] = texts[0]
 
         return result
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from fastmcp.server.context import Context
 from mcp.types import ToolAnnotations
 
@@ -9,11 +11,14 @@ from courtlistener.exceptions import CourtListenerAPIError
 from courtlistener.mcp.exceptions import SessionDataNotFoundError
 from courtlistener.mcp.session import get_session
 from courtlistener.mcp.tools.citation_utils import (
-    MAX_CITATIONS_PER_REQUEST,
-    build_compact_string,
     format_rate_limit_note,
     format_resume,
-    process_api_results,
+    verify_next_batch,
+)
+from courtlistener.mcp.tools.citation_worker import (
+    claim,
+    get_citation_worker,
+    is_draining,
 )
 from courtlistener.mcp.tools.mcp_tool import MCPTool
 
@@ -23,7 +28,9 @@ class ResumeCitationAnalysisTool(MCPTool):
 
     Use this after analyze_citations returns with pending citations
     due to rate limiting (more than 250 unique case citations).
-    Takes the job_id and verifies the next batch.
+    Takes the job_id and verifies the next batch, or, while the server
+    verifies the job in the background, returns the citations verified
+    since the last call without waiting.
     """
 
     name: str = "resume_citation_analysis"
@@ -66,8 +73,9 @@ class ResumeCitationAnalysisTool(MCPTool):
     async def __call__(self, arguments: dict, ctx: Context) -> str:
         job_id = arguments["job_id"]
         wait = bool(arguments.get("wait", False))
+        session = get_session()
         async with self.get_client() as client:
-            job = await get_session().get_citation_analysis(job_id, client)
+            job = await session.get_citation_analysis(job_id, client)
             if job is None:
                 raise SessionDataNotFoundError(
                     f"Job ID {job_id!r} not found. The session may have "
@@ -76,35 +84,42 @@ class ResumeCitationAnalysisTool(MCPTool):
                     argument_name="job_id",
                 )
 
-            pending = job["pending"]
-            if not pending:
+            reported = await session.get_citation_reported(job_id, client)
+            if reported is None:
+                reported = job.get("reported", list(job["verified"]))
+            if not job["pending"] and set(job["verified"]) <= set(reported):
                 return f"Job {job_id!r} is already complete.  All citations processed."
 
-            # Verify next batch
-            batch = pending[:MAX_CITATIONS_PER_REQUEST]
-            compact_text = build_compact_string(batch)
-            try:
-                results = await client.citation_lookup.lookup_text(
-                    compact_text, retry_on_rate_limit=wait
-                )
-            except CourtListenerAPIError as e:
-                if e.status_code != 429:
-                    raise
-                return (
-                    format_resume(job_id, job, set())
-                    + "\n\n"
-                    + format_rate_limit_note(
-                        e.detail,
-                        resumable_with="resume_citation_analysis",
-                    )
+            # Verify next batch, unless a background worker holds the job
+            background = is_draining(job)
+            rate_limit_detail: Any = None
+            if job["pending"] and not background:
+                try:
+                    await verify_next_batch(client, job, wait=wait)
+                except CourtListenerAPIError as e:
+                    if e.status_code != 429:
+                        raise
+                    rate_limit_detail = e.detail
+                worker = get_citation_worker() if job["pending"] else None
+                if worker is not None:
+                    claim(job)
+                    background = True
+                await session.store_citation_analysis(job_id, job, client)
+                if worker is not None:
+                    worker.schedule(job_id, self.get_client())
+
+            newly_verified = set(job["verified"]) - set(reported)
+            if newly_verified:
+                await session.store_citation_reported(
+                    job_id, list(job["verified"]), client
                 )
 
-            previously_verified = set(job["verified"].keys())
-            process_api_results(
-                results, batch, job["verified"], job["pending"]
+            output = format_resume(
+                job_id, job, newly_verified, background=background
             )
-            newly_verified = set(job["verified"].keys()) - previously_verified
-
-            await get_session().store_citation_analysis(job_id, job, client)
-
-            return format_resume(job_id, job, newly_verified)
+            if rate_limit_detail is not None:
+                output += "\n\n" + format_rate_limit_note(
+                    rate_limit_detail,
+                    resumable_with="resume_citation_analysis",
+                )
+            return output
@@ -1,7 +1,9 @@
+import functools
 import json
 import logging
 import re
 import uuid
+from collections.abc import Sequence
 
 import tiktoken
 
@@ -10,6 +12,7 @@ from courtlistener.async_client.resource import AsyncResourceIterator
 from courtlistener.mcp.session import get_session
 from courtlistener.mcp.settings import DEFAULT_NUM_RESULTS
 from courtlistener.models import ENDPOINTS
+from courtlistener.utils import get_choices
 
 logger = logging.getLogger(__name__)
 
@@ -95,19 +98,66 @@ def filter_results_by_fields(
     return filtered, missing
 
 
+# Every token covers at least one byte, so text of at most ``max_tokens``
+# bytes always fits. Choice lists rendered as indented JSON average well
+# under this many bytes per token, so text beyond ``max_tokens`` times
+# this is taken as over budget without running the tokenizer.
+MAX_BYTES_PER_TOKEN_ESTIMATE = 8
+
+_choice_token_counts: dict[tuple[str, str], int] = {}
+
+
+@functools.cache
+def get_encoding() -> tiktoken.Encoding:
+    """The tokenizer used to size tool descriptions, loaded once."""
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens(text: str) -> int:
+    """Number of ``cl100k_base`` tokens in ``text``."""
+    return len(get_encoding().encode(text))
+
+
+def _exceeds_tokens(
+    text: str,
+    max_tokens: int,
+    key: tuple[str, str] | None,
+    estimate: bool,
+) -> bool:
+    if key is not None and key in _choice_token_counts:
+        return _choice_token_counts[key] > max_tokens
+    if estimate:
+        size = len(text.encode())
+        if size <= max_tokens:
+            return False
+        if size > max_tokens * MAX_BYTES_PER_TOKEN_ESTIMATE:
+            return True
+    num_tokens = count_tokens(text)
+    if key is not None:
+        _choice_token_counts[key] = num_tokens
+    return num_tokens > max_tokens
+
+
 def prepare_choices_str(
     choices,
     endpoint_id: str = "",
     field_name: str = "",
     max_tokens=1000,
     snippet_count=5,
+    estimate: bool = True,
 ):
+    """Describe a field's choices in at most about ``max_tokens`` tokens.
+
+    Token counts are remembered per ``(endpoint_id, field_name)``, whose
+    choices never change. With ``estimate``, lists that are clearly
+    under or over budget by size alone skip the tokenizer.
+    """
     if not choices:
         return ""
 
     choices_str = json.dumps(choices, indent=2)
-    num_tokens = len(tiktoken.get_encoding("cl100k_base").encode(choices_str))
-    if num_tokens > max_tokens:
+    key = (endpoint_id, field_name) if endpoint_id and field_name else None
+    if _exceeds_tokens(choices_str, max_tokens, key, estimate):
         snippet = ", ".join(
             f"{c['value']} ({c['display_name']})"
             for c in choices[:snippet_count]
@@ -164,15 +214,15 @@ def strip_schema_keys(node, keys):
 
 def prepare_filter(filter, endpoint_id: str = "", field_name: str = ""):
     choices_str = prepare_choices_str(
-        filter.get("choices"),
+        get_choices(filter),
         endpoint_id=endpoint_id,
         field_name=field_name,
     )
     filter["description"] = (
         filter.get("description", "") + "\n\n" + choices_str
     ).strip()
-    if "choices" in filter:
-        del filter["choices"]
+    filter.pop("choices", None)
+    filter.pop("choices_id", None)
     return strip_schema_keys(
         filter, {"title", "related_class_name", "default"}
     )
@@ -217,6 +267,24 @@ async def fetch_document_text(
     doc_type: str, doc_id: int, client: AsyncCourtListener
 ) -> str | None:
     """Return full document text, fetching from the API on cache miss."""
+    found = await fetch_document_ranges(doc_type, doc_id, client)
+    if found is None:
+        return None
+    return found[1][0]
+
+
+async def fetch_document_ranges(
+    doc_type: str,
+    doc_id: int,
+    client: AsyncCourtListener,
+    ranges: Sequence[tuple[int, int]] | None = None,
+) -> tuple[int, list[str]] | None:
+    """Return a document's length and the text in each ``[start, end)``.
+
+    Cache hits only transfer the stored segments covering ``ranges``
+    (the whole text if omitted); misses fetch the document from the API
+    and cache it. Returns ``None`` if the document has no text.
+    """
     doc_types = {
         "opinion": ("opinions", "html_with_citations"),
         "recap_document": ("recap_documents", "plain_text"),
@@ -225,18 +293,20 @@ async def fetch_document_text(
         raise ValueError(f"Unknown doc_type: {doc_type!r}")
 
     session = get_session()
-    cached = await session.get_document(doc_type, doc_id)
+    cached = await session.get_document_ranges(doc_type, doc_id, ranges)
     if cached is not None:
         return cached
 
     resource_name, field = doc_types[doc_type]
     item = await getattr(client, resource_name).get(doc_id, fields=[field])
     text = item.get(field) or ""
+    if not text:
+        return None
 
-    if text:
-        await session.store_document(doc_type, doc_id, text)
-
-    return text or None
+    await session.store_document(doc_type, doc_id, text)
+    if ranges is None:
+        return len(text), [text]
+    return len(text), [text[start:end] for start, end in ranges]
 
 
 ORDERED_OPINION_TYPES = (
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import httpx
+
+from courtlistener.async_client.transport import create_pooled_transport
+from courtlistener.mcp import settings
+
+_transport: httpx.AsyncBaseTransport | None = None
+
+
+def get_transport() -> httpx.AsyncBaseTransport:
+    """Return the process-wide connection pool, creating it on first use.
+
+    Created lazily so each gunicorn worker builds its own pool after the
+    fork, inside the event loop that will use it.
+    """
+    global _transport
+    if _transport is None:
+        _transport = create_pooled_transport(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            http2=settings.HTTP2_ENABLED,
+        )
+    return _transport
+
+
+def set_transport(transport: httpx.AsyncBaseTransport | None) -> None:
+    """Replace the process-wide connection pool (for tests)."""
+    global _transport
+    _transport = transport
@@ -1,6 +1,6 @@
 import logging
 
-from courtlistener.models.endpoint import Endpoint
+from courtlistener.models.endpoint import Endpoint, EndpointRegistry
 from courtlistener.models.page import Page
 
 try:
@@ -12,12 +12,13 @@ except Exception as exc:
         "You may need to run `scripts/generate_endpoint_models.py` "
         "to generate them."
     )
-    ENDPOINTS = {}
+    ENDPOINTS = EndpointRegistry(__name__, {})
     FILTERS = {}
 
 
 __all__ = [
     "Endpoint",
+    "EndpointRegistry",
     "Page",
     "FILTERS",
     "ENDPOINTS",
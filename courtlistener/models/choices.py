@@ -0,0 +1,2815 @@
+"""
+Please do not edit this file manually.
+This file is automatically generated by the `scripts/generate_endpoint_models.py` script.
+
+Choice tables shared by the endpoint models. Fields reference a table by
+``json_schema_extra["choices_id"]``; see ``courtlistener.utils.get_choices``.
+"""
+
+from typing import Any
+
+CHOICES: dict[str, tuple[tuple[Any, str], ...]] = {
+    "aba_ratings.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("person", "Person"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("year_rated", "Year rated"),
+        ("rating", "Rating"),
+    ),
+    "aba_ratings.order_by": (
+        ("id", "Id (asc)"),
+        ("-id", "Id (desc)"),
+        ("date_created", "Date Created (asc)"),
+        ("-date_created", "Date Created (desc)"),
+        ("date_modified", "Date Modified (asc)"),
+        ("-date_modified", "Date Modified (desc)"),
+        ("year_rated", "Year Rated (asc)"),
+        ("-year_rated", "Year Rated (desc)"),
+    ),
+    "agreements.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("date_raw", "Date raw"),
+        ("parties_and_terms", "Parties and terms"),
+        ("redacted", "Redacted"),
+        ("financial_disclosure", "Financial disclosure"),
+    ),
+    "alert_type": (
+        (0, "Unsubscription"),
+        (1, "Subscription"),
+    ),
+    "alerts.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("alert_type", "Alert type"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("date_last_hit", "Time of last trigger"),
+        ("name", "A name for the alert"),
+        ("query", "The text of an alert created by a user"),
+        ("rate", "The rate chosen by the user for the alert"),
+        (
+            "secret_key",
+            (
+                "A key to be used in links to access the alert without having to log in. Can "
+                "be used for a variety of purposes."
+            ),
+        ),
+    ),
+    "alerts.order_by": (
+        ("date_created", "Date Created (asc)"),
+        ("-date_created", "Date Created (desc)"),
+        ("date_modified", "Date Modified (asc)"),
+        ("-date_modified", "Date Modified (desc)"),
+        ("name", "Name (asc)"),
+        ("-name", "Name (desc)"),
+        ("rate", "Rate (asc)"),
+        ("-rate", "Rate (desc)"),
+    ),
+    "attorneys.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("parties_represented", "Parties represented"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("name", "Name"),
+        ("contact_raw", "Contact raw"),
+        ("phone", "Phone"),
+        ("fax", "Fax"),
+        ("email", "Email"),
+    ),
+    "audio.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("absolute_url", "Absolute url"),
+        ("panel", "Panel"),
+        ("docket", "Docket"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("source", "Source"),
+        ("case_name_short", "Case name short"),
+        ("case_name", "Case name"),
+        ("case_name_full", "Case name full"),
+        ("judges", "Judges"),
+        ("sha1", "Sha1"),
+        ("download_url", "Download url"),
+        ("local_path_mp3", "Local path mp3"),
+        ("local_path_original_file", "Local path original file"),
+        ("filepath_ia", "Filepath ia"),
+        ("ia_upload_failure_count", "Ia upload failure count"),
+        ("duration", "Duration"),
+        ("processing_complete", "Processing complete"),
+        ("date_blocked", "Date blocked"),
+        ("blocked", "Blocked"),
+        ("stt_status", "Speech to text status"),
+        ("stt_source", "Speech to text source"),
+        ("stt_transcript", "Speech to text transcription"),
+    ),
+    "audio.order_by": (
+        ("id", "Id (asc)"),
+        ("-id", "Id (desc)"),
+        ("date_created", "Date Created (asc)"),
+        ("-date_created", "Date Created (desc)"),
+        ("date_modified", "Date Modified (asc)"),
+        ("-date_modified", "Date Modified (desc)"),
+        ("date_blocked", "Date Blocked (asc)"),
+        ("-date_blocked", "Date Blocked (desc)"),
+    ),
+    "audio.source": (
+        ("C", "court website"),
+        ("H", "brad heath archive"),
+    ),
+    "bankruptcy_information.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("date_converted", "Date converted"),
+        ("date_last_to_file_claims", "Date last to file claims"),
+        ("date_last_to_file_govt", "Date last to file govt"),
+        ("date_debtor_dismissed", "Date debtor dismissed"),
+        ("chapter", "Chapter"),
+        ("trustee_str", "Trustee str"),
+        ("docket", "Docket"),
+    ),
+    "clusters.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("absolute_url", "Absolute url"),
+        ("panel", "Panel"),
+        ("non_participating_judges", "Non participating judges"),
+        ("docket_id", "Docket id"),
+        ("docket", "Docket"),
+        ("sub_opinions", "Sub opinions"),
+        ("citations", "Citations"),
+        ("cluster_redirections", "Cluster redirections"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("judges", "Judges"),
+        ("date_filed", "Date filed"),
+        ("date_filed_is_approximate", "Date filed is approximate"),
+        ("slug", "Slug"),
+        ("case_name_short", "Case name short"),
+        ("case_name", "Case name"),
+        ("case_name_full", "Case name full"),
+        ("scdb_id", "Scdb id"),
+        ("scdb_decision_direction", "Scdb decision direction"),
+        ("scdb_votes_majority", "Scdb votes majority"),
+        ("scdb_votes_minority", "Scdb votes minority"),
+        ("source", "Source"),
+        ("procedural_history", "Procedural history"),
+        ("attorneys", "Attorneys"),
+        ("nature_of_suit", "Nature of suit"),
+        ("posture", "Posture"),
+        ("syllabus", "Syllabus"),
+        ("headnotes", "Headnotes"),
+        ("summary", "Summary"),
+        ("disposition", "Disposition"),
+        ("history", "History"),
+        ("other_dates", "Other dates"),
+        ("cross_reference", "Cross reference"),
+        ("correction", "Correction"),
+        ("citation_count", "Citation count"),
+        ("precedential_status", "Precedential status"),
+        ("date_blocked", "Date blocked"),
+        ("blocked", "Blocked"),
+        ("filepath_json_harvard", "Filepath json harvard"),
+        ("filepath_pdf_harvard", "Filepath pdf harvard"),
+        ("filepath_xml_scan", "Filepath xml scan"),
+        ("filepath_pdf_scan", "Filepath pdf scan"),
+        ("arguments", "Arguments"),
+        ("headmatter", "Headmatter"),
+    ),
+    "clusters.order_by": (
+        ("id", "Id (asc)"),
+        ("-id", "Id (desc)"),
+        ("date_created", "Date Created (asc)"),
+        ("-date_created", "Date Created (desc)"),
+        ("date_modified", "Date Modified (asc)"),
+        ("-date_modified", "Date Modified (desc)"),
+        ("date_filed", "Date Filed (asc)"),
+        ("-date_filed", "Date Filed (desc)"),
+        ("citation_count", "Citation Count (asc)"),
+        ("-citation_count", "Citation Count (desc)"),
+        ("date_blocked", "Date Blocked (asc)"),
+        ("-date_blocked", "Date Blocked (desc)"),
+    ),
+    "clusters.source": (
+        ("C", "court website"),
+        ("R", "public.resource.org"),
+        ("CR", "court website merged with resource.org"),
+        ("L", "lawbox"),
+        ("LC", "lawbox merged with court"),
+        ("LR", "lawbox merged with resource.org"),
+        ("M", "manual input"),
+        ("A", "internet archive"),
+        ("Z", "columbia archive"),
+        ("ZC", "columbia merged with court"),
+        ("ZL", "columbia merged with lawbox"),
+        ("ZLC", "columbia merged with lawbox and court"),
+        ("U", "Harvard, Library Innovation Lab Case Law Access Project"),
+        ("CU", "court website merged with Harvard"),
+        ("D", "direct court input"),
+        ("Q", "2020 anonymous database"),
+        ("CRU", "court website merged with public.resource.org and Harvard"),
+        ("LU", "lawbox merged with Harvard"),
+        ("LCU", "Lawbox merged with court website and Harvard"),
+        ("LRU", "Lawbox merged with public.resource.org and with Harvard"),
+        (
+            "LCRU",
+            "Lawbox merged with court website, public.resource.org and Harvard",
+        ),
+        ("MU", "Manual input merged with Harvard"),
+        ("RU", "public.resource.org merged with Harvard"),
+        ("ZU", "columbia archive merged with Harvard"),
+        ("ZLU", "columbia archive merged with Lawbox and Harvard"),
+        ("ZCU", "columbia archive merged with court website and Harvard"),
+        (
+            "ZLCU",
+            "columbia archive merged with lawbox, court website and Harvard",
+        ),
+        ("G", "recap"),
+        ("S", "scanning project"),
+    ),
+    "court": (
+        ("scotus", "Supreme Court of the United States"),
+        ("ca1", "Court of Appeals for the First Circuit"),
+        ("ca2", "Court of Appeals for the Second Circuit"),
+        ("ca3", "Court of Appeals for the Third Circuit"),
+        ("ca4", "Court of Appeals for the Fourth Circuit"),
+        ("ca5", "Court of Appeals for the Fifth Circuit"),
+        ("ca6", "Court of Appeals for the Sixth Circuit"),
+        ("ca7", "Court of Appeals for the Seventh Circuit"),
+        ("ca8", "Court of Appeals for the Eighth Circuit"),
+        ("ca9", "Court of Appeals for the Ninth Circuit"),
+        ("ca10", "Court of Appeals for the Tenth Circuit"),
+        ("ca11", "Court of Appeals for the Eleventh Circuit"),
+        ("cadc", "Court of Appeals for the D.C. Circuit"),
+        ("cafc", "Court of Appeals for the Federal Circuit"),
+        ("dcd", "District Court, District of Columbia"),
+        ("almd", "District Court, M.D. Alabama"),
+        ("alnd", "District Court, N.D. Alabama"),
+        ("alsd", "District Court, S.D. Alabama"),
+        ("akd", "District Court, D. Alaska"),
+        ("azd", "District Court, D. Arizona"),
+        ("ared", "District Court, E.D. Arkansas"),
+        ("arwd", "District Court, W.D. Arkansas"),
+        ("cacd", "District Court, C.D. California"),
+        ("caed", "District Court, E.D. California"),
+        ("cand", "District Court, N.D. California"),
+        ("casd", "District Court, S.D. California"),
+        ("cod", "District Court, D. Colorado"),
+        ("ctd", "District Court, D. Connecticut"),
+        ("ded", "District Court, D. Delaware"),
+        ("flmd", "District Court, M.D. Florida"),
+        ("flnd", "District Court, N.D. Florida"),
+        ("flsd", "District Court, S.D. Florida"),
+        ("gamd", "District Court, M.D. Georgia"),
+        ("gand", "District Court, N.D. Georgia"),
+        ("gasd", "District Court, S.D. Georgia"),
+        ("hid", "District Court, D. Hawaii"),
+        ("idd", "District Court, D. Idaho"),
+        ("ilcd", "District Court, C.D. Illinois"),
+        ("ilnd", "District Court, N.D. Illinois"),
+        ("ilsd", "District Court, S.D. Illinois"),
+        ("innd", "District Court, N.D. Indiana"),
+        ("insd", "District Court, S.D. Indiana"),
+        ("iand", "District Court, N.D. Iowa"),
+        ("iasd", "District Court, S.D. Iowa"),
+        ("ksd", "District Court, D. Kansas"),
+        ("kyed", "District Court, E.D. Kentucky"),
+        ("kywd", "District Court, W.D. Kentucky"),
+        ("laed", "District Court, E.D. Louisiana"),
+        ("lamd", "District Court, M.D. Louisiana"),
+        ("lawd", "District Court, W.D. Louisiana"),
+        ("med", "District Court, D. Maine"),
+        ("mdd", "District Court, D. Maryland"),
+        ("mad", "District Court, D. Massachusetts"),
+        ("mied", "District Court, E.D. Michigan"),
+        ("miwd", "District Court, W.D. Michigan"),
+        ("mnd", "District Court, D. Minnesota"),
+        ("msnd", "District Court, N.D. Mississippi"),
+        ("mssd", "District Court, S.D. Mississippi"),
+        ("moed", "District Court, E.D. Missouri"),
+        ("mowd", "District Court, W.D. Missouri"),
+        ("mtd", "District Court, D. Montana"),
+        ("ned", "District Court, D. Nebraska"),
+        ("nvd", "District Court, D. Nevada"),
+        ("nhd", "District Court, D. New Hampshire"),
+        ("njd", "District Court, D. New Jersey"),
+        ("nmd", "District Court, D. New Mexico"),
+        ("nyed", "District Court, E.D. New York"),
+        ("nynd", "District Court, N.D. New York"),
+        ("nysd", "District Court, S.D. New York"),
+        ("nywd", "District Court, W.D. New York"),
+        ("nced", "District Court, E.D. North Carolina"),
+        ("ncmd", "District Court, M.D. North Carolina"),
+        ("ncwd", "District Court, W.D. North Carolina"),
+        ("ndd", "District Court, D. North Dakota"),
+        ("ohnd", "District Court, N.D. Ohio"),
+        ("ohsd", "District Court, S.D. Ohio"),
+        ("oked", "District Court, E.D. Oklahoma"),
+        ("oknd", "District Court, N.D. Oklahoma"),
+        ("okwd", "District Court, W.D. Oklahoma"),
+        ("ord", "District Court, D. Oregon"),
+        ("paed", "District Court, E.D. Pennsylvania"),
+        ("pamd", "District Court, M.D. Pennsylvania"),
+        ("pawd", "District Court, W.D. Pennsylvania"),
+        ("rid", "District Court, D. Rhode Island"),
+        ("scd", "District Court, D. South Carolina"),
+        ("sdd", "District Court, D. South Dakota"),
+        ("tned", "District Court, E.D. Tennessee"),
+        ("tnmd", "District Court, M.D. Tennessee"),
+        ("tnwd", "District Court, W.D. Tennessee"),
+        ("txed", "District Court, E.D. Texas"),
+        ("txnd", "District Court, N.D. Texas"),
+        ("txsd", "District Court, S.D. Texas"),
+        ("txwd", "District Court, W.D. Texas"),
+        ("utd", "District Court, D. Utah"),
+        ("vtd", "District Court, D. Vermont"),
+        ("vaed", "District Court, E.D. Virginia"),
+        ("vawd", "District Court, W.D. Virginia"),
+        ("waed", "District Court, E.D. Washington"),
+        ("wawd", "District Court, W.D. Washington"),
+        ("wvnd", "District Court, N.D. West Virginia"),
+        ("wvsd", "District Court, S.D. West Virginia"),
+        ("wied", "District Court, E.D. Wisconsin"),
+        ("wiwd", "District Court, W.D. Wisconsin"),
+        ("wyd", "District Court, D. Wyoming"),
+        ("gud", "District Court, D. Guam"),
+        ("nmid", "District Court, Northern Mariana Islands"),
+        ("prd", "District Court, D. Puerto Rico"),
+        ("vid", "District Court, Virgin Islands"),
+        ("californiad", "District Court, D. California"),
+        ("illinoised", "District Court, E.D. Illinois"),
+        ("illinoisd", "District Court, D. Illinois"),
+        ("indianad", "District Court, D. Indiana"),
+        ("orld", "District Court, Orleans"),
+        ("ohiod", "District Court, D. Ohio"),
+        ("pennsylvaniad", "District Court, D. Pennsylvania"),
+        ("southcarolinaed", "District Court, E.D. South Carolina"),
+        ("southcarolinawd", "District Court, W.D. South Carolina"),
+        ("tennessed", "District Court, D. Tennessee"),
+        ("canalzoned", "District Court, Canal Zone"),
+        ("bap1", "Bankruptcy Appellate Panel of the First Circuit"),
+        ("bap2", "Bankruptcy Appellate Panel of the Second Circuit"),
+        ("bap6", "Bankruptcy Appellate Panel of the Sixth Circuit"),
+        (
+            "bap8",
+            "United States Bankruptcy Appellate Panel for the Eighth Circuit",
+        ),
+        (
+            "bap9",
+            "United States Bankruptcy Appellate Panel for the Ninth Circuit",
+        ),
+        ("bap10", "Bankruptcy Appellate Panel of the Tenth Circuit"),
+        ("bapme", "Bankruptcy Appellate Panel, D. Maine"),
+        ("bapma", "Bankruptcy Appellate Panel of Massachusetts"),
+        ("almb", "United States Bankruptcy Court, M.D. Alabama"),
+        ("alnb", "United States Bankruptcy Court, N.D. Alabama"),
+        ("alsb", "United States Bankruptcy Court, S.D. Alabama"),
+        ("akb", "United States Bankruptcy Court, D. Alaska"),
+        ("arb", "United States Bankruptcy Court, D. Arizona"),
+        ("areb", "United States Bankruptcy Court, E.D. Arkansas"),
+        ("arwb", "United States Bankruptcy Court, W.D. Arkansas"),
+        ("cacb", "United States Bankruptcy Court, C.D. California"),
+        ("caeb", "United States Bankruptcy Court, E.D. California"),
+        ("canb", "United States Bankruptcy Court, N.D. California"),
+        ("casb", "United States Bankruptcy Court, S.D. California"),
+        ("cob", "United States Bankruptcy Court, D. Colorado"),
+        ("ctb", "United States Bankruptcy Court, D. Connecticut"),
+        ("deb", "United States Bankruptcy Court, D. Delaware"),
+        ("dcb", "United States Bankruptcy Court, District of Columbia"),
+        ("flmb", "United States Bankruptcy Court, M.D. Florida"),
+        ("flnb", "United States Bankruptcy Court, N.D. Florida"),
+        ("flsb", "United States Bankruptcy Court, S.D. Florida."),
+        ("gamb", "United States Bankruptcy Court, M.D. Georgia"),
+        ("ganb", "United States Bankruptcy Court, N.D. Georgia"),
+        ("gasb", "United States Bankruptcy Court, S.D. Georgia"),
+        ("hib", "United States Bankruptcy Court, D. Hawaii"),
+        ("idb", "United States Bankruptcy Court, D. Idaho"),
+        ("ilcb", "United States Bankruptcy Court, C.D. Illinois"),
+        ("ilnb", "United States Bankruptcy Court, N.D. Illinois"),
+        ("ilsb", "United States Bankruptcy Court, S.D. Illinois"),
+        ("innb", "United States Bankruptcy Court, N.D. Indiana"),
+        ("insb", "United States Bankruptcy Court, S.D. Indiana"),
+        ("ianb", "United States Bankruptcy Court, N.D. Iowa"),
+        ("iasb", "United States Bankruptcy Court, S.D. Iowa"),
+        ("ksb", "United States Bankruptcy Court, D. Kansas"),
+        ("kyeb", "United States Bankruptcy Court, E.D. Kentucky"),
+        ("kywb", "United States Bankruptcy Court, W.D. Kentucky"),
+        ("laeb", "United States Bankruptcy Court, E.D. Louisiana"),
+        ("lamb", "United States Bankruptcy Court, M.D. Louisiana"),
+        ("lawb", "United States Bankruptcy Court, W.D. Louisiana"),
+        ("meb", "United States Bankruptcy Court, D. Maine"),
+        ("mdb", "United States Bankruptcy Court, D. Maryland"),
+        ("mab", "United States Bankruptcy Court, D. Massachusetts"),
+        ("mieb", "United States Bankruptcy Court, E.D. Michigan"),
+        ("miwb", "United States Bankruptcy Court, W.D. Michigan"),
+        ("mnb", "United States Bankruptcy Court, D. Minnesota"),
+        ("msnb", "United States Bankruptcy Court, N.D. Mississippi"),
+        ("mssb", "United States Bankruptcy Court, S.D. Mississippi"),
+        ("moeb", "United States Bankruptcy Court, E.D. Missouri"),
+        ("mowb", "United States Bankruptcy Court, W.D. Missouri"),
+        ("mtb", "United States Bankruptcy Court, D. Montana"),
+        ("nebraskab", "United States Bankruptcy Court, D. Nebraska"),
+        ("nvb", "United States Bankruptcy Court, D. Nevada"),
+        ("nhb", "United States Bankruptcy Court, D. New Hampshire"),
+        ("njb", "United States Bankruptcy Court, D. New Jersey"),
+        ("nmb", "United States Bankruptcy Court, D. New Mexico"),
+        ("nyeb", "United States Bankruptcy Court, E.D. New York"),
+        ("nynb", "United States Bankruptcy Court, N.D. New York"),
+        ("nysb", "United States Bankruptcy Court, S.D. New York"),
+        ("nywb", "United States Bankruptcy Court, W.D. New York"),
+        ("nceb", "United States Bankruptcy Court, E.D. North Carolina"),
+        ("ncmb", "United States Bankruptcy Court, M.D. North Carolina"),
+        ("ncwb", "United States Bankruptcy Court, W.D. North Carolina"),
+        ("ndb", "United States Bankruptcy Court, D. North Dakota"),
+        ("ohnb", "United States Bankruptcy Court, N.D. Ohio"),
+        ("ohsb", "United States Bankruptcy Court, S.D. Ohio"),
+        ("okeb", "United States Bankruptcy Court, E.D. Oklahoma"),
+        ("oknb", "United States Bankruptcy Court, N.D. Oklahoma"),
+        ("okwb", "United States Bankruptcy Court, W.D. Oklahoma"),
+        ("orb", "United States Bankruptcy Court, D. Oregon"),
+        ("paeb", "United States Bankruptcy Court, E.D. Pennsylvania"),
+        ("pamb", "United States Bankruptcy Court, M.D. Pennsylvania"),
+        ("pawb", "United States Bankruptcy Court, W.D. Pennsylvania"),
+        ("rib", "United States Bankruptcy Court, D. Rhode Island"),
+        ("scb", "United States Bankruptcy Court, D. South Carolina"),
+        ("sdb", "United States Bankruptcy Court, D. South Dakota"),
+        ("tneb", "United States Bankruptcy Court, E.D. Tennessee"),
+        ("tnmb", "United States Bankruptcy Court, M.D. Tennessee"),
+        ("tnwb", "United States Bankruptcy Court, W.D. Tennessee"),
+        ("tennesseeb", "United States Bankruptcy Court, D. Tennessee"),
+        ("txeb", "United States Bankruptcy Court, E.D. Texas"),
+        ("txnb", "United States Bankruptcy Court, N.D. Texas"),
+        ("txsb", "United States Bankruptcy Court, S.D. Texas"),
+        ("txwb", "United States Bankruptcy Court, W.D. Texas"),
+        ("utb", "United States Bankruptcy Court, D. Utah"),
+        ("vtb", "United States Bankruptcy Court, D. Vermont"),
+        ("vaeb", "United States Bankruptcy Court, E.D. Virginia"),
+        ("vawb", "United States Bankruptcy Court, W.D. Virginia"),
+        ("waeb", "United States Bankruptcy Court, E.D. Washington"),
+        ("wawb", "United States Bankruptcy Court, W.D. Washington"),
+        ("wvnb", "United States Bankruptcy Court, N.D. West Virginia"),
+        ("wvsb", "United States Bankruptcy Court, S.D. West Virginia"),
+        ("wieb", "United States Bankruptcy Court, E.D. Wisconsin"),
+        ("wiwb", "United States Bankruptcy Court, W.D. Wisconsin"),
+        ("wyb", "United States Bankruptcy Court, D. Wyoming"),
+        ("gub", "United States Bankruptcy Court, D. Guam"),
+        ("nmib", "United States Bankruptcy Court, Northern Mariana Islands"),
+        ("prb", "United States Bankruptcy Court, D. Puerto Rico"),
+        ("vib", "United States Bankruptcy Court, D. Virgin Islands"),
+        ("ala", "Supreme Court of Alabama"),
+        ("alactapp", "Alabama Court of Appeals"),
+        ("alacrimapp", "Court of Criminal Appeals of Alabama"),
+        ("alacivapp", "Court of Civil Appeals of Alabama"),
+        ("alaska", "Alaska Supreme Court"),
+        ("alaskactapp", "Court of Appeals of Alaska"),
+        ("ariz", "Arizona Supreme Court"),
+        ("arizctapp", "Court of Appeals of Arizona"),
+        ("ariztaxct", "Arizona Tax Court"),
+        ("ark", "Supreme Court of Arkansas"),
+        ("arkctapp", "Court of Appeals of Arkansas"),
+        ("arkworkcompcom", "Arkansas Workers' Compensation Commission"),
+        ("arkag", "Arkansas Attorney General Reports"),
+        ("cal", "California Supreme Court"),
+        ("calctapp", "California Court of Appeal"),
+        (
+            "calappdeptsuper",
+            "Appellate Division of the Superior Court of California",
+        ),
+        ("calag", "California Attorney General Reports"),
+        ("colo", "Supreme Court of Colorado"),
+        ("coloctapp", "Colorado Court of Appeals"),
+        ("coloworkcompcom", "Colorado Industrial Claim Appeals Office"),
+        ("coloag", "Colorado Attorney General Reports"),
+        ("conn", "Supreme Court of Connecticut"),
+        ("connappct", "Connecticut Appellate Court"),
+        ("connsuperct", "Connecticut Superior Court"),
+        ("connworkcompcom", "Connecticut Compensation Review Board"),
+        ("del", "Supreme Court of Delaware"),
+        ("delch", "Court of Chancery of Delaware"),
+        ("delorphct", "Orphan's Court of Delaware"),
+        ("delsuperct", "Superior Court of Delaware"),
+        ("delctcompl", "Delaware Court of Common Pleas"),
+        ("delfamct", "Delaware Family Court"),
+        ("deljudct", "Court on the Judiciary of Delaware."),
+        ("dc", "District of Columbia Court of Appeals"),
+        ("fla", "Supreme Court of Florida"),
+        ("fladistctapp", "District Court of Appeal of Florida"),
+        ("flaag", "Florida Attorney General Reports"),
+        ("ga", "Supreme Court of Georgia"),
+        ("gactapp", "Court of Appeals of Georgia"),
+        ("haw", "Hawaii Supreme Court"),
+        ("hawapp", "Hawaii Intermediate Court of Appeals"),
+        ("idaho", "Idaho Supreme Court"),
+        ("idahoctapp", "Idaho Court of Appeals"),
+        ("ill", "Illinois Supreme Court"),
+        ("illappct", "Appellate Court of Illinois"),
+        ("ind", "Indiana Supreme Court"),
+        ("indctapp", "Indiana Court of Appeals"),
+        ("indtc", "Indiana Tax Court"),
+        ("iowa", "Supreme Court of Iowa"),
+        ("iowactapp", "Court of Appeals of Iowa"),
+        ("kan", "Supreme Court of Kansas"),
+        ("kanctapp", "Court of Appeals of Kansas"),
+        ("kanag", "Kansas Attorney General Reports"),
+        ("ky", "Kentucky Supreme Court"),
+        ("kyctapp", "Court of Appeals of Kentucky"),
+        ("kyctapphigh", "Court of Appeals of Kentucky (pre-1976)"),
+        ("la", "Supreme Court of Louisiana"),
+        ("lactapp", "Louisiana Court of Appeal"),
+        ("laag", "Louisiana Attorney General Reports"),
+        ("me", "Supreme Judicial Court of Maine"),
+        ("mesuperct", "Superior Court of Maine"),
+        ("md", "Court of Appeals of Maryland"),
+        ("mdctspecapp", "Court of Special Appeals of Maryland"),
+        ("mdch", "High Court of Chancery of Maryland"),
+        ("mdag", "Maryland Attorney General Reports"),
+        ("mass", "Massachusetts Supreme Judicial Court"),
+        ("massappct", "Massachusetts Appeals Court"),
+        ("masssuperct", "Massachusetts Superior Court"),
+        ("massdistct", "Massachusetts District Court"),
+        ("masslandct", "Massachusetts Land Court"),
+        ("maworkcompcom", "Massachusetts Department of Industrial Accidents"),
+        ("mich", "Michigan Supreme Court"),
+        ("michctapp", "Michigan Court of Appeals"),
+        ("minn", "Supreme Court of Minnesota"),
+        ("minnctapp", "Court of Appeals of Minnesota"),
+        ("minnag", "Minnesota Attorney General Reports"),
+        ("miss", "Mississippi Supreme Court"),
+        ("missctapp", "Court of Appeals of Mississippi"),
+        ("mo", "Supreme Court of Missouri"),
+        ("moctapp", "Missouri Court of Appeals"),
+        ("moag", "Missouri Attorney General Reports"),
+        ("mont", "Montana Supreme Court"),
+        ("monttc", "Montana Tax Appeal Board"),
+        ("montag", "Montana Attorney General Reports"),
+        ("neb", "Nebraska Supreme Court"),
+        ("nebctapp", "Nebraska Court of Appeals"),
+        ("nebag", "Nebraska Attorney General Reports"),
+        ("nev", "Nevada Supreme Court"),
+        ("nevapp", "Court of Appeals of Nevada"),
+        ("nh", "Supreme Court of New Hampshire"),
+        ("nj", "Supreme Court of New Jersey"),
+        ("njsuperctappdiv", "New Jersey Superior Court Appellate Division"),
+        ("njtaxct", "New Jersey Tax Court"),
+        ("njch", "New Jersey Court of Chancery"),
+        ("nm", "New Mexico Supreme Court"),
+        ("nmctapp", "New Mexico Court of Appeals"),
+        ("ny", "New York Court of Appeals"),
+        (
+            "nyappdiv",
+            "Appellate Division of the Supreme Court of the State of New York",
+        ),
+        ("nyappterm", "Appellate Terms of the Supreme Court of New York"),
+        ("nysupct", "New York Supreme Court"),
+        ("nycountyct", "New York County Courts"),
+        ("nydistct", "New York District Court"),
+        ("nyjustct", "New York Justice Court"),
+        ("nyfamct", "New York Family Court"),
+        ("nysurct", "New York Surrogate's Court"),
+        ("nycivct", "Civil Court of the City of New York"),
+        ("nycrimct", "Criminal Court of the City of New York"),
+        ("nyag", "New York Attorney General Reports"),
+        ("nc", "Supreme Court of North Carolina"),
+        ("ncctapp", "Court of Appeals of North Carolina"),
+        ("ncsuperct", "Superior Court of North Carolina"),
+        ("ncbizct", "North Carolina Business Court"),
+        ("ncworkcompcom", "North Carolina Industrial Commission"),
+        ("nd", "North Dakota Supreme Court"),
+        ("ndctapp", "North Dakota Court of Appeals"),
+        ("ohio", "Ohio Supreme Court"),
+        ("ohioctapp", "Ohio Court of Appeals"),
+        ("ohioctcl", "Ohio Court of Claims"),
+        ("okla", "Supreme Court of Oklahoma"),
+        ("oklacivapp", "Court of Civil Appeals of Oklahoma"),
+        ("oklacrimapp", "Court of Criminal Appeals of Oklahoma"),
+        ("oklajeap", "Oklahoma Judicial Ethics Advisory Panel"),
+        ("oklacoj", "Court on the Judiciary of Oklahoma"),
+        ("oklaag", "Oklahoma Attorney General Reports"),
+        ("or", "Oregon Supreme Court"),
+        ("orctapp", "Court of Appeals of Oregon"),
+        ("ortc", "Oregon Tax Court"),
+        ("pa", "Supreme Court of Pennsylvania"),
+        ("pasuperct", "Superior Court of Pennsylvania"),
+        ("pacommwct", "Commonwealth Court of Pennsylvania"),
+        ("cjdpa", "Court of Judicial Discipline of Pennsylvania"),
+        ("ri", "Supreme Court of Rhode Island"),
+        ("risuperct", "Superior Court of Rhode Island"),
+        ("sc", "Supreme Court of South Carolina"),
+        ("scctapp", "Court of Appeals of South Carolina"),
+        ("sd", "South Dakota Supreme Court"),
+        ("tenn", "Tennessee Supreme Court"),
+        ("tennctapp", "Court of Appeals of Tennessee"),
+        ("tenncrimapp", "Court of Criminal Appeals of Tennessee"),
+        ("tennworkcompcl", "Tennessee Court of Workers' Compensation Claims"),
+        ("tennworkcompapp", "Tennessee Workers' Compensation Appeals Board"),
+        ("tennsuperct", "Tennessee Superior Court for Law and Equity"),
+        ("tex", "Texas Supreme Court"),
+        ("texapp", "Court of Appeals of Texas"),
+        ("texcrimapp", "Court of Criminal Appeals of Texas"),
+        ("texreview", "Texas Special Court of Review"),
+        ("texjpml", "Texas Judicial Panel on Multidistrict Litigation"),
+        ("texag", "Texas Attorney General Reports"),
+        ("texbizct", "Texas Business Court"),
+        ("utah", "Utah Supreme Court"),
+        ("utahctapp", "Court of Appeals of Utah"),
+        ("vt", "Supreme Court of Vermont"),
+        ("vtsuperct", "Vermont Superior Court"),
+        ("va", "Supreme Court of Virginia"),
+        ("vactapp", "Court of Appeals of Virginia"),
+        ("wash", "Washington Supreme Court"),
+        ("washctapp", "Court of Appeals of Washington"),
+        ("washag", "Washington Attorney General Reports"),
+        ("washterr", "Washington Territory"),
+        ("wva", "West Virginia Supreme Court"),
+        ("wvactapp", "Intermediate Court of Appeals of West Virginia"),
+        ("wis", "Wisconsin Supreme Court"),
+        ("wisctapp", "Court of Appeals of Wisconsin"),
+        ("wisag", "Wisconsin Attorney General Reports"),
+        ("wyo", "Wyoming Supreme Court"),
+        ("guam", "Supreme Court of Guam"),
+        (
+            "nmariana",
+            "Supreme Court of The Commonwealth of The Northern Mariana Islands",
+        ),
+        (
+            "cnmisuperct",
+            "Northern Mariana Islands Commonwealth Superior Court",
+        ),
+        ("cnmitrialct", "Northern Mariana Islands Commonwealth Trial Court"),
+        ("prsupreme", "Supreme Court of Puerto Rico"),
+        (
+            "prapp",
+            "Tribunal De Apelaciones De Puerto Rico/Court of Appeals of Puerto Rico",
+        ),
+        ("virginislands", "Supreme Court of The Virgin Islands"),
+        ("amsamoa", "High Court of American Samoa"),
+        ("amsamoatc", "American Samoa District Court"),
+        ("afcca", "United States Air Force Court of Criminal Appeals"),
+        ("usafctmilrev", "U S Air Force Court of Military Review"),
+        ("armfor", "Court of Appeals for the Armed Forces"),
+        ("cma", "United States Court of Military Appeals"),
+        ("acca", "Army Court of Criminal Appeals"),
+        ("usarmymilrev", "U.S. Army Court of Military Review"),
+        ("uscgcoca", "U S Coast Guard Court of Criminal Appeals"),
+        ("cgcomilrev", "U S Coast Guard Court of Military Review"),
+        ("mc", "United States Court of Military Commission Review"),
+        ("nmcca", "Navy-Marine Corps Court of Criminal Appeals"),
+        ("usnmcmilrev", "U.S. Navy-Marine Corps Court of Military Review"),
+        ("cherokee", "Cherokee Nation Supreme Court"),
+        ("cherokeeapp", "Cherokee Nation Judicial Appeals Tribunal"),
+        ("cherokeetribct", "Cherokee Indian Tribal Court"),
+        ("cheyrsiouxctapp", "Cheyenne River Sioux Tribal Court of Appeals"),
+        ("colvctapp", "Colville Confederated Court of Appeals"),
+        ("coquct", "Coquille Indian Tribal Court"),
+        ("echerkokee", "Eastern Band of Cherokee Indians Supreme Court"),
+        ("echerokeect", "Eastern Band of Cherokee Indians Tribal Court"),
+        (
+            "ftmcdowctapp",
+            "Fort McDowell Yavapai Nation Tribal Court of Appeals",
+        ),
+        ("ftmcdowell", "Fort McDowell Supreme Court"),
+        ("ftpeckctapp", "Fort Peck Appellate Court"),
+        ("ftpecktrialct", "Fort Peck Tribal Court"),
+        ("grrondectapp", "Grand Ronde Court of Appeals"),
+        ("grrondect", "Grand Ronde Tribal Court"),
+        (
+            "grtravbandctapp",
+            "Grand Traverse Band of Ottawa & Chippewa Indians Tribal Appellate Court",
+        ),
+        (
+            "grtravbandct",
+            "Grand Traverse Band of Ottawa and Chippewa Indians Tribal Court",
+        ),
+        ("hochunk", "Ho-Chunk Nation Supreme Court"),
+        ("hochunkct", "Ho-Chunk Nation Trial Court"),
+        ("hopiappct", "Hopi Appellate Court"),
+        ("leechojibtr", "Leech Lake Band of Ojibwe Tribal Court"),
+        (
+            "lrbottawactapp",
+            "Little River Band of Ottawa Indians Tribal Court of Appeals",
+        ),
+        ("lrbottawact", "Little River Band of Ottawa Indians Tribal Court"),
+        (
+            "odawactapp",
+            "Little Traverse Bay Bands of Odawa Indians Tribal Appellate Court",
+        ),
+        ("moheganctapp", "Mohegan Tribal Court of Appeals"),
+        ("moheganct", "Mohegan Trial Court"),
+        ("mohegangct", "Mohegan Gaming Disputes Trial Court"),
+        ("mohegangctapp", "Mohegan Gaming Disputes Court of Appeals"),
+        ("moheganelders", "Council of Elders of the Mohegan Tribe"),
+        ("navajo", "Navajo Nation Supreme Court"),
+        ("navajoctapp", "Navajo Nation Court of Appeals"),
+        ("navajofamct", "Navajo Nation Family Court"),
+        ("navajochildct", "Navajo Nation Children's Court"),
+        ("oneidactapp", "Oneida Appellate Court"),
+        ("oneidatrialct", "Oneida Tribal Judicial System, Trial Court"),
+        ("sacfoxsupct", "Sac and Fox Nation Supreme Court"),
+        ("sacfoxdistct", "Sac and Fox Nation District Court"),
+        ("salishctapp", "Confederated Salish & Kootenai Court of Appeals"),
+        ("shoaraphotr", "Shoshone and Arapaho Tribal Court"),
+        ("swinomishappct", "Swinomish Tribal Court of Appeals"),
+        ("swinomishtr", "Swinomish Tribal Court"),
+        ("tulalipctapp", "Tulalip Court of Appeals"),
+        ("webchippewatr", "White Earth Band of Chippewa Tribal Court"),
+        ("asbca", "Armed Services Board of Contract Appeals"),
+        ("uscfc", "United States Court of Federal Claims"),
+        ("tax", "United States Tax Court"),
+        ("bia", "Board of Immigration Appeals"),
+        ("olc", "Department of Justice Office of Legal Counsel"),
+        ("mspb", "Merit Systems Protection Board"),
+        ("cavc", "United States Court of Appeals for Veterans Claims"),
+        ("bva", "Board of Veterans' Appeals"),
+        ("fiscr", "Foreign Intelligence Surveillance Court of Review"),
+        ("fisc", "Foreign Intelligence Surveillance Court"),
+        ("cit", "United States Court of International Trade"),
+        ("usjc", "United States Judicial Conference Committee"),
+        ("jpml", "United States Judicial Panel on Multidistrict Litigation"),
+        ("cc", "United States Court of Claims"),
+        ("com", "Commerce Court"),
+        ("ccpa", "Court of Customs and Patent Appeals"),
+        ("cusc", "United States Customs Court"),
+        ("bta", "United States Board of Tax Appeals"),
+        ("eca", "Emergency Court of Appeals"),
+        ("tecoa", "Temporary Emergency Court of Appeals"),
+        (
+            "reglrailreorgct",
+            "Special Court under the Regional Rail Reorganization Act",
+        ),
+        ("kingsbench", "Court of King's Bench"),
+    ),
+    "courts.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("pacer_court_id", "Pacer court id"),
+        ("pacer_has_rss_feed", "Pacer has rss feed"),
+        ("pacer_rss_entry_types", "Pacer rss entry types"),
+        ("date_last_pacer_contact", "Date last pacer contact"),
+        ("fjc_court_id", "Fjc court id"),
+        ("date_modified", "Date modified"),
+        ("in_use", "In use"),
+        ("has_opinion_scraper", "Has opinion scraper"),
+        ("has_oral_argument_scraper", "Has oral argument scraper"),
+        ("position", "Position"),
+        ("citation_string", "Citation string"),
+        ("short_name", "Short name"),
+        ("full_name", "Full name"),
+        ("url", "Url"),
+        ("start_date", "Start date"),
+        ("end_date", "End date"),
+        ("jurisdiction", "Jurisdiction"),
+        ("parent_court", "Parent court"),
+        ("appeals_to", "Appeals to"),
+    ),
+    "courts.jurisdiction": (
+        ("F", "Federal Appellate"),
+        ("FD", "Federal District"),
+        ("FB", "Federal Bankruptcy"),
+        ("FBP", "Federal Bankruptcy Panel"),
+        ("FS", "Federal Special"),
+        ("S", "State Supreme"),
+        ("SA", "State Appellate"),
+        ("ST", "State Trial"),
+        ("SS", "State Special"),
+        ("TRS", "Tribal Supreme"),
+        ("TRA", "Tribal Appellate"),
+        ("TRT", "Tribal Trial"),
+        ("TRX", "Tribal Special"),
+        ("TS", "Territory Supreme"),
+        ("TA", "Territory Appellate"),
+        ("TT", "Territory Trial"),
+        ("TSP", "Territory Special"),
+        ("SAG", "State Attorney General"),
+        ("MA", "Military Appellate"),
+        ("MT", "Military Trial"),
+        ("C", "Committee"),
+        ("I", "International"),
+        ("T", "Testing"),
+    ),
+    "courts.order_by": (
+        ("id", "Id (asc)"),
+        ("-id", "Id (desc)"),
+        ("date_modified", "Date Modified (asc)"),
+        ("-date_modified", "Date Modified (desc)"),
+        ("position", "Position (asc)"),
+        ("-position", "Position (desc)"),
+        ("start_date", "Start Date (asc)"),
+        ("-start_date", "Start Date (desc)"),
+        ("end_date", "End Date (asc)"),
+        ("-end_date", "End Date (desc)"),
+    ),
+    "dataset_source": (
+        (1, "Civil cases filed and terminated from SY 1970 through SY 1987"),
+        (
+            2,
+            "Civil cases filed, terminated, and pending from SY 1988 to present (2017)",
+        ),
+        (
+            8,
+            "Civil cases filed, terminated, and pending from SY 1988 to present (2020)",
+        ),
+        (
+            9,
+            (
+                "Civil cases filed, terminated, and pending from SY 1988 to present "
+                "(September 2021)"
+            ),
+        ),
+        (
+            10,
+            (
+                "Civil cases filed, terminated, and pending from SY 1988 to present (March "
+                "2022)"
+            ),
+        ),
+        (
+            3,
+            "Criminal defendants filed and terminated from SY 1970 through FY 1995",
+        ),
+        (
+            4,
+            (
+                "Criminal defendants filed, terminated, and pending from FY 1996 to present "
+                "(2017)"
+            ),
+        ),
+        (
+            5,
+            "Appellate cases filed and terminated from SY 1971 through FY 2007",
+        ),
+        (
+            6,
+            "Appellate cases filed, terminated, and pending from FY 2008 to present (2017)",
+        ),
+        (
+            7,
+            "Bankruptcy cases filed, terminated, and pending from FY 2008 to present (2017)",
+        ),
+    ),
+    "debts.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("creditor_name", "Creditor name"),
+        ("description", "Description"),
+        ("value_code", "Value code"),
+        ("redacted", "Redacted"),
+        ("financial_disclosure", "Financial disclosure"),
+    ),
+    "debts.value_code": (
+        ("J", "1 - 15,000"),
+        ("K", "15,001 - 50,000"),
+        ("L", "50,001 - 100,000"),
+        ("M", "100,001 - 250,000"),
+        ("N", "250,001 - 500,000"),
+        ("O", "500,001 - 1,000,000"),
+        ("P1", "1,000,001 - 5,000,000"),
+        ("P2", "5,000,001 - 25,000,000"),
+        ("P3", "25,000,001 - 50,000,000"),
+        ("P4", "50,000,001 - "),
+        ("-1", "Failed Extraction"),
+    ),
+    "degree_level": (
+        ("ba", "Bachelor's (e.g. B.A.)"),
+        ("ma", "Master's (e.g. M.A.)"),
+        ("jd", "Juris Doctor (J.D.)"),
+        ("llm", "Master of Laws (LL.M)"),
+        ("llb", "Bachelor of Laws (e.g. LL.B)"),
+        ("jsd", "Doctor of Law (J.S.D)"),
+        ("phd", "Doctor of Philosophy (PhD)"),
+        ("aa", "Associate (e.g. A.A.)"),
+        ("md", "Medical Degree (M.D.)"),
+        ("mba", "Master of Business Administration (M.B.A.)"),
+        ("cfa", "Accounting Certification (C.P.A., C.M.A., C.F.A.)"),
+        ("cert", "Certificate"),
+    ),
+    "disclosure_positions.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("position", "Position"),
+        ("organization_name", "Organization name"),
+        ("redacted", "Redacted"),
+        ("financial_disclosure", "Financial disclosure"),
+    ),
+    "disposition": (
+        (0, "Cases transferred or remanded: Transfer to another district"),
+        (1, "Cases transferred or remanded: Remanded to state court"),
+        (
+            10,
+            "Cases transferred or remanded: Multi-district litigation transfer",
+        ),
+        (11, "Cases transferred or remanded: Remanded to U.S. agency"),
+        (2, "Dismissals: Want of prosecution"),
+        (3, "Dismissals: Lack of jurisdiction"),
+        (12, "Dismissals: Voluntarily dismissed"),
+        (13, "Dismissals: Settled"),
+        (14, "Dismissals: Other"),
+        (4, "Judgment on: Default"),
+        (5, "Judgment on: Consent"),
+        (6, "Judgment on: Motion before trial"),
+        (7, "Judgment on: Jury verdict"),
+        (8, "Judgment on: Directed verdict"),
+        (9, "Judgment on: Court trial"),
+        (15, "Judgment on: Award of arbitrator"),
+        (16, "Judgment on: Stayed pending bankruptcy"),
+        (17, "Judgment on: Other"),
+        (18, "Judgment on: Statistical closing"),
+        (19, "Judgment on: Appeal affirmed (magistrate judge)"),
+        (20, "Judgment on: Appeal denied (magistrate judge"),
+    ),
+    "dob_state": (
+        ("AL", "Alabama"),
+        ("AK", "Alaska"),
+        ("AS", "American Samoa"),
+        ("AZ", "Arizona"),
+        ("AR", "Arkansas"),
+        ("AA", "Armed Forces Americas"),
+        ("AE", "Armed Forces Europe"),
+        ("AP", "Armed Forces Pacific"),
+        ("CA", "California"),
+        ("CO", "Colorado"),
+        ("CT", "Connecticut"),
+        ("DE", "Delaware"),
+        ("DC", "District of Columbia"),
+        ("FL", "Florida"),
+        ("GA", "Georgia"),
+        ("GU", "Guam"),
+        ("HI", "Hawaii"),
+        ("ID", "Idaho"),
+        ("IL", "Illinois"),
+        ("IN", "Indiana"),
+        ("IA", "Iowa"),
+        ("KS", "Kansas"),
+        ("KY", "Kentucky"),
+        ("LA", "Louisiana"),
+        ("ME", "Maine"),
+        ("MD", "Maryland"),
+        ("MA", "Massachusetts"),
+        ("MI", "Michigan"),
+        ("MN", "Minnesota"),
+        ("MS", "Mississippi"),
+        ("MO", "Missouri"),
+        ("MT", "Montana"),
+        ("NE", "Nebraska"),
+        ("NV", "Nevada"),
+        ("NH", "New Hampshire"),
+        ("NJ", "New Jersey"),
+        ("NM", "New Mexico"),
+        ("NY", "New York"),
+        ("NC", "North Carolina"),
+        ("ND", "North Dakota"),
+        ("MP", "Northern Mariana Islands"),
+        ("OH", "Ohio"),
+        ("OK", "Oklahoma"),
+        ("OR", "Oregon"),
+        ("PA", "Pennsylvania"),
+        ("PR", "Puerto Rico"),
+        ("RI", "Rhode Island"),
+        ("SC", "South Carolina"),
+        ("SD", "South Dakota"),
+        ("TN", "Tennessee"),
+        ("WY", "Wyoming"),
+        ("TX", "Texas"),
+        ("UT", "Utah"),
+        ("VT", "Vermont"),
+        ("VI", "Virgin Islands"),
+        ("VA", "Virginia"),
+        ("WA", "Washington"),
+        ("WV", "West Virginia"),
+        ("WI", "Wisconsin"),
+    ),
+    "docket_alerts.fields": (
+        ("id", "ID"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("date_last_hit", "Time of last trigger"),
+        (
+            "secret_key",
+            (
+                "A key to be used in links to access the alert without having to log in. Can "
+                "be used for a variety of purposes."
+            ),
+        ),
+        ("alert_type", "Alert type"),
+        ("docket", "Docket"),
+    ),
+    "docket_alerts.order_by": (
+        ("date_created", "Date Created (asc)"),
+        ("-date_created", "Date Created (desc)"),
+        ("date_modified", "Date Modified (asc)"),
+        ("-date_modified", "Date Modified (desc)"),
+    ),
+    "docket_entries.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("docket", "Docket"),
+        ("recap_documents", "Recap documents"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("date_filed", "Date filed"),
+        ("time_filed", "Time filed"),
+        ("entry_number", "Entry number"),
+        ("recap_sequence_number", "Recap sequence number"),
+        ("pacer_sequence_number", "Pacer sequence number"),
+        ("description", "Description"),
+        ("tags", "Tags"),
+    ),
+    "docket_entries.order_by": (
+        ("id", "Id (asc)"),
+        ("-id", "Id (desc)"),
+        ("date_created", "Date Created (asc)"),
+        ("-date_created", "Date Created (desc)"),
+        ("date_modified", "Date Modified (asc)"),
+        ("-date_modified", "Date Modified (desc)"),
+        ("date_filed", "Date Filed (asc)"),
+        ("-date_filed", "Date Filed (desc)"),
+        ("recap_sequence_number", "Recap Sequence Number (asc)"),
+        ("-recap_sequence_number", "Recap Sequence Number (desc)"),
+        ("entry_number", "Entry Number (asc)"),
+        ("-entry_number", "Entry Number (desc)"),
+    ),
+    "docket_tags.fields": (
+        ("id", "ID"),
+        ("docket", "Docket"),
+        ("tag", "Tag"),
+    ),
+    "dockets.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("court", "Court"),
+        ("court_id", "Court id"),
+        ("original_court_info", "Original court info"),
+        ("idb_data", "Idb data"),
+        ("clusters", "Clusters"),
+        ("audio_files", "Audio files"),
+        ("assigned_to", "Assigned to"),
+        ("referred_to", "Referred to"),
+        ("bankruptcy_information", "Bankruptcy information"),
+        ("absolute_url", "Absolute url"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("source", "Source"),
+        ("appeal_from_str", "Appeal from str"),
+        ("assigned_to_str", "Assigned to str"),
+        ("referred_to_str", "Referred to str"),
+        ("panel_str", "Panel str"),
+        ("date_last_index", "Date last index"),
+        ("date_cert_granted", "Date cert granted"),
+        ("date_cert_denied", "Date cert denied"),
+        ("date_argued", "Date argued"),
+        ("date_reargued", "Date reargued"),
+        ("date_reargument_denied", "Date reargument denied"),
+        ("date_filed", "Date filed"),
+        ("date_terminated", "Date terminated"),
+        ("date_last_filing", "Date last filing"),
+        ("case_name_short", "Case name short"),
+        ("case_name", "Case name"),
+        ("case_name_full", "Case name full"),
+        ("slug", "Slug"),
+        ("docket_number", "Docket number"),
+        ("docket_number_core", "Docket number core"),
+        ("docket_number_raw", "Docket number raw"),
+        ("docket_number_source", "Docket number source"),
+        ("federal_dn_office_code", "Federal dn office code"),
+        ("federal_dn_case_type", "Federal dn case type"),
+        (
+            "federal_dn_judge_initials_assigned",
+            "Federal dn judge initials assigned",
+        ),
+        (
+            "federal_dn_judge_initials_referred",
+            "Federal dn judge initials referred",
+        ),
+        ("federal_defendant_number", "Federal defendant number"),
+        ("pacer_case_id", "Pacer case id"),
+        ("cause", "Cause"),
+        ("nature_of_suit", "Nature of suit"),
+        ("jury_demand", "Jury demand"),
+        ("jurisdiction_type", "Jurisdiction type"),
+        ("appellate_fee_status", "Appellate fee status"),
+        ("appellate_case_type_information", "Appellate case type information"),
+        ("mdl_status", "Mdl status"),
+        ("filepath_ia", "Filepath ia"),
+        ("filepath_ia_json", "Filepath ia json"),
+        ("ia_upload_failure_count", "Ia upload failure count"),
+        ("ia_needs_upload", "Ia needs upload"),
+        ("ia_date_first_change", "Ia date first change"),
+        ("date_blocked", "Date blocked"),
+        ("blocked", "Blocked"),
+        ("appeal_from", "Appeal from"),
+        ("parent_docket", "Parent docket"),
+        ("tags", "Tags"),
+        ("panel", "Panel"),
+    ),
+    "dockets.order_by": (
+        ("id", "Id (asc)"),
+        ("-id", "Id (desc)"),
+        ("date_created", "Date Created (asc)"),
+        ("-date_created", "Date Created (desc)"),
+        ("date_modified", "Date Modified (asc)"),
+        ("-date_modified", "Date Modified (desc)"),
+        ("date_blocked", "Date Blocked (asc)"),
+        ("-date_blocked", "Date Blocked (desc)"),
+        ("date_filed", "Date Filed (asc)"),
+        ("-date_filed", "Date Filed (desc)"),
+        ("date_terminated", "Date Terminated (asc)"),
+        ("-date_terminated", "Date Terminated (desc)"),
+        ("date_last_filing", "Date Last Filing (asc)"),
+        ("-date_last_filing", "Date Last Filing (desc)"),
+    ),
+    "dockets.source": (
+        (0, "Default"),
+        (1, "RECAP"),
+        (2, "Scraper"),
+        (3, "RECAP and Scraper"),
+        (4, "Columbia"),
+        (6, "Columbia and Scraper"),
+        (5, "Columbia and RECAP"),
+        (7, "Columbia, RECAP, and Scraper"),
+        (8, "Integrated Database"),
+        (9, "RECAP and IDB"),
+        (10, "Scraper and IDB"),
+        (11, "RECAP, Scraper, and IDB"),
+        (12, "Columbia and IDB"),
+        (13, "Columbia, RECAP, and IDB"),
+        (14, "Columbia, Scraper, and IDB"),
+        (15, "Columbia, RECAP, Scraper, and IDB"),
+        (16, "Harvard"),
+        (17, "Harvard and RECAP"),
+        (18, "Scraper and Harvard"),
+        (19, "RECAP, Scraper and Harvard"),
+        (20, "Harvard and Columbia"),
+        (21, "Columbia, RECAP, and Harvard"),
+        (22, "Columbia, Scraper, and Harvard"),
+        (23, "Columbia, RECAP, Scraper, and Harvard"),
+        (24, "IDB and Harvard"),
+        (25, "RECAP, IDB and Harvard"),
+        (26, "Scraper, IDB and Harvard"),
+        (27, "RECAP, Scraper, IDB and Harvard"),
+        (28, "Columbia, IDB, and Harvard"),
+        (29, "Columbia, Recap, IDB, and Harvard"),
+        (30, "Columbia, Scraper, IDB, and Harvard"),
+        (31, "Columbia, Recap, Scraper, IDB, and Harvard"),
+        (32, "Direct court input"),
+        (33, "RECAP and Direct court input"),
+        (34, "Scraper and Direct court input"),
+        (35, "RECAP, Scraper, and Direct court input"),
+        (36, "Columbia and Direct court input"),
+        (37, "RECAP, Columbia, and Direct court input"),
+        (38, "Scraper, Columbia, and Direct court input"),
+        (39, "RECAP, Scraper, Columbia, and Direct court input"),
+        (40, "IDB and Direct court input"),
+        (41, "RECAP, IDB, and Direct court input"),
+        (42, "Scraper, IDB, and Direct court input"),
+        (43, "RECAP, Scraper, IDB, and Direct court input"),
+        (44, "Columbia, IDB, and Direct court input"),
+        (45, "RECAP, Columbia, IDB, and Direct court input"),
+        (46, "Scraper, Columbia, IDB, and Direct court input"),
+        (47, "RECAP, Scraper, Columbia, IDB, and Direct court input"),
+        (48, "Direct court input and Harvard"),
+        (49, "RECAP, Harvard, and Direct court input"),
+        (50, "Scraper, Harvard, and Direct court input"),
+        (51, "RECAP, Scraper, Harvard, and Direct court input"),
+        (52, "Columbia, Harvard, and Direct court input"),
+        (53, "RECAP, Columbia, Harvard, and Direct court input"),
+        (54, "Scraper, Columbia, Harvard, and Direct court input"),
+        (55, "RECAP, Scraper, Columbia, Harvard, and Direct court input"),
+        (56, "IDB, Harvard, and Direct court input"),
+        (57, "RECAP, IDB, Harvard, and Direct court input"),
+        (58, "Scraper, IDB, Harvard, and Direct court input"),
+        (59, "RECAP, Scraper, IDB, Harvard, and Direct court input"),
+        (60, "Columbia, IDB, Harvard, and Direct court input"),
+        (61, "RECAP, Columbia, IDB, Harvard, and Direct court input"),
+        (62, "Scraper, Columbia, IDB, Harvard, and Direct court input"),
+        (63, "RECAP, Scraper, Columbia, IDB, Harvard, and Direct court input"),
+        (64, "2020 anonymous database"),
+        (72, "IDB and 2020 anonymous database"),
+        (66, "2020 anonymous database and Scraper"),
+        (67, "RECAP, Scraper, and 2020 anonymous database"),
+        (68, "Columbia and 2020 anonymous database"),
+        (69, "RECAP, Columbia, and 2020 anonymous database"),
+        (70, "Scraper, Columbia, and 2020 anonymous database"),
+        (71, "RECAP, Scraper, Columbia, and 2020 anonymous database"),
+        (73, "RECAP, IDB, and 2020 anonymous database"),
+        (74, "Scraper, IDB, and 2020 anonymous database"),
+        (75, "RECAP, Scraper, IDB, and 2020 anonymous database"),
+        (76, "Columbia, IDB, and 2020 anonymous database"),
+        (77, "RECAP, Columbia, IDB, and 2020 anonymous database"),
+        (78, "Scraper, Columbia, IDB, and 2020 anonymous database"),
+        (79, "RECAP, Scraper, Columbia, IDB, and 2020 anonymous database"),
+        (80, "2020 anonymous database and Harvard"),
+        (82, "2020 anonymous database, Scraper, and Harvard"),
+        (81, "RECAP, Harvard, and 2020 anonymous database"),
+        (83, "RECAP, Scraper, Harvard, and 2020 anonymous database"),
+        (84, "Columbia, Harvard, and 2020 anonymous database"),
+        (85, "RECAP, Columbia, Harvard, and 2020 anonymous database"),
+        (86, "Scraper, Columbia, Harvard, and 2020 anonymous database"),
+        (87, "RECAP, Scraper, Columbia, Harvard, and 2020 anonymous database"),
+        (88, "IDB, Harvard, and 2020 anonymous database"),
+        (89, "RECAP, IDB, Harvard, and 2020 anonymous database"),
+        (90, "Scraper, IDB, Harvard, and 2020 anonymous database"),
+        (91, "RECAP, Scraper, IDB, Harvard, and 2020 anonymous database"),
+        (92, "Columbia, IDB, Harvard, and 2020 anonymous database"),
+        (93, "RECAP, Columbia, IDB, Harvard, and 2020 anonymous database"),
+        (94, "Scraper, Columbia, IDB, Harvard, and 2020 anonymous database"),
+        (
+            95,
+            "RECAP, Scraper, Columbia, IDB, Harvard, and 2020 anonymous database",
+        ),
+        (96, "Direct court input and 2020 anonymous database"),
+        (97, "RECAP, Direct court input, and 2020 anonymous database"),
+        (98, "Scraper, Direct court input, and 2020 anonymous database"),
+        (
+            99,
+            "RECAP, Scraper, Direct court input, and 2020 anonymous database",
+        ),
+        (100, "Columbia, Direct court input, and 2020 anonymous database"),
+        (
+            101,
+            "RECAP, Columbia, Direct court input, and 2020 anonymous database",
+        ),
+        (
+            102,
+            "Scraper, Columbia, Direct court input, and 2020 anonymous database",
+        ),
+        (
+            103,
+            "RECAP, Scraper, Columbia, Direct court input, and 2020 anonymous database",
+        ),
+        (104, "IDB, Direct court input, and 2020 anonymous database"),
+        (105, "RECAP, IDB, Direct court input, and 2020 anonymous database"),
+        (106, "Scraper, IDB, Direct court input, and 2020 anonymous database"),
+        (
+            107,
+            "RECAP, Scraper, IDB, Direct court input, and 2020 anonymous database",
+        ),
+        (
+            108,
+            "Columbia, IDB, Direct court input, and 2020 anonymous database",
+        ),
+        (
+            109,
+            "RECAP, Columbia, IDB, Direct court input, and 2020 anonymous database",
+        ),
+        (
+            110,
+            "Scraper, Columbia, IDB, Direct court input, and 2020 anonymous database",
+        ),
+        (
+            111,
+            "RECAP, Scraper, Columbia, IDB, Direct court input, and 2020 anonymous database",
+        ),
+        (112, "Harvard, Direct court input, and 2020 anonymous database"),
+        (
+            113,
+            "RECAP, Harvard, Direct court input, and 2020 anonymous database",
+        ),
+        (
+            114,
+            "Scraper, Harvard, Direct court input, and 2020 anonymous database",
+        ),
+        (
+            115,
+            "RECAP, Scraper, Harvard, Direct court input, and 2020 anonymous database",
+        ),
+        (
+            116,
+            "Columbia, Harvard, Direct court input, and 2020 anonymous database",
+        ),
+        (
+            117,
+            "RECAP, Columbia, Harvard, Direct court input, and 2020 anonymous database",
+        ),
+        (
+            118,
+            "Scraper, Columbia, Harvard, Direct court input, and 2020 anonymous database",
+        ),
+        (
+            119,
+            (
+                "RECAP, Scraper, Columbia, Harvard, Direct court input, and 2020 anonymous "
+                "database"
+            ),
+        ),
+        (120, "IDB, Harvard, Direct court input, and 2020 anonymous database"),
+        (
+            121,
+            "RECAP, IDB, Harvard, Direct court input, and 2020 anonymous database",
+        ),
+        (
+            122,
+            "Scraper, IDB, Harvard, Direct court input, and 2020 anonymous database",
+        ),
+        (
+            123,
+            "RECAP, Scraper, IDB, Harvard, Direct court input, and 2020 anonymous database",
+        ),
+        (
+            124,
+            "Columbia, IDB, Harvard, Direct court input, and 2020 anonymous database",
+        ),
+        (
+            125,
+            "RECAP, Columbia, IDB, Harvard, Direct court input, and 2020 anonymous database",
+        ),
+        (
+            126,
+            (
+                "Scraper, Columbia, IDB, Harvard, Direct court input, and 2020 anonymous "
+                "database"
+            ),
+        ),
+        (
+            127,
+            (
+                "RECAP, Scraper, Columbia, IDB, Harvard, Direct court input, and 2020 "
+                "anonymous database"
+            ),
+        ),
+        (128, "Scanning project"),
+        (129, "RECAP and scanning project"),
+        (130, "Scraper and scanning project"),
+        (131, "RECAP, scraper, and scanning project"),
+        (132, "Columbia and scanning project"),
+        (133, "Columbia, RECAP, and scanning project"),
+        (134, "Columbia, scraper, and scanning project"),
+        (135, "Columbia, RECAP, scraper, and scanning project"),
+        (136, "IDB and scanning project"),
+        (137, "RECAP, IDB, and scanning project"),
+        (138, "Scraper, IDB, and scanning project"),
+        (139, "RECAP, scraper, IDB, and scanning project"),
+        (140, "Columbia, IDB, and scanning project"),
+        (141, "Columbia, RECAP, IDB, and scanning project"),
+        (142, "Columbia, scraper, IDB, and scanning project"),
+        (143, "Columbia, RECAP, scraper, IDB, and scanning project"),
+        (144, "Harvard and scanning project"),
+        (145, "Harvard, RECAP, and scanning project"),
+        (146, "Scraper, Harvard, and scanning project"),
+        (147, "RECAP, scraper, Harvard, and scanning project"),
+        (148, "Harvard, Columbia, and scanning project"),
+        (149, "Columbia, RECAP, Harvard, and scanning project"),
+        (150, "Columbia, scraper, Harvard, and scanning project"),
+        (151, "Columbia, RECAP, scraper, Harvard, and scanning project"),
+        (152, "IDB, Harvard, and scanning project"),
+        (153, "RECAP, IDB, Harvard, and scanning project"),
+        (154, "Scraper, IDB, Harvard, and scanning project"),
+        (155, "RECAP, scraper, IDB, Harvard, and scanning project"),
+        (156, "Columbia, IDB, Harvard, and scanning project"),
+        (157, "Columbia, RECAP, IDB, Harvard, and scanning project"),
+        (158, "Columbia, scraper, IDB, Harvard, and scanning project"),
+        (159, "Columbia, RECAP, scraper, IDB, Harvard, and scanning project"),
+        (160, "Direct court input and scanning project"),
+        (161, "RECAP, direct court input, and scanning project"),
+        (162, "Scraper, direct court input, and scanning project"),
+        (163, "RECAP, scraper, direct court input, and scanning project"),
+        (164, "Columbia, direct court input, and scanning project"),
+        (165, "RECAP, Columbia, direct court input, and scanning project"),
+        (166, "Scraper, Columbia, direct court input, and scanning project"),
+        (
+            167,
+            "RECAP, scraper, Columbia, direct court input, and scanning project",
+        ),
+        (168, "IDB, direct court input, and scanning project"),
+        (169, "RECAP, IDB, direct court input, and scanning project"),
+        (170, "Scraper, IDB, direct court input, and scanning project"),
+        (171, "RECAP, scraper, IDB, direct court input, and scanning project"),
+        (172, "Columbia, IDB, direct court input, and scanning project"),
+        (
+            173,
+            "RECAP, Columbia, IDB, direct court input, and scanning project",
+        ),
+        (
+            174,
+            "Scraper, Columbia, IDB, direct court input, and scanning project",
+        ),
+        (
+            175,
+            "RECAP, scraper, Columbia, IDB, direct court input, and scanning project",
+        ),
+        (176, "Direct court input, Harvard, and scanning project"),
+        (177, "RECAP, Harvard, direct court input, and scanning project"),
+        (178, "Scraper, Harvard, direct court input, and scanning project"),
+        (
+            179,
+            "RECAP, scraper, Harvard, direct court input, and scanning project",
+        ),
+        (180, "Columbia, Harvard, direct court input, and scanning project"),
+        (
+            181,
+            "RECAP, Columbia, Harvard, direct court input, and scanning project",
+        ),
+        (
+            182,
+            "Scraper, Columbia, Harvard, direct court input, and scanning project",
+        ),
+        (
+            183,
+            "RECAP, scraper, Columbia, Harvard, direct court input, and scanning project",
+        ),
+        (184, "IDB, Harvard, direct court input, and scanning project"),
+        (185, "RECAP, IDB, Harvard, direct court input, and scanning project"),
+        (
+            186,
+            "Scraper, IDB, Harvard, direct court input, and scanning project",
+        ),
+        (
+            187,
+            "RECAP, scraper, IDB, Harvard, direct court input, and scanning project",
+        ),
+        (
+            188,
+            "Columbia, IDB, Harvard, direct court input, and scanning project",
+        ),
+        (
+            189,
+            "RECAP, Columbia, IDB, Harvard, direct court input, and scanning project",
+        ),
+        (
+            190,
+            "Scraper, Columbia, IDB, Harvard, direct court input, and scanning project",
+        ),
+        (
+            191,
+            (
+                "RECAP, scraper, Columbia, IDB, Harvard, direct court input, and scanning "
+                "project"
+            ),
+        ),
+        (192, "2020 anonymous database and scanning project"),
+        (193, "RECAP, 2020 anonymous database, and scanning project"),
+        (194, "2020 anonymous database, scraper, and scanning project"),
+        (195, "RECAP, scraper, 2020 anonymous database, and scanning project"),
+        (196, "Columbia, 2020 anonymous database, and scanning project"),
+        (
+            197,
+            "RECAP, Columbia, 2020 anonymous database, and scanning project",
+        ),
+        (
+            198,
+            "Scraper, Columbia, 2020 anonymous database, and scanning project",
+        ),
+        (
+            199,
+            "RECAP, scraper, Columbia, 2020 anonymous database, and scanning project",
+        ),
+        (200, "IDB, 2020 anonymous database, and scanning project"),
+        (201, "RECAP, IDB, 2020 anonymous database, and scanning project"),
+        (202, "Scraper, IDB, 2020 anonymous database, and scanning project"),
+        (
+            203,
+            "RECAP, scraper, IDB, 2020 anonymous database, and scanning project",
+        ),
+        (204, "Columbia, IDB, 2020 anonymous database, and scanning project"),
+        (
+            205,
+            "RECAP, Columbia, IDB, 2020 anonymous database, and scanning project",
+        ),
+        (
+            206,
+            "Scraper, Columbia, IDB, 2020 anonymous database, and scanning project",
+        ),
+        (
+            207,
+            "RECAP, scraper, Columbia, IDB, 2020 anonymous database, and scanning project",
+        ),
+        (208, "2020 anonymous database, Harvard, and scanning project"),
+        (209, "RECAP, Harvard, 2020 anonymous database, and scanning project"),
+        (
+            210,
+            "2020 anonymous database, scraper, Harvard, and scanning project",
+        ),
+        (
+            211,
+            "RECAP, scraper, Harvard, 2020 anonymous database, and scanning project",
+        ),
+        (
+            212,
+            "Columbia, Harvard, 2020 anonymous database, and scanning project",
+        ),
+        (
+            213,
+            "RECAP, Columbia, Harvard, 2020 anonymous database, and scanning project",
+        ),
+        (
+            214,
+            "Scraper, Columbia, Harvard, 2020 anonymous database, and scanning project",
+        ),
+        (
+            215,
+            (
+                "RECAP, scraper, Columbia, Harvard, 2020 anonymous database, and scanning "
+                "project"
+            ),
+        ),
+        (216, "IDB, Harvard, 2020 anonymous database, and scanning project"),
+        (
+            217,
+            "RECAP, IDB, Harvard, 2020 anonymous database, and scanning project",
+        ),
+        (
+            218,
+            "Scraper, IDB, Harvard, 2020 anonymous database, and scanning project",
+        ),
+        (
+            219,
+            "RECAP, scraper, IDB, Harvard, 2020 anonymous database, and scanning project",
+        ),
+        (
+            220,
+            "Columbia, IDB, Harvard, 2020 anonymous database, and scanning project",
+        ),
+        (
+            221,
+            "RECAP, Columbia, IDB, Harvard, 2020 anonymous database, and scanning project",
+        ),
+        (
+            222,
+            "Scraper, Columbia, IDB, Harvard, 2020 anonymous database, and scanning project",
+        ),
+        (
+            223,
+            (
+                "RECAP, scraper, Columbia, IDB, Harvard, 2020 anonymous database, and "
+                "scanning project"
+            ),
+        ),
+        (
+            224,
+            "Direct court input, 2020 anonymous database, and scanning project",
+        ),
+        (
+            225,
+            "RECAP, direct court input, 2020 anonymous database, and scanning project",
+        ),
+        (
+            226,
+            "Scraper, direct court input, 2020 anonymous database, and scanning project",
+        ),
+        (
+            227,
+            (
+                "RECAP, scraper, direct court input, 2020 anonymous database, and scanning "
+                "project"
+            ),
+        ),
+        (
+            228,
+            "Columbia, direct court input, 2020 anonymous database, and scanning project",
+        ),
+        (
+            229,
+            (
+                "RECAP, Columbia, direct court input, 2020 anonymous database, and scanning "
+                "project"
+            ),
+        ),
+        (
+            230,
+            (
+                "Scraper, Columbia, direct court input, 2020 anonymous database, and scanning "
+                "project"
+            ),
+        ),
+        (
+            231,
+            (
+                "RECAP, scraper, Columbia, direct court input, 2020 anonymous database, and "
+                "scanning project"
+            ),
+        ),
+        (
+            232,
+            "IDB, direct court input, 2020 anonymous database, and scanning project",
+        ),
+        (
+            233,
+            "RECAP, IDB, direct court input, 2020 anonymous database, and scanning project",
+        ),
+        (
+            234,
+            (
+                "Scraper, IDB, direct court input, 2020 anonymous database, and scanning "
+                "project"
+            ),
+        ),
+        (
+            235,
+            (
+                "RECAP, scraper, IDB, direct court input, 2020 anonymous database, and "
+                "scanning project"
+            ),
+        ),
+        (
+            236,
+            (
+                "Columbia, IDB, direct court input, 2020 anonymous database, and scanning "
+                "project"
+            ),
+        ),
+        (
+            237,
+            (
+                "RECAP, Columbia, IDB, direct court input, 2020 anonymous database, and "
+                "scanning project"
+            ),
+        ),
+        (
+            238,
+            (
+                "Scraper, Columbia, IDB, direct court input, 2020 anonymous database, and "
+                "scanning project"
+            ),
+        ),
+        (
+            239,
+            (
+                "RECAP, scraper, Columbia, IDB, direct court input, 2020 anonymous database, "
+                "and scanning project"
+            ),
+        ),
+        (
+            240,
+            "Harvard, direct court input, 2020 anonymous database, and scanning project",
+        ),
+        (
+            241,
+            (
+                "RECAP, Harvard, direct court input, 2020 anonymous database, and scanning "
+                "project"
+            ),
+        ),
+        (
+            242,
+            (
+                "Scraper, Harvard, direct court input, 2020 anonymous database, and scanning "
+                "project"
+            ),
+        ),
+        (
+            243,
+            (
+                "RECAP, scraper, Harvard, direct court input, 2020 anonymous database, and "
+                "scanning project"
+            ),
+        ),
+        (
+            244,
+            (
+                "Columbia, Harvard, direct court input, 2020 anonymous database, and scanning "
+                "project"
+            ),
+        ),
+        (
+            245,
+            (
+                "RECAP, Columbia, Harvard, direct court input, 2020 anonymous database, and "
+                "scanning project"
+            ),
+        ),
+        (
+            246,
+            (
+                "Scraper, Columbia, Harvard, direct court input, 2020 anonymous database, and "
+                "scanning project"
+            ),
+        ),
+        (
+            247,
+            (
+                "RECAP, scraper, Columbia, Harvard, direct court input, 2020 anonymous "
+                "database, and scanning project"
+            ),
+        ),
+        (
+            248,
+            (
+                "IDB, Harvard, direct court input, 2020 anonymous database, and scanning "
+                "project"
+            ),
+        ),
+        (
+            249,
+            (
+                "RECAP, IDB, Harvard, direct court input, 2020 anonymous database, and "
+                "scanning project"
+            ),
+        ),
+        (
+            250,
+            (
+                "Scraper, IDB, Harvard, direct court input, 2020 anonymous database, and "
+                "scanning project"
+            ),
+        ),
+        (
+            251,
+            (
+                "RECAP, scraper, IDB, Harvard, direct court input, 2020 anonymous database, "
+                "and scanning project"
+            ),
+        ),
+        (
+            252,
+            (
+                "Columbia, IDB, Harvard, direct court input, 2020 anonymous database, and "
+                "scanning project"
+            ),
+        ),
+        (
+            253,
+            (
+                "RECAP, Columbia, IDB, Harvard, direct court input, 2020 anonymous database, "
+                "and scanning project"
+            ),
+        ),
+        (
+            254,
+            (
+                "Scraper, Columbia, IDB, Harvard, direct court input, 2020 anonymous "
+                "database, and scanning project"
+            ),
+        ),
+        (
+            255,
+            (
+                "RECAP, scraper, Columbia, IDB, Harvard, direct court input, 2020 anonymous "
+                "database, and scanning project"
+            ),
+        ),
+    ),
+    "document_type": (
+        (1, "PACER Document"),
+        (2, "Attachment"),
+    ),
+    "educations.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("school", "School"),
+        ("person", "Person"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("degree_level", "Degree level"),
+        ("degree_detail", "Degree detail"),
+        ("degree_year", "Degree year"),
+    ),
+    "financial_disclosures.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("agreements", "Agreements"),
+        ("debts", "Debts"),
+        ("gifts", "Gifts"),
+        ("investments", "Investments"),
+        ("non_investment_incomes", "Non investment incomes"),
+        ("positions", "Positions"),
+        ("reimbursements", "Reimbursements"),
+        ("spouse_incomes", "Spouse incomes"),
+        ("person", "Person"),
+        ("filepath", "Filepath"),
+        ("thumbnail", "Thumbnail"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("year", "Year"),
+        ("thumbnail_status", "Thumbnail status"),
+        ("page_count", "Page count"),
+        ("sha1", "Sha1"),
+        ("report_type", "Report type"),
+        ("is_amended", "Is amended"),
+        ("addendum_content_raw", "Addendum content raw"),
+        ("addendum_redacted", "Addendum redacted"),
+        ("has_been_extracted", "Has been extracted"),
+    ),
+    "fjc_integrated_database.arbitration_at_filing": (
+        ("M", "Mandatory"),
+        ("V", "Voluntary"),
+        ("E", "Exempt"),
+        ("Y", "Yes, but type unknown"),
+    ),
+    "fjc_integrated_database.fields": (
+        ("resource_uri", "Resource uri"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("dataset_source", "Dataset source"),
+        ("office", "Office"),
+        ("docket_number", "Docket number"),
+        ("origin", "Origin"),
+        ("date_filed", "Date filed"),
+        ("jurisdiction", "Jurisdiction"),
+        ("nature_of_suit", "Nature of suit"),
+        ("title", "Title"),
+        ("section", "Section"),
+        ("subsection", "Subsection"),
+        ("diversity_of_residence", "Diversity of residence"),
+        ("class_action", "Class action"),
+        ("monetary_demand", "Monetary demand"),
+        ("county_of_residence", "County of residence"),
+        ("arbitration_at_filing", "Arbitration at filing"),
+        ("arbitration_at_termination", "Arbitration at termination"),
+        (
+            "multidistrict_litigation_docket_number",
+            "Multidistrict litigation docket number",
+        ),
+        ("plaintiff", "Plaintiff"),
+        ("defendant", "Defendant"),
+        ("date_transfer", "Date transfer"),
+        ("transfer_office", "Transfer office"),
+        ("transfer_docket_number", "Transfer docket number"),
+        ("transfer_origin", "Transfer origin"),
+        ("date_terminated", "Date terminated"),
+        ("termination_class_action_status", "Termination class action status"),
+        ("procedural_progress", "Procedural progress"),
+        ("disposition", "Disposition"),
+        ("nature_of_judgement", "Nature of judgement"),
+        ("amount_received", "Amount received"),
+        ("judgment", "Judgment"),
+        ("pro_se", "Pro se"),
+        ("year_of_tape", "Year of tape"),
+        ("nature_of_offense", "Nature of offense"),
+        ("version", "Version"),
+        ("circuit", "Circuit"),
+        ("district", "District"),
+    ),
+    "fjc_integrated_database.jurisdiction": (
+        (1, "Government plaintiff"),
+        (2, "Government defendant"),
+        (3, "Federal question"),
+        (4, "Diversity of citizenship"),
+        (5, "Local question"),
+    ),
+    "fjc_integrated_database.order_by": (
+        ("id", "Id (asc)"),
+        ("-id", "Id (desc)"),
+        ("date_created", "Date Created (asc)"),
+        ("-date_created", "Date Created (desc)"),
+        ("date_modified", "Date Modified (asc)"),
+        ("-date_modified", "Date Modified (desc)"),
+        ("date_filed", "Date Filed (asc)"),
+        ("-date_filed", "Date Filed (desc)"),
+    ),
+    "gender": (
+        ("m", "Male"),
+        ("f", "Female"),
+        ("o", "Other"),
+    ),
+    "gifts.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("source", "Source"),
+        ("description", "Description"),
+        ("value", "Value"),
+        ("redacted", "Redacted"),
+        ("financial_disclosure", "Financial disclosure"),
+    ),
+    "how_selected": (
+        ("e_part", "Election: Partisan Election"),
+        ("e_non_part", "Election: Non-Partisan Election"),
+        ("a_pres", "Appointment: Appointment (President)"),
+        ("a_gov", "Appointment: Appointment (Governor)"),
+        ("a_legis", "Appointment: Appointment (Legislature)"),
+        ("a_judge", "Appointment: Appointment (Judge)"),
+        ("ct_trans", "Other: Transferred (Court Restructuring)"),
+    ),
+    "income_during_reporting_period_code": (
+        ("A", "1 - 1,000"),
+        ("B", "1,001 - 2,500"),
+        ("C", "2,501 - 5,000"),
+        ("D", "5,001 - 15,000"),
+        ("E", "15,001 - 50,000"),
+        ("F", "50,001 - 100,000"),
+        ("G", "100,001 - 1,000,000"),
+        ("H1", "1,000,001 - 5,000,000"),
+        ("H2", "5,000,001 +"),
+        ("-1", "Failed Extraction"),
+    ),
+    "increment_event.fields": (("label", "Label"),),
+    "investments.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("page_number", "Page number"),
+        ("description", "Description"),
+        ("redacted", "Redacted"),
+        (
+            "income_during_reporting_period_code",
+            "Income during reporting period code",
+        ),
+        (
+            "income_during_reporting_period_type",
+            "Income during reporting period type",
+        ),
+        ("gross_value_code", "Gross value code"),
+        ("gross_value_method", "Gross value method"),
+        (
+            "transaction_during_reporting_period",
+            "Transaction during reporting period",
+        ),
+        ("transaction_date_raw", "Transaction date raw"),
+        ("transaction_date", "Transaction date"),
+        ("transaction_value_code", "Transaction value code"),
+        ("transaction_gain_code", "Transaction gain code"),
+        ("transaction_partner", "Transaction partner"),
+        ("has_inferred_values", "Has inferred values"),
+        ("financial_disclosure", "Financial disclosure"),
+    ),
+    "judge_search.order_by": (
+        ("score desc", "Relevance"),
+        ("name_reverse asc", "Last Name"),
+        ("dob desc,name_reverse asc", "Most Recently Born"),
+        ("dob asc,name_reverse asc", "Least Recently Born"),
+        ("dod desc,name_reverse asc", "Most Recently Deceased"),
+    ),
+    "judgment": (
+        (1, "Plaintiff"),
+        (2, "Defendant"),
+        (3, "Both plaintiff and defendant"),
+        (4, "Unknown"),
+    ),
+    "judicial_committee_action": (
+        ("no_rep", "Not Reported"),
+        ("rep_w_rec", "Reported with Recommendation"),
+        ("rep_wo_rec", "Reported without Recommendation"),
+        ("rec_postpone", "Recommendation Postponed"),
+        ("rec_bad", "Recommended Unfavorably"),
+    ),
+    "name_suffix": (
+        ("jr", "Jr."),
+        ("sr", "Sr."),
+        ("1", "I"),
+        ("2", "II"),
+        ("3", "III"),
+        ("4", "IV"),
+    ),
+    "nomination_process": (
+        ("fed_senate", "U.S. Senate"),
+        ("state_senate", "State Senate"),
+        ("election", "Primary Election"),
+        ("merit_comm", "Merit Commission"),
+    ),
+    "non_investment_incomes.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("date_raw", "Date raw"),
+        ("source_type", "Source type"),
+        ("income_amount", "Income amount"),
+        ("redacted", "Redacted"),
+        ("financial_disclosure", "Financial disclosure"),
+    ),
+    "ocr_status": (
+        (1, "OCR Complete"),
+        (2, "OCR Not Necessary"),
+        (3, "OCR Failed"),
+        (4, "OCR Needed"),
+    ),
+    "opinion_search.order_by": (
+        ("score desc", "Relevance"),
+        ("dateFiled desc", "Newest Cases First"),
+        ("dateFiled asc", "Oldest Cases First"),
+        ("citeCount desc", "Most Cited First"),
+        ("citeCount asc", "Least Cited First"),
+    ),
+    "opinions.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("absolute_url", "Absolute url"),
+        ("cluster_id", "Cluster id"),
+        ("cluster", "Cluster"),
+        ("author_id", "Author id"),
+        ("author", "Author"),
+        ("joined_by", "Joined by"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("author_str", "Author str"),
+        ("per_curiam", "Per curiam"),
+        ("joined_by_str", "Joined by str"),
+        ("type", "Type"),
+        ("sha1", "Sha1"),
+        ("page_count", "Page count"),
+        ("download_url", "Download url"),
+        ("local_path", "Local path"),
+        ("plain_text", "Plain text"),
+        ("html", "Html"),
+        ("html_lawbox", "Html lawbox"),
+        ("html_columbia", "Html columbia"),
+        ("html_anon_2020", "Html anon 2020"),
+        ("xml_harvard", "Xml harvard"),
+        ("xml_scan", "Xml scan"),
+        ("html_with_citations", "Html with citations"),
+        ("extracted_by_ocr", "Extracted by ocr"),
+        ("ordering_key", "Ordering key"),
+        ("main_version", "Main version"),
+        ("opinions_cited", "Opinions cited"),
+    ),
+    "opinions.order_by": (
+        ("id", "Id (asc)"),
+        ("-id", "Id (desc)"),
+        ("date_created", "Date Created (asc)"),
+        ("-date_created", "Date Created (desc)"),
+        ("date_modified", "Date Modified (asc)"),
+        ("-date_modified", "Date Modified (desc)"),
+    ),
+    "opinions.type": (
+        ("010combined", "Combined Opinion"),
+        ("015unamimous", "Unanimous Opinion"),
+        ("020lead", "Lead Opinion"),
+        ("025plurality", "Plurality Opinion"),
+        ("030concurrence", "Concurrence Opinion"),
+        ("035concurrenceinpart", "In Part Opinion"),
+        ("040dissent", "Dissent"),
+        ("050addendum", "Addendum"),
+        ("060remittitur", "Remittitur"),
+        ("070rehearing", "Rehearing"),
+        ("080onthemerits", "On the Merits"),
+        ("090onmotiontostrike", "On Motion to Strike Cost Bill"),
+        ("100trialcourt", "Trial Court Document"),
+    ),
+    "opinions_cited.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("citing_opinion", "Citing opinion"),
+        ("cited_opinion", "Cited opinion"),
+        ("depth", "Depth"),
+    ),
+    "oral_argument_search.order_by": (
+        ("score desc", "Relevance"),
+        ("dateArgued desc", "Newest First"),
+        ("dateArgued asc", "Oldest First"),
+    ),
+    "origin": (
+        (1, "Original Proceeding"),
+        (
+            2,
+            "Removed  (began in the state court, removed to the district court)",
+        ),
+        (3, "Remanded for further action (removal from court of appeals)"),
+        (
+            4,
+            (
+                "Reinstated/reopened (previously opened and closed, reopened for additional "
+                "action)"
+            ),
+        ),
+        (5, "Transferred from another district(pursuant to 28 USC 1404)"),
+        (
+            6,
+            (
+                "Multi district litigation (cases transferred to this district by an order "
+                "entered by Judicial Panel on Multi District Litigation pursuant to 28 USC "
+                "1407)"
+            ),
+        ),
+        (7, "Appeal to a district judge of a magistrate judge's decision"),
+        (8, "Second reopen"),
+        (9, "Third reopen"),
+        (10, "Fourth reopen"),
+        (11, "Fifth reopen"),
+        (12, "Sixth reopen"),
+        (
+            13,
+            (
+                "Multi district litigation originating in the district (valid beginning July "
+                "1, 2016)"
+            ),
+        ),
+    ),
+    "originating_court_information.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("docket_number", "Docket number"),
+        ("docket_number_raw", "Docket number raw"),
+        ("assigned_to_str", "Assigned to str"),
+        ("ordering_judge_str", "Ordering judge str"),
+        ("court_reporter", "Court reporter"),
+        ("date_disposed", "Date disposed"),
+        ("date_filed", "Date filed"),
+        ("date_judgment", "Date judgment"),
+        ("date_judgment_eod", "Date judgment eod"),
+        ("date_filed_noa", "Date filed noa"),
+        ("date_received_coa", "Date received coa"),
+        ("date_rehearing_denied", "Date rehearing denied"),
+        ("assigned_to", "Assigned to"),
+        ("ordering_judge", "Ordering judge"),
+    ),
+    "parties.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("attorneys", "Attorneys"),
+        ("party_types", "Party types"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("name", "Name"),
+        ("extra_info", "Extra info"),
+    ),
+    "people.dob_state": (
+        ("AL", "Alabama"),
+        ("AK", "Alaska"),
+        ("AS", "American Samoa"),
+        ("AZ", "Arizona"),
+        ("AR", "Arkansas"),
+        ("AA", "Armed Forces Americas"),
+        ("AE", "Armed Forces Europe"),
+        ("AP", "Armed Forces Pacific"),
+        ("CA", "California"),
+        ("CO", "Colorado"),
+        ("CT", "Connecticut"),
+        ("DE", "Delaware"),
+        ("DC", "District of Columbia"),
+        ("FL", "Florida"),
+        ("GA", "Georgia"),
+        ("GU", "Guam"),
+        ("HI", "Hawaii"),
+        ("ID", "Idaho"),
+        ("IL", "Illinois"),
+        ("IN", "Indiana"),
+        ("IA", "Iowa"),
+        ("KS", "Kansas"),
+        ("KY", "Kentucky"),
+        ("LA", "Louisiana"),
+        ("ME", "Maine"),
+        ("MD", "Maryland"),
+        ("MA", "Massachusetts"),
+        ("MI", "Michigan"),
+        ("MN", "Minnesota"),
+        ("MS", "Mississippi"),
+        ("MO", "Missouri"),
+        ("MT", "Montana"),
+        ("NE", "Nebraska"),
+        ("NV", "Nevada"),
+        ("NH", "New Hampshire"),
+        ("NJ", "New Jersey"),
+        ("NM", "New Mexico"),
+        ("NY", "New York"),
+        ("NC", "North Carolina"),
+        ("ND", "North Dakota"),
+        ("MP", "Northern Mariana Islands"),
+        ("OH", "Ohio"),
+        ("OK", "Oklahoma"),
+        ("OR", "Oregon"),
+        ("PA", "Pennsylvania"),
+        ("PR", "Puerto Rico"),
+        ("RI", "Rhode Island"),
+        ("SC", "South Carolina"),
+        ("SD", "South Dakota"),
+        ("TN", "Tennessee"),
+        ("TX", "Texas"),
+        ("UT", "Utah"),
+        ("VT", "Vermont"),
+        ("VI", "Virgin Islands"),
+        ("VA", "Virginia"),
+        ("WA", "Washington"),
+        ("WV", "West Virginia"),
+        ("WI", "Wisconsin"),
+        ("WY", "Wyoming"),
+    ),
+    "people.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("race", "Race"),
+        ("sources", "Sources"),
+        ("aba_ratings", "Aba ratings"),
+        ("educations", "Educations"),
+        ("positions", "Positions"),
+        ("political_affiliations", "Political affiliations"),
+        ("is_alias_of", "Is alias of"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("date_completed", "Date completed"),
+        ("fjc_id", "Fjc id"),
+        ("slug", "Slug"),
+        ("name_first", "Name first"),
+        ("name_middle", "Name middle"),
+        ("name_last", "Name last"),
+        ("name_suffix", "Name suffix"),
+        ("date_dob", "Date dob"),
+        ("date_granularity_dob", "Date granularity dob"),
+        ("date_dod", "Date dod"),
+        ("date_granularity_dod", "Date granularity dod"),
+        ("dob_city", "Dob city"),
+        ("dob_state", "Dob state"),
+        ("dob_country", "Dob country"),
+        ("dod_city", "Dod city"),
+        ("dod_state", "Dod state"),
+        ("dod_country", "Dod country"),
+        ("gender", "Gender"),
+        ("religion", "Religion"),
+        ("ftm_total_received", "Ftm total received"),
+        ("ftm_eid", "Ftm eid"),
+        ("has_photo", "Has photo"),
+    ),
+    "people.order_by": (
+        ("id", "Id (asc)"),
+        ("-id", "Id (desc)"),
+        ("date_created", "Date Created (asc)"),
+        ("-date_created", "Date Created (desc)"),
+        ("date_modified", "Date Modified (asc)"),
+        ("-date_modified", "Date Modified (desc)"),
+        ("date_dob", "Date Dob (asc)"),
+        ("-date_dob", "Date Dob (desc)"),
+        ("date_dod", "Date Dod (asc)"),
+        ("-date_dod", "Date Dod (desc)"),
+        ("name_last", "Name Last (asc)"),
+        ("-name_last", "Name Last (desc)"),
+    ),
+    "political_affiliations.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("person", "Person"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("political_party", "Political party"),
+        ("source", "Source"),
+        ("date_start", "Date start"),
+        ("date_granularity_start", "Date granularity start"),
+        ("date_end", "Date end"),
+        ("date_granularity_end", "Date granularity end"),
+    ),
+    "political_affiliations.order_by": (
+        ("id", "Id (asc)"),
+        ("-id", "Id (desc)"),
+        ("date_created", "Date Created (asc)"),
+        ("-date_created", "Date Created (desc)"),
+        ("date_modified", "Date Modified (asc)"),
+        ("-date_modified", "Date Modified (desc)"),
+        ("date_start", "Date Start (asc)"),
+        ("-date_start", "Date Start (desc)"),
+        ("date_end", "Date End (asc)"),
+        ("-date_end", "Date End (desc)"),
+    ),
+    "political_affiliations.source": (
+        ("b", "Ballot"),
+        ("a", "Appointer"),
+        ("o", "Other"),
+    ),
+    "position_type": (
+        ("jud", "Judge: Judge"),
+        ("jus", "Judge: Justice"),
+        ("ad-law-jud", "Judge: Administrative Law Judge"),
+        ("act-jud", "Judge: Acting Judge"),
+        ("act-jus", "Judge: Acting Justice"),
+        ("act-pres-jud", "Judge: Acting Presiding Judge"),
+        ("act-c-admin-jus", "Judge: Acting Chief Administrative Justice"),
+        ("ass-jud", "Judge: Associate Judge"),
+        ("ass-jus", "Judge: Associate Justice"),
+        ("ass-c-jud", "Judge: Associate Chief Judge"),
+        ("ass-pres-jud", "Judge: Associate Presiding Judge"),
+        ("asst-pres-jud", "Judge: Assistant Presiding Judge"),
+        ("c-jud", "Judge: Chief Judge"),
+        ("c-jus", "Judge: Chief Justice"),
+        ("c-spec-m", "Judge: Chief Special Master"),
+        ("c-admin-jus", "Judge: Chief Administrative Justice"),
+        ("c-spec-tr-jud", "Judge: Chief Special Trial Judge"),
+        ("pres-jud", "Judge: Presiding Judge"),
+        ("pres-jus", "Judge: Presiding Justice"),
+        ("sup-jud", "Judge: Supervising Judge"),
+        ("ad-pres-jus", "Judge: Administrative Presiding Justice"),
+        ("com", "Judge: Commissioner"),
+        ("com-dep", "Judge: Deputy Commissioner"),
+        ("jud-pt", "Judge: Judge Pro Tem"),
+        ("jus-pt", "Judge: Justice Pro Tem"),
+        ("ref-jud-tr", "Judge: Judge Trial Referee"),
+        ("ref-off", "Judge: Official Referee"),
+        ("ref-state-trial", "Judge: State Trial Referee"),
+        ("ret-act-jus", "Judge: Active Retired Justice"),
+        ("ret-ass-jud", "Judge: Retired Associate Judge"),
+        ("ret-c-jud", "Judge: Retired Chief Judge"),
+        ("ret-jus", "Judge: Retired Justice"),
+        ("ret-senior-jud", "Judge: Senior Judge"),
+        ("mag", "Judge: Magistrate"),
+        ("c-mag", "Judge: Chief Magistrate"),
+        ("pres-mag", "Judge: Presiding Magistrate"),
+        ("mag-pt", "Judge: Magistrate Pro Tem"),
+        ("mag-rc", "Judge: Magistrate (Recalled)"),
+        ("mag-part-time", "Judge: Magistrate (Part-Time)"),
+        ("spec-chair", "Judge: Special Chairman"),
+        ("spec-jud", "Judge: Special Judge"),
+        ("spec-m", "Judge: Special Master"),
+        (
+            "spec-scjcbc",
+            "Judge: Special Superior Court Judge for Complex Business Cases",
+        ),
+        ("spec-tr-jud", "Judge: Special Trial Judge"),
+        ("chair", "Judge: Chairman"),
+        ("chan", "Judge: Chancellor"),
+        ("presi-jud", "Judge: President"),
+        ("res-jud", "Judge: Reserve Judge"),
+        ("trial-jud", "Judge: Trial Judge"),
+        ("vice-chan", "Judge: Vice Chancellor"),
+        ("vice-cj", "Judge: Vice Chief Judge"),
+        ("att-gen", "Attorney General: Attorney General"),
+        ("att-gen-ass", "Attorney General: Assistant Attorney General"),
+        (
+            "att-gen-ass-spec",
+            "Attorney General: Special Assistant Attorney General",
+        ),
+        ("sen-counsel", "Attorney General: Senior Counsel"),
+        ("dep-sol-gen", "Attorney General: Deputy Solicitor General"),
+        ("pres", "Appointing Authority: President of the United States"),
+        ("gov", "Appointing Authority: Governor"),
+        ("mayor", "Appointing Authority: Mayor"),
+        ("clerk", "Clerkships: Clerk"),
+        ("clerk-chief-dep", "Clerkships: Chief Deputy Clerk"),
+        ("staff-atty", "Clerkships: Staff Attorney"),
+        ("prof", "Professor"),
+        ("adj-prof", "Adjunct Professor"),
+        ("prac", "Practitioner"),
+        ("pros", "Prosecutor"),
+        ("pub-def", "Public Defender"),
+        ("da", "District Attorney"),
+        ("ada", "Assistant District Attorney"),
+        ("legis", "Legislator"),
+        ("sen", "Senator"),
+        ("state-sen", "State Senator"),
+    ),
+    "positions.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("retention_events", "Retention events"),
+        ("person", "Person"),
+        ("supervisor", "Supervisor"),
+        ("predecessor", "Predecessor"),
+        ("school", "School"),
+        ("court", "Court"),
+        ("appointer", "Appointer"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("position_type", "Position type"),
+        ("job_title", "Job title"),
+        ("sector", "Sector"),
+        ("organization_name", "Organization name"),
+        ("location_city", "Location city"),
+        ("location_state", "Location state"),
+        ("date_nominated", "Date nominated"),
+        ("date_elected", "Date elected"),
+        ("date_recess_appointment", "Date recess appointment"),
+        (
+            "date_referred_to_judicial_committee",
+            "Date referred to judicial committee",
+        ),
+        ("date_judicial_committee_action", "Date judicial committee action"),
+        ("judicial_committee_action", "Judicial committee action"),
+        ("date_hearing", "Date hearing"),
+        ("date_confirmation", "Date confirmation"),
+        ("date_start", "Date start"),
+        ("date_granularity_start", "Date granularity start"),
+        ("date_termination", "Date termination"),
+        ("termination_reason", "Termination reason"),
+        ("date_granularity_termination", "Date granularity termination"),
+        ("date_retirement", "Date retirement"),
+        ("nomination_process", "Nomination process"),
+        ("vote_type", "Vote type"),
+        ("voice_vote", "Voice vote"),
+        ("votes_yes", "Votes yes"),
+        ("votes_no", "Votes no"),
+        ("votes_yes_percent", "Votes yes percent"),
+        ("votes_no_percent", "Votes no percent"),
+        ("how_selected", "How selected"),
+        ("has_inferred_values", "Has inferred values"),
+    ),
+    "positions.order_by": (
+        ("id", "Id (asc)"),
+        ("-id", "Id (desc)"),
+        ("date_created", "Date Created (asc)"),
+        ("-date_created", "Date Created (desc)"),
+        ("date_modified", "Date Modified (asc)"),
+        ("-date_modified", "Date Modified (desc)"),
+        ("date_nominated", "Date Nominated (asc)"),
+        ("-date_nominated", "Date Nominated (desc)"),
+        ("date_elected", "Date Elected (asc)"),
+        ("-date_elected", "Date Elected (desc)"),
+        ("date_recess_appointment", "Date Recess Appointment (asc)"),
+        ("-date_recess_appointment", "Date Recess Appointment (desc)"),
+        (
+            "date_referred_to_judicial_committee",
+            "Date Referred To Judicial Committee (asc)",
+        ),
+        (
+            "-date_referred_to_judicial_committee",
+            "Date Referred To Judicial Committee (desc)",
+        ),
+        (
+            "date_judicial_committee_action",
+            "Date Judicial Committee Action (asc)",
+        ),
+        (
+            "-date_judicial_committee_action",
+            "Date Judicial Committee Action (desc)",
+        ),
+        ("date_hearing", "Date Hearing (asc)"),
+        ("-date_hearing", "Date Hearing (desc)"),
+        ("date_confirmation", "Date Confirmation (asc)"),
+        ("-date_confirmation", "Date Confirmation (desc)"),
+        ("date_start", "Date Start (asc)"),
+        ("-date_start", "Date Start (desc)"),
+        ("date_retirement", "Date Retirement (asc)"),
+        ("-date_retirement", "Date Retirement (desc)"),
+        ("date_termination", "Date Termination (asc)"),
+        ("-date_termination", "Date Termination (desc)"),
+    ),
+    "prayers.fields": (
+        ("id", "ID"),
+        ("date_created", "Date created"),
+        ("status", "Status"),
+        ("recap_document", "Recap document"),
+    ),
+    "prayers.order_by": (
+        ("date_created", "Date Created (asc)"),
+        ("-date_created", "Date Created (desc)"),
+    ),
+    "prayers.status": (
+        (1, "Still waiting for the document."),
+        (2, "Prayer has been granted."),
+    ),
+    "precedential_status": (
+        ("Published", "Precedential"),
+        ("Unpublished", "Non-Precedential"),
+        ("Errata", "Errata"),
+        ("Separate", "Separate Opinion"),
+        ("In-chambers", "In-chambers"),
+        ("Relating-to", "Relating-to orders"),
+        ("Unknown", "Unknown Status"),
+    ),
+    "pro_se": (
+        (0, "No pro se plaintiffs or defendants"),
+        (1, "Pro se plaintiffs, but no pro se defendants"),
+        (2, "Pro se defendants, but no pro se plaintiffs"),
+        (3, "Both pro se plaintiffs & defendants"),
+    ),
+    "procedural_progress": (
+        (1, "Before issue joined: No court action (before issue joined)"),
+        (2, "Before issue joined: Order entered"),
+        (11, "Before issue joined: Hearing held"),
+        (12, "Before issue joined: Order decided"),
+        (3, "After issue joined: No court action (after issue joined)"),
+        (4, "After issue joined: Judgment on motion"),
+        (5, "After issue joined: Pretrial conference held"),
+        (6, "After issue joined: During court trial"),
+        (7, "After issue joined: During jury trial"),
+        (8, "After issue joined: After court trial"),
+        (9, "After issue joined: After jury trial"),
+        (10, "After issue joined: Other"),
+        (
+            13,
+            "After issue joined: Request for trial de novo after arbitration",
+        ),
+    ),
+    "race": (
+        ("w", "White"),
+        ("b", "Black or African American"),
+        ("i", "American Indian or Alaska Native"),
+        ("a", "Asian"),
+        ("p", "Native Hawaiian or Other Pacific Islander"),
+        ("mena", "Middle Eastern/North African"),
+        ("h", "Hispanic/Latino"),
+        ("o", "Other"),
+    ),
+    "rate": (
+        ("rt", "Real Time"),
+        ("dly", "Daily"),
+        ("wly", "Weekly"),
+        ("mly", "Monthly"),
+        ("off", "Off"),
+    ),
+    "rating": (
+        ("ewq", "Exceptionally Well Qualified"),
+        ("wq", "Well Qualified"),
+        ("q", "Qualified"),
+        ("nq", "Not Qualified"),
+        ("nqa", "Not Qualified By Reason of Age"),
+    ),
+    "recap_documents.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("tags", "Tags"),
+        ("absolute_url", "Absolute url"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("sha1", "Sha1"),
+        ("page_count", "Page count"),
+        ("file_size", "File size"),
+        ("filepath_local", "Filepath local"),
+        ("filepath_ia", "Filepath ia"),
+        ("ia_upload_failure_count", "Ia upload failure count"),
+        ("thumbnail", "Thumbnail"),
+        ("thumbnail_status", "Thumbnail status"),
+        ("plain_text", "Plain text"),
+        ("ocr_status", "Ocr status"),
+        ("date_upload", "Date upload"),
+        ("document_number", "Document number"),
+        ("attachment_number", "Attachment number"),
+        ("pacer_doc_id", "Pacer doc id"),
+        ("is_available", "Is available"),
+        ("is_free_on_pacer", "Is free on pacer"),
+        ("is_sealed", "Is sealed"),
+        ("document_type", "Document type"),
+        ("description", "Description"),
+        ("acms_document_guid", "Acms document guid"),
+    ),
+    "recap_documents.order_by": (
+        ("id", "Id (asc)"),
+        ("-id", "Id (desc)"),
+        ("date_created", "Date Created (asc)"),
+        ("-date_created", "Date Created (desc)"),
+        ("date_modified", "Date Modified (asc)"),
+        ("-date_modified", "Date Modified (desc)"),
+        ("date_upload", "Date Upload (asc)"),
+        ("-date_upload", "Date Upload (desc)"),
+    ),
+    "recap_fetch.fields": (
+        ("id", "ID"),
+        ("court", "Court"),
+        ("docket", "Docket"),
+        ("recap_document", "Recap document"),
+        ("pacer_username", "Pacer username"),
+        ("pacer_password", "Pacer password"),
+        ("client_code", "Client code"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("date_completed", "Date completed"),
+        ("status", "Status"),
+        ("request_type", "Request type"),
+        ("message", "Message"),
+        ("pacer_case_id", "Pacer case id"),
+        ("docket_number", "Docket number"),
+        ("de_date_start", "De date start"),
+        ("de_date_end", "De date end"),
+        ("de_number_start", "De number start"),
+        ("de_number_end", "De number end"),
+        ("show_parties_and_counsel", "Show parties and counsel"),
+        ("show_terminated_parties", "Show terminated parties"),
+        ("show_list_of_member_cases", "Show list of member cases"),
+    ),
+    "recap_fetch.order_by": (
+        ("id", "Id (asc)"),
+        ("-id", "Id (desc)"),
+        ("date_created", "Date Created (asc)"),
+        ("-date_created", "Date Created (desc)"),
+        ("date_modified", "Date Modified (asc)"),
+        ("-date_modified", "Date Modified (desc)"),
+        ("date_completed", "Date Completed (asc)"),
+        ("-date_completed", "Date Completed (desc)"),
+    ),
+    "recap_fetch.status": (
+        (1, "Awaiting processing in queue."),
+        (2, "Item processed successfully."),
+        (3, "Item encountered an error while processing."),
+        (4, "Item is currently being processed."),
+        (5, "Item failed processing, but will be retried."),
+        (6, "Item failed validity tests."),
+        (7, "There was insufficient metadata to complete the task."),
+    ),
+    "recap_query.fields": (
+        ("pacer_doc_id", "Pacer doc id"),
+        ("filepath_local", "Filepath local"),
+        ("acms_document_guid", "Acms document guid"),
+        ("id", "ID"),
+    ),
+    "recap_search.order_by": (
+        ("score desc", "Relevance"),
+        ("dateFiled desc", "Newest Cases First"),
+        ("dateFiled asc", "Oldest Cases First"),
+        ("entry_date_filed desc", "Newest Documents First"),
+        ("entry_date_filed asc", "Oldest Documents First"),
+    ),
+    "reimbursements.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("source", "Source"),
+        ("date_raw", "Date raw"),
+        ("location", "Location"),
+        ("purpose", "Purpose"),
+        ("items_paid_or_provided", "Items paid or provided"),
+        ("redacted", "Redacted"),
+        ("financial_disclosure", "Financial disclosure"),
+    ),
+    "request_type": (
+        (1, "HTML Docket"),
+        (2, "PDF"),
+        (3, "Attachment Page"),
+    ),
+    "retention_events.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("position", "Position"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("retention_type", "Retention type"),
+        ("date_retention", "Date retention"),
+        ("votes_yes", "Votes yes"),
+        ("votes_no", "Votes no"),
+        ("votes_yes_percent", "Votes yes percent"),
+        ("votes_no_percent", "Votes no percent"),
+        ("unopposed", "Unopposed"),
+        ("won", "Won"),
+    ),
+    "retention_events.order_by": (
+        ("id", "Id (asc)"),
+        ("-id", "Id (desc)"),
+        ("date_created", "Date Created (asc)"),
+        ("-date_created", "Date Created (desc)"),
+        ("date_modified", "Date Modified (asc)"),
+        ("-date_modified", "Date Modified (desc)"),
+        ("date_retention", "Date Retention (asc)"),
+        ("-date_retention", "Date Retention (desc)"),
+    ),
+    "retention_type": (
+        ("reapp_gov", "Governor Reappointment"),
+        ("reapp_leg", "Legislative Reappointment"),
+        ("elec_p", "Partisan Election"),
+        ("elec_n", "Nonpartisan Election"),
+        ("elec_u", "Uncontested Election"),
+    ),
+    "scdb_decision_direction": (
+        (1, "Conservative"),
+        (2, "Liberal"),
+        (3, "Unspecifiable"),
+    ),
+    "schools.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("is_alias_of", "Is alias of"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("name", "Name"),
+        ("ein", "Ein"),
+    ),
+    "schools.order_by": (
+        ("id", "Id (asc)"),
+        ("-id", "Id (desc)"),
+        ("date_created", "Date Created (asc)"),
+        ("-date_created", "Date Created (desc)"),
+        ("date_modified", "Date Modified (asc)"),
+        ("-date_modified", "Date Modified (desc)"),
+        ("name", "Name (asc)"),
+        ("-name", "Name (desc)"),
+    ),
+    "search.order_by": (
+        ("score desc", "Relevance"),
+        ("dateFiled desc", "Newest Cases First"),
+        ("dateFiled asc", "Oldest Cases First"),
+        ("citeCount desc", "Most Cited First"),
+        ("citeCount asc", "Least Cited First"),
+        ("entry_date_filed desc", "Newest Documents First"),
+        ("entry_date_filed asc", "Oldest Documents First"),
+        ("name_reverse asc", "Last Name"),
+        ("dob desc,name_reverse asc", "Most Recently Born"),
+        ("dob asc,name_reverse asc", "Least Recently Born"),
+        ("dod desc,name_reverse asc", "Most Recently Deceased"),
+        ("dateArgued desc", "Newest First"),
+        ("dateArgued asc", "Oldest First"),
+    ),
+    "search.political_affiliation": (
+        ("d", "Democratic"),
+        ("r", "Republican"),
+        ("i", "Independent"),
+        ("g", "Green"),
+        ("l", "Libertarian"),
+        ("f", "Federalist"),
+        ("w", "Whig"),
+        ("j", "Jeffersonian Republican"),
+        ("u", "National Union"),
+        ("z", "Reform Party"),
+    ),
+    "search.type": (
+        ("o", "Opinion"),
+        ("r", "Recap"),
+        ("rd", "Document"),
+        ("d", "Docket"),
+        ("p", "Judge"),
+        ("oa", "Oral Argument"),
+    ),
+    "selection_method": (
+        ("e_part", "Partisan Election"),
+        ("appoine_non_parttment", "Non-Partisan Election"),
+        ("a_pres", "Appointment (President)"),
+        ("a_gov", "Appointment (Governor)"),
+        ("a_legis", "Appointment (Legislature)"),
+        ("a_judge", "Appointment (Judge)"),
+        ("ct_trans", "Transferred (Court Restructuring)"),
+    ),
+    "sources.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("person", "Person"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("url", "Url"),
+        ("date_accessed", "Date accessed"),
+        ("notes", "Notes"),
+    ),
+    "sources.order_by": (
+        ("id", "Id (asc)"),
+        ("-id", "Id (desc)"),
+        ("date_modified", "Date Modified (asc)"),
+        ("-date_modified", "Date Modified (desc)"),
+        ("date_accessed", "Date Accessed (asc)"),
+        ("-date_accessed", "Date Accessed (desc)"),
+    ),
+    "spouse_incomes.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("source_type", "Source type"),
+        ("date_raw", "Date raw"),
+        ("redacted", "Redacted"),
+        ("financial_disclosure", "Financial disclosure"),
+    ),
+    "stt_status": (
+        (0, "Speech to Text Needed"),
+        (1, "Speech to Text Complete"),
+        (2, "Speech to Text Failed"),
+        (3, "Transcription does not match audio"),
+        (4, "File size is bigger than 25 MB"),
+        (5, "File does not exist"),
+    ),
+    "tag.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("name", "Name"),
+    ),
+    "tags.fields": (
+        ("id", "ID"),
+        ("description", "Description"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("name", "Name"),
+        ("title", "Title"),
+        ("view_count", "View count"),
+        ("published", "Published"),
+        ("dockets", "Dockets"),
+    ),
+    "tags.order_by": (
+        ("date_created", "Date Created (asc)"),
+        ("-date_created", "Date Created (desc)"),
+        ("date_modified", "Date Modified (asc)"),
+        ("-date_modified", "Date Modified (desc)"),
+        ("name", "Name (asc)"),
+        ("-name", "Name (desc)"),
+        ("view_count", "View Count (asc)"),
+        ("-view_count", "View Count (desc)"),
+    ),
+    "termination_class_action_status": (
+        (2, "Denied"),
+        (3, "Granted"),
+    ),
+    "termination_reason": (
+        ("ded", "Death"),
+        ("retire_vol", "Voluntary Retirement"),
+        ("retire_mand", "Mandatory Retirement"),
+        ("resign", "Resigned"),
+        ("other_pos", "Appointed to Other Judgeship"),
+        ("lost", "Lost Election"),
+        ("abolished", "Court Abolished"),
+        ("bad_judge", "Impeached and Convicted"),
+        ("recess_not_confirmed", "Recess Appointment Not Confirmed"),
+        ("termed_out", "Term Limit Reached"),
+    ),
+    "visualizations.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("title", "Title"),
+        ("cluster_start", "Cluster start"),
+        ("cluster_end", "Cluster end"),
+        ("json_versions", "Json versions"),
+        ("clusters", "Clusters"),
+        ("absolute_url", "Absolute url"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("date_published", "Date published"),
+        ("date_deleted", "Date deleted"),
+        ("slug", "Slug"),
+        ("notes", "Notes"),
+        ("view_count", "View count"),
+        ("published", "Published"),
+        ("deleted", "Deleted"),
+        ("generation_time", "Generation time"),
+    ),
+    "visualizations_json.fields": (
+        ("resource_uri", "Resource uri"),
+        ("id", "Id"),
+        ("date_created", "Date created"),
+        ("date_modified", "Date modified"),
+        ("json_data", "Json data"),
+        ("map", "Map"),
+    ),
+}
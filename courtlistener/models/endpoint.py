@@ -1,3 +1,5 @@
+import importlib
+from collections.abc import Iterator, Mapping
 from typing import Any, ClassVar
 
 from pydantic import BaseModel, ConfigDict, model_validator
@@ -19,3 +21,51 @@ class Endpoint(BaseModel):
     def validate_filters(cls, data: Any) -> dict[str, Any]:
         assert isinstance(data, dict)
         return unflatten_filters(data)
+
+
+class EndpointRegistry(Mapping[str, type[Endpoint]]):
+    """Endpoint models by attribute name, each imported on first access.
+
+    Each generated endpoint module builds a pydantic model when it is
+    imported, so importing all of them up front makes
+    ``import courtlistener`` slow for scripts that touch one or two
+    endpoints. Membership tests and iteration over names import
+    nothing; looking up a model imports only its module.
+    """
+
+    def __init__(self, package: str, classes: dict[str, str]) -> None:
+        """Set up the registry.
+
+        Args:
+            package: Package holding one module per endpoint, named by
+                the endpoint's attribute name.
+            classes: Endpoint class name by attribute name.
+        """
+        self._package = package
+        self._classes = classes
+        self._names_by_class = {
+            class_name: name for name, class_name in classes.items()
+        }
+        self._models: dict[str, type[Endpoint]] = {}
+
+    def __getitem__(self, name: str) -> type[Endpoint]:
+        model = self._models.get(name)
+        if model is None:
+            class_name = self._classes[name]
+            module = importlib.import_module(f"{self._package}.{name}")
+            model = self._models[name] = getattr(module, class_name)
+        return model
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._classes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._classes)
+
+    def __len__(self) -> int:
+        return len(self._classes)
+
+    def by_class_name(self, class_name: str) -> type[Endpoint] | None:
+        """Return the model whose class is named ``class_name``, if any."""
+        name = self._names_by_class.get(class_name)
+        return None if name is None else self[name]
@@ -30,18 +30,7 @@ class AbaRatingsEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {"value": "person", "display_name": "Person"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {"value": "year_rated", "display_name": "Year rated"},
-                    {"value": "rating", "display_name": "Rating"},
-                ],
+                "choices_id": "aba_ratings.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -80,19 +69,7 @@ class AbaRatingsEndpoint(Endpoint):
             None,
             description="The rating given to the person.",
             json_schema_extra={
-                "choices": [
-                    {
-                        "value": "ewq",
-                        "display_name": "Exceptionally Well Qualified",
-                    },
-                    {"value": "wq", "display_name": "Well Qualified"},
-                    {"value": "q", "display_name": "Qualified"},
-                    {"value": "nq", "display_name": "Not Qualified"},
-                    {
-                        "value": "nqa",
-                        "display_name": "Not Qualified By Reason of Age",
-                    },
-                ],
+                "choices_id": "rating",
             },
         ),
         BeforeValidator(choice_validator),
@@ -108,34 +85,7 @@ class AbaRatingsEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {"value": "id", "display_name": "Id (asc)"},
-                    {"value": "-id", "display_name": "Id (desc)"},
-                    {
-                        "value": "date_created",
-                        "display_name": "Date Created (asc)",
-                    },
-                    {
-                        "value": "-date_created",
-                        "display_name": "Date Created (desc)",
-                    },
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date Modified (asc)",
-                    },
-                    {
-                        "value": "-date_modified",
-                        "display_name": "Date Modified (desc)",
-                    },
-                    {
-                        "value": "year_rated",
-                        "display_name": "Year Rated (asc)",
-                    },
-                    {
-                        "value": "-year_rated",
-                        "display_name": "Year Rated (desc)",
-                    },
-                ],
+                "choices_id": "aba_ratings.order_by",
             },
         ),
         BeforeValidator(choice_validator),
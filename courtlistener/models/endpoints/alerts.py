@@ -29,33 +29,7 @@ class AlertsEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {"value": "alert_type", "display_name": "Alert type"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {
-                        "value": "date_last_hit",
-                        "display_name": "Time of last trigger",
-                    },
-                    {"value": "name", "display_name": "A name for the alert"},
-                    {
-                        "value": "query",
-                        "display_name": "The text of an alert created by a user",
-                    },
-                    {
-                        "value": "rate",
-                        "display_name": "The rate chosen by the user for the alert",
-                    },
-                    {
-                        "value": "secret_key",
-                        "display_name": "A key to be used in links to access the alert without having to log in. Can be used for a variety of purposes.",
-                    },
-                ],
+                "choices_id": "alerts.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -84,13 +58,7 @@ class AlertsEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {"value": "rt", "display_name": "Real Time"},
-                    {"value": "dly", "display_name": "Daily"},
-                    {"value": "wly", "display_name": "Weekly"},
-                    {"value": "mly", "display_name": "Monthly"},
-                    {"value": "off", "display_name": "Off"},
-                ],
+                "choices_id": "rate",
             },
         ),
         BeforeValidator(choice_validator),
@@ -100,28 +68,7 @@ class AlertsEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {
-                        "value": "date_created",
-                        "display_name": "Date Created (asc)",
-                    },
-                    {
-                        "value": "-date_created",
-                        "display_name": "Date Created (desc)",
-                    },
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date Modified (asc)",
-                    },
-                    {
-                        "value": "-date_modified",
-                        "display_name": "Date Modified (desc)",
-                    },
-                    {"value": "name", "display_name": "Name (asc)"},
-                    {"value": "-name", "display_name": "Name (desc)"},
-                    {"value": "rate", "display_name": "Rate (asc)"},
-                    {"value": "-rate", "display_name": "Rate (desc)"},
-                ],
+                "choices_id": "alerts.order_by",
             },
         ),
         BeforeValidator(choice_validator),
@@ -31,24 +31,7 @@ class AttorneysEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {
-                        "value": "parties_represented",
-                        "display_name": "Parties represented",
-                    },
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {"value": "name", "display_name": "Name"},
-                    {"value": "contact_raw", "display_name": "Contact raw"},
-                    {"value": "phone", "display_name": "Phone"},
-                    {"value": "fax", "display_name": "Fax"},
-                    {"value": "email", "display_name": "Email"},
-                ],
+                "choices_id": "attorneys.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -114,26 +97,7 @@ class AttorneysEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {"value": "id", "display_name": "Id (asc)"},
-                    {"value": "-id", "display_name": "Id (desc)"},
-                    {
-                        "value": "date_created",
-                        "display_name": "Date Created (asc)",
-                    },
-                    {
-                        "value": "-date_created",
-                        "display_name": "Date Created (desc)",
-                    },
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date Modified (asc)",
-                    },
-                    {
-                        "value": "-date_modified",
-                        "display_name": "Date Modified (desc)",
-                    },
-                ],
+                "choices_id": "opinions.order_by",
             },
         ),
         BeforeValidator(choice_validator),
@@ -31,63 +31,7 @@ class AudioEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {"value": "absolute_url", "display_name": "Absolute url"},
-                    {"value": "panel", "display_name": "Panel"},
-                    {"value": "docket", "display_name": "Docket"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {"value": "source", "display_name": "Source"},
-                    {
-                        "value": "case_name_short",
-                        "display_name": "Case name short",
-                    },
-                    {"value": "case_name", "display_name": "Case name"},
-                    {
-                        "value": "case_name_full",
-                        "display_name": "Case name full",
-                    },
-                    {"value": "judges", "display_name": "Judges"},
-                    {"value": "sha1", "display_name": "Sha1"},
-                    {"value": "download_url", "display_name": "Download url"},
-                    {
-                        "value": "local_path_mp3",
-                        "display_name": "Local path mp3",
-                    },
-                    {
-                        "value": "local_path_original_file",
-                        "display_name": "Local path original file",
-                    },
-                    {"value": "filepath_ia", "display_name": "Filepath ia"},
-                    {
-                        "value": "ia_upload_failure_count",
-                        "display_name": "Ia upload failure count",
-                    },
-                    {"value": "duration", "display_name": "Duration"},
-                    {
-                        "value": "processing_complete",
-                        "display_name": "Processing complete",
-                    },
-                    {"value": "date_blocked", "display_name": "Date blocked"},
-                    {"value": "blocked", "display_name": "Blocked"},
-                    {
-                        "value": "stt_status",
-                        "display_name": "Speech to text status",
-                    },
-                    {
-                        "value": "stt_source",
-                        "display_name": "Speech to text source",
-                    },
-                    {
-                        "value": "stt_transcript",
-                        "display_name": "Speech to text transcription",
-                    },
-                ],
+                "choices_id": "audio.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -147,20 +91,7 @@ class AudioEndpoint(Endpoint):
             None,
             description="The status of the Speech to Text for this item?",
             json_schema_extra={
-                "choices": [
-                    {"value": 0, "display_name": "Speech to Text Needed"},
-                    {"value": 1, "display_name": "Speech to Text Complete"},
-                    {"value": 2, "display_name": "Speech to Text Failed"},
-                    {
-                        "value": 3,
-                        "display_name": "Transcription does not match audio",
-                    },
-                    {
-                        "value": 4,
-                        "display_name": "File size is bigger than 25 MB",
-                    },
-                    {"value": 5, "display_name": "File does not exist"},
-                ],
+                "choices_id": "stt_status",
             },
         ),
         BeforeValidator(choice_validator),
@@ -182,10 +113,7 @@ class AudioEndpoint(Endpoint):
             None,
             description="the source of the audio file, one of: C (court website), H (brad heath archive)",
             json_schema_extra={
-                "choices": [
-                    {"value": "C", "display_name": "court website"},
-                    {"value": "H", "display_name": "brad heath archive"},
-                ],
+                "choices_id": "audio.source",
             },
         ),
         BeforeValidator(multiple_choice_validator),
@@ -195,34 +123,7 @@ class AudioEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {"value": "id", "display_name": "Id (asc)"},
-                    {"value": "-id", "display_name": "Id (desc)"},
-                    {
-                        "value": "date_created",
-                        "display_name": "Date Created (asc)",
-                    },
-                    {
-                        "value": "-date_created",
-                        "display_name": "Date Created (desc)",
-                    },
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date Modified (asc)",
-                    },
-                    {
-                        "value": "-date_modified",
-                        "display_name": "Date Modified (desc)",
-                    },
-                    {
-                        "value": "date_blocked",
-                        "display_name": "Date Blocked (asc)",
-                    },
-                    {
-                        "value": "-date_blocked",
-                        "display_name": "Date Blocked (desc)",
-                    },
-                ],
+                "choices_id": "audio.order_by",
             },
         ),
         BeforeValidator(choice_validator),
@@ -27,34 +27,7 @@ class BankruptcyInformationEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {
-                        "value": "date_converted",
-                        "display_name": "Date converted",
-                    },
-                    {
-                        "value": "date_last_to_file_claims",
-                        "display_name": "Date last to file claims",
-                    },
-                    {
-                        "value": "date_last_to_file_govt",
-                        "display_name": "Date last to file govt",
-                    },
-                    {
-                        "value": "date_debtor_dismissed",
-                        "display_name": "Date debtor dismissed",
-                    },
-                    {"value": "chapter", "display_name": "Chapter"},
-                    {"value": "trustee_str", "display_name": "Trustee str"},
-                    {"value": "docket", "display_name": "Docket"},
-                ],
+                "choices_id": "bankruptcy_information.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
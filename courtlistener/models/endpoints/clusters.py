@@ -31,108 +31,7 @@ class ClustersEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {"value": "absolute_url", "display_name": "Absolute url"},
-                    {"value": "panel", "display_name": "Panel"},
-                    {
-                        "value": "non_participating_judges",
-                        "display_name": "Non participating judges",
-                    },
-                    {"value": "docket_id", "display_name": "Docket id"},
-                    {"value": "docket", "display_name": "Docket"},
-                    {"value": "sub_opinions", "display_name": "Sub opinions"},
-                    {"value": "citations", "display_name": "Citations"},
-                    {
-                        "value": "cluster_redirections",
-                        "display_name": "Cluster redirections",
-                    },
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {"value": "judges", "display_name": "Judges"},
-                    {"value": "date_filed", "display_name": "Date filed"},
-                    {
-                        "value": "date_filed_is_approximate",
-                        "display_name": "Date filed is approximate",
-                    },
-                    {"value": "slug", "display_name": "Slug"},
-                    {
-                        "value": "case_name_short",
-                        "display_name": "Case name short",
-                    },
-                    {"value": "case_name", "display_name": "Case name"},
-                    {
-                        "value": "case_name_full",
-                        "display_name": "Case name full",
-                    },
-                    {"value": "scdb_id", "display_name": "Scdb id"},
-                    {
-                        "value": "scdb_decision_direction",
-                        "display_name": "Scdb decision direction",
-                    },
-                    {
-                        "value": "scdb_votes_majority",
-                        "display_name": "Scdb votes majority",
-                    },
-                    {
-                        "value": "scdb_votes_minority",
-                        "display_name": "Scdb votes minority",
-                    },
-                    {"value": "source", "display_name": "Source"},
-                    {
-                        "value": "procedural_history",
-                        "display_name": "Procedural history",
-                    },
-                    {"value": "attorneys", "display_name": "Attorneys"},
-                    {
-                        "value": "nature_of_suit",
-                        "display_name": "Nature of suit",
-                    },
-                    {"value": "posture", "display_name": "Posture"},
-                    {"value": "syllabus", "display_name": "Syllabus"},
-                    {"value": "headnotes", "display_name": "Headnotes"},
-                    {"value": "summary", "display_name": "Summary"},
-                    {"value": "disposition", "display_name": "Disposition"},
-                    {"value": "history", "display_name": "History"},
-                    {"value": "other_dates", "display_name": "Other dates"},
-                    {
-                        "value": "cross_reference",
-                        "display_name": "Cross reference",
-                    },
-                    {"value": "correction", "display_name": "Correction"},
-                    {
-                        "value": "citation_count",
-                        "display_name": "Citation count",
-                    },
-                    {
-                        "value": "precedential_status",
-                        "display_name": "Precedential status",
-                    },
-                    {"value": "date_blocked", "display_name": "Date blocked"},
-                    {"value": "blocked", "display_name": "Blocked"},
-                    {
-                        "value": "filepath_json_harvard",
-                        "display_name": "Filepath json harvard",
-                    },
-                    {
-                        "value": "filepath_pdf_harvard",
-                        "display_name": "Filepath pdf harvard",
-                    },
-                    {
-                        "value": "filepath_xml_scan",
-                        "display_name": "Filepath xml scan",
-                    },
-                    {
-                        "value": "filepath_pdf_scan",
-                        "display_name": "Filepath pdf scan",
-                    },
-                    {"value": "arguments", "display_name": "Arguments"},
-                    {"value": "headmatter", "display_name": "Headmatter"},
-                ],
+                "choices_id": "clusters.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -178,11 +77,7 @@ class ClustersEndpoint(Endpoint):
             None,
             description='the ideological "direction" of a decision in the Supreme Court database. More details at: http://scdb.wustl.edu/documentation.php?var=decisionDirection',
             json_schema_extra={
-                "choices": [
-                    {"value": 1, "display_name": "Conservative"},
-                    {"value": 2, "display_name": "Liberal"},
-                    {"value": 3, "display_name": "Unspecifiable"},
-                ],
+                "choices_id": "scdb_decision_direction",
             },
         ),
         BeforeValidator(choice_validator),
@@ -214,21 +109,7 @@ class ClustersEndpoint(Endpoint):
             None,
             description="The precedential status of document, one of: Published, Unpublished, Errata, Separate, In-chambers, Relating-to, Unknown",
             json_schema_extra={
-                "choices": [
-                    {"value": "Published", "display_name": "Precedential"},
-                    {
-                        "value": "Unpublished",
-                        "display_name": "Non-Precedential",
-                    },
-                    {"value": "Errata", "display_name": "Errata"},
-                    {"value": "Separate", "display_name": "Separate Opinion"},
-                    {"value": "In-chambers", "display_name": "In-chambers"},
-                    {
-                        "value": "Relating-to",
-                        "display_name": "Relating-to orders",
-                    },
-                    {"value": "Unknown", "display_name": "Unknown Status"},
-                ],
+                "choices_id": "precedential_status",
             },
         ),
         BeforeValidator(choice_validator),
@@ -297,94 +178,7 @@ class ClustersEndpoint(Endpoint):
             None,
             description="the source of the cluster, one of: C (court website), R (public.resource.org), CR (court website merged with resource.org), L (lawbox), LC (lawbox merged with court), LR (lawbox merged with resource.org), M (manual input), A (internet archive), Z (columbia archive), ZC (columbia merged with court), ZL (columbia merged with lawbox), ZLC (columbia merged with lawbox and court), U (Harvard, Library Innovation Lab Case Law Access Project), CU (court website merged with Harvard), D (direct court input), Q (2020 anonymous database), CRU (court website merged with public.resource.org and Harvard), LU (lawbox merged with Harvard), LCU (Lawbox merged with court website and Harvard), LRU (Lawbox merged with public.resource.org and with Harvard), LCRU (Lawbox merged with court website, public.resource.org and Harvard), MU (Manual input merged with Harvard), RU (public.resource.org merged with Harvard), ZU (columbia archive merged with Harvard), ZLU (columbia archive merged with Lawbox and Harvard), ZCU (columbia archive merged with court website and Harvard), ZLCU (columbia archive merged with lawbox, court website and Harvard), G (recap), S (scanning project)",
             json_schema_extra={
-                "choices": [
-                    {"value": "C", "display_name": "court website"},
-                    {"value": "R", "display_name": "public.resource.org"},
-                    {
-                        "value": "CR",
-                        "display_name": "court website merged with resource.org",
-                    },
-                    {"value": "L", "display_name": "lawbox"},
-                    {
-                        "value": "LC",
-                        "display_name": "lawbox merged with court",
-                    },
-                    {
-                        "value": "LR",
-                        "display_name": "lawbox merged with resource.org",
-                    },
-                    {"value": "M", "display_name": "manual input"},
-                    {"value": "A", "display_name": "internet archive"},
-                    {"value": "Z", "display_name": "columbia archive"},
-                    {
-                        "value": "ZC",
-                        "display_name": "columbia merged with court",
-                    },
-                    {
-                        "value": "ZL",
-                        "display_name": "columbia merged with lawbox",
-                    },
-                    {
-                        "value": "ZLC",
-                        "display_name": "columbia merged with lawbox and court",
-                    },
-                    {
-                        "value": "U",
-                        "display_name": "Harvard, Library Innovation Lab Case Law Access Project",
-                    },
-                    {
-                        "value": "CU",
-                        "display_name": "court website merged with Harvard",
-                    },
-                    {"value": "D", "display_name": "direct court input"},
-                    {"value": "Q", "display_name": "2020 anonymous database"},
-                    {
-                        "value": "CRU",
-                        "display_name": "court website merged with public.resource.org and Harvard",
-                    },
-                    {
-                        "value": "LU",
-                        "display_name": "lawbox merged with Harvard",
-                    },
-                    {
-                        "value": "LCU",
-                        "display_name": "Lawbox merged with court website and Harvard",
-                    },
-                    {
-                        "value": "LRU",
-                        "display_name": "Lawbox merged with public.resource.org and with Harvard",
-                    },
-                    {
-                        "value": "LCRU",
-                        "display_name": "Lawbox merged with court website, public.resource.org and Harvard",
-                    },
-                    {
-                        "value": "MU",
-                        "display_name": "Manual input merged with Harvard",
-                    },
-                    {
-                        "value": "RU",
-                        "display_name": "public.resource.org merged with Harvard",
-                    },
-                    {
-                        "value": "ZU",
-                        "display_name": "columbia archive merged with Harvard",
-                    },
-                    {
-                        "value": "ZLU",
-                        "display_name": "columbia archive merged with Lawbox and Harvard",
-                    },
-                    {
-                        "value": "ZCU",
-                        "display_name": "columbia archive merged with court website and Harvard",
-                    },
-                    {
-                        "value": "ZLCU",
-                        "display_name": "columbia archive merged with lawbox, court website and Harvard",
-                    },
-                    {"value": "G", "display_name": "recap"},
-                    {"value": "S", "display_name": "scanning project"},
-                ],
+                "choices_id": "clusters.source",
             },
         ),
         BeforeValidator(multiple_choice_validator),
@@ -401,50 +195,7 @@ class ClustersEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {"value": "id", "display_name": "Id (asc)"},
-                    {"value": "-id", "display_name": "Id (desc)"},
-                    {
-                        "value": "date_created",
-                        "display_name": "Date Created (asc)",
-                    },
-                    {
-                        "value": "-date_created",
-                        "display_name": "Date Created (desc)",
-                    },
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date Modified (asc)",
-                    },
-                    {
-                        "value": "-date_modified",
-                        "display_name": "Date Modified (desc)",
-                    },
-                    {
-                        "value": "date_filed",
-                        "display_name": "Date Filed (asc)",
-                    },
-                    {
-                        "value": "-date_filed",
-                        "display_name": "Date Filed (desc)",
-                    },
-                    {
-                        "value": "citation_count",
-                        "display_name": "Citation Count (asc)",
-                    },
-                    {
-                        "value": "-citation_count",
-                        "display_name": "Citation Count (desc)",
-                    },
-                    {
-                        "value": "date_blocked",
-                        "display_name": "Date Blocked (asc)",
-                    },
-                    {
-                        "value": "-date_blocked",
-                        "display_name": "Date Blocked (desc)",
-                    },
-                ],
+                "choices_id": "clusters.order_by",
             },
         ),
         BeforeValidator(choice_validator),
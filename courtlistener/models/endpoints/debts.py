@@ -31,26 +31,7 @@ class DebtsEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {
-                        "value": "creditor_name",
-                        "display_name": "Creditor name",
-                    },
-                    {"value": "description", "display_name": "Description"},
-                    {"value": "value_code", "display_name": "Value code"},
-                    {"value": "redacted", "display_name": "Redacted"},
-                    {
-                        "value": "financial_disclosure",
-                        "display_name": "Financial disclosure",
-                    },
-                ],
+                "choices_id": "debts.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -103,19 +84,7 @@ class DebtsEndpoint(Endpoint):
             None,
             description="Form code for the value of the judicial debt.",
             json_schema_extra={
-                "choices": [
-                    {"value": "J", "display_name": "1 - 15,000"},
-                    {"value": "K", "display_name": "15,001 - 50,000"},
-                    {"value": "L", "display_name": "50,001 - 100,000"},
-                    {"value": "M", "display_name": "100,001 - 250,000"},
-                    {"value": "N", "display_name": "250,001 - 500,000"},
-                    {"value": "O", "display_name": "500,001 - 1,000,000"},
-                    {"value": "P1", "display_name": "1,000,001 - 5,000,000"},
-                    {"value": "P2", "display_name": "5,000,001 - 25,000,000"},
-                    {"value": "P3", "display_name": "25,000,001 - 50,000,000"},
-                    {"value": "P4", "display_name": "50,000,001 - "},
-                    {"value": "-1", "display_name": "Failed Extraction"},
-                ],
+                "choices_id": "debts.value_code",
             },
         ),
         BeforeValidator(choice_validator),
@@ -136,26 +105,7 @@ class DebtsEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {"value": "id", "display_name": "Id (asc)"},
-                    {"value": "-id", "display_name": "Id (desc)"},
-                    {
-                        "value": "date_created",
-                        "display_name": "Date Created (asc)",
-                    },
-                    {
-                        "value": "-date_created",
-                        "display_name": "Date Created (desc)",
-                    },
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date Modified (asc)",
-                    },
-                    {
-                        "value": "-date_modified",
-                        "display_name": "Date Modified (desc)",
-                    },
-                ],
+                "choices_id": "opinions.order_by",
             },
         ),
         BeforeValidator(choice_validator),
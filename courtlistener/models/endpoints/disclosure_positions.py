@@ -31,25 +31,7 @@ class DisclosurePositionsEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {"value": "position", "display_name": "Position"},
-                    {
-                        "value": "organization_name",
-                        "display_name": "Organization name",
-                    },
-                    {"value": "redacted", "display_name": "Redacted"},
-                    {
-                        "value": "financial_disclosure",
-                        "display_name": "Financial disclosure",
-                    },
-                ],
+                "choices_id": "disclosure_positions.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -112,26 +94,7 @@ class DisclosurePositionsEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {"value": "id", "display_name": "Id (asc)"},
-                    {"value": "-id", "display_name": "Id (desc)"},
-                    {
-                        "value": "date_created",
-                        "display_name": "Date Created (asc)",
-                    },
-                    {
-                        "value": "-date_created",
-                        "display_name": "Date Created (desc)",
-                    },
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date Modified (asc)",
-                    },
-                    {
-                        "value": "-date_modified",
-                        "display_name": "Date Modified (desc)",
-                    },
-                ],
+                "choices_id": "opinions.order_by",
             },
         ),
         BeforeValidator(choice_validator),
@@ -28,24 +28,7 @@ class DocketAlertsEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "id", "display_name": "ID"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {
-                        "value": "date_last_hit",
-                        "display_name": "Time of last trigger",
-                    },
-                    {
-                        "value": "secret_key",
-                        "display_name": "A key to be used in links to access the alert without having to log in. Can be used for a variety of purposes.",
-                    },
-                    {"value": "alert_type", "display_name": "Alert type"},
-                    {"value": "docket", "display_name": "Docket"},
-                ],
+                "choices_id": "docket_alerts.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -63,10 +46,7 @@ class DocketAlertsEndpoint(Endpoint):
             None,
             description="The subscription type assigned, Unsubscription or Subscription.",
             json_schema_extra={
-                "choices": [
-                    {"value": 0, "display_name": "Unsubscription"},
-                    {"value": 1, "display_name": "Subscription"},
-                ],
+                "choices_id": "alert_type",
             },
         ),
         BeforeValidator(choice_validator),
@@ -83,24 +63,7 @@ class DocketAlertsEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {
-                        "value": "date_created",
-                        "display_name": "Date Created (asc)",
-                    },
-                    {
-                        "value": "-date_created",
-                        "display_name": "Date Created (desc)",
-                    },
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date Modified (asc)",
-                    },
-                    {
-                        "value": "-date_modified",
-                        "display_name": "Date Modified (desc)",
-                    },
-                ],
+                "choices_id": "docket_alerts.order_by",
             },
         ),
         BeforeValidator(choice_validator),
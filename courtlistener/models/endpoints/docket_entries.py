@@ -31,33 +31,7 @@ class DocketEntriesEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {"value": "docket", "display_name": "Docket"},
-                    {
-                        "value": "recap_documents",
-                        "display_name": "Recap documents",
-                    },
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {"value": "date_filed", "display_name": "Date filed"},
-                    {"value": "time_filed", "display_name": "Time filed"},
-                    {"value": "entry_number", "display_name": "Entry number"},
-                    {
-                        "value": "recap_sequence_number",
-                        "display_name": "Recap sequence number",
-                    },
-                    {
-                        "value": "pacer_sequence_number",
-                        "display_name": "Pacer sequence number",
-                    },
-                    {"value": "description", "display_name": "Description"},
-                    {"value": "tags", "display_name": "Tags"},
-                ],
+                "choices_id": "docket_entries.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -142,50 +116,7 @@ class DocketEntriesEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {"value": "id", "display_name": "Id (asc)"},
-                    {"value": "-id", "display_name": "Id (desc)"},
-                    {
-                        "value": "date_created",
-                        "display_name": "Date Created (asc)",
-                    },
-                    {
-                        "value": "-date_created",
-                        "display_name": "Date Created (desc)",
-                    },
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date Modified (asc)",
-                    },
-                    {
-                        "value": "-date_modified",
-                        "display_name": "Date Modified (desc)",
-                    },
-                    {
-                        "value": "date_filed",
-                        "display_name": "Date Filed (asc)",
-                    },
-                    {
-                        "value": "-date_filed",
-                        "display_name": "Date Filed (desc)",
-                    },
-                    {
-                        "value": "recap_sequence_number",
-                        "display_name": "Recap Sequence Number (asc)",
-                    },
-                    {
-                        "value": "-recap_sequence_number",
-                        "display_name": "Recap Sequence Number (desc)",
-                    },
-                    {
-                        "value": "entry_number",
-                        "display_name": "Entry Number (asc)",
-                    },
-                    {
-                        "value": "-entry_number",
-                        "display_name": "Entry Number (desc)",
-                    },
-                ],
+                "choices_id": "docket_entries.order_by",
             },
         ),
         BeforeValidator(choice_validator),
@@ -28,11 +28,7 @@ class DocketTagsEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "id", "display_name": "ID"},
-                    {"value": "docket", "display_name": "Docket"},
-                    {"value": "tag", "display_name": "Tag"},
-                ],
+                "choices_id": "docket_tags.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
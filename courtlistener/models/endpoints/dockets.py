@@ -40,170 +40,7 @@ class DocketsEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {"value": "court", "display_name": "Court"},
-                    {"value": "court_id", "display_name": "Court id"},
-                    {
-                        "value": "original_court_info",
-                        "display_name": "Original court info",
-                    },
-                    {"value": "idb_data", "display_name": "Idb data"},
-                    {"value": "clusters", "display_name": "Clusters"},
-                    {"value": "audio_files", "display_name": "Audio files"},
-                    {"value": "assigned_to", "display_name": "Assigned to"},
-                    {"value": "referred_to", "display_name": "Referred to"},
-                    {
-                        "value": "bankruptcy_information",
-                        "display_name": "Bankruptcy information",
-                    },
-                    {"value": "absolute_url", "display_name": "Absolute url"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {"value": "source", "display_name": "Source"},
-                    {
-                        "value": "appeal_from_str",
-                        "display_name": "Appeal from str",
-                    },
-                    {
-                        "value": "assigned_to_str",
-                        "display_name": "Assigned to str",
-                    },
-                    {
-                        "value": "referred_to_str",
-                        "display_name": "Referred to str",
-                    },
-                    {"value": "panel_str", "display_name": "Panel str"},
-                    {
-                        "value": "date_last_index",
-                        "display_name": "Date last index",
-                    },
-                    {
-                        "value": "date_cert_granted",
-                        "display_name": "Date cert granted",
-                    },
-                    {
-                        "value": "date_cert_denied",
-                        "display_name": "Date cert denied",
-                    },
-                    {"value": "date_argued", "display_name": "Date argued"},
-                    {
-                        "value": "date_reargued",
-                        "display_name": "Date reargued",
-                    },
-                    {
-                        "value": "date_reargument_denied",
-                        "display_name": "Date reargument denied",
-                    },
-                    {"value": "date_filed", "display_name": "Date filed"},
-                    {
-                        "value": "date_terminated",
-                        "display_name": "Date terminated",
-                    },
-                    {
-                        "value": "date_last_filing",
-                        "display_name": "Date last filing",
-                    },
-                    {
-                        "value": "case_name_short",
-                        "display_name": "Case name short",
-                    },
-                    {"value": "case_name", "display_name": "Case name"},
-                    {
-                        "value": "case_name_full",
-                        "display_name": "Case name full",
-                    },
-                    {"value": "slug", "display_name": "Slug"},
-                    {
-                        "value": "docket_number",
-                        "display_name": "Docket number",
-                    },
-                    {
-                        "value": "docket_number_core",
-                        "display_name": "Docket number core",
-                    },
-                    {
-                        "value": "docket_number_raw",
-                        "display_name": "Docket number raw",
-                    },
-                    {
-                        "value": "docket_number_source",
-                        "display_name": "Docket number source",
-                    },
-                    {
-                        "value": "federal_dn_office_code",
-                        "display_name": "Federal dn office code",
-                    },
-                    {
-                        "value": "federal_dn_case_type",
-                        "display_name": "Federal dn case type",
-                    },
-                    {
-                        "value": "federal_dn_judge_initials_assigned",
-                        "display_name": "Federal dn judge initials assigned",
-                    },
-                    {
-                        "value": "federal_dn_judge_initials_referred",
-                        "display_name": "Federal dn judge initials referred",
-                    },
-                    {
-                        "value": "federal_defendant_number",
-                        "display_name": "Federal defendant number",
-                    },
-                    {
-                        "value": "pacer_case_id",
-                        "display_name": "Pacer case id",
-                    },
-                    {"value": "cause", "display_name": "Cause"},
-                    {
-                        "value": "nature_of_suit",
-                        "display_name": "Nature of suit",
-                    },
-                    {"value": "jury_demand", "display_name": "Jury demand"},
-                    {
-                        "value": "jurisdiction_type",
-                        "display_name": "Jurisdiction type",
-                    },
-                    {
-                        "value": "appellate_fee_status",
-                        "display_name": "Appellate fee status",
-                    },
-                    {
-                        "value": "appellate_case_type_information",
-                        "display_name": "Appellate case type information",
-                    },
-                    {"value": "mdl_status", "display_name": "Mdl status"},
-                    {"value": "filepath_ia", "display_name": "Filepath ia"},
-                    {
-                        "value": "filepath_ia_json",
-                        "display_name": "Filepath ia json",
-                    },
-                    {
-                        "value": "ia_upload_failure_count",
-                        "display_name": "Ia upload failure count",
-                    },
-                    {
-                        "value": "ia_needs_upload",
-                        "display_name": "Ia needs upload",
-                    },
-                    {
-                        "value": "ia_date_first_change",
-                        "display_name": "Ia date first change",
-                    },
-                    {"value": "date_blocked", "display_name": "Date blocked"},
-                    {"value": "blocked", "display_name": "Blocked"},
-                    {"value": "appeal_from", "display_name": "Appeal from"},
-                    {
-                        "value": "parent_docket",
-                        "display_name": "Parent docket",
-                    },
-                    {"value": "tags", "display_name": "Tags"},
-                    {"value": "panel", "display_name": "Panel"},
-                ],
+                "choices_id": "dockets.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -284,956 +121,7 @@ class DocketsEndpoint(Endpoint):
             None,
             description="contains the source of the Docket.",
             json_schema_extra={
-                "choices": [
-                    {"value": 0, "display_name": "Default"},
-                    {"value": 1, "display_name": "RECAP"},
-                    {"value": 2, "display_name": "Scraper"},
-                    {"value": 3, "display_name": "RECAP and Scraper"},
-                    {"value": 4, "display_name": "Columbia"},
-                    {"value": 6, "display_name": "Columbia and Scraper"},
-                    {"value": 5, "display_name": "Columbia and RECAP"},
-                    {
-                        "value": 7,
-                        "display_name": "Columbia, RECAP, and Scraper",
-                    },
-                    {"value": 8, "display_name": "Integrated Database"},
-                    {"value": 9, "display_name": "RECAP and IDB"},
-                    {"value": 10, "display_name": "Scraper and IDB"},
-                    {"value": 11, "display_name": "RECAP, Scraper, and IDB"},
-                    {"value": 12, "display_name": "Columbia and IDB"},
-                    {"value": 13, "display_name": "Columbia, RECAP, and IDB"},
-                    {
-                        "value": 14,
-                        "display_name": "Columbia, Scraper, and IDB",
-                    },
-                    {
-                        "value": 15,
-                        "display_name": "Columbia, RECAP, Scraper, and IDB",
-                    },
-                    {"value": 16, "display_name": "Harvard"},
-                    {"value": 17, "display_name": "Harvard and RECAP"},
-                    {"value": 18, "display_name": "Scraper and Harvard"},
-                    {
-                        "value": 19,
-                        "display_name": "RECAP, Scraper and Harvard",
-                    },
-                    {"value": 20, "display_name": "Harvard and Columbia"},
-                    {
-                        "value": 21,
-                        "display_name": "Columbia, RECAP, and Harvard",
-                    },
-                    {
-                        "value": 22,
-                        "display_name": "Columbia, Scraper, and Harvard",
-                    },
-                    {
-                        "value": 23,
-                        "display_name": "Columbia, RECAP, Scraper, and Harvard",
-                    },
-                    {"value": 24, "display_name": "IDB and Harvard"},
-                    {"value": 25, "display_name": "RECAP, IDB and Harvard"},
-                    {"value": 26, "display_name": "Scraper, IDB and Harvard"},
-                    {
-                        "value": 27,
-                        "display_name": "RECAP, Scraper, IDB and Harvard",
-                    },
-                    {
-                        "value": 28,
-                        "display_name": "Columbia, IDB, and Harvard",
-                    },
-                    {
-                        "value": 29,
-                        "display_name": "Columbia, Recap, IDB, and Harvard",
-                    },
-                    {
-                        "value": 30,
-                        "display_name": "Columbia, Scraper, IDB, and Harvard",
-                    },
-                    {
-                        "value": 31,
-                        "display_name": "Columbia, Recap, Scraper, IDB, and Harvard",
-                    },
-                    {"value": 32, "display_name": "Direct court input"},
-                    {
-                        "value": 33,
-                        "display_name": "RECAP and Direct court input",
-                    },
-                    {
-                        "value": 34,
-                        "display_name": "Scraper and Direct court input",
-                    },
-                    {
-                        "value": 35,
-                        "display_name": "RECAP, Scraper, and Direct court input",
-                    },
-                    {
-                        "value": 36,
-                        "display_name": "Columbia and Direct court input",
-                    },
-                    {
-                        "value": 37,
-                        "display_name": "RECAP, Columbia, and Direct court input",
-                    },
-                    {
-                        "value": 38,
-                        "display_name": "Scraper, Columbia, and Direct court input",
-                    },
-                    {
-                        "value": 39,
-                        "display_name": "RECAP, Scraper, Columbia, and Direct court input",
-                    },
-                    {
-                        "value": 40,
-                        "display_name": "IDB and Direct court input",
-                    },
-                    {
-                        "value": 41,
-                        "display_name": "RECAP, IDB, and Direct court input",
-                    },
-                    {
-                        "value": 42,
-                        "display_name": "Scraper, IDB, and Direct court input",
-                    },
-                    {
-                        "value": 43,
-                        "display_name": "RECAP, Scraper, IDB, and Direct court input",
-                    },
-                    {
-                        "value": 44,
-                        "display_name": "Columbia, IDB, and Direct court input",
-                    },
-                    {
-                        "value": 45,
-                        "display_name": "RECAP, Columbia, IDB, and Direct court input",
-                    },
-                    {
-                        "value": 46,
-                        "display_name": "Scraper, Columbia, IDB, and Direct court input",
-                    },
-                    {
-                        "value": 47,
-                        "display_name": "RECAP, Scraper, Columbia, IDB, and Direct court input",
-                    },
-                    {
-                        "value": 48,
-                        "display_name": "Direct court input and Harvard",
-                    },
-                    {
-                        "value": 49,
-                        "display_name": "RECAP, Harvard, and Direct court input",
-                    },
-                    {
-                        "value": 50,
-                        "display_name": "Scraper, Harvard, and Direct court input",
-                    },
-                    {
-                        "value": 51,
-                        "display_name": "RECAP, Scraper, Harvard, and Direct court input",
-                    },
-                    {
-                        "value": 52,
-                        "display_name": "Columbia, Harvard, and Direct court input",
-                    },
-                    {
-                        "value": 53,
-                        "display_name": "RECAP, Columbia, Harvard, and Direct court input",
-                    },
-                    {
-                        "value": 54,
-                        "display_name": "Scraper, Columbia, Harvard, and Direct court input",
-                    },
-                    {
-                        "value": 55,
-                        "display_name": "RECAP, Scraper, Columbia, Harvard, and Direct court input",
-                    },
-                    {
-                        "value": 56,
-                        "display_name": "IDB, Harvard, and Direct court input",
-                    },
-                    {
-                        "value": 57,
-                        "display_name": "RECAP, IDB, Harvard, and Direct court input",
-                    },
-                    {
-                        "value": 58,
-                        "display_name": "Scraper, IDB, Harvard, and Direct court input",
-                    },
-                    {
-                        "value": 59,
-                        "display_name": "RECAP, Scraper, IDB, Harvard, and Direct court input",
-                    },
-                    {
-                        "value": 60,
-                        "display_name": "Columbia, IDB, Harvard, and Direct court input",
-                    },
-                    {
-                        "value": 61,
-                        "display_name": "RECAP, Columbia, IDB, Harvard, and Direct court input",
-                    },
-                    {
-                        "value": 62,
-                        "display_name": "Scraper, Columbia, IDB, Harvard, and Direct court input",
-                    },
-                    {
-                        "value": 63,
-                        "display_name": "RECAP, Scraper, Columbia, IDB, Harvard, and Direct court input",
-                    },
-                    {"value": 64, "display_name": "2020 anonymous database"},
-                    {
-                        "value": 72,
-                        "display_name": "IDB and 2020 anonymous database",
-                    },
-                    {
-                        "value": 66,
-                        "display_name": "2020 anonymous database and Scraper",
-                    },
-                    {
-                        "value": 67,
-                        "display_name": "RECAP, Scraper, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 68,
-                        "display_name": "Columbia and 2020 anonymous database",
-                    },
-                    {
-                        "value": 69,
-                        "display_name": "RECAP, Columbia, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 70,
-                        "display_name": "Scraper, Columbia, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 71,
-                        "display_name": "RECAP, Scraper, Columbia, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 73,
-                        "display_name": "RECAP, IDB, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 74,
-                        "display_name": "Scraper, IDB, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 75,
-                        "display_name": "RECAP, Scraper, IDB, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 76,
-                        "display_name": "Columbia, IDB, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 77,
-                        "display_name": "RECAP, Columbia, IDB, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 78,
-                        "display_name": "Scraper, Columbia, IDB, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 79,
-                        "display_name": "RECAP, Scraper, Columbia, IDB, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 80,
-                        "display_name": "2020 anonymous database and Harvard",
-                    },
-                    {
-                        "value": 82,
-                        "display_name": "2020 anonymous database, Scraper, and Harvard",
-                    },
-                    {
-                        "value": 81,
-                        "display_name": "RECAP, Harvard, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 83,
-                        "display_name": "RECAP, Scraper, Harvard, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 84,
-                        "display_name": "Columbia, Harvard, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 85,
-                        "display_name": "RECAP, Columbia, Harvard, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 86,
-                        "display_name": "Scraper, Columbia, Harvard, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 87,
-                        "display_name": "RECAP, Scraper, Columbia, Harvard, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 88,
-                        "display_name": "IDB, Harvard, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 89,
-                        "display_name": "RECAP, IDB, Harvard, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 90,
-                        "display_name": "Scraper, IDB, Harvard, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 91,
-                        "display_name": "RECAP, Scraper, IDB, Harvard, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 92,
-                        "display_name": "Columbia, IDB, Harvard, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 93,
-                        "display_name": "RECAP, Columbia, IDB, Harvard, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 94,
-                        "display_name": "Scraper, Columbia, IDB, Harvard, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 95,
-                        "display_name": "RECAP, Scraper, Columbia, IDB, Harvard, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 96,
-                        "display_name": "Direct court input and 2020 anonymous database",
-                    },
-                    {
-                        "value": 97,
-                        "display_name": "RECAP, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 98,
-                        "display_name": "Scraper, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 99,
-                        "display_name": "RECAP, Scraper, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 100,
-                        "display_name": "Columbia, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 101,
-                        "display_name": "RECAP, Columbia, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 102,
-                        "display_name": "Scraper, Columbia, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 103,
-                        "display_name": "RECAP, Scraper, Columbia, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 104,
-                        "display_name": "IDB, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 105,
-                        "display_name": "RECAP, IDB, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 106,
-                        "display_name": "Scraper, IDB, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 107,
-                        "display_name": "RECAP, Scraper, IDB, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 108,
-                        "display_name": "Columbia, IDB, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 109,
-                        "display_name": "RECAP, Columbia, IDB, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 110,
-                        "display_name": "Scraper, Columbia, IDB, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 111,
-                        "display_name": "RECAP, Scraper, Columbia, IDB, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 112,
-                        "display_name": "Harvard, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 113,
-                        "display_name": "RECAP, Harvard, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 114,
-                        "display_name": "Scraper, Harvard, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 115,
-                        "display_name": "RECAP, Scraper, Harvard, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 116,
-                        "display_name": "Columbia, Harvard, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 117,
-                        "display_name": "RECAP, Columbia, Harvard, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 118,
-                        "display_name": "Scraper, Columbia, Harvard, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 119,
-                        "display_name": "RECAP, Scraper, Columbia, Harvard, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 120,
-                        "display_name": "IDB, Harvard, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 121,
-                        "display_name": "RECAP, IDB, Harvard, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 122,
-                        "display_name": "Scraper, IDB, Harvard, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 123,
-                        "display_name": "RECAP, Scraper, IDB, Harvard, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 124,
-                        "display_name": "Columbia, IDB, Harvard, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 125,
-                        "display_name": "RECAP, Columbia, IDB, Harvard, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 126,
-                        "display_name": "Scraper, Columbia, IDB, Harvard, Direct court input, and 2020 anonymous database",
-                    },
-                    {
-                        "value": 127,
-                        "display_name": "RECAP, Scraper, Columbia, IDB, Harvard, Direct court input, and 2020 anonymous database",
-                    },
-                    {"value": 128, "display_name": "Scanning project"},
-                    {
-                        "value": 129,
-                        "display_name": "RECAP and scanning project",
-                    },
-                    {
-                        "value": 130,
-                        "display_name": "Scraper and scanning project",
-                    },
-                    {
-                        "value": 131,
-                        "display_name": "RECAP, scraper, and scanning project",
-                    },
-                    {
-                        "value": 132,
-                        "display_name": "Columbia and scanning project",
-                    },
-                    {
-                        "value": 133,
-                        "display_name": "Columbia, RECAP, and scanning project",
-                    },
-                    {
-                        "value": 134,
-                        "display_name": "Columbia, scraper, and scanning project",
-                    },
-                    {
-                        "value": 135,
-                        "display_name": "Columbia, RECAP, scraper, and scanning project",
-                    },
-                    {"value": 136, "display_name": "IDB and scanning project"},
-                    {
-                        "value": 137,
-                        "display_name": "RECAP, IDB, and scanning project",
-                    },
-                    {
-                        "value": 138,
-                        "display_name": "Scraper, IDB, and scanning project",
-                    },
-                    {
-                        "value": 139,
-                        "display_name": "RECAP, scraper, IDB, and scanning project",
-                    },
-                    {
-                        "value": 140,
-                        "display_name": "Columbia, IDB, and scanning project",
-                    },
-                    {
-                        "value": 141,
-                        "display_name": "Columbia, RECAP, IDB, and scanning project",
-                    },
-                    {
-                        "value": 142,
-                        "display_name": "Columbia, scraper, IDB, and scanning project",
-                    },
-                    {
-                        "value": 143,
-                        "display_name": "Columbia, RECAP, scraper, IDB, and scanning project",
-                    },
-                    {
-                        "value": 144,
-                        "display_name": "Harvard and scanning project",
-                    },
-                    {
-                        "value": 145,
-                        "display_name": "Harvard, RECAP, and scanning project",
-                    },
-                    {
-                        "value": 146,
-                        "display_name": "Scraper, Harvard, and scanning project",
-                    },
-                    {
-                        "value": 147,
-                        "display_name": "RECAP, scraper, Harvard, and scanning project",
-                    },
-                    {
-                        "value": 148,
-                        "display_name": "Harvard, Columbia, and scanning project",
-                    },
-                    {
-                        "value": 149,
-                        "display_name": "Columbia, RECAP, Harvard, and scanning project",
-                    },
-                    {
-                        "value": 150,
-                        "display_name": "Columbia, scraper, Harvard, and scanning project",
-                    },
-                    {
-                        "value": 151,
-                        "display_name": "Columbia, RECAP, scraper, Harvard, and scanning project",
-                    },
-                    {
-                        "value": 152,
-                        "display_name": "IDB, Harvard, and scanning project",
-                    },
-                    {
-                        "value": 153,
-                        "display_name": "RECAP, IDB, Harvard, and scanning project",
-                    },
-                    {
-                        "value": 154,
-                        "display_name": "Scraper, IDB, Harvard, and scanning project",
-                    },
-                    {
-                        "value": 155,
-                        "display_name": "RECAP, scraper, IDB, Harvard, and scanning project",
-                    },
-                    {
-                        "value": 156,
-                        "display_name": "Columbia, IDB, Harvard, and scanning project",
-                    },
-                    {
-                        "value": 157,
-                        "display_name": "Columbia, RECAP, IDB, Harvard, and scanning project",
-                    },
-                    {
-                        "value": 158,
-                        "display_name": "Columbia, scraper, IDB, Harvard, and scanning project",
-                    },
-                    {
-                        "value": 159,
-                        "display_name": "Columbia, RECAP, scraper, IDB, Harvard, and scanning project",
-                    },
-                    {
-                        "value": 160,
-                        "display_name": "Direct court input and scanning project",
-                    },
-                    {
-                        "value": 161,
-                        "display_name": "RECAP, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 162,
-                        "display_name": "Scraper, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 163,
-                        "display_name": "RECAP, scraper, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 164,
-                        "display_name": "Columbia, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 165,
-                        "display_name": "RECAP, Columbia, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 166,
-                        "display_name": "Scraper, Columbia, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 167,
-                        "display_name": "RECAP, scraper, Columbia, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 168,
-                        "display_name": "IDB, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 169,
-                        "display_name": "RECAP, IDB, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 170,
-                        "display_name": "Scraper, IDB, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 171,
-                        "display_name": "RECAP, scraper, IDB, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 172,
-                        "display_name": "Columbia, IDB, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 173,
-                        "display_name": "RECAP, Columbia, IDB, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 174,
-                        "display_name": "Scraper, Columbia, IDB, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 175,
-                        "display_name": "RECAP, scraper, Columbia, IDB, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 176,
-                        "display_name": "Direct court input, Harvard, and scanning project",
-                    },
-                    {
-                        "value": 177,
-                        "display_name": "RECAP, Harvard, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 178,
-                        "display_name": "Scraper, Harvard, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 179,
-                        "display_name": "RECAP, scraper, Harvard, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 180,
-                        "display_name": "Columbia, Harvard, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 181,
-                        "display_name": "RECAP, Columbia, Harvard, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 182,
-                        "display_name": "Scraper, Columbia, Harvard, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 183,
-                        "display_name": "RECAP, scraper, Columbia, Harvard, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 184,
-                        "display_name": "IDB, Harvard, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 185,
-                        "display_name": "RECAP, IDB, Harvard, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 186,
-                        "display_name": "Scraper, IDB, Harvard, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 187,
-                        "display_name": "RECAP, scraper, IDB, Harvard, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 188,
-                        "display_name": "Columbia, IDB, Harvard, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 189,
-                        "display_name": "RECAP, Columbia, IDB, Harvard, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 190,
-                        "display_name": "Scraper, Columbia, IDB, Harvard, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 191,
-                        "display_name": "RECAP, scraper, Columbia, IDB, Harvard, direct court input, and scanning project",
-                    },
-                    {
-                        "value": 192,
-                        "display_name": "2020 anonymous database and scanning project",
-                    },
-                    {
-                        "value": 193,
-                        "display_name": "RECAP, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 194,
-                        "display_name": "2020 anonymous database, scraper, and scanning project",
-                    },
-                    {
-                        "value": 195,
-                        "display_name": "RECAP, scraper, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 196,
-                        "display_name": "Columbia, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 197,
-                        "display_name": "RECAP, Columbia, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 198,
-                        "display_name": "Scraper, Columbia, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 199,
-                        "display_name": "RECAP, scraper, Columbia, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 200,
-                        "display_name": "IDB, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 201,
-                        "display_name": "RECAP, IDB, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 202,
-                        "display_name": "Scraper, IDB, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 203,
-                        "display_name": "RECAP, scraper, IDB, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 204,
-                        "display_name": "Columbia, IDB, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 205,
-                        "display_name": "RECAP, Columbia, IDB, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 206,
-                        "display_name": "Scraper, Columbia, IDB, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 207,
-                        "display_name": "RECAP, scraper, Columbia, IDB, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 208,
-                        "display_name": "2020 anonymous database, Harvard, and scanning project",
-                    },
-                    {
-                        "value": 209,
-                        "display_name": "RECAP, Harvard, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 210,
-                        "display_name": "2020 anonymous database, scraper, Harvard, and scanning project",
-                    },
-                    {
-                        "value": 211,
-                        "display_name": "RECAP, scraper, Harvard, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 212,
-                        "display_name": "Columbia, Harvard, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 213,
-                        "display_name": "RECAP, Columbia, Harvard, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 214,
-                        "display_name": "Scraper, Columbia, Harvard, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 215,
-                        "display_name": "RECAP, scraper, Columbia, Harvard, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 216,
-                        "display_name": "IDB, Harvard, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 217,
-                        "display_name": "RECAP, IDB, Harvard, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 218,
-                        "display_name": "Scraper, IDB, Harvard, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 219,
-                        "display_name": "RECAP, scraper, IDB, Harvard, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 220,
-                        "display_name": "Columbia, IDB, Harvard, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 221,
-                        "display_name": "RECAP, Columbia, IDB, Harvard, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 222,
-                        "display_name": "Scraper, Columbia, IDB, Harvard, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 223,
-                        "display_name": "RECAP, scraper, Columbia, IDB, Harvard, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 224,
-                        "display_name": "Direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 225,
-                        "display_name": "RECAP, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 226,
-                        "display_name": "Scraper, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 227,
-                        "display_name": "RECAP, scraper, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 228,
-                        "display_name": "Columbia, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 229,
-                        "display_name": "RECAP, Columbia, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 230,
-                        "display_name": "Scraper, Columbia, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 231,
-                        "display_name": "RECAP, scraper, Columbia, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 232,
-                        "display_name": "IDB, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 233,
-                        "display_name": "RECAP, IDB, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 234,
-                        "display_name": "Scraper, IDB, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 235,
-                        "display_name": "RECAP, scraper, IDB, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 236,
-                        "display_name": "Columbia, IDB, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 237,
-                        "display_name": "RECAP, Columbia, IDB, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 238,
-                        "display_name": "Scraper, Columbia, IDB, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 239,
-                        "display_name": "RECAP, scraper, Columbia, IDB, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 240,
-                        "display_name": "Harvard, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 241,
-                        "display_name": "RECAP, Harvard, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 242,
-                        "display_name": "Scraper, Harvard, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 243,
-                        "display_name": "RECAP, scraper, Harvard, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 244,
-                        "display_name": "Columbia, Harvard, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 245,
-                        "display_name": "RECAP, Columbia, Harvard, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 246,
-                        "display_name": "Scraper, Columbia, Harvard, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 247,
-                        "display_name": "RECAP, scraper, Columbia, Harvard, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 248,
-                        "display_name": "IDB, Harvard, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 249,
-                        "display_name": "RECAP, IDB, Harvard, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 250,
-                        "display_name": "Scraper, IDB, Harvard, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 251,
-                        "display_name": "RECAP, scraper, IDB, Harvard, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 252,
-                        "display_name": "Columbia, IDB, Harvard, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 253,
-                        "display_name": "RECAP, Columbia, IDB, Harvard, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 254,
-                        "display_name": "Scraper, Columbia, IDB, Harvard, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                    {
-                        "value": 255,
-                        "display_name": "RECAP, scraper, Columbia, IDB, Harvard, direct court input, 2020 anonymous database, and scanning project",
-                    },
-                ],
+                "choices_id": "dockets.source",
             },
         ),
         AfterValidator(in_post_validator),
@@ -1348,58 +236,7 @@ class DocketsEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {"value": "id", "display_name": "Id (asc)"},
-                    {"value": "-id", "display_name": "Id (desc)"},
-                    {
-                        "value": "date_created",
-                        "display_name": "Date Created (asc)",
-                    },
-                    {
-                        "value": "-date_created",
-                        "display_name": "Date Created (desc)",
-                    },
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date Modified (asc)",
-                    },
-                    {
-                        "value": "-date_modified",
-                        "display_name": "Date Modified (desc)",
-                    },
-                    {
-                        "value": "date_blocked",
-                        "display_name": "Date Blocked (asc)",
-                    },
-                    {
-                        "value": "-date_blocked",
-                        "display_name": "Date Blocked (desc)",
-                    },
-                    {
-                        "value": "date_filed",
-                        "display_name": "Date Filed (asc)",
-                    },
-                    {
-                        "value": "-date_filed",
-                        "display_name": "Date Filed (desc)",
-                    },
-                    {
-                        "value": "date_terminated",
-                        "display_name": "Date Terminated (asc)",
-                    },
-                    {
-                        "value": "-date_terminated",
-                        "display_name": "Date Terminated (desc)",
-                    },
-                    {
-                        "value": "date_last_filing",
-                        "display_name": "Date Last Filing (asc)",
-                    },
-                    {
-                        "value": "-date_last_filing",
-                        "display_name": "Date Last Filing (desc)",
-                    },
-                ],
+                "choices_id": "dockets.order_by",
             },
         ),
         BeforeValidator(choice_validator),
@@ -31,23 +31,7 @@ class EducationsEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {"value": "school", "display_name": "School"},
-                    {"value": "person", "display_name": "Person"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {"value": "degree_level", "display_name": "Degree level"},
-                    {
-                        "value": "degree_detail",
-                        "display_name": "Degree detail",
-                    },
-                    {"value": "degree_year", "display_name": "Degree year"},
-                ],
+                "choices_id": "educations.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -93,32 +77,7 @@ class EducationsEndpoint(Endpoint):
             None,
             description="Normalized degree level, e.g. BA, JD.",
             json_schema_extra={
-                "choices": [
-                    {"value": "ba", "display_name": "Bachelor's (e.g. B.A.)"},
-                    {"value": "ma", "display_name": "Master's (e.g. M.A.)"},
-                    {"value": "jd", "display_name": "Juris Doctor (J.D.)"},
-                    {"value": "llm", "display_name": "Master of Laws (LL.M)"},
-                    {
-                        "value": "llb",
-                        "display_name": "Bachelor of Laws (e.g. LL.B)",
-                    },
-                    {"value": "jsd", "display_name": "Doctor of Law (J.S.D)"},
-                    {
-                        "value": "phd",
-                        "display_name": "Doctor of Philosophy (PhD)",
-                    },
-                    {"value": "aa", "display_name": "Associate (e.g. A.A.)"},
-                    {"value": "md", "display_name": "Medical Degree (M.D.)"},
-                    {
-                        "value": "mba",
-                        "display_name": "Master of Business Administration (M.B.A.)",
-                    },
-                    {
-                        "value": "cfa",
-                        "display_name": "Accounting Certification (C.P.A., C.M.A., C.F.A.)",
-                    },
-                    {"value": "cert", "display_name": "Certificate"},
-                ],
+                "choices_id": "degree_level",
             },
         ),
         BeforeValidator(choice_validator),
@@ -150,26 +109,7 @@ class EducationsEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {"value": "id", "display_name": "Id (asc)"},
-                    {"value": "-id", "display_name": "Id (desc)"},
-                    {
-                        "value": "date_created",
-                        "display_name": "Date Created (asc)",
-                    },
-                    {
-                        "value": "-date_created",
-                        "display_name": "Date Created (desc)",
-                    },
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date Modified (asc)",
-                    },
-                    {
-                        "value": "-date_modified",
-                        "display_name": "Date Modified (desc)",
-                    },
-                ],
+                "choices_id": "opinions.order_by",
             },
         ),
         BeforeValidator(choice_validator),
@@ -31,56 +31,7 @@ class FinancialDisclosuresEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {"value": "agreements", "display_name": "Agreements"},
-                    {"value": "debts", "display_name": "Debts"},
-                    {"value": "gifts", "display_name": "Gifts"},
-                    {"value": "investments", "display_name": "Investments"},
-                    {
-                        "value": "non_investment_incomes",
-                        "display_name": "Non investment incomes",
-                    },
-                    {"value": "positions", "display_name": "Positions"},
-                    {
-                        "value": "reimbursements",
-                        "display_name": "Reimbursements",
-                    },
-                    {
-                        "value": "spouse_incomes",
-                        "display_name": "Spouse incomes",
-                    },
-                    {"value": "person", "display_name": "Person"},
-                    {"value": "filepath", "display_name": "Filepath"},
-                    {"value": "thumbnail", "display_name": "Thumbnail"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {"value": "year", "display_name": "Year"},
-                    {
-                        "value": "thumbnail_status",
-                        "display_name": "Thumbnail status",
-                    },
-                    {"value": "page_count", "display_name": "Page count"},
-                    {"value": "sha1", "display_name": "Sha1"},
-                    {"value": "report_type", "display_name": "Report type"},
-                    {"value": "is_amended", "display_name": "Is amended"},
-                    {
-                        "value": "addendum_content_raw",
-                        "display_name": "Addendum content raw",
-                    },
-                    {
-                        "value": "addendum_redacted",
-                        "display_name": "Addendum redacted",
-                    },
-                    {
-                        "value": "has_been_extracted",
-                        "display_name": "Has been extracted",
-                    },
-                ],
+                "choices_id": "financial_disclosures.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -224,26 +175,7 @@ class FinancialDisclosuresEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {"value": "id", "display_name": "Id (asc)"},
-                    {"value": "-id", "display_name": "Id (desc)"},
-                    {
-                        "value": "date_created",
-                        "display_name": "Date Created (asc)",
-                    },
-                    {
-                        "value": "-date_created",
-                        "display_name": "Date Created (desc)",
-                    },
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date Modified (asc)",
-                    },
-                    {
-                        "value": "-date_modified",
-                        "display_name": "Date Modified (desc)",
-                    },
-                ],
+                "choices_id": "opinions.order_by",
             },
         ),
         BeforeValidator(choice_validator),
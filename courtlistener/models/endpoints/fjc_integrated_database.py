@@ -33,107 +33,7 @@ class FjcIntegratedDatabaseEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {
-                        "value": "dataset_source",
-                        "display_name": "Dataset source",
-                    },
-                    {"value": "office", "display_name": "Office"},
-                    {
-                        "value": "docket_number",
-                        "display_name": "Docket number",
-                    },
-                    {"value": "origin", "display_name": "Origin"},
-                    {"value": "date_filed", "display_name": "Date filed"},
-                    {"value": "jurisdiction", "display_name": "Jurisdiction"},
-                    {
-                        "value": "nature_of_suit",
-                        "display_name": "Nature of suit",
-                    },
-                    {"value": "title", "display_name": "Title"},
-                    {"value": "section", "display_name": "Section"},
-                    {"value": "subsection", "display_name": "Subsection"},
-                    {
-                        "value": "diversity_of_residence",
-                        "display_name": "Diversity of residence",
-                    },
-                    {"value": "class_action", "display_name": "Class action"},
-                    {
-                        "value": "monetary_demand",
-                        "display_name": "Monetary demand",
-                    },
-                    {
-                        "value": "county_of_residence",
-                        "display_name": "County of residence",
-                    },
-                    {
-                        "value": "arbitration_at_filing",
-                        "display_name": "Arbitration at filing",
-                    },
-                    {
-                        "value": "arbitration_at_termination",
-                        "display_name": "Arbitration at termination",
-                    },
-                    {
-                        "value": "multidistrict_litigation_docket_number",
-                        "display_name": "Multidistrict litigation docket number",
-                    },
-                    {"value": "plaintiff", "display_name": "Plaintiff"},
-                    {"value": "defendant", "display_name": "Defendant"},
-                    {
-                        "value": "date_transfer",
-                        "display_name": "Date transfer",
-                    },
-                    {
-                        "value": "transfer_office",
-                        "display_name": "Transfer office",
-                    },
-                    {
-                        "value": "transfer_docket_number",
-                        "display_name": "Transfer docket number",
-                    },
-                    {
-                        "value": "transfer_origin",
-                        "display_name": "Transfer origin",
-                    },
-                    {
-                        "value": "date_terminated",
-                        "display_name": "Date terminated",
-                    },
-                    {
-                        "value": "termination_class_action_status",
-                        "display_name": "Termination class action status",
-                    },
-                    {
-                        "value": "procedural_progress",
-                        "display_name": "Procedural progress",
-                    },
-                    {"value": "disposition", "display_name": "Disposition"},
-                    {
-                        "value": "nature_of_judgement",
-                        "display_name": "Nature of judgement",
-                    },
-                    {
-                        "value": "amount_received",
-                        "display_name": "Amount received",
-                    },
-                    {"value": "judgment", "display_name": "Judgment"},
-                    {"value": "pro_se", "display_name": "Pro se"},
-                    {"value": "year_of_tape", "display_name": "Year of tape"},
-                    {
-                        "value": "nature_of_offense",
-                        "display_name": "Nature of offense",
-                    },
-                    {"value": "version", "display_name": "Version"},
-                    {"value": "circuit", "display_name": "Circuit"},
-                    {"value": "district", "display_name": "District"},
-                ],
+                "choices_id": "fjc_integrated_database.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -145,48 +45,7 @@ class FjcIntegratedDatabaseEndpoint(Endpoint):
             None,
             description="IDB has several source datafiles. This field helps keep track of where a row came from originally.",
             json_schema_extra={
-                "choices": [
-                    {
-                        "value": 1,
-                        "display_name": "Civil cases filed and terminated from SY 1970 through SY 1987",
-                    },
-                    {
-                        "value": 2,
-                        "display_name": "Civil cases filed, terminated, and pending from SY 1988 to present (2017)",
-                    },
-                    {
-                        "value": 8,
-                        "display_name": "Civil cases filed, terminated, and pending from SY 1988 to present (2020)",
-                    },
-                    {
-                        "value": 9,
-                        "display_name": "Civil cases filed, terminated, and pending from SY 1988 to present (September 2021)",
-                    },
-                    {
-                        "value": 10,
-                        "display_name": "Civil cases filed, terminated, and pending from SY 1988 to present (March 2022)",
-                    },
-                    {
-                        "value": 3,
-                        "display_name": "Criminal defendants filed and terminated from SY 1970 through FY 1995",
-                    },
-                    {
-                        "value": 4,
-                        "display_name": "Criminal defendants filed, terminated, and pending from FY 1996 to present (2017)",
-                    },
-                    {
-                        "value": 5,
-                        "display_name": "Appellate cases filed and terminated from SY 1971 through FY 2007",
-                    },
-                    {
-                        "value": 6,
-                        "display_name": "Appellate cases filed, terminated, and pending from FY 2008 to present (2017)",
-                    },
-                    {
-                        "value": 7,
-                        "display_name": "Bankruptcy cases filed, terminated, and pending from FY 2008 to present (2017)",
-                    },
-                ],
+                "choices_id": "dataset_source",
             },
         ),
         AfterValidator(in_post_validator),
@@ -228,42 +87,7 @@ class FjcIntegratedDatabaseEndpoint(Endpoint):
             None,
             description="A single digit code describing the manner in which the case was filed in the district.",
             json_schema_extra={
-                "choices": [
-                    {"value": 1, "display_name": "Original Proceeding"},
-                    {
-                        "value": 2,
-                        "display_name": "Removed  (began in the state court, removed to the district court)",
-                    },
-                    {
-                        "value": 3,
-                        "display_name": "Remanded for further action (removal from court of appeals)",
-                    },
-                    {
-                        "value": 4,
-                        "display_name": "Reinstated/reopened (previously opened and closed, reopened for additional action)",
-                    },
-                    {
-                        "value": 5,
-                        "display_name": "Transferred from another district(pursuant to 28 USC 1404)",
-                    },
-                    {
-                        "value": 6,
-                        "display_name": "Multi district litigation (cases transferred to this district by an order entered by Judicial Panel on Multi District Litigation pursuant to 28 USC 1407)",
-                    },
-                    {
-                        "value": 7,
-                        "display_name": "Appeal to a district judge of a magistrate judge's decision",
-                    },
-                    {"value": 8, "display_name": "Second reopen"},
-                    {"value": 9, "display_name": "Third reopen"},
-                    {"value": 10, "display_name": "Fourth reopen"},
-                    {"value": 11, "display_name": "Fifth reopen"},
-                    {"value": 12, "display_name": "Sixth reopen"},
-                    {
-                        "value": 13,
-                        "display_name": "Multi district litigation originating in the district (valid beginning July 1, 2016)",
-                    },
-                ],
+                "choices_id": "origin",
             },
         ),
         AfterValidator(in_post_validator),
@@ -284,13 +108,7 @@ class FjcIntegratedDatabaseEndpoint(Endpoint):
             None,
             description="The code which provides the basis for the U.S. district court jurisdiction in the case. This code is used in conjunction with appropriate nature of suit code.",
             json_schema_extra={
-                "choices": [
-                    {"value": 1, "display_name": "Government plaintiff"},
-                    {"value": 2, "display_name": "Government defendant"},
-                    {"value": 3, "display_name": "Federal question"},
-                    {"value": 4, "display_name": "Diversity of citizenship"},
-                    {"value": 5, "display_name": "Local question"},
-                ],
+                "choices_id": "fjc_integrated_database.jurisdiction",
             },
         ),
         AfterValidator(in_post_validator),
@@ -325,12 +143,7 @@ class FjcIntegratedDatabaseEndpoint(Endpoint):
             None,
             description="This field is used only by the courts  participating in the Formal Arbitration Program.  It is not used for any other purpose.",
             json_schema_extra={
-                "choices": [
-                    {"value": "M", "display_name": "Mandatory"},
-                    {"value": "V", "display_name": "Voluntary"},
-                    {"value": "E", "display_name": "Exempt"},
-                    {"value": "Y", "display_name": "Yes, but type unknown"},
-                ],
+                "choices_id": "fjc_integrated_database.arbitration_at_filing",
             },
         ),
         AfterValidator(in_post_validator),
@@ -343,12 +156,7 @@ class FjcIntegratedDatabaseEndpoint(Endpoint):
             None,
             description="Termination arbitration code.",
             json_schema_extra={
-                "choices": [
-                    {"value": "M", "display_name": "Mandatory"},
-                    {"value": "V", "display_name": "Voluntary"},
-                    {"value": "E", "display_name": "Exempt"},
-                    {"value": "Y", "display_name": "Yes, but type unknown"},
-                ],
+                "choices_id": "fjc_integrated_database.arbitration_at_filing",
             },
         ),
         AfterValidator(in_post_validator),
@@ -382,10 +190,7 @@ class FjcIntegratedDatabaseEndpoint(Endpoint):
             None,
             description="A code that indicates a case involving allegations of class action.",
             json_schema_extra={
-                "choices": [
-                    {"value": 2, "display_name": "Denied"},
-                    {"value": 3, "display_name": "Granted"},
-                ],
+                "choices_id": "termination_class_action_status",
             },
         ),
         AfterValidator(in_post_validator),
@@ -399,57 +204,7 @@ class FjcIntegratedDatabaseEndpoint(Endpoint):
             None,
             description="The point to which the case had progressed when it was disposed of. See notes in codebook.",
             json_schema_extra={
-                "choices": [
-                    {
-                        "value": 1,
-                        "display_name": "Before issue joined: No court action (before issue joined)",
-                    },
-                    {
-                        "value": 2,
-                        "display_name": "Before issue joined: Order entered",
-                    },
-                    {
-                        "value": 11,
-                        "display_name": "Before issue joined: Hearing held",
-                    },
-                    {
-                        "value": 12,
-                        "display_name": "Before issue joined: Order decided",
-                    },
-                    {
-                        "value": 3,
-                        "display_name": "After issue joined: No court action (after issue joined)",
-                    },
-                    {
-                        "value": 4,
-                        "display_name": "After issue joined: Judgment on motion",
-                    },
-                    {
-                        "value": 5,
-                        "display_name": "After issue joined: Pretrial conference held",
-                    },
-                    {
-                        "value": 6,
-                        "display_name": "After issue joined: During court trial",
-                    },
-                    {
-                        "value": 7,
-                        "display_name": "After issue joined: During jury trial",
-                    },
-                    {
-                        "value": 8,
-                        "display_name": "After issue joined: After court trial",
-                    },
-                    {
-                        "value": 9,
-                        "display_name": "After issue joined: After jury trial",
-                    },
-                    {"value": 10, "display_name": "After issue joined: Other"},
-                    {
-                        "value": 13,
-                        "display_name": "After issue joined: Request for trial de novo after arbitration",
-                    },
-                ],
+                "choices_id": "procedural_progress",
             },
         ),
         AfterValidator(in_post_validator),
@@ -463,71 +218,7 @@ class FjcIntegratedDatabaseEndpoint(Endpoint):
             None,
             description="The manner in which the case was disposed of.",
             json_schema_extra={
-                "choices": [
-                    {
-                        "value": 0,
-                        "display_name": "Cases transferred or remanded: Transfer to another district",
-                    },
-                    {
-                        "value": 1,
-                        "display_name": "Cases transferred or remanded: Remanded to state court",
-                    },
-                    {
-                        "value": 10,
-                        "display_name": "Cases transferred or remanded: Multi-district litigation transfer",
-                    },
-                    {
-                        "value": 11,
-                        "display_name": "Cases transferred or remanded: Remanded to U.S. agency",
-                    },
-                    {
-                        "value": 2,
-                        "display_name": "Dismissals: Want of prosecution",
-                    },
-                    {
-                        "value": 3,
-                        "display_name": "Dismissals: Lack of jurisdiction",
-                    },
-                    {
-                        "value": 12,
-                        "display_name": "Dismissals: Voluntarily dismissed",
-                    },
-                    {"value": 13, "display_name": "Dismissals: Settled"},
-                    {"value": 14, "display_name": "Dismissals: Other"},
-                    {"value": 4, "display_name": "Judgment on: Default"},
-                    {"value": 5, "display_name": "Judgment on: Consent"},
-                    {
-                        "value": 6,
-                        "display_name": "Judgment on: Motion before trial",
-                    },
-                    {"value": 7, "display_name": "Judgment on: Jury verdict"},
-                    {
-                        "value": 8,
-                        "display_name": "Judgment on: Directed verdict",
-                    },
-                    {"value": 9, "display_name": "Judgment on: Court trial"},
-                    {
-                        "value": 15,
-                        "display_name": "Judgment on: Award of arbitrator",
-                    },
-                    {
-                        "value": 16,
-                        "display_name": "Judgment on: Stayed pending bankruptcy",
-                    },
-                    {"value": 17, "display_name": "Judgment on: Other"},
-                    {
-                        "value": 18,
-                        "display_name": "Judgment on: Statistical closing",
-                    },
-                    {
-                        "value": 19,
-                        "display_name": "Judgment on: Appeal affirmed (magistrate judge)",
-                    },
-                    {
-                        "value": 20,
-                        "display_name": "Judgment on: Appeal denied (magistrate judge",
-                    },
-                ],
+                "choices_id": "disposition",
             },
         ),
         AfterValidator(in_post_validator),
@@ -541,15 +232,7 @@ class FjcIntegratedDatabaseEndpoint(Endpoint):
             None,
             description="Which party the cases was disposed in favor of.",
             json_schema_extra={
-                "choices": [
-                    {"value": 1, "display_name": "Plaintiff"},
-                    {"value": 2, "display_name": "Defendant"},
-                    {
-                        "value": 3,
-                        "display_name": "Both plaintiff and defendant",
-                    },
-                    {"value": 4, "display_name": "Unknown"},
-                ],
+                "choices_id": "judgment",
             },
         ),
         AfterValidator(in_post_validator),
@@ -563,24 +246,7 @@ class FjcIntegratedDatabaseEndpoint(Endpoint):
             None,
             description="Which parties filed pro se? (See codebook for more details.)",
             json_schema_extra={
-                "choices": [
-                    {
-                        "value": 0,
-                        "display_name": "No pro se plaintiffs or defendants",
-                    },
-                    {
-                        "value": 1,
-                        "display_name": "Pro se plaintiffs, but no pro se defendants",
-                    },
-                    {
-                        "value": 2,
-                        "display_name": "Pro se defendants, but no pro se plaintiffs",
-                    },
-                    {
-                        "value": 3,
-                        "display_name": "Both pro se plaintiffs & defendants",
-                    },
-                ],
+                "choices_id": "pro_se",
             },
         ),
         AfterValidator(in_post_validator),
@@ -593,34 +259,7 @@ class FjcIntegratedDatabaseEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {"value": "id", "display_name": "Id (asc)"},
-                    {"value": "-id", "display_name": "Id (desc)"},
-                    {
-                        "value": "date_created",
-                        "display_name": "Date Created (asc)",
-                    },
-                    {
-                        "value": "-date_created",
-                        "display_name": "Date Created (desc)",
-                    },
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date Modified (asc)",
-                    },
-                    {
-                        "value": "-date_modified",
-                        "display_name": "Date Modified (desc)",
-                    },
-                    {
-                        "value": "date_filed",
-                        "display_name": "Date Filed (asc)",
-                    },
-                    {
-                        "value": "-date_filed",
-                        "display_name": "Date Filed (desc)",
-                    },
-                ],
+                "choices_id": "fjc_integrated_database.order_by",
             },
         ),
         BeforeValidator(choice_validator),
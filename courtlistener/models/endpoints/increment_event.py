@@ -27,7 +27,7 @@ class IncrementEventEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [{"value": "label", "display_name": "Label"}],
+                "choices_id": "increment_event.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -31,66 +31,7 @@ class InvestmentsEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {"value": "page_number", "display_name": "Page number"},
-                    {"value": "description", "display_name": "Description"},
-                    {"value": "redacted", "display_name": "Redacted"},
-                    {
-                        "value": "income_during_reporting_period_code",
-                        "display_name": "Income during reporting period code",
-                    },
-                    {
-                        "value": "income_during_reporting_period_type",
-                        "display_name": "Income during reporting period type",
-                    },
-                    {
-                        "value": "gross_value_code",
-                        "display_name": "Gross value code",
-                    },
-                    {
-                        "value": "gross_value_method",
-                        "display_name": "Gross value method",
-                    },
-                    {
-                        "value": "transaction_during_reporting_period",
-                        "display_name": "Transaction during reporting period",
-                    },
-                    {
-                        "value": "transaction_date_raw",
-                        "display_name": "Transaction date raw",
-                    },
-                    {
-                        "value": "transaction_date",
-                        "display_name": "Transaction date",
-                    },
-                    {
-                        "value": "transaction_value_code",
-                        "display_name": "Transaction value code",
-                    },
-                    {
-                        "value": "transaction_gain_code",
-                        "display_name": "Transaction gain code",
-                    },
-                    {
-                        "value": "transaction_partner",
-                        "display_name": "Transaction partner",
-                    },
-                    {
-                        "value": "has_inferred_values",
-                        "display_name": "Has inferred values",
-                    },
-                    {
-                        "value": "financial_disclosure",
-                        "display_name": "Financial disclosure",
-                    },
-                ],
+                "choices_id": "investments.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -136,19 +77,7 @@ class InvestmentsEndpoint(Endpoint):
             None,
             description="Investment total value code at end of reporting period as code (ex. J (1-15,000)).",
             json_schema_extra={
-                "choices": [
-                    {"value": "J", "display_name": "1 - 15,000"},
-                    {"value": "K", "display_name": "15,001 - 50,000"},
-                    {"value": "L", "display_name": "50,001 - 100,000"},
-                    {"value": "M", "display_name": "100,001 - 250,000"},
-                    {"value": "N", "display_name": "250,001 - 500,000"},
-                    {"value": "O", "display_name": "500,001 - 1,000,000"},
-                    {"value": "P1", "display_name": "1,000,001 - 5,000,000"},
-                    {"value": "P2", "display_name": "5,000,001 - 25,000,000"},
-                    {"value": "P3", "display_name": "25,000,001 - 50,000,000"},
-                    {"value": "P4", "display_name": "50,000,001 - "},
-                    {"value": "-1", "display_name": "Failed Extraction"},
-                ],
+                "choices_id": "debts.value_code",
             },
         ),
         BeforeValidator(choice_validator),
@@ -159,18 +88,7 @@ class InvestmentsEndpoint(Endpoint):
             None,
             description="Increase in investment value - as a form code",
             json_schema_extra={
-                "choices": [
-                    {"value": "A", "display_name": "1 - 1,000"},
-                    {"value": "B", "display_name": "1,001 - 2,500"},
-                    {"value": "C", "display_name": "2,501 - 5,000"},
-                    {"value": "D", "display_name": "5,001 - 15,000"},
-                    {"value": "E", "display_name": "15,001 - 50,000"},
-                    {"value": "F", "display_name": "50,001 - 100,000"},
-                    {"value": "G", "display_name": "100,001 - 1,000,000"},
-                    {"value": "H1", "display_name": "1,000,001 - 5,000,000"},
-                    {"value": "H2", "display_name": "5,000,001 +"},
-                    {"value": "-1", "display_name": "Failed Extraction"},
-                ],
+                "choices_id": "income_during_reporting_period_code",
             },
         ),
         BeforeValidator(choice_validator),
@@ -188,19 +106,7 @@ class InvestmentsEndpoint(Endpoint):
             None,
             description="Transaction value amount, as form code (ex. J (1-15,000)).",
             json_schema_extra={
-                "choices": [
-                    {"value": "J", "display_name": "1 - 15,000"},
-                    {"value": "K", "display_name": "15,001 - 50,000"},
-                    {"value": "L", "display_name": "50,001 - 100,000"},
-                    {"value": "M", "display_name": "100,001 - 250,000"},
-                    {"value": "N", "display_name": "250,001 - 500,000"},
-                    {"value": "O", "display_name": "500,001 - 1,000,000"},
-                    {"value": "P1", "display_name": "1,000,001 - 5,000,000"},
-                    {"value": "P2", "display_name": "5,000,001 - 25,000,000"},
-                    {"value": "P3", "display_name": "25,000,001 - 50,000,000"},
-                    {"value": "P4", "display_name": "50,000,001 - "},
-                    {"value": "-1", "display_name": "Failed Extraction"},
-                ],
+                "choices_id": "debts.value_code",
             },
         ),
         BeforeValidator(choice_validator),
@@ -221,26 +127,7 @@ class InvestmentsEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {"value": "id", "display_name": "Id (asc)"},
-                    {"value": "-id", "display_name": "Id (desc)"},
-                    {
-                        "value": "date_created",
-                        "display_name": "Date Created (asc)",
-                    },
-                    {
-                        "value": "-date_created",
-                        "display_name": "Date Created (desc)",
-                    },
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date Modified (asc)",
-                    },
-                    {
-                        "value": "-date_modified",
-                        "display_name": "Date Modified (desc)",
-                    },
-                ],
+                "choices_id": "opinions.order_by",
             },
         ),
         BeforeValidator(choice_validator),
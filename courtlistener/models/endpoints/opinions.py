@@ -31,59 +31,7 @@ class OpinionsEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {"value": "absolute_url", "display_name": "Absolute url"},
-                    {"value": "cluster_id", "display_name": "Cluster id"},
-                    {"value": "cluster", "display_name": "Cluster"},
-                    {"value": "author_id", "display_name": "Author id"},
-                    {"value": "author", "display_name": "Author"},
-                    {"value": "joined_by", "display_name": "Joined by"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {"value": "author_str", "display_name": "Author str"},
-                    {"value": "per_curiam", "display_name": "Per curiam"},
-                    {
-                        "value": "joined_by_str",
-                        "display_name": "Joined by str",
-                    },
-                    {"value": "type", "display_name": "Type"},
-                    {"value": "sha1", "display_name": "Sha1"},
-                    {"value": "page_count", "display_name": "Page count"},
-                    {"value": "download_url", "display_name": "Download url"},
-                    {"value": "local_path", "display_name": "Local path"},
-                    {"value": "plain_text", "display_name": "Plain text"},
-                    {"value": "html", "display_name": "Html"},
-                    {"value": "html_lawbox", "display_name": "Html lawbox"},
-                    {
-                        "value": "html_columbia",
-                        "display_name": "Html columbia",
-                    },
-                    {
-                        "value": "html_anon_2020",
-                        "display_name": "Html anon 2020",
-                    },
-                    {"value": "xml_harvard", "display_name": "Xml harvard"},
-                    {"value": "xml_scan", "display_name": "Xml scan"},
-                    {
-                        "value": "html_with_citations",
-                        "display_name": "Html with citations",
-                    },
-                    {
-                        "value": "extracted_by_ocr",
-                        "display_name": "Extracted by ocr",
-                    },
-                    {"value": "ordering_key", "display_name": "Ordering key"},
-                    {"value": "main_version", "display_name": "Main version"},
-                    {
-                        "value": "opinions_cited",
-                        "display_name": "Opinions cited",
-                    },
-                ],
+                "choices_id": "opinions.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -168,45 +116,7 @@ class OpinionsEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {
-                        "value": "010combined",
-                        "display_name": "Combined Opinion",
-                    },
-                    {
-                        "value": "015unamimous",
-                        "display_name": "Unanimous Opinion",
-                    },
-                    {"value": "020lead", "display_name": "Lead Opinion"},
-                    {
-                        "value": "025plurality",
-                        "display_name": "Plurality Opinion",
-                    },
-                    {
-                        "value": "030concurrence",
-                        "display_name": "Concurrence Opinion",
-                    },
-                    {
-                        "value": "035concurrenceinpart",
-                        "display_name": "In Part Opinion",
-                    },
-                    {"value": "040dissent", "display_name": "Dissent"},
-                    {"value": "050addendum", "display_name": "Addendum"},
-                    {"value": "060remittitur", "display_name": "Remittitur"},
-                    {"value": "070rehearing", "display_name": "Rehearing"},
-                    {
-                        "value": "080onthemerits",
-                        "display_name": "On the Merits",
-                    },
-                    {
-                        "value": "090onmotiontostrike",
-                        "display_name": "On Motion to Strike Cost Bill",
-                    },
-                    {
-                        "value": "100trialcourt",
-                        "display_name": "Trial Court Document",
-                    },
-                ],
+                "choices_id": "opinions.type",
             },
         ),
         BeforeValidator(multiple_choice_validator),
@@ -216,26 +126,7 @@ class OpinionsEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {"value": "id", "display_name": "Id (asc)"},
-                    {"value": "-id", "display_name": "Id (desc)"},
-                    {
-                        "value": "date_created",
-                        "display_name": "Date Created (asc)",
-                    },
-                    {
-                        "value": "-date_created",
-                        "display_name": "Date Created (desc)",
-                    },
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date Modified (asc)",
-                    },
-                    {
-                        "value": "-date_modified",
-                        "display_name": "Date Modified (desc)",
-                    },
-                ],
+                "choices_id": "opinions.order_by",
             },
         ),
         BeforeValidator(choice_validator),
@@ -29,19 +29,7 @@ class OpinionsCitedEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {
-                        "value": "citing_opinion",
-                        "display_name": "Citing opinion",
-                    },
-                    {
-                        "value": "cited_opinion",
-                        "display_name": "Cited opinion",
-                    },
-                    {"value": "depth", "display_name": "Depth"},
-                ],
+                "choices_id": "opinions_cited.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
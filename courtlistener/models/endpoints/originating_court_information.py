@@ -27,65 +27,7 @@ class OriginatingCourtInformationEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {
-                        "value": "docket_number",
-                        "display_name": "Docket number",
-                    },
-                    {
-                        "value": "docket_number_raw",
-                        "display_name": "Docket number raw",
-                    },
-                    {
-                        "value": "assigned_to_str",
-                        "display_name": "Assigned to str",
-                    },
-                    {
-                        "value": "ordering_judge_str",
-                        "display_name": "Ordering judge str",
-                    },
-                    {
-                        "value": "court_reporter",
-                        "display_name": "Court reporter",
-                    },
-                    {
-                        "value": "date_disposed",
-                        "display_name": "Date disposed",
-                    },
-                    {"value": "date_filed", "display_name": "Date filed"},
-                    {
-                        "value": "date_judgment",
-                        "display_name": "Date judgment",
-                    },
-                    {
-                        "value": "date_judgment_eod",
-                        "display_name": "Date judgment eod",
-                    },
-                    {
-                        "value": "date_filed_noa",
-                        "display_name": "Date filed noa",
-                    },
-                    {
-                        "value": "date_received_coa",
-                        "display_name": "Date received coa",
-                    },
-                    {
-                        "value": "date_rehearing_denied",
-                        "display_name": "Date rehearing denied",
-                    },
-                    {"value": "assigned_to", "display_name": "Assigned to"},
-                    {
-                        "value": "ordering_judge",
-                        "display_name": "Ordering judge",
-                    },
-                ],
+                "choices_id": "originating_court_information.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -31,59 +31,7 @@ class PeopleEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {"value": "race", "display_name": "Race"},
-                    {"value": "sources", "display_name": "Sources"},
-                    {"value": "aba_ratings", "display_name": "Aba ratings"},
-                    {"value": "educations", "display_name": "Educations"},
-                    {"value": "positions", "display_name": "Positions"},
-                    {
-                        "value": "political_affiliations",
-                        "display_name": "Political affiliations",
-                    },
-                    {"value": "is_alias_of", "display_name": "Is alias of"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {
-                        "value": "date_completed",
-                        "display_name": "Date completed",
-                    },
-                    {"value": "fjc_id", "display_name": "Fjc id"},
-                    {"value": "slug", "display_name": "Slug"},
-                    {"value": "name_first", "display_name": "Name first"},
-                    {"value": "name_middle", "display_name": "Name middle"},
-                    {"value": "name_last", "display_name": "Name last"},
-                    {"value": "name_suffix", "display_name": "Name suffix"},
-                    {"value": "date_dob", "display_name": "Date dob"},
-                    {
-                        "value": "date_granularity_dob",
-                        "display_name": "Date granularity dob",
-                    },
-                    {"value": "date_dod", "display_name": "Date dod"},
-                    {
-                        "value": "date_granularity_dod",
-                        "display_name": "Date granularity dod",
-                    },
-                    {"value": "dob_city", "display_name": "Dob city"},
-                    {"value": "dob_state", "display_name": "Dob state"},
-                    {"value": "dob_country", "display_name": "Dob country"},
-                    {"value": "dod_city", "display_name": "Dod city"},
-                    {"value": "dod_state", "display_name": "Dod state"},
-                    {"value": "dod_country", "display_name": "Dod country"},
-                    {"value": "gender", "display_name": "Gender"},
-                    {"value": "religion", "display_name": "Religion"},
-                    {
-                        "value": "ftm_total_received",
-                        "display_name": "Ftm total received",
-                    },
-                    {"value": "ftm_eid", "display_name": "Ftm eid"},
-                    {"value": "has_photo", "display_name": "Has photo"},
-                ],
+                "choices_id": "people.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -150,14 +98,7 @@ class PeopleEndpoint(Endpoint):
             None,
             description="Any suffixes that this person\u0027s name may have",
             json_schema_extra={
-                "choices": [
-                    {"value": "jr", "display_name": "Jr."},
-                    {"value": "sr", "display_name": "Sr."},
-                    {"value": "1", "display_name": "I"},
-                    {"value": "2", "display_name": "II"},
-                    {"value": "3", "display_name": "III"},
-                    {"value": "4", "display_name": "IV"},
-                ],
+                "choices_id": "name_suffix",
             },
         ),
         BeforeValidator(choice_validator),
@@ -195,70 +136,7 @@ class PeopleEndpoint(Endpoint):
             None,
             description="The state where the person was born.",
             json_schema_extra={
-                "choices": [
-                    {"value": "AL", "display_name": "Alabama"},
-                    {"value": "AK", "display_name": "Alaska"},
-                    {"value": "AS", "display_name": "American Samoa"},
-                    {"value": "AZ", "display_name": "Arizona"},
-                    {"value": "AR", "display_name": "Arkansas"},
-                    {"value": "AA", "display_name": "Armed Forces Americas"},
-                    {"value": "AE", "display_name": "Armed Forces Europe"},
-                    {"value": "AP", "display_name": "Armed Forces Pacific"},
-                    {"value": "CA", "display_name": "California"},
-                    {"value": "CO", "display_name": "Colorado"},
-                    {"value": "CT", "display_name": "Connecticut"},
-                    {"value": "DE", "display_name": "Delaware"},
-                    {"value": "DC", "display_name": "District of Columbia"},
-                    {"value": "FL", "display_name": "Florida"},
-                    {"value": "GA", "display_name": "Georgia"},
-                    {"value": "GU", "display_name": "Guam"},
-                    {"value": "HI", "display_name": "Hawaii"},
-                    {"value": "ID", "display_name": "Idaho"},
-                    {"value": "IL", "display_name": "Illinois"},
-                    {"value": "IN", "display_name": "Indiana"},
-                    {"value": "IA", "display_name": "Iowa"},
-                    {"value": "KS", "display_name": "Kansas"},
-                    {"value": "KY", "display_name": "Kentucky"},
-                    {"value": "LA", "display_name": "Louisiana"},
-                    {"value": "ME", "display_name": "Maine"},
-                    {"value": "MD", "display_name": "Maryland"},
-                    {"value": "MA", "display_name": "Massachusetts"},
-                    {"value": "MI", "display_name": "Michigan"},
-                    {"value": "MN", "display_name": "Minnesota"},
-                    {"value": "MS", "display_name": "Mississippi"},
-                    {"value": "MO", "display_name": "Missouri"},
-                    {"value": "MT", "display_name": "Montana"},
-                    {"value": "NE", "display_name": "Nebraska"},
-                    {"value": "NV", "display_name": "Nevada"},
-                    {"value": "NH", "display_name": "New Hampshire"},
-                    {"value": "NJ", "display_name": "New Jersey"},
-                    {"value": "NM", "display_name": "New Mexico"},
-                    {"value": "NY", "display_name": "New York"},
-                    {"value": "NC", "display_name": "North Carolina"},
-                    {"value": "ND", "display_name": "North Dakota"},
-                    {
-                        "value": "MP",
-                        "display_name": "Northern Mariana Islands",
-                    },
-                    {"value": "OH", "display_name": "Ohio"},
-                    {"value": "OK", "display_name": "Oklahoma"},
-                    {"value": "OR", "display_name": "Oregon"},
-                    {"value": "PA", "display_name": "Pennsylvania"},
-                    {"value": "PR", "display_name": "Puerto Rico"},
-                    {"value": "RI", "display_name": "Rhode Island"},
-                    {"value": "SC", "display_name": "South Carolina"},
-                    {"value": "SD", "display_name": "South Dakota"},
-                    {"value": "TN", "display_name": "Tennessee"},
-                    {"value": "TX", "display_name": "Texas"},
-                    {"value": "UT", "display_name": "Utah"},
-                    {"value": "VT", "display_name": "Vermont"},
-                    {"value": "VI", "display_name": "Virgin Islands"},
-                    {"value": "VA", "display_name": "Virginia"},
-                    {"value": "WA", "display_name": "Washington"},
-                    {"value": "WV", "display_name": "West Virginia"},
-                    {"value": "WI", "display_name": "Wisconsin"},
-                    {"value": "WY", "display_name": "Wyoming"},
-                ],
+                "choices_id": "people.dob_state",
             },
         ),
         BeforeValidator(choice_validator),
@@ -276,70 +154,7 @@ class PeopleEndpoint(Endpoint):
             None,
             description="The state where the person died.",
             json_schema_extra={
-                "choices": [
-                    {"value": "AL", "display_name": "Alabama"},
-                    {"value": "AK", "display_name": "Alaska"},
-                    {"value": "AS", "display_name": "American Samoa"},
-                    {"value": "AZ", "display_name": "Arizona"},
-                    {"value": "AR", "display_name": "Arkansas"},
-                    {"value": "AA", "display_name": "Armed Forces Americas"},
-                    {"value": "AE", "display_name": "Armed Forces Europe"},
-                    {"value": "AP", "display_name": "Armed Forces Pacific"},
-                    {"value": "CA", "display_name": "California"},
-                    {"value": "CO", "display_name": "Colorado"},
-                    {"value": "CT", "display_name": "Connecticut"},
-                    {"value": "DE", "display_name": "Delaware"},
-                    {"value": "DC", "display_name": "District of Columbia"},
-                    {"value": "FL", "display_name": "Florida"},
-                    {"value": "GA", "display_name": "Georgia"},
-                    {"value": "GU", "display_name": "Guam"},
-                    {"value": "HI", "display_name": "Hawaii"},
-                    {"value": "ID", "display_name": "Idaho"},
-                    {"value": "IL", "display_name": "Illinois"},
-                    {"value": "IN", "display_name": "Indiana"},
-                    {"value": "IA", "display_name": "Iowa"},
-                    {"value": "KS", "display_name": "Kansas"},
-                    {"value": "KY", "display_name": "Kentucky"},
-                    {"value": "LA", "display_name": "Louisiana"},
-                    {"value": "ME", "display_name": "Maine"},
-                    {"value": "MD", "display_name": "Maryland"},
-                    {"value": "MA", "display_name": "Massachusetts"},
-                    {"value": "MI", "display_name": "Michigan"},
-                    {"value": "MN", "display_name": "Minnesota"},
-                    {"value": "MS", "display_name": "Mississippi"},
-                    {"value": "MO", "display_name": "Missouri"},
-                    {"value": "MT", "display_name": "Montana"},
-                    {"value": "NE", "display_name": "Nebraska"},
-                    {"value": "NV", "display_name": "Nevada"},
-                    {"value": "NH", "display_name": "New Hampshire"},
-                    {"value": "NJ", "display_name": "New Jersey"},
-                    {"value": "NM", "display_name": "New Mexico"},
-                    {"value": "NY", "display_name": "New York"},
-                    {"value": "NC", "display_name": "North Carolina"},
-                    {"value": "ND", "display_name": "North Dakota"},
-                    {
-                        "value": "MP",
-                        "display_name": "Northern Mariana Islands",
-                    },
-                    {"value": "OH", "display_name": "Ohio"},
-                    {"value": "OK", "display_name": "Oklahoma"},
-                    {"value": "OR", "display_name": "Oregon"},
-                    {"value": "PA", "display_name": "Pennsylvania"},
-                    {"value": "PR", "display_name": "Puerto Rico"},
-                    {"value": "RI", "display_name": "Rhode Island"},
-                    {"value": "SC", "display_name": "South Carolina"},
-                    {"value": "SD", "display_name": "South Dakota"},
-                    {"value": "TN", "display_name": "Tennessee"},
-                    {"value": "TX", "display_name": "Texas"},
-                    {"value": "UT", "display_name": "Utah"},
-                    {"value": "VT", "display_name": "Vermont"},
-                    {"value": "VI", "display_name": "Virgin Islands"},
-                    {"value": "VA", "display_name": "Virginia"},
-                    {"value": "WA", "display_name": "Washington"},
-                    {"value": "WV", "display_name": "West Virginia"},
-                    {"value": "WI", "display_name": "Wisconsin"},
-                    {"value": "WY", "display_name": "Wyoming"},
-                ],
+                "choices_id": "people.dob_state",
             },
         ),
         BeforeValidator(choice_validator),
@@ -350,11 +165,7 @@ class PeopleEndpoint(Endpoint):
             None,
             description="The person\u0027s gender",
             json_schema_extra={
-                "choices": [
-                    {"value": "m", "display_name": "Male"},
-                    {"value": "f", "display_name": "Female"},
-                    {"value": "o", "display_name": "Other"},
-                ],
+                "choices_id": "gender",
             },
         ),
         BeforeValidator(choice_validator),
@@ -463,28 +274,7 @@ class PeopleEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {"value": "w", "display_name": "White"},
-                    {
-                        "value": "b",
-                        "display_name": "Black or African American",
-                    },
-                    {
-                        "value": "i",
-                        "display_name": "American Indian or Alaska Native",
-                    },
-                    {"value": "a", "display_name": "Asian"},
-                    {
-                        "value": "p",
-                        "display_name": "Native Hawaiian or Other Pacific Islander",
-                    },
-                    {
-                        "value": "mena",
-                        "display_name": "Middle Eastern/North African",
-                    },
-                    {"value": "h", "display_name": "Hispanic/Latino"},
-                    {"value": "o", "display_name": "Other"},
-                ],
+                "choices_id": "race",
             },
         ),
         BeforeValidator(multiple_choice_validator),
@@ -494,35 +284,7 @@ class PeopleEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {"value": "id", "display_name": "Id (asc)"},
-                    {"value": "-id", "display_name": "Id (desc)"},
-                    {
-                        "value": "date_created",
-                        "display_name": "Date Created (asc)",
-                    },
-                    {
-                        "value": "-date_created",
-                        "display_name": "Date Created (desc)",
-                    },
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date Modified (asc)",
-                    },
-                    {
-                        "value": "-date_modified",
-                        "display_name": "Date Modified (desc)",
-                    },
-                    {"value": "date_dob", "display_name": "Date Dob (asc)"},
-                    {"value": "-date_dob", "display_name": "Date Dob (desc)"},
-                    {"value": "date_dod", "display_name": "Date Dod (asc)"},
-                    {"value": "-date_dod", "display_name": "Date Dod (desc)"},
-                    {"value": "name_last", "display_name": "Name Last (asc)"},
-                    {
-                        "value": "-name_last",
-                        "display_name": "Name Last (desc)",
-                    },
-                ],
+                "choices_id": "people.order_by",
             },
         ),
         BeforeValidator(choice_validator),
@@ -30,31 +30,7 @@ class PoliticalAffiliationsEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {"value": "person", "display_name": "Person"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {
-                        "value": "political_party",
-                        "display_name": "Political party",
-                    },
-                    {"value": "source", "display_name": "Source"},
-                    {"value": "date_start", "display_name": "Date start"},
-                    {
-                        "value": "date_granularity_start",
-                        "display_name": "Date granularity start",
-                    },
-                    {"value": "date_end", "display_name": "Date end"},
-                    {
-                        "value": "date_granularity_end",
-                        "display_name": "Date granularity end",
-                    },
-                ],
+                "choices_id": "political_affiliations.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -100,18 +76,7 @@ class PoliticalAffiliationsEndpoint(Endpoint):
             None,
             description="The political party the person is affiliated with.",
             json_schema_extra={
-                "choices": [
-                    {"value": "d", "display_name": "Democratic"},
-                    {"value": "r", "display_name": "Republican"},
-                    {"value": "i", "display_name": "Independent"},
-                    {"value": "g", "display_name": "Green"},
-                    {"value": "l", "display_name": "Libertarian"},
-                    {"value": "f", "display_name": "Federalist"},
-                    {"value": "w", "display_name": "Whig"},
-                    {"value": "j", "display_name": "Jeffersonian Republican"},
-                    {"value": "u", "display_name": "National Union"},
-                    {"value": "z", "display_name": "Reform Party"},
-                ],
+                "choices_id": "search.political_affiliation",
             },
         ),
         BeforeValidator(choice_validator),
@@ -122,11 +87,7 @@ class PoliticalAffiliationsEndpoint(Endpoint):
             None,
             description="The source of the political affiliation -- where it is documented that this affiliation exists.",
             json_schema_extra={
-                "choices": [
-                    {"value": "b", "display_name": "Ballot"},
-                    {"value": "a", "display_name": "Appointer"},
-                    {"value": "o", "display_name": "Other"},
-                ],
+                "choices_id": "political_affiliations.source",
             },
         ),
         BeforeValidator(choice_validator),
@@ -142,36 +103,7 @@ class PoliticalAffiliationsEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {"value": "id", "display_name": "Id (asc)"},
-                    {"value": "-id", "display_name": "Id (desc)"},
-                    {
-                        "value": "date_created",
-                        "display_name": "Date Created (asc)",
-                    },
-                    {
-                        "value": "-date_created",
-                        "display_name": "Date Created (desc)",
-                    },
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date Modified (asc)",
-                    },
-                    {
-                        "value": "-date_modified",
-                        "display_name": "Date Modified (desc)",
-                    },
-                    {
-                        "value": "date_start",
-                        "display_name": "Date Start (asc)",
-                    },
-                    {
-                        "value": "-date_start",
-                        "display_name": "Date Start (desc)",
-                    },
-                    {"value": "date_end", "display_name": "Date End (asc)"},
-                    {"value": "-date_end", "display_name": "Date End (desc)"},
-                ],
+                "choices_id": "political_affiliations.order_by",
             },
         ),
         BeforeValidator(choice_validator),
@@ -31,111 +31,7 @@ class PositionsEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {
-                        "value": "retention_events",
-                        "display_name": "Retention events",
-                    },
-                    {"value": "person", "display_name": "Person"},
-                    {"value": "supervisor", "display_name": "Supervisor"},
-                    {"value": "predecessor", "display_name": "Predecessor"},
-                    {"value": "school", "display_name": "School"},
-                    {"value": "court", "display_name": "Court"},
-                    {"value": "appointer", "display_name": "Appointer"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {
-                        "value": "position_type",
-                        "display_name": "Position type",
-                    },
-                    {"value": "job_title", "display_name": "Job title"},
-                    {"value": "sector", "display_name": "Sector"},
-                    {
-                        "value": "organization_name",
-                        "display_name": "Organization name",
-                    },
-                    {
-                        "value": "location_city",
-                        "display_name": "Location city",
-                    },
-                    {
-                        "value": "location_state",
-                        "display_name": "Location state",
-                    },
-                    {
-                        "value": "date_nominated",
-                        "display_name": "Date nominated",
-                    },
-                    {"value": "date_elected", "display_name": "Date elected"},
-                    {
-                        "value": "date_recess_appointment",
-                        "display_name": "Date recess appointment",
-                    },
-                    {
-                        "value": "date_referred_to_judicial_committee",
-                        "display_name": "Date referred to judicial committee",
-                    },
-                    {
-                        "value": "date_judicial_committee_action",
-                        "display_name": "Date judicial committee action",
-                    },
-                    {
-                        "value": "judicial_committee_action",
-                        "display_name": "Judicial committee action",
-                    },
-                    {"value": "date_hearing", "display_name": "Date hearing"},
-                    {
-                        "value": "date_confirmation",
-                        "display_name": "Date confirmation",
-                    },
-                    {"value": "date_start", "display_name": "Date start"},
-                    {
-                        "value": "date_granularity_start",
-                        "display_name": "Date granularity start",
-                    },
-                    {
-                        "value": "date_termination",
-                        "display_name": "Date termination",
-                    },
-                    {
-                        "value": "termination_reason",
-                        "display_name": "Termination reason",
-                    },
-                    {
-                        "value": "date_granularity_termination",
-                        "display_name": "Date granularity termination",
-                    },
-                    {
-                        "value": "date_retirement",
-                        "display_name": "Date retirement",
-                    },
-                    {
-                        "value": "nomination_process",
-                        "display_name": "Nomination process",
-                    },
-                    {"value": "vote_type", "display_name": "Vote type"},
-                    {"value": "voice_vote", "display_name": "Voice vote"},
-                    {"value": "votes_yes", "display_name": "Votes yes"},
-                    {"value": "votes_no", "display_name": "Votes no"},
-                    {
-                        "value": "votes_yes_percent",
-                        "display_name": "Votes yes percent",
-                    },
-                    {
-                        "value": "votes_no_percent",
-                        "display_name": "Votes no percent",
-                    },
-                    {"value": "how_selected", "display_name": "How selected"},
-                    {
-                        "value": "has_inferred_values",
-                        "display_name": "Has inferred values",
-                    },
-                ],
+                "choices_id": "positions.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -153,239 +49,7 @@ class PositionsEndpoint(Endpoint):
             None,
             description="If this is a judicial position, this indicates the role the person had. This field may be blank if job_title is complete instead.",
             json_schema_extra={
-                "choices": [
-                    {"value": "jud", "display_name": "Judge: Judge"},
-                    {"value": "jus", "display_name": "Judge: Justice"},
-                    {
-                        "value": "ad-law-jud",
-                        "display_name": "Judge: Administrative Law Judge",
-                    },
-                    {
-                        "value": "act-jud",
-                        "display_name": "Judge: Acting Judge",
-                    },
-                    {
-                        "value": "act-jus",
-                        "display_name": "Judge: Acting Justice",
-                    },
-                    {
-                        "value": "act-pres-jud",
-                        "display_name": "Judge: Acting Presiding Judge",
-                    },
-                    {
-                        "value": "act-c-admin-jus",
-                        "display_name": "Judge: Acting Chief Administrative Justice",
-                    },
-                    {
-                        "value": "ass-jud",
-                        "display_name": "Judge: Associate Judge",
-                    },
-                    {
-                        "value": "ass-jus",
-                        "display_name": "Judge: Associate Justice",
-                    },
-                    {
-                        "value": "ass-c-jud",
-                        "display_name": "Judge: Associate Chief Judge",
-                    },
-                    {
-                        "value": "ass-pres-jud",
-                        "display_name": "Judge: Associate Presiding Judge",
-                    },
-                    {
-                        "value": "asst-pres-jud",
-                        "display_name": "Judge: Assistant Presiding Judge",
-                    },
-                    {"value": "c-jud", "display_name": "Judge: Chief Judge"},
-                    {"value": "c-jus", "display_name": "Judge: Chief Justice"},
-                    {
-                        "value": "c-spec-m",
-                        "display_name": "Judge: Chief Special Master",
-                    },
-                    {
-                        "value": "c-admin-jus",
-                        "display_name": "Judge: Chief Administrative Justice",
-                    },
-                    {
-                        "value": "c-spec-tr-jud",
-                        "display_name": "Judge: Chief Special Trial Judge",
-                    },
-                    {
-                        "value": "pres-jud",
-                        "display_name": "Judge: Presiding Judge",
-                    },
-                    {
-                        "value": "pres-jus",
-                        "display_name": "Judge: Presiding Justice",
-                    },
-                    {
-                        "value": "sup-jud",
-                        "display_name": "Judge: Supervising Judge",
-                    },
-                    {
-                        "value": "ad-pres-jus",
-                        "display_name": "Judge: Administrative Presiding Justice",
-                    },
-                    {"value": "com", "display_name": "Judge: Commissioner"},
-                    {
-                        "value": "com-dep",
-                        "display_name": "Judge: Deputy Commissioner",
-                    },
-                    {
-                        "value": "jud-pt",
-                        "display_name": "Judge: Judge Pro Tem",
-                    },
-                    {
-                        "value": "jus-pt",
-                        "display_name": "Judge: Justice Pro Tem",
-                    },
-                    {
-                        "value": "ref-jud-tr",
-                        "display_name": "Judge: Judge Trial Referee",
-                    },
-                    {
-                        "value": "ref-off",
-                        "display_name": "Judge: Official Referee",
-                    },
-                    {
-                        "value": "ref-state-trial",
-                        "display_name": "Judge: State Trial Referee",
-                    },
-                    {
-                        "value": "ret-act-jus",
-                        "display_name": "Judge: Active Retired Justice",
-                    },
-                    {
-                        "value": "ret-ass-jud",
-                        "display_name": "Judge: Retired Associate Judge",
-                    },
-                    {
-                        "value": "ret-c-jud",
-                        "display_name": "Judge: Retired Chief Judge",
-                    },
-                    {
-                        "value": "ret-jus",
-                        "display_name": "Judge: Retired Justice",
-                    },
-                    {
-                        "value": "ret-senior-jud",
-                        "display_name": "Judge: Senior Judge",
-                    },
-                    {"value": "mag", "display_name": "Judge: Magistrate"},
-                    {
-                        "value": "c-mag",
-                        "display_name": "Judge: Chief Magistrate",
-                    },
-                    {
-                        "value": "pres-mag",
-                        "display_name": "Judge: Presiding Magistrate",
-                    },
-                    {
-                        "value": "mag-pt",
-                        "display_name": "Judge: Magistrate Pro Tem",
-                    },
-                    {
-                        "value": "mag-rc",
-                        "display_name": "Judge: Magistrate (Recalled)",
-                    },
-                    {
-                        "value": "mag-part-time",
-                        "display_name": "Judge: Magistrate (Part-Time)",
-                    },
-                    {
-                        "value": "spec-chair",
-                        "display_name": "Judge: Special Chairman",
-                    },
-                    {
-                        "value": "spec-jud",
-                        "display_name": "Judge: Special Judge",
-                    },
-                    {
-                        "value": "spec-m",
-                        "display_name": "Judge: Special Master",
-                    },
-                    {
-                        "value": "spec-scjcbc",
-                        "display_name": "Judge: Special Superior Court Judge for Complex Business Cases",
-                    },
-                    {
-                        "value": "spec-tr-jud",
-                        "display_name": "Judge: Special Trial Judge",
-                    },
-                    {"value": "chair", "display_name": "Judge: Chairman"},
-                    {"value": "chan", "display_name": "Judge: Chancellor"},
-                    {"value": "presi-jud", "display_name": "Judge: President"},
-                    {
-                        "value": "res-jud",
-                        "display_name": "Judge: Reserve Judge",
-                    },
-                    {
-                        "value": "trial-jud",
-                        "display_name": "Judge: Trial Judge",
-                    },
-                    {
-                        "value": "vice-chan",
-                        "display_name": "Judge: Vice Chancellor",
-                    },
-                    {
-                        "value": "vice-cj",
-                        "display_name": "Judge: Vice Chief Judge",
-                    },
-                    {
-                        "value": "att-gen",
-                        "display_name": "Attorney General: Attorney General",
-                    },
-                    {
-                        "value": "att-gen-ass",
-                        "display_name": "Attorney General: Assistant Attorney General",
-                    },
-                    {
-                        "value": "att-gen-ass-spec",
-                        "display_name": "Attorney General: Special Assistant Attorney General",
-                    },
-                    {
-                        "value": "sen-counsel",
-                        "display_name": "Attorney General: Senior Counsel",
-                    },
-                    {
-                        "value": "dep-sol-gen",
-                        "display_name": "Attorney General: Deputy Solicitor General",
-                    },
-                    {
-                        "value": "pres",
-                        "display_name": "Appointing Authority: President of the United States",
-                    },
-                    {
-                        "value": "gov",
-                        "display_name": "Appointing Authority: Governor",
-                    },
-                    {
-                        "value": "mayor",
-                        "display_name": "Appointing Authority: Mayor",
-                    },
-                    {"value": "clerk", "display_name": "Clerkships: Clerk"},
-                    {
-                        "value": "clerk-chief-dep",
-                        "display_name": "Clerkships: Chief Deputy Clerk",
-                    },
-                    {
-                        "value": "staff-atty",
-                        "display_name": "Clerkships: Staff Attorney",
-                    },
-                    {"value": "prof", "display_name": "Professor"},
-                    {"value": "adj-prof", "display_name": "Adjunct Professor"},
-                    {"value": "prac", "display_name": "Practitioner"},
-                    {"value": "pros", "display_name": "Prosecutor"},
-                    {"value": "pub-def", "display_name": "Public Defender"},
-                    {"value": "da", "display_name": "District Attorney"},
-                    {
-                        "value": "ada",
-                        "display_name": "Assistant District Attorney",
-                    },
-                    {"value": "legis", "display_name": "Legislator"},
-                    {"value": "sen", "display_name": "Senator"},
-                    {"value": "state-sen", "display_name": "State Senator"},
-                ],
+                "choices_id": "position_type",
             },
         ),
         BeforeValidator(choice_validator),
@@ -505,25 +169,7 @@ class PositionsEndpoint(Endpoint):
             None,
             description="The action that the judicial committee took in response to a nomination",
             json_schema_extra={
-                "choices": [
-                    {"value": "no_rep", "display_name": "Not Reported"},
-                    {
-                        "value": "rep_w_rec",
-                        "display_name": "Reported with Recommendation",
-                    },
-                    {
-                        "value": "rep_wo_rec",
-                        "display_name": "Reported without Recommendation",
-                    },
-                    {
-                        "value": "rec_postpone",
-                        "display_name": "Recommendation Postponed",
-                    },
-                    {
-                        "value": "rec_bad",
-                        "display_name": "Recommended Unfavorably",
-                    },
-                ],
+                "choices_id": "judicial_committee_action",
             },
         ),
         BeforeValidator(choice_validator),
@@ -534,15 +180,7 @@ class PositionsEndpoint(Endpoint):
             None,
             description="The process by which a person was nominated into this position.",
             json_schema_extra={
-                "choices": [
-                    {"value": "fed_senate", "display_name": "U.S. Senate"},
-                    {"value": "state_senate", "display_name": "State Senate"},
-                    {"value": "election", "display_name": "Primary Election"},
-                    {
-                        "value": "merit_comm",
-                        "display_name": "Merit Commission",
-                    },
-                ],
+                "choices_id": "nomination_process",
             },
         ),
         BeforeValidator(choice_validator),
@@ -574,36 +212,7 @@ class PositionsEndpoint(Endpoint):
             None,
             description="The method that was used for selecting this judge for this position (generally an election or appointment).",
             json_schema_extra={
-                "choices": [
-                    {
-                        "value": "e_part",
-                        "display_name": "Election: Partisan Election",
-                    },
-                    {
-                        "value": "e_non_part",
-                        "display_name": "Election: Non-Partisan Election",
-                    },
-                    {
-                        "value": "a_pres",
-                        "display_name": "Appointment: Appointment (President)",
-                    },
-                    {
-                        "value": "a_gov",
-                        "display_name": "Appointment: Appointment (Governor)",
-                    },
-                    {
-                        "value": "a_legis",
-                        "display_name": "Appointment: Appointment (Legislature)",
-                    },
-                    {
-                        "value": "a_judge",
-                        "display_name": "Appointment: Appointment (Judge)",
-                    },
-                    {
-                        "value": "ct_trans",
-                        "display_name": "Other: Transferred (Court Restructuring)",
-                    },
-                ],
+                "choices_id": "how_selected",
             },
         ),
         BeforeValidator(choice_validator),
@@ -614,36 +223,7 @@ class PositionsEndpoint(Endpoint):
             None,
             description="The reason for a termination",
             json_schema_extra={
-                "choices": [
-                    {"value": "ded", "display_name": "Death"},
-                    {
-                        "value": "retire_vol",
-                        "display_name": "Voluntary Retirement",
-                    },
-                    {
-                        "value": "retire_mand",
-                        "display_name": "Mandatory Retirement",
-                    },
-                    {"value": "resign", "display_name": "Resigned"},
-                    {
-                        "value": "other_pos",
-                        "display_name": "Appointed to Other Judgeship",
-                    },
-                    {"value": "lost", "display_name": "Lost Election"},
-                    {"value": "abolished", "display_name": "Court Abolished"},
-                    {
-                        "value": "bad_judge",
-                        "display_name": "Impeached and Convicted",
-                    },
-                    {
-                        "value": "recess_not_confirmed",
-                        "display_name": "Recess Appointment Not Confirmed",
-                    },
-                    {
-                        "value": "termed_out",
-                        "display_name": "Term Limit Reached",
-                    },
-                ],
+                "choices_id": "termination_reason",
             },
         ),
         BeforeValidator(choice_validator),
@@ -661,70 +241,7 @@ class PositionsEndpoint(Endpoint):
             None,
             description="If not a court or school, the state where person worked.",
             json_schema_extra={
-                "choices": [
-                    {"value": "AL", "display_name": "Alabama"},
-                    {"value": "AK", "display_name": "Alaska"},
-                    {"value": "AS", "display_name": "American Samoa"},
-                    {"value": "AZ", "display_name": "Arizona"},
-                    {"value": "AR", "display_name": "Arkansas"},
-                    {"value": "AA", "display_name": "Armed Forces Americas"},
-                    {"value": "AE", "display_name": "Armed Forces Europe"},
-                    {"value": "AP", "display_name": "Armed Forces Pacific"},
-                    {"value": "CA", "display_name": "California"},
-                    {"value": "CO", "display_name": "Colorado"},
-                    {"value": "CT", "display_name": "Connecticut"},
-                    {"value": "DE", "display_name": "Delaware"},
-                    {"value": "DC", "display_name": "District of Columbia"},
-                    {"value": "FL", "display_name": "Florida"},
-                    {"value": "GA", "display_name": "Georgia"},
-                    {"value": "GU", "display_name": "Guam"},
-                    {"value": "HI", "display_name": "Hawaii"},
-                    {"value": "ID", "display_name": "Idaho"},
-                    {"value": "IL", "display_name": "Illinois"},
-                    {"value": "IN", "display_name": "Indiana"},
-                    {"value": "IA", "display_name": "Iowa"},
-                    {"value": "KS", "display_name": "Kansas"},
-                    {"value": "KY", "display_name": "Kentucky"},
-                    {"value": "LA", "display_name": "Louisiana"},
-                    {"value": "ME", "display_name": "Maine"},
-                    {"value": "MD", "display_name": "Maryland"},
-                    {"value": "MA", "display_name": "Massachusetts"},
-                    {"value": "MI", "display_name": "Michigan"},
-                    {"value": "MN", "display_name": "Minnesota"},
-                    {"value": "MS", "display_name": "Mississippi"},
-                    {"value": "MO", "display_name": "Missouri"},
-                    {"value": "MT", "display_name": "Montana"},
-                    {"value": "NE", "display_name": "Nebraska"},
-                    {"value": "NV", "display_name": "Nevada"},
-                    {"value": "NH", "display_name": "New Hampshire"},
-                    {"value": "NJ", "display_name": "New Jersey"},
-                    {"value": "NM", "display_name": "New Mexico"},
-                    {"value": "NY", "display_name": "New York"},
-                    {"value": "NC", "display_name": "North Carolina"},
-                    {"value": "ND", "display_name": "North Dakota"},
-                    {
-                        "value": "MP",
-                        "display_name": "Northern Mariana Islands",
-                    },
-                    {"value": "OH", "display_name": "Ohio"},
-                    {"value": "OK", "display_name": "Oklahoma"},
-                    {"value": "OR", "display_name": "Oregon"},
-                    {"value": "PA", "display_name": "Pennsylvania"},
-                    {"value": "PR", "display_name": "Puerto Rico"},
-                    {"value": "RI", "display_name": "Rhode Island"},
-                    {"value": "SC", "display_name": "South Carolina"},
-                    {"value": "SD", "display_name": "South Dakota"},
-                    {"value": "TN", "display_name": "Tennessee"},
-                    {"value": "TX", "display_name": "Texas"},
-                    {"value": "UT", "display_name": "Utah"},
-                    {"value": "VT", "display_name": "Vermont"},
-                    {"value": "VI", "display_name": "Virgin Islands"},
-                    {"value": "VA", "display_name": "Virginia"},
-                    {"value": "WA", "display_name": "Washington"},
-                    {"value": "WV", "display_name": "West Virginia"},
-                    {"value": "WI", "display_name": "Wisconsin"},
-                    {"value": "WY", "display_name": "Wyoming"},
-                ],
+                "choices_id": "people.dob_state",
             },
         ),
         BeforeValidator(choice_validator),
@@ -756,106 +273,7 @@ class PositionsEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {"value": "id", "display_name": "Id (asc)"},
-                    {"value": "-id", "display_name": "Id (desc)"},
-                    {
-                        "value": "date_created",
-                        "display_name": "Date Created (asc)",
-                    },
-                    {
-                        "value": "-date_created",
-                        "display_name": "Date Created (desc)",
-                    },
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date Modified (asc)",
-                    },
-                    {
-                        "value": "-date_modified",
-                        "display_name": "Date Modified (desc)",
-                    },
-                    {
-                        "value": "date_nominated",
-                        "display_name": "Date Nominated (asc)",
-                    },
-                    {
-                        "value": "-date_nominated",
-                        "display_name": "Date Nominated (desc)",
-                    },
-                    {
-                        "value": "date_elected",
-                        "display_name": "Date Elected (asc)",
-                    },
-                    {
-                        "value": "-date_elected",
-                        "display_name": "Date Elected (desc)",
-                    },
-                    {
-                        "value": "date_recess_appointment",
-                        "display_name": "Date Recess Appointment (asc)",
-                    },
-                    {
-                        "value": "-date_recess_appointment",
-                        "display_name": "Date Recess Appointment (desc)",
-                    },
-                    {
-                        "value": "date_referred_to_judicial_committee",
-                        "display_name": "Date Referred To Judicial Committee (asc)",
-                    },
-                    {
-                        "value": "-date_referred_to_judicial_committee",
-                        "display_name": "Date Referred To Judicial Committee (desc)",
-                    },
-                    {
-                        "value": "date_judicial_committee_action",
-                        "display_name": "Date Judicial Committee Action (asc)",
-                    },
-                    {
-                        "value": "-date_judicial_committee_action",
-                        "display_name": "Date Judicial Committee Action (desc)",
-                    },
-                    {
-                        "value": "date_hearing",
-                        "display_name": "Date Hearing (asc)",
-                    },
-                    {
-                        "value": "-date_hearing",
-                        "display_name": "Date Hearing (desc)",
-                    },
-                    {
-                        "value": "date_confirmation",
-                        "display_name": "Date Confirmation (asc)",
-                    },
-                    {
-                        "value": "-date_confirmation",
-                        "display_name": "Date Confirmation (desc)",
-                    },
-                    {
-                        "value": "date_start",
-                        "display_name": "Date Start (asc)",
-                    },
-                    {
-                        "value": "-date_start",
-                        "display_name": "Date Start (desc)",
-                    },
-                    {
-                        "value": "date_retirement",
-                        "display_name": "Date Retirement (asc)",
-                    },
-                    {
-                        "value": "-date_retirement",
-                        "display_name": "Date Retirement (desc)",
-                    },
-                    {
-                        "value": "date_termination",
-                        "display_name": "Date Termination (asc)",
-                    },
-                    {
-                        "value": "-date_termination",
-                        "display_name": "Date Termination (desc)",
-                    },
-                ],
+                "choices_id": "positions.order_by",
             },
         ),
         BeforeValidator(choice_validator),
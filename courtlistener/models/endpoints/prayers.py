@@ -31,15 +31,7 @@ class PrayersEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "id", "display_name": "ID"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {"value": "status", "display_name": "Status"},
-                    {
-                        "value": "recap_document",
-                        "display_name": "Recap document",
-                    },
-                ],
+                "choices_id": "prayers.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -64,13 +56,7 @@ class PrayersEndpoint(Endpoint):
             None,
             description="Whether the prayer has been granted or is still waiting.",
             json_schema_extra={
-                "choices": [
-                    {
-                        "value": 1,
-                        "display_name": "Still waiting for the document.",
-                    },
-                    {"value": 2, "display_name": "Prayer has been granted."},
-                ],
+                "choices_id": "prayers.status",
             },
         ),
         AfterValidator(in_post_validator),
@@ -83,16 +69,7 @@ class PrayersEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {
-                        "value": "date_created",
-                        "display_name": "Date Created (asc)",
-                    },
-                    {
-                        "value": "-date_created",
-                        "display_name": "Date Created (desc)",
-                    },
-                ],
+                "choices_id": "prayers.order_by",
             },
         ),
         BeforeValidator(choice_validator),
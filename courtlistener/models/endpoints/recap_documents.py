@@ -33,61 +33,7 @@ class RecapDocumentsEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {"value": "tags", "display_name": "Tags"},
-                    {"value": "absolute_url", "display_name": "Absolute url"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {"value": "sha1", "display_name": "Sha1"},
-                    {"value": "page_count", "display_name": "Page count"},
-                    {"value": "file_size", "display_name": "File size"},
-                    {
-                        "value": "filepath_local",
-                        "display_name": "Filepath local",
-                    },
-                    {"value": "filepath_ia", "display_name": "Filepath ia"},
-                    {
-                        "value": "ia_upload_failure_count",
-                        "display_name": "Ia upload failure count",
-                    },
-                    {"value": "thumbnail", "display_name": "Thumbnail"},
-                    {
-                        "value": "thumbnail_status",
-                        "display_name": "Thumbnail status",
-                    },
-                    {"value": "plain_text", "display_name": "Plain text"},
-                    {"value": "ocr_status", "display_name": "Ocr status"},
-                    {"value": "date_upload", "display_name": "Date upload"},
-                    {
-                        "value": "document_number",
-                        "display_name": "Document number",
-                    },
-                    {
-                        "value": "attachment_number",
-                        "display_name": "Attachment number",
-                    },
-                    {"value": "pacer_doc_id", "display_name": "Pacer doc id"},
-                    {"value": "is_available", "display_name": "Is available"},
-                    {
-                        "value": "is_free_on_pacer",
-                        "display_name": "Is free on pacer",
-                    },
-                    {"value": "is_sealed", "display_name": "Is sealed"},
-                    {
-                        "value": "document_type",
-                        "display_name": "Document type",
-                    },
-                    {"value": "description", "display_name": "Description"},
-                    {
-                        "value": "acms_document_guid",
-                        "display_name": "Acms document guid",
-                    },
-                ],
+                "choices_id": "recap_documents.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -126,10 +72,7 @@ class RecapDocumentsEndpoint(Endpoint):
             None,
             description="Whether this is a regular document or an attachment.",
             json_schema_extra={
-                "choices": [
-                    {"value": 1, "display_name": "PACER Document"},
-                    {"value": 2, "display_name": "Attachment"},
-                ],
+                "choices_id": "document_type",
             },
         ),
         BeforeValidator(choice_validator),
@@ -170,12 +113,7 @@ class RecapDocumentsEndpoint(Endpoint):
             None,
             description="The status of OCR processing on this item.",
             json_schema_extra={
-                "choices": [
-                    {"value": 1, "display_name": "OCR Complete"},
-                    {"value": 2, "display_name": "OCR Not Necessary"},
-                    {"value": 3, "display_name": "OCR Failed"},
-                    {"value": 4, "display_name": "OCR Needed"},
-                ],
+                "choices_id": "ocr_status",
             },
         ),
         BeforeValidator(choice_validator),
@@ -214,34 +152,7 @@ class RecapDocumentsEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {"value": "id", "display_name": "Id (asc)"},
-                    {"value": "-id", "display_name": "Id (desc)"},
-                    {
-                        "value": "date_created",
-                        "display_name": "Date Created (asc)",
-                    },
-                    {
-                        "value": "-date_created",
-                        "display_name": "Date Created (desc)",
-                    },
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date Modified (asc)",
-                    },
-                    {
-                        "value": "-date_modified",
-                        "display_name": "Date Modified (desc)",
-                    },
-                    {
-                        "value": "date_upload",
-                        "display_name": "Date Upload (asc)",
-                    },
-                    {
-                        "value": "-date_upload",
-                        "display_name": "Date Upload (desc)",
-                    },
-                ],
+                "choices_id": "recap_documents.order_by",
             },
         ),
         BeforeValidator(choice_validator),
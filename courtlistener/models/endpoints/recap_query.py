@@ -33,18 +33,7 @@ class RecapQueryEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "pacer_doc_id", "display_name": "Pacer doc id"},
-                    {
-                        "value": "filepath_local",
-                        "display_name": "Filepath local",
-                    },
-                    {
-                        "value": "acms_document_guid",
-                        "display_name": "Acms document guid",
-                    },
-                    {"value": "id", "display_name": "ID"},
-                ],
+                "choices_id": "recap_query.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -79,10 +68,7 @@ class RecapQueryEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {"value": 1, "display_name": "PACER Document"},
-                    {"value": 2, "display_name": "Attachment"},
-                ],
+                "choices_id": "document_type",
             },
         ),
         BeforeValidator(choice_validator),
@@ -119,12 +105,7 @@ class RecapQueryEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {"value": 1, "display_name": "OCR Complete"},
-                    {"value": 2, "display_name": "OCR Not Necessary"},
-                    {"value": 3, "display_name": "OCR Failed"},
-                    {"value": 4, "display_name": "OCR Needed"},
-                ],
+                "choices_id": "ocr_status",
             },
         ),
         BeforeValidator(choice_validator),
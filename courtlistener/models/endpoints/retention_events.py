@@ -30,36 +30,7 @@ class RetentionEventsEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {"value": "position", "display_name": "Position"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {
-                        "value": "retention_type",
-                        "display_name": "Retention type",
-                    },
-                    {
-                        "value": "date_retention",
-                        "display_name": "Date retention",
-                    },
-                    {"value": "votes_yes", "display_name": "Votes yes"},
-                    {"value": "votes_no", "display_name": "Votes no"},
-                    {
-                        "value": "votes_yes_percent",
-                        "display_name": "Votes yes percent",
-                    },
-                    {
-                        "value": "votes_no_percent",
-                        "display_name": "Votes no percent",
-                    },
-                    {"value": "unopposed", "display_name": "Unopposed"},
-                    {"value": "won", "display_name": "Won"},
-                ],
+                "choices_id": "retention_events.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -104,25 +75,7 @@ class RetentionEventsEndpoint(Endpoint):
             None,
             description="The method through which this position was retained.",
             json_schema_extra={
-                "choices": [
-                    {
-                        "value": "reapp_gov",
-                        "display_name": "Governor Reappointment",
-                    },
-                    {
-                        "value": "reapp_leg",
-                        "display_name": "Legislative Reappointment",
-                    },
-                    {"value": "elec_p", "display_name": "Partisan Election"},
-                    {
-                        "value": "elec_n",
-                        "display_name": "Nonpartisan Election",
-                    },
-                    {
-                        "value": "elec_u",
-                        "display_name": "Uncontested Election",
-                    },
-                ],
+                "choices_id": "retention_type",
             },
         ),
         BeforeValidator(choice_validator),
@@ -160,34 +113,7 @@ class RetentionEventsEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {"value": "id", "display_name": "Id (asc)"},
-                    {"value": "-id", "display_name": "Id (desc)"},
-                    {
-                        "value": "date_created",
-                        "display_name": "Date Created (asc)",
-                    },
-                    {
-                        "value": "-date_created",
-                        "display_name": "Date Created (desc)",
-                    },
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date Modified (asc)",
-                    },
-                    {
-                        "value": "-date_modified",
-                        "display_name": "Date Modified (desc)",
-                    },
-                    {
-                        "value": "date_retention",
-                        "display_name": "Date Retention (asc)",
-                    },
-                    {
-                        "value": "-date_retention",
-                        "display_name": "Date Retention (desc)",
-                    },
-                ],
+                "choices_id": "retention_events.order_by",
             },
         ),
         BeforeValidator(choice_validator),
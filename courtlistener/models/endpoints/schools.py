@@ -31,18 +31,7 @@ class SchoolsEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {"value": "is_alias_of", "display_name": "Is alias of"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {"value": "name", "display_name": "Name"},
-                    {"value": "ein", "display_name": "Ein"},
-                ],
+                "choices_id": "schools.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -98,28 +87,7 @@ class SchoolsEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {"value": "id", "display_name": "Id (asc)"},
-                    {"value": "-id", "display_name": "Id (desc)"},
-                    {
-                        "value": "date_created",
-                        "display_name": "Date Created (asc)",
-                    },
-                    {
-                        "value": "-date_created",
-                        "display_name": "Date Created (desc)",
-                    },
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date Modified (asc)",
-                    },
-                    {
-                        "value": "-date_modified",
-                        "display_name": "Date Modified (desc)",
-                    },
-                    {"value": "name", "display_name": "Name (asc)"},
-                    {"value": "-name", "display_name": "Name (desc)"},
-                ],
+                "choices_id": "schools.order_by",
             },
         ),
         BeforeValidator(choice_validator),
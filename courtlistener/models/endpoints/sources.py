@@ -30,22 +30,7 @@ class SourcesEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {"value": "person", "display_name": "Person"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {"value": "url", "display_name": "Url"},
-                    {
-                        "value": "date_accessed",
-                        "display_name": "Date accessed",
-                    },
-                    {"value": "notes", "display_name": "Notes"},
-                ],
+                "choices_id": "sources.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -75,26 +60,7 @@ class SourcesEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {"value": "id", "display_name": "Id (asc)"},
-                    {"value": "-id", "display_name": "Id (desc)"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date Modified (asc)",
-                    },
-                    {
-                        "value": "-date_modified",
-                        "display_name": "Date Modified (desc)",
-                    },
-                    {
-                        "value": "date_accessed",
-                        "display_name": "Date Accessed (asc)",
-                    },
-                    {
-                        "value": "-date_accessed",
-                        "display_name": "Date Accessed (desc)",
-                    },
-                ],
+                "choices_id": "sources.order_by",
             },
         ),
         BeforeValidator(choice_validator),
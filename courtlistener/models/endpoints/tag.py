@@ -27,16 +27,7 @@ class TagEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {"value": "name", "display_name": "Name"},
-                ],
+                "choices_id": "tag.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
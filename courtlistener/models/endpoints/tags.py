@@ -29,20 +29,7 @@ class TagsEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "id", "display_name": "ID"},
-                    {"value": "description", "display_name": "Description"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {"value": "name", "display_name": "Name"},
-                    {"value": "title", "display_name": "Title"},
-                    {"value": "view_count", "display_name": "View count"},
-                    {"value": "published", "display_name": "Published"},
-                    {"value": "dockets", "display_name": "Dockets"},
-                ],
+                "choices_id": "tags.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
@@ -79,34 +66,7 @@ class TagsEndpoint(Endpoint):
         Field(
             None,
             json_schema_extra={
-                "choices": [
-                    {
-                        "value": "date_created",
-                        "display_name": "Date Created (asc)",
-                    },
-                    {
-                        "value": "-date_created",
-                        "display_name": "Date Created (desc)",
-                    },
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date Modified (asc)",
-                    },
-                    {
-                        "value": "-date_modified",
-                        "display_name": "Date Modified (desc)",
-                    },
-                    {"value": "name", "display_name": "Name (asc)"},
-                    {"value": "-name", "display_name": "Name (desc)"},
-                    {
-                        "value": "view_count",
-                        "display_name": "View Count (asc)",
-                    },
-                    {
-                        "value": "-view_count",
-                        "display_name": "View Count (desc)",
-                    },
-                ],
+                "choices_id": "tags.order_by",
             },
         ),
         BeforeValidator(choice_validator),
@@ -27,41 +27,7 @@ class VisualizationsEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {"value": "title", "display_name": "Title"},
-                    {
-                        "value": "cluster_start",
-                        "display_name": "Cluster start",
-                    },
-                    {"value": "cluster_end", "display_name": "Cluster end"},
-                    {
-                        "value": "json_versions",
-                        "display_name": "Json versions",
-                    },
-                    {"value": "clusters", "display_name": "Clusters"},
-                    {"value": "absolute_url", "display_name": "Absolute url"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {
-                        "value": "date_published",
-                        "display_name": "Date published",
-                    },
-                    {"value": "date_deleted", "display_name": "Date deleted"},
-                    {"value": "slug", "display_name": "Slug"},
-                    {"value": "notes", "display_name": "Notes"},
-                    {"value": "view_count", "display_name": "View count"},
-                    {"value": "published", "display_name": "Published"},
-                    {"value": "deleted", "display_name": "Deleted"},
-                    {
-                        "value": "generation_time",
-                        "display_name": "Generation time",
-                    },
-                ],
+                "choices_id": "visualizations.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
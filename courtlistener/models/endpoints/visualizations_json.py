@@ -27,17 +27,7 @@ class VisualizationsJsonEndpoint(Endpoint):
             None,
             description="Filter which fields are returned.",
             json_schema_extra={
-                "choices": [
-                    {"value": "resource_uri", "display_name": "Resource uri"},
-                    {"value": "id", "display_name": "Id"},
-                    {"value": "date_created", "display_name": "Date created"},
-                    {
-                        "value": "date_modified",
-                        "display_name": "Date modified",
-                    },
-                    {"value": "json_data", "display_name": "Json data"},
-                    {"value": "map", "display_name": "Map"},
-                ],
+                "choices_id": "visualizations_json.fields",
             },
         ),
         AfterValidator(comma_separated_post_validator),
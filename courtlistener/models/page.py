@@ -13,3 +13,17 @@ class Page(BaseModel):
     results: list[dict[str, Any]]
 
     model_config = ConfigDict(extra="forbid")
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> "Page":
+        """Build a page from an API response without validating it.
+
+        Validating every result dict is measurable CPU on large pages,
+        and the API's own responses don't need it. Responses without a
+        ``results`` list still go through full validation so they fail
+        loudly. Use ``Page(**data)`` for untrusted input such as dumped
+        iterator state.
+        """
+        if not isinstance(data.get("results"), list):
+            return cls(**data)
+        return cls.model_construct(**data)
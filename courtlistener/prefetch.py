@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+from collections.abc import Awaitable, Callable
+
+from courtlistener.models import Page
+
+
+class AsyncPagePrefetcher:
+    """Follow ``next`` cursors in a background task, up to ``depth`` ahead.
+
+    Pages are handed out in cursor order by :meth:`get`. At most
+    ``depth`` pages are fetched or in flight ahead of the consumer; the
+    background task pauses until one is taken, which bounds memory. A
+    fetch error is re-raised by the :meth:`get` call that would have
+    returned the page.
+
+    ``fetch`` must not hold a reference to the prefetcher's owner, or the
+    running task would keep the owner alive after it is dropped.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Awaitable[Page]],
+        url: str,
+        depth: int,
+    ) -> None:
+        self.url: str | None = url
+        self._slots = asyncio.Semaphore(depth)
+        self._queue: asyncio.Queue[Page | Exception] = asyncio.Queue()
+        self._task = asyncio.create_task(self._run(fetch, url))
+
+    async def _run(
+        self, fetch: Callable[[str], Awaitable[Page]], url: str | None
+    ) -> None:
+        while url is not None:
+            await self._slots.acquire()
+            try:
+                page = await fetch(url)
+            except Exception as exc:
+                self._queue.put_nowait(exc)
+                return
+            self._queue.put_nowait(page)
+            url = page.next
+
+    async def get(self) -> Page:
+        """Return the page at ``self.url`` and advance to the one after."""
+        item = await self._queue.get()
+        self._slots.release()
+        if isinstance(item, Exception):
+            self.url = None
+            raise item
+        self.url = item.next
+        return item
+
+    def cancel(self) -> None:
+        """Stop fetching. Safe to call more than once."""
+        self._task.cancel()
+
+
+class PagePrefetcher:
+    """Follow ``next`` cursors in a background thread, up to ``depth`` ahead.
+
+    Pages are handed out in cursor order by :meth:`get`. At most
+    ``depth`` pages are fetched or in flight ahead of the consumer; the
+    background thread pauses until one is taken, which bounds memory. A
+    fetch error is re-raised by the :meth:`get` call that would have
+    returned the page.
+
+    ``fetch`` must not hold a reference to the prefetcher's owner, or the
+    running thread would keep the owner alive after it is dropped.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Page],
+        url: str,
+        depth: int,
+    ) -> None:
+        self.url: str | None = url
+        self._slots = threading.Semaphore(depth)
+        self._queue: queue.Queue[Page | Exception] = queue.Queue()
+        self._closed = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(fetch, url), daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, fetch: Callable[[str], Page], url: str | None) -> None:
+        while url is not None:
+            # Poll so a cancelled prefetcher's thread exits promptly.
+            while not self._slots.acquire(timeout=0.1):
+                if self._closed.is_set():
+                    return
+            if self._closed.is_set():
+                return
+            try:
+                page = fetch(url)
+            except Exception as exc:
+                self._queue.put(exc)
+                return
+            self._queue.put(page)
+            url = page.next
+
+    def get(self) -> Page:
+        """Return the page at ``self.url`` and advance to the one after."""
+        item = self._queue.get()
+        self._slots.release()
+        if isinstance(item, Exception):
+            self.url = None
+            raise item
+        self.url = item.next
+        return item
+
+    def cancel(self) -> None:
+        """Stop fetching. Safe to call more than once."""
+        self._closed.set()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """Token-bucket limiter that throttles requests before they are sent.
+
+    The bucket holds up to ``burst`` tokens and refills at ``requests``
+    tokens per ``per`` seconds. Each request takes one token; when the
+    bucket is empty the caller sleeps until its token is due. Waiting
+    callers reserve their tokens up front, so they are served in arrival
+    order instead of racing each other when the bucket refills.
+
+    One instance can be shared by any number of clients, threads and
+    coroutines in a process; pass it as ``rate_limiter=`` to each client
+    that draws on the same API budget.
+    """
+
+    def __init__(
+        self,
+        requests: float,
+        per: float = 1.0,
+        burst: int | None = None,
+    ) -> None:
+        """Configure the limiter.
+
+        Args:
+            requests: Requests allowed per ``per`` seconds.
+            per: Length of the rate window in seconds, e.g. ``60`` for
+                a per-minute rate.
+            burst: Requests that may be sent back to back after an idle
+                period. Defaults to ``requests``, rounded up.
+        """
+        if requests <= 0 or per <= 0:
+            raise ValueError("requests and per must be positive.")
+        self.rate = requests / per
+        self.burst = burst if burst is not None else max(1, int(requests))
+        if self.burst < 1:
+            raise ValueError("burst must be at least 1.")
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before use."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated_at
+            self._tokens = min(
+                float(self.burst), self._tokens + elapsed * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block the current thread until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def aacquire(self) -> None:
+        """Wait without blocking the event loop until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
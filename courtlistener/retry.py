@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+
+THROTTLE_STATUS = 429
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Methods that are safe to repeat after the server may have acted on them.
+IDEMPOTENT_METHODS = frozenset(
+    {"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"}
+)
+
+# Transport errors raised before the request reached the server, so any
+# method can be retried after them.
+UNSENT_REQUEST_ERRORS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+)
+
+
+def parse_wait_until(detail: Any) -> datetime | None:
+    """Parse the ``wait_until`` timestamp from a 429 error body.
+
+    Returns a timezone-aware datetime, or None if the body shape is
+    unexpected or the value can't be parsed. Naive timestamps are
+    interpreted as UTC.
+    """
+    if not isinstance(detail, dict):
+        return None
+    wait_until = detail.get("wait_until")
+    if not isinstance(wait_until, str):
+        return None
+    try:
+        target = datetime.fromisoformat(wait_until)
+    except ValueError:
+        return None
+    if target.tzinfo is None:
+        target = target.replace(tzinfo=timezone.utc)
+    return target
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header, or None.
+
+    Accepts both the delay-seconds and the HTTP-date forms.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        target = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if target.tzinfo is None:
+        target = target.replace(tzinfo=timezone.utc)
+    return max(0.0, (target - datetime.now(timezone.utc)).total_seconds())
+
+
+def server_requested_delay(response: httpx.Response) -> float | None:
+    """Seconds the server asked us to wait before retrying, or None.
+
+    Prefers the ``Retry-After`` header and falls back to the
+    ``wait_until`` timestamp CourtListener puts in throttled bodies.
+    """
+    delay = parse_retry_after(response.headers.get("Retry-After"))
+    if delay is not None:
+        return delay
+    try:
+        detail = response.json()
+    except Exception:
+        return None
+    target = parse_wait_until(detail)
+    if target is None:
+        return None
+    return max(0.0, (target - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """When and how long to wait before retrying a failed API request.
+
+    Server errors and dropped connections back off exponentially with
+    full jitter. Throttled (429) responses wait as long as the server
+    asks via ``Retry-After`` or ``wait_until``. Non-idempotent methods
+    (POST, PATCH) are only retried when the server cannot have acted on
+    the request: a 429, or a connection that was never established.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        max_total_wait: float = 120.0,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        idempotent_methods: Iterable[str] = IDEMPOTENT_METHODS,
+    ) -> None:
+        """Configure the retry policy.
+
+        Args:
+            max_retries: Retries after the first attempt.
+            backoff_factor: Base delay in seconds; retry ``n`` waits a
+                random time up to ``backoff_factor * 2**n``.
+            max_backoff: Cap on a single backoff delay in seconds.
+            max_total_wait: Budget in seconds for all sleeps of one
+                request. A retry that would exceed it is not attempted,
+                so a far-off ``wait_until`` raises immediately.
+            retry_statuses: Response status codes worth retrying.
+            idempotent_methods: Methods retried after server errors and
+                failures that may have reached the server.
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_total_wait = max_total_wait
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotent_methods = frozenset(
+            method.upper() for method in idempotent_methods
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """Jittered exponential delay before retry number *attempt*."""
+        cap = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        return random.uniform(0, cap)
+
+    def get_delay(
+        self,
+        method: str,
+        attempt: int,
+        waited: float,
+        response: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> float | None:
+        """Seconds to sleep before retrying, or None to give up.
+
+        Args:
+            method: HTTP method of the failed request.
+            attempt: Number of retries already made (0 on first failure).
+            waited: Seconds already slept retrying this request.
+            response: The error response, if the server answered.
+            error: The transport error, if it didn't.
+        """
+        if attempt >= self.max_retries:
+            return None
+        idempotent = method.upper() in self.idempotent_methods
+        if response is not None:
+            status = response.status_code
+            if status not in self.retry_statuses:
+                return None
+            if status != THROTTLE_STATUS and not idempotent:
+                return None
+            delay = server_requested_delay(response)
+            if delay is None:
+                delay = self.backoff(attempt)
+        elif isinstance(error, httpx.TransportError):
+            if not idempotent and not isinstance(error, UNSENT_REQUEST_ERRORS):
+                return None
+            delay = self.backoff(attempt)
+        else:
+            return None
+        if waited + delay > self.max_total_wait:
+            return None
+        return delay
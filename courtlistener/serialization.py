@@ -0,0 +1,111 @@
+"""JSON encoding and decoding with the fastest backend available.
+
+``orjson`` is used when installed, then ``msgspec``, then the standard
+library. Set ``COURTLISTENER_JSON_BACKEND`` to ``orjson``, ``msgspec`` or
+``json`` to pick one explicitly. The backend is chosen once, at import.
+
+Whatever the backend, :func:`loads` accepts the same documents as
+:func:`json.loads` and :func:`dumps` returns a ``str``, so callers can
+swap backends without noticing. Input a fast backend rejects (``NaN``,
+integers beyond 64 bits) falls back to the standard library.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Callable
+from typing import Any
+
+Default = Callable[[Any], Any]
+
+
+def _json_loads(data: bytes | str) -> Any:
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any, default: Default | None = None) -> str:
+    return json.dumps(obj, default=default)
+
+
+def _orjson_backend() -> tuple[Callable[..., Any], Callable[..., str]]:
+    import orjson
+
+    options = orjson.OPT_NON_STR_KEYS
+
+    def loads(data: bytes | str) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return _json_loads(data)
+
+    def dumps(obj: Any, default: Default | None = None) -> str:
+        try:
+            return orjson.dumps(obj, default=default, option=options).decode()
+        except orjson.JSONEncodeError:
+            return _json_dumps(obj, default)
+
+    return loads, dumps
+
+
+def _msgspec_backend() -> tuple[Callable[..., Any], Callable[..., str]]:
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+
+    def loads(data: bytes | str) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError:
+            return _json_loads(data)
+
+    def dumps(obj: Any, default: Default | None = None) -> str:
+        try:
+            return msgspec.json.encode(obj, enc_hook=default).decode()
+        except (msgspec.EncodeError, TypeError, OverflowError):
+            return _json_dumps(obj, default)
+
+    return loads, dumps
+
+
+_BACKENDS = {"orjson": _orjson_backend, "msgspec": _msgspec_backend}
+
+
+def _select_backend() -> tuple[
+    str, Callable[[bytes | str], Any], Callable[..., str]
+]:
+    requested = os.environ.get("COURTLISTENER_JSON_BACKEND", "").lower()
+    if requested == "json":
+        return "json", _json_loads, _json_dumps
+    if requested:
+        if requested not in _BACKENDS:
+            raise ValueError(
+                f"Unknown COURTLISTENER_JSON_BACKEND {requested!r}; "
+                f"expected one of {['json', *_BACKENDS]}."
+            )
+        return requested, *_BACKENDS[requested]()
+    for name, build in _BACKENDS.items():
+        try:
+            return name, *build()
+        except ImportError:
+            continue
+    return "json", _json_loads, _json_dumps
+
+
+BACKEND, _loads, _dumps = _select_backend()
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode a JSON document."""
+    return _loads(data)
+
+
+def dumps(obj: Any, default: Default | None = None) -> str:
+    """Encode ``obj`` as JSON.
+
+    Args:
+        obj: Value to encode.
+        default: Called with objects the encoder can't handle; returns a
+            serializable replacement or raises ``TypeError``.
+    """
+    return _dumps(obj, default)
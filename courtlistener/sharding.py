@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from courtlistener.async_client.resource import AsyncResourceIterator
+    from courtlistener.sync_client.resource import ResourceIterator
+
+RangeValue = int | date | datetime
+
+_SHARD_DONE = object()
+
+
+def _interior_boundaries(
+    lower: RangeValue, upper: RangeValue, shards: int
+) -> list[RangeValue]:
+    """Evenly spaced, distinct values strictly between lower and upper."""
+    points: list[RangeValue] = []
+    for i in range(1, shards):
+        if isinstance(lower, datetime) and isinstance(upper, datetime):
+            point: RangeValue = lower + (upper - lower) * i / shards
+        elif isinstance(lower, date) and isinstance(upper, date):
+            days = (upper - lower).days * i // shards
+            point = lower + timedelta(days=days)
+        elif isinstance(lower, int) and isinstance(upper, int):
+            point = lower + (upper - lower) * i // shards
+        else:
+            raise TypeError(
+                f"Cannot shard between {lower!r} and {upper!r}; expected "
+                "ints, dates, or datetimes."
+            )
+        if lower < point < upper and (not points or point > points[-1]):  # type: ignore[operator]
+            points.append(point)
+    return points
+
+
+def split_range_filters(
+    filters: dict[str, Any], shard_by: str, shards: int
+) -> list[dict[str, Any]]:
+    """Split validated filters into disjoint ranges over *shard_by*.
+
+    The query must already bound *shard_by* from below (``gte``, ``gt``
+    or ``range``) and above (``lt``, ``lte`` or ``range``). Every shard
+    keeps the original filters and adds ``gte``/``lt`` cut points, so the
+    shards never overlap and together match exactly what the original
+    query matched. Ranges too narrow for *shards* pieces get fewer.
+
+    Args:
+        filters: Filters as returned by ``Resource.validate_filters``.
+        shard_by: Name of an int, date, or datetime field with range
+            lookups, e.g. ``"date_filed"``.
+        shards: Number of shards to split into.
+
+    Returns:
+        One filter dict per shard, in ascending range order.
+    """
+    if shards < 1:
+        raise ValueError("shards must be at least 1.")
+    span = filters.get(f"{shard_by}__range")
+    lowers = [
+        filters.get(f"{shard_by}__gte"),
+        filters.get(f"{shard_by}__gt"),
+        span[0] if span else None,
+    ]
+    uppers = [
+        filters.get(f"{shard_by}__lt"),
+        filters.get(f"{shard_by}__lte"),
+        span[1] if span else None,
+    ]
+    lower_values = [value for value in lowers if value is not None]
+    upper_values = [value for value in uppers if value is not None]
+    if not lower_values or not upper_values:
+        raise ValueError(
+            f"Sharding by {shard_by!r} needs a lower bound "
+            f"({shard_by}__gte or {shard_by}__gt) and an upper bound "
+            f"({shard_by}__lt or {shard_by}__lte) in the filters."
+        )
+    lower = max(lower_values)
+    upper = min(upper_values)
+    cuts = _interior_boundaries(lower, upper, shards)
+
+    shard_filters = []
+    for i in range(len(cuts) + 1):
+        shard = dict(filters)
+        if i > 0:
+            shard[f"{shard_by}__gte"] = cuts[i - 1]
+        if i < len(cuts):
+            shard[f"{shard_by}__lt"] = cuts[i]
+        shard_filters.append(shard)
+    return shard_filters
+
+
+class AsyncShardedIterator:
+    """Iterate several shard iterators concurrently as one stream.
+
+    Up to ``concurrency`` shards are paged through at once. Results are
+    yielded a page at a time as pages arrive, so ordering holds within a
+    shard but not across shards. At most ``concurrency`` fetched pages
+    wait to be consumed. Iterate it once.
+    """
+
+    def __init__(
+        self, iterators: list[AsyncResourceIterator], concurrency: int
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+        self.shards = iterators
+        self._concurrency = concurrency
+
+    async def get_count(self) -> int:
+        """Total count of results across all shards."""
+        return sum([await shard.get_count() for shard in self.shards])
+
+    async def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
+        pages: asyncio.Queue[Any] = asyncio.Queue(maxsize=self._concurrency)
+        slots = asyncio.Semaphore(self._concurrency)
+
+        async def drain(shard: AsyncResourceIterator) -> None:
+            try:
+                async with slots:
+                    while True:
+                        await pages.put(await shard.get_results())
+                        if not await shard.has_next():
+                            break
+                        await shard.next()
+            except Exception as exc:
+                await pages.put(exc)
+            await pages.put(_SHARD_DONE)
+
+        tasks = [asyncio.create_task(drain(shard)) for shard in self.shards]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                page = await pages.get()
+                if page is _SHARD_DONE:
+                    remaining -= 1
+                elif isinstance(page, Exception):
+                    raise page
+                else:
+                    for item in page:
+                        yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+class ShardedIterator:
+    """Iterate several shard iterators concurrently as one stream.
+
+    Up to ``concurrency`` shards are paged through at once. Results are
+    yielded a page at a time as pages arrive, so ordering holds within a
+    shard but not across shards. At most ``concurrency`` fetched pages
+    wait to be consumed. Iterate it once.
+    """
+
+    def __init__(
+        self, iterators: list[ResourceIterator], concurrency: int
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+        self.shards = iterators
+        self._concurrency = concurrency
+
+    def get_count(self) -> int:
+        """Total count of results across all shards."""
+        return sum([shard.get_count() for shard in self.shards])
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        pages: queue.Queue[Any] = queue.Queue(maxsize=self._concurrency)
+        stopped = threading.Event()
+
+        def put(item: Any) -> bool:
+            """Wait for buffer space; give up once the consumer stops."""
+            while not stopped.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                except queue.Full:
+                    continue
+                return True
+            return False
+
+        def drain(shard: ResourceIterator) -> None:
+            try:
+                while not stopped.is_set():
+                    if not put(shard.get_results()):
+                        return
+                    if not shard.has_next():
+                        break
+                    shard.next()
+            except Exception as exc:
+                put(exc)
+            put(_SHARD_DONE)
+
+        executor = ThreadPoolExecutor(max_workers=self._concurrency)
+        for shard in self.shards:
+            executor.submit(drain, shard)
+        try:
+            remaining = len(self.shards)
+            while remaining:
+                page = pages.get()
+                if page is _SHARD_DONE:
+                    remaining -= 1
+                elif isinstance(page, Exception):
+                    raise page
+                else:
+                    yield from page
+        finally:
+            stopped.set()
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -7,14 +7,21 @@ from `courtlistener/async_client/client.py`.
 from __future__ import annotations
 
 import os
+import time
 from typing import TYPE_CHECKING, Any
 
 import httpx
 
+from courtlistener.cache import CachedResponse, ResponseCache, cache_key
+from courtlistener.citation_cache import CitationCache
 from courtlistener.exceptions import CourtListenerAPIError
 from courtlistener.models import ENDPOINTS
+from courtlistener.rate_limit import RateLimiter
+from courtlistener.retry import RetryPolicy
+from courtlistener.serialization import loads
 from courtlistener.settings import get_api_base_url
 from courtlistener.sync_client.resource import Resource
+from courtlistener.sync_client.transport import BorrowedTransport
 
 if TYPE_CHECKING:
     from courtlistener.sync_client.alerts import (
@@ -33,6 +40,11 @@ class CourtListener:
         access_token: str | None = None,
         base_url: str | None = None,
         timeout: float = 300.0,
+        transport: httpx.BaseTransport | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        citation_cache: CitationCache | None = None,
     ) -> None:
         """Initialize the CourtListener client.
 
@@ -46,6 +58,24 @@ class CourtListener:
                 takes precedence over ``api_token`` and the env var.
             base_url: Base URL for the CourtListener API.
             timeout: Request timeout in seconds.
+            transport: Shared httpx transport (e.g. from
+                ``create_pooled_transport``) to send requests through.
+                The client borrows it: closing the client leaves the
+                transport open for other clients to reuse.
+            retry: Policy for retrying throttled, failed, and dropped
+                requests. Requests are not retried when unset.
+            rate_limiter: Limiter every request, including retries,
+                waits on before it is sent. Share one instance between
+                clients that draw on the same API rate budget.
+            cache: Store for GET responses that carry an ``ETag`` or
+                ``Last-Modified`` header. Cached URLs are revalidated
+                with a conditional request, and a ``304`` is answered
+                from the cache. Entries are keyed by credential, so one
+                cache can be shared between users.
+            citation_cache: Store for citation verification results.
+                ``citation_lookup.lookup_citation()`` and
+                ``lookup_text_batched(..., extract_locally=True)`` only
+                send citations it doesn't hold to the API.
         """
         self.api_token = api_token or (
             None if access_token else os.environ.get("COURTLISTENER_API_TOKEN")
@@ -63,6 +93,11 @@ class CourtListener:
 
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.transport = transport
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.citation_cache = citation_cache
         self._http_client: httpx.Client | None = None
         self._resources: dict[str, Resource] = {}
 
@@ -124,6 +159,11 @@ class CourtListener:
                     "Authorization": auth_header,
                 },
                 timeout=self.timeout,
+                transport=(
+                    BorrowedTransport(self.transport)
+                    if self.transport is not None
+                    else None
+                ),
             )
         return self._http_client
 
@@ -158,7 +198,20 @@ class CourtListener:
         )
         if overlap:
             path = path[overlap:]
-        response = self.client.request(method, path, **kwargs)
+        key = None
+        cached = None
+        if self.cache is not None and method == "GET":
+            url = self.client.build_request(method, path, **kwargs).url
+            key = cache_key(self.client.headers["Authorization"], str(url))
+            cached = self.cache.get(key)
+            if cached is not None:
+                kwargs["headers"] = {
+                    **kwargs.get("headers", {}),
+                    **cached.conditional_headers(),
+                }
+        response = self._send_with_retries(method, path, **kwargs)
+        if cached is not None and response.status_code == 304:
+            return loads(cached.body)
         try:
             response.raise_for_status()
         except httpx.HTTPStatusError:
@@ -173,4 +226,39 @@ class CourtListener:
             ) from None
         if response.status_code == 204:
             return {}
-        return response.json()
+        if self.cache is not None and key is not None:
+            entry = CachedResponse.from_response(response)
+            if entry is not None:
+                self.cache.set(key, entry)
+        return loads(response.content)
+
+    def _send_with_retries(
+        self, method: str, path: str, **kwargs: Any
+    ) -> httpx.Response:
+        """Send a request, retrying per ``self.retry`` while it allows."""
+        attempt = 0
+        waited = 0.0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                response = self.client.request(method, path, **kwargs)
+            except httpx.TransportError as exc:
+                if self.retry is None:
+                    raise
+                delay = self.retry.get_delay(
+                    method, attempt, waited, error=exc
+                )
+                if delay is None:
+                    raise
+            else:
+                if self.retry is None or response.is_success:
+                    return response
+                delay = self.retry.get_delay(
+                    method, attempt, waited, response=response
+                )
+                if delay is None:
+                    return response
+            time.sleep(delay)
+            waited += delay
+            attempt += 1
@@ -0,0 +1,60 @@
+"""
+Please do not edit this file manually.
+This file is automatically generated by `scripts/generate_sync_client.py`
+from `courtlistener/async_client/transport.py`.
+"""
+
+from __future__ import annotations
+
+import httpx
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+
+def create_pooled_transport(
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+    http2: bool = False,
+) -> httpx.HTTPTransport:
+    """Build a keep-alive connection pool that many clients can share.
+
+    Pass the result as ``transport=`` to any number of clients; each
+    client still sends its own ``Authorization`` header, but they all
+    reuse the same open connections to the API.
+
+    Args:
+        max_connections: Upper bound on concurrent connections.
+        max_keepalive_connections: Idle connections kept open for reuse.
+        keepalive_expiry: Seconds an idle connection stays in the pool.
+        http2: Negotiate HTTP/2. Requires the ``h2`` package
+            (``pip install httpx[http2]``).
+    """
+    return httpx.HTTPTransport(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        http2=http2,
+    )
+
+
+class BorrowedTransport(httpx.BaseTransport):
+    """Delegate to a shared transport without taking ownership of it.
+
+    httpx closes a client's transport when the client is closed. Wrapping
+    a shared pool in this class lets short-lived clients be closed as
+    usual while the pool, owned by whoever created it, stays open.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport) -> None:
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        """Leave the shared transport open."""
@@ -1,6 +1,7 @@
 import difflib
+import functools
 import re
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from contextlib import suppress
 from datetime import date
 from typing import TYPE_CHECKING, Any
@@ -15,9 +16,17 @@ if TYPE_CHECKING:
 
 def did_you_mean(value: Any, choices: Iterable[Any]) -> str:
     """Suggest near-miss matches for value from choices."""
+    return _did_you_mean(value, _casefolded(choices))
+
+
+def _casefolded(choices: Iterable[Any]) -> dict[str, str]:
     originals: dict[str, str] = {}
     for choice in choices:
         originals.setdefault(str(choice).casefold(), str(choice))
+    return originals
+
+
+def _did_you_mean(value: Any, originals: dict[str, str]) -> str:
     matches = difflib.get_close_matches(
         str(value).casefold(), list(originals), n=3, cutoff=0.6
     )
@@ -80,34 +89,38 @@ def validate_model_fields(
         fields = fields.split(",")
     # Don't enforce choices if no `fields` field.
     if "fields" in model.model_fields:
-        extra = model.model_fields["fields"].json_schema_extra
-        if isinstance(extra, dict):
-            choices = extra.get("choices")
-            if isinstance(choices, list):
-                values = []
-                for choice in choices:
-                    if isinstance(choice, dict):
-                        values.append(choice["value"])
-                invalid_fields = [f for f in fields if f not in values]
-                if invalid_fields:
-                    suggestions = "".join(
-                        did_you_mean(f, values) for f in invalid_fields
-                    )
-                    raise InvalidFieldsError(
-                        f"Invalid fields: {invalid_fields}.{suggestions}\n"
-                        f"Fields must be one of: {values}"
-                    )
+        index = get_choice_index(model, "fields")
+        if index.choices:
+            invalid_fields = [f for f in fields if f not in index.choices]
+            if invalid_fields:
+                suggestions = "".join(
+                    did_you_mean(f, index.choices) for f in invalid_fields
+                )
+                raise InvalidFieldsError(
+                    f"Invalid fields: {invalid_fields}.{suggestions}\n"
+                    f"Fields must be one of: {list(index.choices)}"
+                )
     return fields
 
 
+def supports_in_lookup(model: type["Endpoint"], field_name: str) -> bool:
+    """Whether the endpoint accepts ``{field_name}__in`` list filters."""
+    field = model.model_fields.get(field_name)
+    if field is None:
+        return False
+    return any(
+        getattr(meta, "func", None) is in_pre_validator
+        for meta in field.metadata
+    )
+
+
 def get_endpoint_model_from_info(info: ValidationInfo) -> type["Endpoint"]:
     from courtlistener.models import ENDPOINTS
 
     if info.config is not None:
-        model_name = info.config["title"]
-        for model in ENDPOINTS.values():
-            if model.__name__ == model_name:
-                return model
+        model = ENDPOINTS.by_class_name(info.config["title"])
+        if model is not None:
+            return model
     raise ValueError(f"Model for {info.field_name} not found")
 
 
@@ -129,59 +142,124 @@ def related_validator(
     if related_class_name is None:
         # Return raw value if there isn't a schema for the related field.
         return value
-    related_model = None
-    for model in ENDPOINTS.values():
-        if model.__name__ == related_class_name:
-            related_model = model
-            break
+    related_model = ENDPOINTS.by_class_name(related_class_name)
     if related_model is None:
         raise ValueError(f"Related model for {info.field_name} not found")
     return related_model.model_validate(value).model_dump(by_alias=True)
 
 
+class ChoiceIndex:
+    """Lookup tables for one field's choices, built once per field.
+
+    ``choices`` maps each value to its display name, ``display_names``
+    maps display names back to values, and ``casefolded`` maps the
+    casefolded spelling of every value and display name to the original,
+    for suggestions. Use :func:`get_choice_index` rather than building
+    these directly, so each field's tables are only built once.
+    """
+
+    __slots__ = ("choices", "display_names", "casefolded")
+
+    def __init__(self, choices: Mapping[Any, str]) -> None:
+        self.choices: dict[Any, str] = dict(choices)
+        self.display_names: dict[str, Any] = {}
+        for value, display_name in self.choices.items():
+            self.display_names.setdefault(display_name, value)
+        self.casefolded = _casefolded([*self.choices, *self.choices.values()])
+
+    def lookup(self, choice: Any) -> str | int | None:
+        """The value ``choice`` names, or ``None`` if it isn't valid.
+
+        ``choice`` may be a value or a display name. String-typed
+        numerics are accepted for int-valued choices.
+        """
+        if choice in self.choices:
+            return choice
+        if choice in self.display_names:
+            return self.display_names[choice]
+        if isinstance(choice, str) and choice.lstrip("-").isdigit():
+            as_int = int(choice)
+            if as_int in self.choices:
+                return as_int
+        return None
+
+    def did_you_mean(self, value: Any) -> str:
+        """Suggest near-miss values or display names for ``value``."""
+        return _did_you_mean(value, self.casefolded)
+
+
+@functools.cache
+def get_choice_index(model: type["Endpoint"], field_name: str) -> ChoiceIndex:
+    """The cached :class:`ChoiceIndex` for a model field's choices."""
+    field = model.model_fields[field_name]
+    choices = get_choices(getattr(field, "json_schema_extra", None))
+    return ChoiceIndex(
+        {choice["value"]: choice["display_name"] for choice in choices}
+    )
+
+
+def get_choices(extra: Any) -> list[dict[str, Any]]:
+    """The choices a field's ``json_schema_extra`` or JSON schema declares.
+
+    Generated models reference a shared table in
+    ``courtlistener.models.choices`` by ``choices_id``; other models may
+    list their ``choices`` inline. Returns ``[]`` for fields without
+    choices.
+    """
+    if not isinstance(extra, Mapping):
+        return []
+    if "choices_id" in extra:
+        from courtlistener.models.choices import CHOICES
+
+        return [
+            {"value": value, "display_name": display_name}
+            for value, display_name in CHOICES[extra["choices_id"]]
+        ]
+    return extra.get("choices") or []
+
+
+def _as_index(
+    choices: ChoiceIndex | dict[str, str] | dict[int, str],
+) -> ChoiceIndex:
+    return (
+        choices if isinstance(choices, ChoiceIndex) else ChoiceIndex(choices)
+    )
+
+
+def get_choice_index_from_info(info: ValidationInfo) -> ChoiceIndex:
+    """Get the choice index for the field being validated."""
+    model = get_endpoint_model_from_info(info)
+    return get_choice_index(model, str(info.field_name))
+
+
 def get_choice_dict_from_info(
     info: ValidationInfo,
 ) -> dict[str, str] | dict[int, str]:
     """Get the choice dictionary for a field."""
-    model = get_endpoint_model_from_info(info)
-    field = model.model_fields[str(info.field_name)]
-    extra = getattr(field, "json_schema_extra", None) or {}
-    choices = extra.get("choices", [])
-    return {choice["value"]: choice["display_name"] for choice in choices}
+    return get_choice_index_from_info(info).choices
 
 
 def get_valid_choice(
-    choice: str | int | None, choice_dict: dict[str, str] | dict[int, str]
+    choice: str | int | None,
+    choice_dict: ChoiceIndex | dict[str, str] | dict[int, str],
 ) -> str | int | None:
-    """Get a valid choice from a choice dictionary.
+    """Get a valid choice from a choice dictionary or index.
 
     Falls back to the display name if the choice is not found in values.
     Returns None if choice is not valid.
     """
-    if choice in choice_dict:
-        return choice
-    for value, display_name in choice_dict.items():
-        if choice == display_name:
-            return value
-    # Tolerate string-typed numerics for int-keyed choices
-    if isinstance(choice, str) and choice.lstrip("-").isdigit():
-        as_int = int(choice)
-        if as_int in choice_dict:
-            return as_int
-    return None
+    return _as_index(choice_dict).lookup(choice)
 
 
 def invalid_choice_error(
     field_name: str | None,
     value: Any,
     invalid_parts: list[Any],
-    choice_dict: dict[str, str] | dict[int, str],
+    choice_dict: ChoiceIndex | dict[str, str] | dict[int, str],
 ) -> ValueError:
     """Build a compact invalid-choice error with near-miss suggestions."""
-    candidates = list(choice_dict) + list(choice_dict.values())
-    suggestions = "".join(
-        did_you_mean(part, candidates) for part in invalid_parts
-    )
+    index = _as_index(choice_dict)
+    suggestions = "".join(index.did_you_mean(part) for part in invalid_parts)
     return ValueError(
         f"Invalid value '{value}' for {field_name}.{suggestions} "
         "MCP clients can use the `get_choices` tool to list valid values."
@@ -191,11 +269,11 @@ def invalid_choice_error(
 def choice_validator(value: Any, info: ValidationInfo) -> None | int | str:
     if value is None:
         return None
-    choice_dict = get_choice_dict_from_info(info)
-    valid_value = get_valid_choice(value, choice_dict)
+    index = get_choice_index_from_info(info)
+    valid_value = index.lookup(value)
     if valid_value is not None:
         return valid_value
-    raise invalid_choice_error(info.field_name, value, [value], choice_dict)
+    raise invalid_choice_error(info.field_name, value, [value], index)
 
 
 def multiple_choice_validator(
@@ -203,13 +281,13 @@ def multiple_choice_validator(
 ) -> None | int | str | list[int | str]:
     if values is None:
         return None
-    choice_dict = get_choice_dict_from_info(info)
+    index = get_choice_index_from_info(info)
     values_list = values if isinstance(values, list) else [values]
     valid_values: list[int | str] = []
     for value in values_list:
         # Strip stray leading/trailing delimiters
         cleaned = value.strip(" ,\t\r\n") if isinstance(value, str) else value
-        valid_value = get_valid_choice(cleaned, choice_dict)
+        valid_value = index.lookup(cleaned)
         if valid_value is not None:
             valid_values.append(valid_value)
             continue
@@ -219,7 +297,7 @@ def multiple_choice_validator(
             if isinstance(cleaned, str)
             else []
         )
-        token_values = [get_valid_choice(t, choice_dict) for t in tokens]
+        token_values = [index.lookup(t) for t in tokens]
         if len(tokens) > 1 and all(v is not None for v in token_values):
             valid_values.extend(token_values)  # type: ignore[arg-type]
             continue
@@ -231,7 +309,7 @@ def multiple_choice_validator(
         else:
             invalid_parts = [cleaned]
         raise invalid_choice_error(
-            info.field_name, value, invalid_parts, choice_dict
+            info.field_name, value, invalid_parts, index
         )
     return valid_values[0] if len(valid_values) == 1 else valid_values
 
@@ -10,6 +10,7 @@ from utils import (
 
 from courtlistener.mcp.tools.utils import inline_refs
 from courtlistener.models import ENDPOINTS
+from courtlistener.utils import get_choices
 
 ENDPOINTS_DOCS_DIR = DOCS_DIR / "endpoints"
 
@@ -110,7 +111,7 @@ def render_field(
         lines.append(note)
         lines.append("")
 
-    choices = prop.get("choices")
+    choices = get_choices(prop)
     if choices:
         render_choices(choices, lines)
 
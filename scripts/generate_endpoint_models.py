@@ -14,6 +14,7 @@ from courtlistener import CourtListener
 TEMPLATES_DIR = BASE_DIR / "templates"
 ENDPOINTS_DIR = BASE_DIR / "courtlistener" / "models" / "endpoints"
 FILTERS_DIR = BASE_DIR / "courtlistener" / "models" / "filters"
+CHOICES_PATH = BASE_DIR / "courtlistener" / "models" / "choices.py"
 HTTP_OPTIONS_PATH = DOCS_DIR / "http_options.json"
 
 RELATED_ENDPOINT_MAP = {
@@ -819,6 +820,51 @@ def get_endpoint_data(use_cache: bool = True) -> dict[str, Any]:
     return {
         "endpoints": endpoints,
         "filters": filter_classes,
+        "choices": build_choice_tables(endpoints),
+    }
+
+
+def build_choice_tables(endpoints: dict[str, Any]) -> dict[str, Any]:
+    """Move field choices into shared tables, referenced by ``choices_id``.
+
+    Identical choice lists (the court list appears on every search
+    endpoint) become one table. A table is named after its field when
+    every field using it has that name and no other table claims it,
+    otherwise after the first endpoint and field that use it.
+    """
+    users: dict[str, list[tuple[str, str]]] = {}
+    for endpoint in endpoints.values():
+        for field in endpoint["fields"].values():
+            if field["choices"]:
+                key = json.dumps(field["choices"])
+                users.setdefault(key, []).append(
+                    (endpoint["attr_name"], field["id"])
+                )
+
+    def field_name(key: str) -> str | None:
+        names = {name for _, name in users[key]}
+        return names.pop() if len(names) == 1 else None
+
+    name_counts: dict[str | None, int] = {}
+    for key in users:
+        name = field_name(key)
+        name_counts[name] = name_counts.get(name, 0) + 1
+
+    table_ids = {}
+    for key, fields in users.items():
+        name = field_name(key)
+        if name is None or name_counts[name] > 1:
+            name = ".".join(fields[0])
+        table_ids[key] = name
+
+    for endpoint in endpoints.values():
+        for field in endpoint["fields"].values():
+            if field["choices"]:
+                field["choices_id"] = table_ids[json.dumps(field["choices"])]
+
+    return {
+        table_ids[key]: json.loads(key)
+        for key in sorted(users, key=lambda key: table_ids[key])
     }
 
 
@@ -860,6 +906,11 @@ def main() -> None:
         )
     )
 
+    # Generate Choice Tables
+    CHOICES_PATH.write_text(
+        env.get_template("choices.jinja2").render(tables=data["choices"])
+    )
+
     # Generate Endpoints Module
     ENDPOINTS_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -888,9 +939,12 @@ def main() -> None:
                 print(f"Removed stale {path.relative_to(BASE_DIR)}")
 
     generated = [
-        str(path)
-        for directory in (FILTERS_DIR, ENDPOINTS_DIR)
-        for path in sorted(directory.glob("*.py"))
+        str(CHOICES_PATH),
+        *(
+            str(path)
+            for directory in (FILTERS_DIR, ENDPOINTS_DIR)
+            for path in sorted(directory.glob("*.py"))
+        ),
     ]
     subprocess.run(
         ["pre-commit", "run", "--files", *generated],
@@ -15,8 +15,19 @@ REPLACEMENTS = {
     "AsyncSearchAlerts": "SearchAlerts",
     "AsyncDocketAlerts": "DocketAlerts",
     "AsyncCitationLookup": "CitationLookup",
+    "AsyncPagePrefetcher": "PagePrefetcher",
+    "AsyncShardedIterator": "ShardedIterator",
     "AsyncClient": "Client",
+    "AsyncBaseTransport": "BaseTransport",
+    "AsyncBorrowedTransport": "BorrowedTransport",
+    "AsyncHTTPTransport": "HTTPTransport",
+    "handle_async_request": "handle_request",
     "aclose": "close",
+    "aacquire": "acquire",
+    "abounded_map": "bounded_map",
+    "aget": "get",
+    "aget_many": "get_many",
+    "aset": "set",
     "asyncio": "time",
 }
 
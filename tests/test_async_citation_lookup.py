@@ -1,5 +1,6 @@
 """Unit tests for the AsyncCitationLookup helper."""
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -9,6 +10,8 @@ import pytest
 from courtlistener.async_client.citation_lookup import (
     MAX_TEXT_LENGTH,
     AsyncCitationLookup,
+    _split_text,
+    _ThrottleGate,
 )
 from courtlistener.exceptions import CourtListenerAPIError
 
@@ -16,7 +19,7 @@ pytestmark = pytest.mark.asyncio
 
 
 def _mock_client(*responses):
-    client = MagicMock()
+    client = MagicMock(citation_cache=None)
     client._request = AsyncMock(side_effect=list(responses) or None)
     return client
 
@@ -146,3 +149,98 @@ class TestLookupTextBatched:
         assert output[1]["status"] == 200
         # Second result's index should be adjusted to original text
         assert output[1]["start_index"] == 22
+
+
+def _long_text(chunks):
+    """Text that ``_split_text`` cuts into ``chunks`` chunks."""
+    return " ".join(["word"] * (MAX_TEXT_LENGTH // 5 * chunks - 1))
+
+
+class TestConcurrentBatches:
+    async def _lookup(self, text, concurrency):
+        lookup = AsyncCitationLookup(_mock_client())
+        started = 0
+        in_flight = 0
+        peak = 0
+
+        async def lookup_text(chunk):
+            nonlocal started, in_flight, peak
+            started += 1
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Earlier chunks finish last.
+            await asyncio.sleep(0.01 * (4 - started))
+            in_flight -= 1
+            return [
+                {
+                    "citation": "x",
+                    "status": 200,
+                    "start_index": 5,
+                    "end_index": 9,
+                }
+            ]
+
+        with patch.object(lookup, "lookup_text", side_effect=lookup_text):
+            output = await lookup.lookup_text_batched(
+                text, concurrency=concurrency
+            )
+        return output, peak
+
+    async def test_chunks_are_verified_concurrently_in_text_order(self):
+        text = _long_text(3)
+        output, peak = await self._lookup(text, concurrency=4)
+        assert peak == 3
+        offsets = [offset for offset, _ in _split_text(text)]
+        assert [r["start_index"] for r in output] == [o + 5 for o in offsets]
+        assert [r["end_index"] for r in output] == [o + 9 for o in offsets]
+
+    async def test_concurrency_limit(self):
+        _, peak = await self._lookup(_long_text(3), concurrency=1)
+        assert peak == 1
+
+    async def test_whole_request_throttle_waits_for_wait_until(self):
+        results = [{"citation": "x", "status": 200, "start_index": 0}]
+        lookup = AsyncCitationLookup(_mock_client())
+        mock = AsyncMock(side_effect=[_throttle_error(0.05), results])
+        with patch.object(lookup, "lookup_text", mock):
+            started = asyncio.get_running_loop().time()
+            output = await lookup.lookup_text_batched("576 U.S. 644")
+            elapsed = asyncio.get_running_loop().time() - started
+        assert output == results
+        assert mock.await_count == 2
+        assert elapsed >= 0.04
+
+    async def test_throttle_pauses_every_chunk(self):
+        gate = _ThrottleGate()
+        gate.close_for(0.05)
+        started = asyncio.get_running_loop().time()
+        await asyncio.gather(gate.wait(), gate.wait())
+        assert asyncio.get_running_loop().time() - started >= 0.04
+
+    async def test_gives_up_after_repeated_throttling(self):
+        lookup = AsyncCitationLookup(_mock_client())
+        mock = AsyncMock(side_effect=[_throttle_error(0) for _ in range(3)])
+        with (
+            patch.object(lookup, "lookup_text", mock),
+            patch(
+                "courtlistener.async_client.citation_lookup."
+                "MAX_BATCH_THROTTLE_RETRIES",
+                2,
+            ),
+            pytest.raises(CourtListenerAPIError),
+        ):
+            await lookup.lookup_text_batched("576 U.S. 644")
+        assert mock.await_count == 3
+
+    async def test_throttle_without_wait_until_raises(self):
+        error = CourtListenerAPIError(
+            429, {}, MagicMock(spec=httpx.Response, status_code=429)
+        )
+        lookup = AsyncCitationLookup(_mock_client())
+        mock = AsyncMock(side_effect=error)
+        with (
+            patch.object(lookup, "lookup_text", mock),
+            pytest.raises(CourtListenerAPIError),
+        ):
+            await lookup.lookup_text_batched("576 U.S. 644")
+        assert mock.await_count == 1
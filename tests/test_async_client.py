@@ -1,7 +1,9 @@
 """Tests for AsyncCourtListener and sync/async API parity."""
 
 import inspect
+from unittest.mock import patch
 
+import httpx
 import pytest
 
 from courtlistener import AsyncCourtListener, CourtListener
@@ -14,6 +16,7 @@ from courtlistener.async_client.resource import (
     AsyncResource,
     AsyncResourceIterator,
 )
+from courtlistener.async_client.transport import create_pooled_transport
 from courtlistener.sync_client.alerts import DocketAlerts, SearchAlerts
 from courtlistener.sync_client.citation_lookup import CitationLookup
 from courtlistener.sync_client.resource import Resource, ResourceIterator
@@ -254,3 +257,57 @@ class TestAsyncClientConstruction:
         cl = AsyncCourtListener(api_token="tok")
         await cl.aclose()
         assert cl._http_client is None
+
+
+class TestSharedTransport:
+    """Clients borrowing one connection pool keep their own credentials."""
+
+    @staticmethod
+    def _recording_transport(seen):
+        def handler(request):
+            seen.append(request.headers["Authorization"])
+            return httpx.Response(200, json={"ok": True})
+
+        return httpx.MockTransport(handler)
+
+    @pytest.mark.asyncio
+    async def test_each_client_sends_its_own_credential(self):
+        seen = []
+        transport = self._recording_transport(seen)
+        async with (
+            AsyncCourtListener(api_token="a", transport=transport) as a,
+            AsyncCourtListener(access_token="b", transport=transport) as b,
+        ):
+            await a._request("GET", "/courts/")
+            await b._request("GET", "/courts/")
+        assert seen == ["Token a", "Bearer b"]
+
+    @pytest.mark.asyncio
+    async def test_closing_a_client_leaves_the_transport_open(self):
+        seen = []
+        transport = self._recording_transport(seen)
+        with patch.object(
+            transport, "aclose", wraps=transport.aclose
+        ) as aclose:
+            async with AsyncCourtListener(
+                api_token="a", transport=transport
+            ) as cl:
+                await cl._request("GET", "/courts/")
+            aclose.assert_not_awaited()
+
+        async with AsyncCourtListener(
+            api_token="b", transport=transport
+        ) as cl:
+            await cl._request("GET", "/courts/")
+        assert seen == ["Token a", "Token b"]
+
+    def test_create_pooled_transport_applies_limits(self):
+        transport = create_pooled_transport(
+            max_connections=7,
+            max_keepalive_connections=3,
+            keepalive_expiry=5.0,
+        )
+        pool = transport._pool
+        assert pool._max_connections == 7
+        assert pool._max_keepalive_connections == 3
+        assert pool._keepalive_expiry == 5.0
@@ -101,7 +101,7 @@ class TestCourtListenerAPIError:
         response = MagicMock(spec=httpx.Response)
         response.status_code = 200
         response.raise_for_status = MagicMock()
-        response.json.return_value = {"id": 1}
+        response.content = b'{"id": 1}'
         _attach(cl, response)
 
         result = await cl._request("GET", "/dockets/1/")
@@ -124,7 +124,7 @@ class TestRequestResponseHandling:
         response = MagicMock(spec=httpx.Response)
         response.status_code = 200
         response.raise_for_status = MagicMock()
-        response.json.return_value = {"results": []}
+        response.content = b'{"results": []}'
         request = _attach(cl, response)
 
         await cl._request("GET", "/api/rest/v4/dockets/?cursor=abc")
@@ -135,7 +135,7 @@ class TestRequestResponseHandling:
         response = MagicMock(spec=httpx.Response)
         response.status_code = 200
         response.raise_for_status = MagicMock()
-        response.json.return_value = {"results": []}
+        response.content = b'{"results": []}'
         request = _attach(cl, response)
 
         await cl._request("GET", "/dockets/", params={"court": "scotus"})
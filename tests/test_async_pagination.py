@@ -1,8 +1,11 @@
 """Unit tests for AsyncResourceIterator pagination behavior."""
 
+import asyncio
+import gc
 from unittest.mock import AsyncMock
 
 import pytest
+from pydantic import ValidationError
 
 from courtlistener import AsyncCourtListener
 from courtlistener.async_client.resource import AsyncResourceIterator
@@ -21,10 +24,27 @@ def _page(results, next=None, previous=None, count=None):
     }
 
 
-def _iterator(pages) -> AsyncResourceIterator:
+def _iterator(pages, prefetch=0) -> AsyncResourceIterator:
     cl = AsyncCourtListener(api_token="tok")
     cl._request = AsyncMock(side_effect=pages)
-    return cl.courts.list()
+    return cl.courts.list(prefetch=prefetch)
+
+
+def _chain(num_pages, per_page=2):
+    """Pages linked by distinct next cursors, ids numbered from 0."""
+    return [
+        _page(
+            [{"id": n * per_page + i} for i in range(per_page)],
+            next=f"{NEXT_URL}{n + 1}" if n + 1 < num_pages else None,
+        )
+        for n in range(num_pages)
+    ]
+
+
+async def _settle():
+    """Let background prefetch tasks run until they block."""
+    for _ in range(20):
+        await asyncio.sleep(0)
 
 
 class TestCurrentPage:
@@ -100,6 +120,73 @@ class TestIteration:
         assert [item["id"] async for item in it] == [3]
 
 
+class TestPrefetch:
+    async def test_yields_every_result_in_order(self):
+        it = _iterator(_chain(5), prefetch=2)
+        assert [item["id"] async for item in it] == list(range(10))
+        assert it._client._request.await_count == 5
+
+    async def test_fetches_ahead_while_page_is_consumed(self):
+        it = _iterator(_chain(5), prefetch=2)
+        async for _ in it:
+            break
+        await _settle()
+        # The first page plus two prefetched ones; the buffer is full.
+        assert it._client._request.await_count == 3
+        paths = [call.args[1] for call in it._client._request.await_args_list]
+        assert paths[1:] == [
+            "/api/rest/v4/courts/?cursor=abc1",
+            "/api/rest/v4/courts/?cursor=abc2",
+        ]
+
+    async def test_resumed_iteration_uses_buffered_pages(self):
+        it = _iterator(_chain(3), prefetch=2)
+        collected = []
+        async for item in it:
+            collected.append(item["id"])
+            if len(collected) == 3:
+                break
+        collected.extend([item["id"] async for item in it])
+        assert collected == list(range(6))
+        assert it._client._request.await_count == 3
+
+    async def test_manual_next_uses_prefetcher(self):
+        it = _iterator(_chain(3), prefetch=1)
+        async for _ in it:
+            break
+        await _settle()
+        assert it._client._request.await_count == 2
+        await it.next()
+        assert [item["id"] for item in await it.get_results()] == [2, 3]
+        await _settle()
+        assert it._client._request.await_count == 3
+
+    async def test_fetch_error_surfaces_at_that_page(self):
+        pages = _chain(3)
+        pages[1] = RuntimeError("boom")
+        it = _iterator(pages, prefetch=2)
+        collected = []
+        with pytest.raises(RuntimeError, match="boom"):
+            async for item in it:
+                collected.append(item["id"])
+        assert collected == [0, 1]
+
+    async def test_dropping_the_iterator_cancels_prefetch(self):
+        it = _iterator(_chain(5), prefetch=1)
+        async for _ in it:
+            break
+        task = it._prefetcher._task
+        del it
+        gc.collect()
+        await _settle()
+        assert task.cancelled()
+
+    async def test_negative_prefetch_rejected(self):
+        cl = AsyncCourtListener(api_token="tok")
+        with pytest.raises(ValueError, match="prefetch"):
+            cl.courts.list(prefetch=-1)
+
+
 class TestCount:
     async def test_integer_count(self):
         it = _iterator([_page([{"id": 1}], count=42)])
@@ -135,7 +222,7 @@ class TestDumpLoad:
     async def test_round_trip_uses_cached_page(self):
         it = _iterator([_page([{"id": 1}], count=7)])
         await it.get_count()
-        state = await it.dump()
+        state = await it.dump(include_page=True)
 
         restored_client = AsyncCourtListener(api_token="tok")
         restored_client._request = AsyncMock()
@@ -154,3 +241,76 @@ class TestDumpLoad:
                 break
         state = await it.dump()
         assert state["page_result_index"] == 1
+
+    async def test_compact_dump_refetches_current_page(self):
+        pages = _chain(3)
+        it = _iterator(pages)
+        await it.next()
+        await it.get_count()
+        state = await it.dump()
+        assert "current_page" not in state
+        assert state["page_url"] == f"{NEXT_URL}1"
+        assert state["count"] == 2
+
+        restored_client = AsyncCourtListener(api_token="tok")
+        restored_client._request = AsyncMock(side_effect=pages[1:])
+        restored = AsyncResourceIterator.load(restored_client, state)
+        assert await restored.get_count() == 2
+        restored_client._request.assert_not_awaited()
+        assert await restored.get_results() == [{"id": 2}, {"id": 3}]
+        method, path = restored_client._request.await_args.args
+        assert path == "/api/rest/v4/courts/?cursor=abc1"
+
+    async def test_compact_dump_of_first_page_refetches_with_filters(self):
+        it = _iterator([_page([{"id": 1}])])
+        await it.get_current_page()
+        state = await it.dump()
+        assert state["page_url"] is None
+
+        restored_client = AsyncCourtListener(api_token="tok")
+        restored_client._request = AsyncMock(return_value=_page([{"id": 1}]))
+        restored = AsyncResourceIterator.load(restored_client, state)
+        assert await restored.get_results() == [{"id": 1}]
+        restored_client._request.assert_awaited_once_with(
+            "GET", "/courts/", params=state["filters"]
+        )
+
+    async def test_compact_dump_keeps_count_url(self):
+        count_url = (
+            "https://www.courtlistener.com/api/rest/v4/courts/?count=on"
+        )
+        it = _iterator([_page([{"id": 1}], count=count_url)])
+        await it.get_current_page()
+        state = await it.dump()
+        assert state["count_url"] == count_url
+
+        restored_client = AsyncCourtListener(api_token="tok")
+        restored_client._request = AsyncMock(return_value={"count": 5})
+        restored = AsyncResourceIterator.load(restored_client, state)
+        assert await restored.get_count() == 5
+        restored_client._request.assert_awaited_once()
+
+    async def test_legacy_dump_keeps_its_page_inline(self):
+        it = _iterator(_chain(2))
+        await it.next()
+        state = await it.dump(include_page=True)
+        del state["page_url"], state["count_url"]
+
+        restored = AsyncResourceIterator.load(
+            AsyncCourtListener(api_token="tok"), state
+        )
+        assert "current_page" in await restored.dump()
+
+    async def test_fetched_pages_are_not_revalidated(self):
+        page = _page([{"id": 1}])
+        it = _iterator([page])
+        assert (await it.get_current_page()).results is page["results"]
+
+    async def test_load_validates_dumped_page(self):
+        it = _iterator([_page([{"id": 1}])])
+        state = await it.dump(include_page=True)
+        state["current_page"]["results"] = ["not a result"]
+        with pytest.raises(ValidationError):
+            AsyncResourceIterator.load(
+                AsyncCourtListener(api_token="t"), state
+            )
@@ -156,6 +156,23 @@ class TestMCPToolGetClient:
         assert cl.access_token is None
         assert cl.client.headers["Authorization"] == "Token env-api-token"
 
+    def test_clients_borrow_the_shared_transport(self):
+        """Every tool call's client sends through the worker's pool."""
+        from courtlistener.mcp.transport import get_transport
+
+        tool = self._get_tool()
+        with patch(
+            "courtlistener.mcp.tools.mcp_tool.get_access_token",
+            return_value=self._verified(
+                "cl-api-token", token_kind=TokenKind.API
+            ),
+        ):
+            first = tool.get_client()
+            second = tool.get_client()
+        assert first.transport is get_transport()
+        assert second.transport is first.transport
+        assert first.client is not second.client
+
 
 def http_response(status_code: int):
     resp = MagicMock()
@@ -16,7 +16,13 @@ from courtlistener.models import ENDPOINTS
 from courtlistener.models.endpoints.opinion_search import (
     OpinionSearchEndpoint,
 )
-from courtlistener.utils import multiple_choice_validator
+from courtlistener.utils import (
+    ChoiceIndex,
+    get_choice_index,
+    get_choices,
+    get_valid_choice,
+    multiple_choice_validator,
+)
 
 
 def uses_multiple_choice_validator(field) -> bool:
@@ -263,3 +269,59 @@ class TestSuggestionQuality:
     def test_genuine_list_still_suggests_per_token(self):
         msg = self.error_for("scotus texapp2")
         assert "texapp" in msg
+
+
+class TestChoiceIndex:
+    def test_built_once_per_field(self):
+        first = get_choice_index(OpinionSearchEndpoint, "court")
+        assert get_choice_index(OpinionSearchEndpoint, "court") is first
+        court_of(court=["scotus", "ca1"])
+        assert get_choice_index(OpinionSearchEndpoint, "court") is first
+
+    def test_lookup_matches_value_then_display_name(self):
+        index = get_choice_index(OpinionSearchEndpoint, "court")
+        assert index.lookup("scotus") == "scotus"
+        assert index.lookup("Supreme Court of the United States") == "scotus"
+        assert index.lookup("SCOTUS") is None
+        assert index.casefolded["scotus"] == "scotus"
+
+    def test_string_numerics_match_int_values(self):
+        index = ChoiceIndex({1: "One", 2: "Two"})
+        assert index.lookup("2") == 2
+        assert index.lookup("Two") == 2
+        assert index.lookup("3") is None
+
+    def test_first_value_wins_for_shared_display_name(self):
+        index = ChoiceIndex({"a": "Same", "b": "Same"})
+        assert index.lookup("Same") == "a"
+
+    def test_plain_dicts_still_accepted(self):
+        assert get_valid_choice("One", {1: "One"}) == 1
+
+
+class TestSharedChoiceTables:
+    def test_search_models_share_the_court_table(self):
+        ids = {
+            ENDPOINTS[name]
+            .model_fields["court"]
+            .json_schema_extra["choices_id"]
+            for name in ENDPOINTS
+            if name.endswith("search")
+        }
+        assert ids == {"court"}
+
+    def test_schema_references_the_table(self):
+        court = OpinionSearchEndpoint.model_json_schema()["properties"][
+            "court"
+        ]
+        assert court["choices_id"] == "court"
+        assert "choices" not in court
+        assert get_choices(court)[0] == {
+            "value": "scotus",
+            "display_name": "Supreme Court of the United States",
+        }
+
+    def test_inline_choices_still_work(self):
+        choices = [{"value": "a", "display_name": "A"}]
+        assert get_choices({"choices": choices}) == choices
+        assert get_choices(None) == []
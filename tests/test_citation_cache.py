@@ -0,0 +1,249 @@
+"""Tests for the citation verification cache and its backends."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+import redis
+
+from courtlistener import AsyncCourtListener, CourtListener
+from courtlistener.async_client.citation_lookup import AsyncCitationLookup
+from courtlistener.citation_cache import (
+    MemoryCitationCache,
+    RedisCitationCache,
+    SQLiteCitationCache,
+    normalize_citation,
+)
+from courtlistener.serialization import dumps
+
+run = asyncio.run
+
+FOUND = {
+    "citation": "576 U.S. 644",
+    "status": 200,
+    "clusters": [{"id": 2812209}],
+}
+
+
+def _lookup_transport(seen, result=FOUND):
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json=[result])
+
+    return httpx.MockTransport(handler)
+
+
+class TestNormalizeCitation:
+    def test_reporter_spacing_is_ignored(self):
+        assert normalize_citation("347 U. S. 483") == "347 U.S. 483"
+        assert normalize_citation(" 347  U.S.  483 ") == "347 U.S. 483"
+
+    def test_multi_word_reporters(self):
+        assert normalize_citation("1 F. Supp. 2d 5") == "1 F.Supp.2d 5"
+
+
+class TestMemoryCitationCache:
+    def test_round_trip_by_normalized_citation(self):
+        cache = MemoryCitationCache()
+        cache.set("576 U. S. 644", FOUND)
+        assert cache.get("576 U.S. 644") == FOUND
+        assert cache.get_many(["576 U.S. 644", "1 U.S. 1"]) == {
+            "576 U.S. 644": FOUND
+        }
+
+    def test_only_found_and_not_found_results_are_cached(self):
+        cache = MemoryCitationCache()
+        for status in (400, 429, None):
+            cache.set("1 U.S. 1", {"status": status})
+        assert len(cache) == 0
+        cache.set("1 U.S. 1", {"status": 300})
+        cache.set("2 U.S. 2", {"status": 404})
+        assert len(cache) == 2
+
+    def test_not_found_results_expire_sooner(self):
+        cache = MemoryCitationCache(ttl=100, negative_ttl=10)
+        with patch("courtlistener.citation_cache.time.monotonic") as clock:
+            clock.return_value = 0
+            cache.set("576 U.S. 644", FOUND)
+            cache.set("1 U.S. 1", {"status": 404})
+            clock.return_value = 50
+            assert cache.get_many(["576 U.S. 644", "1 U.S. 1"]) == {
+                "576 U.S. 644": FOUND
+            }
+            clock.return_value = 100
+            assert cache.get("576 U.S. 644") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = MemoryCitationCache(max_entries=2)
+        cache.set("1 U.S. 1", FOUND)
+        cache.set("2 U.S. 2", FOUND)
+        cache.get("1 U.S. 1")
+        cache.set("3 U.S. 3", FOUND)
+        assert cache.get("2 U.S. 2") is None
+        assert cache.get("1 U.S. 1") == FOUND
+
+    def test_rejects_non_positive_ttls(self):
+        with pytest.raises(ValueError):
+            MemoryCitationCache(negative_ttl=0)
+
+
+class TestSQLiteCitationCache:
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "citations.db"
+        cache = SQLiteCitationCache(path)
+        cache.set("576 U.S. 644", FOUND)
+        cache.close()
+
+        reopened = SQLiteCitationCache(path)
+        assert reopened.get("576 U. S. 644") == FOUND
+        reopened.clear()
+        assert reopened.get("576 U.S. 644") is None
+
+    def test_async_methods(self, tmp_path):
+        cache = SQLiteCitationCache(tmp_path / "citations.db")
+        run(cache.aset("576 U.S. 644", FOUND))
+        assert run(cache.aget_many(["576 U.S. 644"])) == {
+            "576 U.S. 644": FOUND
+        }
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        cache = SQLiteCitationCache(tmp_path / "citations.db")
+        with patch("courtlistener.citation_cache.time.time") as clock:
+            clock.return_value = 1000
+            cache.set("1 U.S. 1", {"status": 404})
+            clock.return_value = 1000 + cache.negative_ttl
+            assert cache.get("1 U.S. 1") is None
+
+
+class TestRedisCitationCache:
+    def test_keys_are_prefixed_and_expire(self):
+        cache = RedisCitationCache("redis://localhost:6379", negative_ttl=60)
+        cache._client = MagicMock()
+        cache._client.mget.return_value = [dumps(FOUND), None]
+        assert cache.get_many(["576 U. S. 644", "1 U.S. 1"]) == {
+            "576 U. S. 644": FOUND
+        }
+        cache._client.mget.assert_called_once_with(
+            [
+                "courtlistener:citation:576 U.S. 644",
+                "courtlistener:citation:1 U.S. 1",
+            ]
+        )
+        cache.set("1 U.S. 1", {"status": 404})
+        assert cache._client.set.call_args.kwargs == {"ex": 60}
+
+    def test_connection_errors_are_misses(self):
+        cache = RedisCitationCache("redis://localhost:6379")
+        cache._async_client = MagicMock()
+        cache._async_client.mget = AsyncMock(
+            side_effect=redis.ConnectionError("down")
+        )
+        cache._async_client.set = AsyncMock(
+            side_effect=redis.ConnectionError("down")
+        )
+        assert run(cache.aget("576 U.S. 644")) is None
+        run(cache.aset("576 U.S. 644", FOUND))
+
+
+class TestClientIntegration:
+    def test_lookup_citation_uses_the_cache(self):
+        seen = []
+        cache = MemoryCitationCache()
+        with CourtListener(
+            api_token="test",
+            transport=_lookup_transport(seen),
+            citation_cache=cache,
+        ) as cl:
+            first = cl.citation_lookup.lookup_citation(576, "U.S.", "644")
+            second = cl.citation_lookup.lookup_citation(576, "U. S.", "644")
+        assert first == second == [FOUND]
+        assert len(seen) == 1
+
+    def test_async_lookup_citation_uses_the_cache(self):
+        seen = []
+        cache = MemoryCitationCache()
+
+        async def lookups():
+            async with AsyncCourtListener(
+                api_token="test",
+                transport=_lookup_transport(seen),
+                citation_cache=cache,
+            ) as cl:
+                await cl.citation_lookup.lookup_citation(576, "U.S.", "644")
+                return await cl.citation_lookup.lookup_citation(
+                    576, "U.S.", "644"
+                )
+
+        assert run(lookups()) == [FOUND]
+        assert len(seen) == 1
+
+    def test_extract_locally_sends_only_uncached_citations(self):
+        pytest.importorskip("eyecite")
+        cache = MemoryCitationCache()
+        cache.set("347 U.S. 483", {**FOUND, "citation": "347 U.S. 483"})
+        lookup = AsyncCitationLookup(MagicMock(citation_cache=cache))
+        api_result = {**FOUND, "start_index": 0, "end_index": 12}
+        mock = AsyncMock(return_value=[api_result])
+        text = "Brown, 347 U.S. 483 (1954); Obergefell, 576 U.S. 644 (2015)."
+        with patch.object(lookup, "lookup_text", mock):
+            output = run(
+                lookup.lookup_text_batched(text, extract_locally=True)
+            )
+        mock.assert_awaited_once_with("576 U.S. 644")
+        assert [r["status"] for r in output] == [200, 200]
+        assert cache.get("576 U.S. 644") == api_result
+
+
+class TestMCPCitationCache:
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        from courtlistener.mcp.citation_cache import set_citation_cache
+
+        set_citation_cache(None)
+        yield
+        set_citation_cache(None)
+
+    def test_in_memory_without_redis(self, monkeypatch):
+        from courtlistener.mcp import settings
+        from courtlistener.mcp.citation_cache import get_citation_cache
+
+        monkeypatch.setattr(settings, "REDIS_URL", None)
+        cache = get_citation_cache()
+        assert isinstance(cache, MemoryCitationCache)
+        assert get_citation_cache() is cache
+
+    def test_redis_when_configured(self, monkeypatch):
+        from courtlistener.mcp import settings
+        from courtlistener.mcp.citation_cache import get_citation_cache
+
+        monkeypatch.setattr(settings, "REDIS_URL", "redis://localhost:6379")
+        cache = get_citation_cache()
+        assert isinstance(cache, RedisCitationCache)
+        assert cache.prefix == "mcp:citation:"
+
+    def test_disabled(self, monkeypatch):
+        from courtlistener.mcp import settings
+        from courtlistener.mcp.citation_cache import get_citation_cache
+
+        monkeypatch.setattr(settings, "CITATION_CACHE_ENABLED", False)
+        assert get_citation_cache() is None
+
+    def test_cached_results_leave_pending(self):
+        from courtlistener.mcp.citation_cache import set_citation_cache
+        from courtlistener.mcp.tools.citation_utils import (
+            apply_cached_results,
+            cache_api_results,
+        )
+
+        cache = MemoryCitationCache()
+        set_citation_cache(cache)
+        run(cache_api_results([FOUND], ["576 U.S. 644"]))
+        pending = ["576 U.S. 644", "1 U.S. 1"]
+        verified: dict = {}
+        run(apply_cached_results(pending, verified))
+        assert pending == ["1 U.S. 1"]
+        assert verified["576 U.S. 644"]["clusters"][0]["cluster_id"] == (
+            2812209
+        )
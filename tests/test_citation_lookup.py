@@ -1,5 +1,7 @@
 """Tests for the CitationLookup helper."""
 
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
@@ -15,7 +17,7 @@ from courtlistener.sync_client.citation_lookup import (
 
 
 def _mock_client(*responses):
-    client = MagicMock()
+    client = MagicMock(citation_cache=None)
     client._request = MagicMock(side_effect=list(responses) or None)
     return client
 
@@ -221,3 +223,23 @@ class TestLookupTextBatched:
         assert output[1]["status"] == 200
         # Second result's index should be adjusted to original text
         assert output[1]["start_index"] == 22
+
+    def test_chunks_are_verified_in_threads_in_text_order(self):
+        text = " ".join(["word"] * (MAX_TEXT_LENGTH // 5 * 3 - 1))
+        lookup = CitationLookup(MagicMock())
+        lock = threading.Lock()
+        started = 0
+
+        def lookup_text(chunk):
+            nonlocal started
+            with lock:
+                started += 1
+                delay = 0.01 * (4 - started)
+            time.sleep(delay)
+            return [{"status": 200, "start_index": 1, "end_index": 2}]
+
+        with patch.object(lookup, "lookup_text", side_effect=lookup_text):
+            output = lookup.lookup_text_batched(text, concurrency=3)
+
+        offsets = [offset for offset, _ in _split_text(text)]
+        assert [r["start_index"] for r in output] == [o + 1 for o in offsets]
@@ -0,0 +1,279 @@
+"""Tests for background verification of citation-analysis jobs."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from courtlistener.async_client.citation_lookup import (
+    MAX_BATCH_THROTTLE_RETRIES,
+)
+from courtlistener.exceptions import CourtListenerAPIError
+from courtlistener.mcp import settings
+from courtlistener.mcp.citation_cache import set_citation_cache
+from courtlistener.mcp.session import InMemorySession, get_session, set_session
+from courtlistener.mcp.tools.citation_worker import (
+    CitationWorker,
+    claim,
+    get_citation_worker,
+    is_draining,
+    set_citation_worker,
+)
+from courtlistener.mcp.tools.resume_citation_analysis_tool import (
+    ResumeCitationAnalysisTool,
+)
+
+run = asyncio.run
+
+
+@pytest.fixture(autouse=True)
+def _isolate(monkeypatch):
+    monkeypatch.setattr(settings, "CITATION_CACHE_ENABLED", False)
+    set_citation_cache(None)
+    set_session(InMemorySession())
+    set_citation_worker(None)
+    yield
+    set_citation_worker(None)
+    set_session(None)
+
+
+def _results_for(compact, status=200):
+    return [
+        {"citation": cite, "status": status, "clusters": []}
+        for cite in compact.split("; ")
+    ]
+
+
+def _lookup(compact, retry_on_rate_limit=False):
+    return _results_for(compact)
+
+
+def _make_client(lookup_text=_lookup):
+    client = MagicMock(api_token="token", access_token=None)
+    client.__aenter__.return_value = client
+    client.__aexit__.return_value = False
+    client.citation_lookup.lookup_text = AsyncMock(side_effect=lookup_text)
+    return client
+
+
+def _job(keys, verified=()):
+    return {
+        "resource_refs": {},
+        "unique_citations": list(keys),
+        "input_case_names": {},
+        "verified": {
+            key: {"status": 200, "citation": key, "clusters": []}
+            for key in verified
+        },
+        "pending": [key for key in keys if key not in verified],
+        "reported": list(verified),
+    }
+
+
+def _keys(n):
+    return [f"{i} U.S. {i}" for i in range(1, n + 1)]
+
+
+def _throttle_error():
+    return CourtListenerAPIError(
+        429,
+        {"wait_until": "2000-01-01T00:00:00+00:00"},
+        MagicMock(spec=httpx.Response, status_code=429),
+    )
+
+
+class TestDrain:
+    def test_verifies_every_batch_and_releases_the_job(self):
+        client = _make_client()
+        job = _job(_keys(600))
+        claim(job)
+
+        async def drain():
+            await get_session().store_citation_analysis("job", job, client)
+            await CitationWorker().drain("job", client)
+            return await get_session().get_citation_analysis("job", client)
+
+        stored = run(drain())
+        assert client.citation_lookup.lookup_text.await_count == 3
+        assert stored["pending"] == []
+        assert len(stored["verified"]) == 600
+        assert not is_draining(stored)
+
+    def test_waits_out_a_rate_limited_request(self):
+        calls = iter([_throttle_error()])
+
+        async def lookup_text(compact, retry_on_rate_limit=False):
+            assert retry_on_rate_limit
+            error = next(calls, None)
+            if error is not None:
+                raise error
+            return _results_for(compact)
+
+        client = _make_client(lookup_text)
+
+        async def drain():
+            await get_session().store_citation_analysis(
+                "job", _job(_keys(3)), client
+            )
+            with patch(
+                "courtlistener.mcp.tools.citation_worker.asyncio.sleep",
+                AsyncMock(),
+            ) as sleep:
+                await CitationWorker().drain("job", client)
+            return sleep, await get_session().get_citation_analysis(
+                "job", client
+            )
+
+        sleep, stored = run(drain())
+        sleep.assert_awaited_once_with(0.0)
+        assert stored["pending"] == []
+
+    def test_gives_up_when_batches_stop_verifying(self):
+        client = _make_client(lambda compact, **_: _results_for(compact, 429))
+
+        async def drain():
+            await get_session().store_citation_analysis(
+                "job", _job(_keys(3)), client
+            )
+            with patch(
+                "courtlistener.mcp.tools.citation_worker.asyncio.sleep",
+                AsyncMock(),
+            ):
+                await CitationWorker().drain("job", client)
+            return await get_session().get_citation_analysis("job", client)
+
+        stored = run(drain())
+        assert (
+            client.citation_lookup.lookup_text.await_count
+            == MAX_BATCH_THROTTLE_RETRIES
+        )
+        assert len(stored["pending"]) == 3
+        assert not is_draining(stored)
+
+    def test_logs_a_failed_release(self, caplog):
+        client = _make_client()
+        session = InMemorySession()
+        set_session(session)
+
+        async def drain():
+            await session.store_citation_analysis(
+                "job", _job(_keys(3)), client
+            )
+            with patch.object(
+                session,
+                "store_citation_analysis",
+                AsyncMock(side_effect=RuntimeError("session down")),
+            ):
+                await CitationWorker().drain("job", client)
+
+        run(drain())
+        assert "citation job job failed" in caplog.text
+
+
+class TestShutdown:
+    def test_server_shutdown_releases_running_jobs(self, monkeypatch):
+        from courtlistener.mcp.server import lifespan
+
+        monkeypatch.setattr(settings, "CITATION_WORKER_ENABLED", True)
+        started = asyncio.Event()
+
+        async def lookup_text(compact, retry_on_rate_limit=False):
+            started.set()
+            await asyncio.sleep(60)
+
+        client = _make_client(lookup_text)
+        job = _job(_keys(3))
+        claim(job)
+
+        async def serve():
+            session = get_session()
+            await session.store_citation_analysis("job", job, client)
+            async with lifespan(None):
+                worker = get_citation_worker()
+                worker.schedule("job", client)
+                await started.wait()
+            assert len(worker) == 0
+            return await session.get_citation_analysis("job", client)
+
+        stored = run(serve())
+        assert len(stored["pending"]) == 3
+        assert not is_draining(stored)
+        client.__aexit__.assert_awaited_once()
+
+
+class TestResumeWithWorker:
+    def test_collects_progress_without_calling_the_api(self):
+        client = _make_client()
+        tool = ResumeCitationAnalysisTool()
+        job = _job(_keys(3), verified=_keys(1))
+        claim(job)
+
+        async def resume_twice():
+            session = get_session()
+            await session.store_citation_analysis("job", job, client)
+            # The worker verifies a citation between calls.
+            job["verified"]["2 U.S. 2"] = {
+                "status": 200,
+                "citation": "2 U.S. 2",
+                "clusters": [],
+            }
+            job["pending"].remove("2 U.S. 2")
+            await session.store_citation_analysis("job", job, client)
+            with patch.object(
+                ResumeCitationAnalysisTool, "get_client", return_value=client
+            ):
+                first = await tool({"job_id": "job"}, None)
+                second = await tool({"job_id": "job"}, None)
+            return first, second
+
+        first, second = run(resume_twice())
+        client.citation_lookup.lookup_text.assert_not_awaited()
+        assert "Newly verified (1)" in first
+        assert "verifying in the background" in first
+        assert "No new citations verified since the last call." in second
+
+    def test_hands_remaining_citations_to_the_worker(self, monkeypatch):
+        monkeypatch.setattr(settings, "CITATION_WORKER_ENABLED", True)
+        client = _make_client()
+        tool = ResumeCitationAnalysisTool()
+
+        async def resume():
+            session = get_session()
+            await session.store_citation_analysis(
+                "job", _job(_keys(300)), client
+            )
+            with patch.object(
+                ResumeCitationAnalysisTool, "get_client", return_value=client
+            ):
+                output = await tool({"job_id": "job"}, None)
+                worker = get_citation_worker()
+                assert len(worker) == 1
+                await worker.join()
+            return output, await session.get_citation_analysis("job", client)
+
+        output, stored = run(resume())
+        assert "Newly verified (250)" in output
+        assert "50 still pending — verifying in the background" in output
+        assert client.citation_lookup.lookup_text.await_count == 2
+        assert stored["pending"] == []
+        assert not is_draining(stored)
+
+    def test_expired_lease_falls_back_to_verifying_here(self):
+        client = _make_client()
+        job = _job(_keys(2))
+        job["draining_until"] = time.time() - 1
+
+        async def resume():
+            await get_session().store_citation_analysis("job", job, client)
+            with patch.object(
+                ResumeCitationAnalysisTool, "get_client", return_value=client
+            ):
+                return await ResumeCitationAnalysisTool()(
+                    {"job_id": "job"}, None
+                )
+
+        output = run(resume())
+        client.citation_lookup.lookup_text.assert_awaited_once()
+        assert "All citations verified!" in output
@@ -0,0 +1,127 @@
+"""Tests for local citation extraction in courtlistener.citations."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from courtlistener.async_client.citation_lookup import AsyncCitationLookup
+from courtlistener.citations import (
+    MAX_CITATIONS_PER_REQUEST,
+    build_compact_string,
+    extract_citations,
+    match_batch_results,
+)
+from courtlistener.sync_client.citation_lookup import CitationLookup
+
+pytest.importorskip("eyecite")
+
+TEXT = (
+    "See Brown v. Board, 347 U.S. 483 (1954). Obergefell v. Hodges, "
+    "576 U.S. 644 (2015), relied on Brown, 347 U.S. 483, and a slip "
+    "opinion, 586 U. S. ___ (2019)."
+)
+
+
+def _results_for(compact, status=200):
+    """What the API returns for a compact string: one result per cite."""
+    results = []
+    start = 0
+    for cite in compact.split("; "):
+        results.append(
+            {
+                "citation": cite,
+                "normalized_citations": [cite],
+                "start_index": start,
+                "end_index": start + len(cite),
+                "status": status,
+                "error_message": "",
+                "clusters": [{"id": len(cite)}],
+            }
+        )
+        start += len(cite) + 2
+    return results
+
+
+class TestExtractCitations:
+    def test_dedupes_and_keeps_every_occurrence(self):
+        extracted = extract_citations(TEXT)
+        assert extracted.keys == ["347 U.S. 483", "576 U.S. 644"]
+        spans = extracted.occurrences["347 U.S. 483"]
+        assert [TEXT[start:end] for start, end in spans] == [
+            "347 U.S. 483",
+            "347 U.S. 483",
+        ]
+        (unpaged,) = extracted.unpaged
+        assert TEXT[unpaged[0] : unpaged[1]] == "586 U. S. ___"
+
+    def test_batches_hold_at_most_250_citations(self):
+        text = " ".join(f"{n} U.S. {n}." for n in range(1, 301))
+        batches = extract_citations(text).batches()
+        assert [len(batch) for batch in batches] == [
+            MAX_CITATIONS_PER_REQUEST,
+            50,
+        ]
+
+
+class TestMatchBatchResults:
+    def test_matches_by_position_in_the_compact_string(self):
+        batch = ["347 U.S. 483", "576 U.S. 644"]
+        results = _results_for(build_compact_string(batch))
+        results[1]["citation"] = "576 U. S. 644"
+        matched = match_batch_results(results, batch)
+        assert matched["576 U.S. 644"] is results[1]
+
+    def test_falls_back_to_the_citation_text(self):
+        matched = match_batch_results(
+            [{"citation": "576 u.s. 644", "start_index": 99, "status": 200}],
+            ["347 U.S. 483", "576 U.S. 644"],
+        )
+        assert list(matched) == ["576 U.S. 644"]
+
+
+class TestExtractLocally:
+    @pytest.mark.asyncio
+    async def test_sends_each_citation_once_and_maps_back(self):
+        lookup = AsyncCitationLookup(MagicMock(citation_cache=None))
+        mock = AsyncMock(side_effect=_results_for)
+        with patch.object(lookup, "lookup_text", mock):
+            output = await lookup.lookup_text_batched(
+                TEXT, extract_locally=True
+            )
+
+        mock.assert_awaited_once_with("347 U.S. 483; 576 U.S. 644")
+        assert [r["citation"] for r in output] == [
+            "347 U.S. 483",
+            "576 U.S. 644",
+            "347 U.S. 483",
+            "586 U. S. ___",
+        ]
+        for result in output:
+            start, end = result["start_index"], result["end_index"]
+            assert TEXT[start:end] == result["citation"]
+        assert output[0]["clusters"] == output[2]["clusters"]
+        assert output[3]["status"] == 400
+
+    @pytest.mark.asyncio
+    async def test_throttled_citations_are_resubmitted(self):
+        lookup = AsyncCitationLookup(MagicMock(citation_cache=None))
+        first = _results_for("347 U.S. 483; 576 U.S. 644")
+        first[1]["status"] = 429
+        mock = AsyncMock(side_effect=[first, _results_for("576 U.S. 644")])
+        with patch.object(lookup, "lookup_text", mock):
+            output = await lookup.lookup_text_batched(
+                TEXT, extract_locally=True
+            )
+        assert mock.await_args_list[1].args == ("576 U.S. 644",)
+        assert [r["status"] for r in output] == [200, 200, 200, 400]
+
+    def test_sync_client_splits_large_texts_into_batches(self):
+        text = " ".join(f"{n} U.S. {n}." for n in range(1, 301))
+        lookup = CitationLookup(MagicMock(citation_cache=None))
+        with patch.object(
+            lookup, "lookup_text", side_effect=_results_for
+        ) as mock:
+            output = lookup.lookup_text_batched(text, extract_locally=True)
+        assert mock.call_count == 2
+        assert len(output) == 300
+        assert output[-1]["citation"] == "300 U.S. 300"
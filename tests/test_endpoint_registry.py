@@ -0,0 +1,80 @@
+"""Tests for the lazily importing ENDPOINTS registry."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from courtlistener.models import ENDPOINTS, EndpointRegistry
+
+
+def _modules_loaded_after(code):
+    """Endpoint modules imported by *code* in a fresh interpreter."""
+    script = (
+        f"{code}\n"
+        "import sys\n"
+        "print(sorted(m.rsplit('.', 1)[1] for m in sys.modules "
+        "if m.startswith('courtlistener.models.endpoints.')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return eval(result.stdout)
+
+
+def test_importing_the_package_skips_unused_endpoints():
+    loaded = _modules_loaded_after("import courtlistener")
+    assert "search" not in loaded
+    assert "dockets" not in loaded
+
+
+def test_resource_access_imports_only_its_endpoint():
+    loaded = _modules_loaded_after(
+        "import courtlistener\n"
+        "'opinions' in courtlistener.models.ENDPOINTS\n"
+        "courtlistener.CourtListener(api_token='x').dockets"
+    )
+    assert "dockets" in loaded
+    assert "opinions" not in loaded
+
+
+class TestEndpointRegistry:
+    def test_lookup(self):
+        from courtlistener.models.endpoints.dockets import DocketsEndpoint
+
+        assert ENDPOINTS["dockets"] is DocketsEndpoint
+        assert ENDPOINTS.by_class_name("DocketsEndpoint") is DocketsEndpoint
+        assert ENDPOINTS.by_class_name("NopeEndpoint") is None
+
+    def test_unknown_name_raises_key_error(self):
+        assert "nope" not in ENDPOINTS
+        with pytest.raises(KeyError):
+            ENDPOINTS["nope"]
+
+    def test_mapping_protocol(self):
+        from courtlistener.models import endpoints
+
+        modules = Path(endpoints.__file__).parent.glob("*.py")
+        assert (
+            len(ENDPOINTS)
+            == len(list(ENDPOINTS))
+            == len([path for path in modules if path.name != "__init__.py"])
+        )
+        assert dict(ENDPOINTS.items())["courts"].endpoint_id == "courts"
+
+    def test_class_names_resolve_as_package_attributes(self):
+        from courtlistener.models import endpoints
+        from courtlistener.models.endpoints import ClustersEndpoint
+
+        assert ClustersEndpoint is ENDPOINTS["clusters"]
+        with pytest.raises(AttributeError):
+            endpoints.NopeEndpoint  # noqa: B018
+
+    def test_empty_registry(self):
+        registry = EndpointRegistry("courtlistener.models.endpoints", {})
+        assert len(registry) == 0
+        assert registry.by_class_name("DocketsEndpoint") is None
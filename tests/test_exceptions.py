@@ -106,7 +106,7 @@ class TestCourtListenerAPIError:
         response = MagicMock(spec=httpx.Response)
         response.status_code = 200
         response.raise_for_status = MagicMock()
-        response.json.return_value = {"id": 1}
+        response.content = b'{"id": 1}'
         cl._http_client = MagicMock()
         cl._http_client.request.return_value = response
 
@@ -130,7 +130,7 @@ class TestRequestResponseHandling:
         response = MagicMock(spec=httpx.Response)
         response.status_code = 200
         response.raise_for_status = MagicMock()
-        response.json.return_value = {"results": []}
+        response.content = b'{"results": []}'
         request = _attach(cl, response)
 
         cl._request("GET", "/api/rest/v4/dockets/?cursor=abc")
@@ -141,7 +141,7 @@ class TestRequestResponseHandling:
         response = MagicMock(spec=httpx.Response)
         response.status_code = 200
         response.raise_for_status = MagicMock()
-        response.json.return_value = {"results": []}
+        response.content = b'{"results": []}'
         request = _attach(cl, response)
 
         cl._request("GET", "/dockets/", params={"court": "scotus"})
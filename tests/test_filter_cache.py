@@ -0,0 +1,115 @@
+"""Tests for the memo of validated filters."""
+
+from datetime import date
+
+import pytest
+from pydantic import ValidationError
+
+from courtlistener import AsyncCourtListener, CourtListener
+from courtlistener.filter_cache import (
+    FilterCache,
+    canonical_filters,
+    filter_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear():
+    filter_cache.clear()
+    yield
+    filter_cache.clear()
+
+
+class TestCanonicalFilters:
+    def test_ignores_key_order(self):
+        assert canonical_filters({"a": 1, "b": [1, 2]}) == canonical_filters(
+            {"b": [1, 2], "a": 1}
+        )
+
+    def test_keeps_types_apart(self):
+        keys = {
+            canonical_filters({"a": value}) for value in (1, 1.5, True, "1")
+        }
+        assert len(keys) == 4
+
+    def test_nested_filters(self):
+        assert canonical_filters(
+            {"date_filed": {"gte": date(2020, 1, 1)}}
+        ) != canonical_filters({"date_filed": {"gte": date(2020, 1, 2)}})
+
+    def test_unhashable_values_raise(self):
+        with pytest.raises(TypeError):
+            canonical_filters({"a": [set()]})
+
+
+class TestFilterCache:
+    def test_hits_and_misses(self):
+        cache = FilterCache()
+        calls = []
+
+        def validate(filters):
+            calls.append(filters)
+            return {"x": filters["x"]}
+
+        for _ in range(3):
+            assert cache.validate(object, {"x": 1}, validate) == {"x": 1}
+        assert len(calls) == 1
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_returns_a_fresh_dict(self):
+        cache = FilterCache()
+        cache.validate(object, {"x": 1}, dict)
+        cache.validate(object, {"x": 1}, dict)["x"] = 2
+        assert cache.validate(object, {"x": 1}, dict) == {"x": 1}
+
+    def test_evicts_least_recently_used(self):
+        cache = FilterCache(maxsize=2)
+        cache.validate(object, {"x": 1}, dict)
+        cache.validate(object, {"x": 2}, dict)
+        cache.validate(object, {"x": 1}, dict)
+        cache.validate(object, {"x": 3}, dict)
+        assert len(cache) == 2
+        cache.validate(object, {"x": 2}, dict)
+        assert cache.misses == 4
+
+    def test_disabled(self):
+        cache = FilterCache(maxsize=0)
+        cache.validate(object, {"x": 1}, dict)
+        cache.validate(object, {"x": 1}, dict)
+        assert len(cache) == 0
+        assert cache.hits == 0
+
+    def test_uncacheable_filters_are_validated(self):
+        cache = FilterCache()
+        assert cache.validate(object, {"x": [set()]}, dict) == {"x": [set()]}
+        assert len(cache) == 0
+
+
+class TestResourceValidation:
+    def test_sync_repeated_queries_hit(self):
+        cl = CourtListener(api_token="tok")
+        for _ in range(3):
+            filters = cl.search.validate_filters(
+                {"type": "o", "court": "scotus", "filed_after": "3 days ago"}
+            )
+        # Relative dates are resolved by the API, not during validation.
+        assert filters["filed_after"] == "3 days ago"
+        assert (filter_cache.hits, filter_cache.misses) == (2, 1)
+
+    def test_async_and_sync_share_entries_per_model(self):
+        sync = CourtListener(api_token="tok").opinions
+        async_ = AsyncCourtListener(api_token="tok").opinions
+        assert sync.validate_filters({"id": 1}) == async_.validate_filters(
+            {"id": 1}
+        )
+        assert filter_cache.hits == 1
+        CourtListener(api_token="tok").clusters.validate_filters({"id": 1})
+        assert filter_cache.misses == 2
+
+    def test_invalid_filters_are_not_cached(self):
+        cl = CourtListener(api_token="tok")
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                cl.dockets.validate_filters({"nope": 1})
+        assert len(filter_cache) == 0
+        assert filter_cache.misses == 2
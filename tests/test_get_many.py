@@ -0,0 +1,158 @@
+"""Tests for get_many on the async and sync resources."""
+
+import asyncio
+from typing import Annotated, ClassVar
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from pydantic import AfterValidator, BeforeValidator, Field
+
+from courtlistener import AsyncCourtListener, CourtListener
+from courtlistener.async_client.resource import AsyncResource
+from courtlistener.exceptions import CourtListenerAPIError
+from courtlistener.models import Endpoint
+from courtlistener.sync_client.resource import Resource
+from courtlistener.utils import (
+    comma_separated_post_validator,
+    in_post_validator,
+    in_pre_validator,
+    supports_in_lookup,
+    try_coerce_ints,
+)
+
+
+class IdInEndpoint(Endpoint):
+    """An endpoint whose ``id`` filter accepts ``in`` lookups."""
+
+    endpoint: ClassVar[str] = "/things/"
+    endpoint_id: ClassVar[str] = "things"
+    endpoint_name: ClassVar[str] = "Things"
+
+    id: Annotated[
+        None | int | list[int],
+        Field(None),
+        AfterValidator(in_post_validator),
+        BeforeValidator(try_coerce_ints),
+        BeforeValidator(in_pre_validator),
+    ]
+    fields: Annotated[
+        None | str | list[str],
+        Field(None),
+        AfterValidator(comma_separated_post_validator),
+    ]
+
+
+def _api_error(status_code):
+    response = httpx.Response(status_code, json={"detail": "error"})
+    return CourtListenerAPIError(status_code, {"detail": "error"}, response)
+
+
+def _page(results, next=None):
+    return {
+        "count": len(results),
+        "next": next,
+        "previous": None,
+        "results": results,
+    }
+
+
+def _single_gets(existing):
+    def request(method, path, params=None):
+        id = int(path.rstrip("/").rsplit("/", 1)[1])
+        if id not in existing:
+            raise _api_error(404)
+        return {"id": id}
+
+    return request
+
+
+def _id_in_queries(existing, calls):
+    def request(method, path, params=None):
+        calls.append(params)
+        ids = [int(id) for id in params["id__in"].split(",")]
+        return _page([{"id": id} for id in ids if id in existing])
+
+    return request
+
+
+def test_supports_in_lookup():
+    from courtlistener.models.endpoints.dockets import DocketsEndpoint
+
+    assert supports_in_lookup(IdInEndpoint, "id")
+    assert supports_in_lookup(DocketsEndpoint, "source")
+    assert not supports_in_lookup(DocketsEndpoint, "id")
+    assert not supports_in_lookup(DocketsEndpoint, "nope")
+
+
+class TestAsyncGetMany:
+    @pytest.mark.asyncio
+    async def test_falls_back_to_single_gets(self):
+        cl = AsyncCourtListener(api_token="tok")
+        cl._request = AsyncMock(side_effect=_single_gets({1, 3}))
+        found, missing = await cl.dockets.get_many([1, 2, 3, 1.0])
+        assert found == {1: {"id": 1}, 3: {"id": 3}}
+        assert missing == [2]
+        assert cl._request.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_single_gets_are_bounded(self):
+        active = 0
+        peak = 0
+
+        async def request(method, path, params=None):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {"id": int(path.rstrip("/").rsplit("/", 1)[1])}
+
+        cl = AsyncCourtListener(api_token="tok")
+        cl._request = request
+        found, _ = await cl.dockets.get_many(range(10), concurrency=3)
+        assert len(found) == 10
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_other_errors_propagate(self):
+        cl = AsyncCourtListener(api_token="tok")
+        cl._request = AsyncMock(side_effect=_api_error(500))
+        with pytest.raises(CourtListenerAPIError):
+            await cl.dockets.get_many([1, 2])
+
+    @pytest.mark.asyncio
+    async def test_chunks_into_id_in_queries(self):
+        calls = []
+        cl = AsyncCourtListener(api_token="tok")
+        cl._request = AsyncMock(
+            side_effect=_id_in_queries(set(range(0, 250, 2)), calls)
+        )
+        resource = AsyncResource(cl, IdInEndpoint)
+        found, missing = await resource.get_many(
+            range(250), fields=["name"], chunk_size=100
+        )
+        assert len(calls) == 3
+        assert calls[0]["id__in"] == ",".join(str(i) for i in range(100))
+        assert calls[0]["fields"] == "name,id"
+        assert sorted(found) == list(range(0, 250, 2))
+        assert missing == list(range(1, 250, 2))
+
+
+class TestSyncGetMany:
+    def test_falls_back_to_single_gets(self):
+        cl = CourtListener(api_token="tok")
+        cl._request = MagicMock(side_effect=_single_gets({1, 3}))
+        found, missing = cl.dockets.get_many([1, 2, 3])
+        assert found == {1: {"id": 1}, 3: {"id": 3}}
+        assert missing == [2]
+
+    def test_chunks_into_id_in_queries(self):
+        calls = []
+        cl = CourtListener(api_token="tok")
+        cl._request = MagicMock(side_effect=_id_in_queries({5, 7}, calls))
+        resource = Resource(cl, IdInEndpoint)
+        found, missing = resource.get_many([5, 6, 7], chunk_size=2)
+        assert len(calls) == 2
+        assert found == {5: {"id": 5}, 7: {"id": 7}}
+        assert missing == [6]
@@ -24,7 +24,11 @@ from jsonschema import Draft202012Validator
 from courtlistener.mcp.tools import MCP_TOOLS
 from courtlistener.mcp.tools.utils import endpoint_id_choices
 from courtlistener.models import ENDPOINTS
-from courtlistener.utils import did_you_mean, validate_model_fields
+from courtlistener.utils import (
+    did_you_mean,
+    get_choices,
+    validate_model_fields,
+)
 
 ENDPOINT_ID_TOOLS = [
     "get_endpoint_schema",
@@ -190,7 +194,7 @@ def _field_choices(endpoint_id: str) -> list[str]:
     Distinct from ``model_fields``, which holds the filter parameters.
     """
     extra = ENDPOINTS[endpoint_id].model_fields["fields"].json_schema_extra
-    return [choice["value"] for choice in extra["choices"]]
+    return [choice["value"] for choice in get_choices(extra)]
 
 
 class TestDidYouMean:
@@ -260,3 +264,46 @@ class TestFieldsNormalization:
         MCP_TOOLS["search"].validate_arguments(
             {"type": "o", "q": "test", "fields": "caseName,dateFiled"}
         )
+
+
+class TestToolListCaching:
+    def test_tool_is_built_once(self, monkeypatch):
+        tool = MCP_TOOLS["get_counts"]
+        first = tool.tool
+        monkeypatch.setattr(
+            type(tool),
+            "get_input_schema",
+            lambda self: pytest.fail("schema rebuilt for tools/list"),
+        )
+        assert tool.tool is first
+        assert first.parameters == tool.input_schema
+
+    def test_list_tools_reuses_definitions(self, monkeypatch):
+        from courtlistener.mcp import tools
+
+        subset = {
+            name: MCP_TOOLS[name]
+            for name in ("get_counts", "get_more_results")
+        }
+        monkeypatch.setattr(tools, "MCP_TOOLS", subset)
+        first = tools.list_tools()
+        assert [t.name for t in first] == list(subset)
+        assert all(a is b for a, b in zip(first, tools.list_tools()))
+
+    def test_warm_up_survives_a_failing_tool(self, monkeypatch, caplog):
+        from courtlistener.mcp import tools
+
+        class BrokenTool(type(MCP_TOOLS["get_counts"])):
+            name = "broken"
+
+            def get_input_schema(self):
+                raise RuntimeError("no schema")
+
+        good = type(MCP_TOOLS["get_counts"])()
+        monkeypatch.setattr(
+            tools, "MCP_TOOLS", {"broken": BrokenTool(), "get_counts": good}
+        )
+        tools.warm_up_tools()
+        assert "tool" in good.__dict__
+        assert "input_validator" in good.__dict__
+        assert "Couldn't warm up tool broken" in caplog.text
@@ -0,0 +1,114 @@
+"""Tests for running eyecite off the event loop in the MCP server."""
+
+import asyncio
+import subprocess
+import sys
+import time
+from concurrent.futures import BrokenExecutor, Executor, Future
+from unittest.mock import patch
+
+import pytest
+
+from courtlistener.mcp import settings
+from courtlistener.mcp.exceptions import ExtractionTimeoutError, before_send
+from courtlistener.mcp.extraction import (
+    extract_and_resolve,
+    get_extraction_executor,
+    set_extraction_executor,
+)
+
+pytest.importorskip("eyecite")
+
+run = asyncio.run
+
+TEXT = (
+    "See Brown v. Board, 347 U.S. 483, 495 (1954); id. at 496. "
+    "Obergefell v. Hodges, 576 U.S. 644 (2015)."
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_pool():
+    set_extraction_executor(None)
+    yield
+    executor = get_extraction_executor()
+    if executor is not None:
+        executor.shutdown()
+    set_extraction_executor(None)
+
+
+def _extract(executor, monkeypatch, **kwargs):
+    monkeypatch.setattr(settings, "EXTRACTION_EXECUTOR", executor)
+    monkeypatch.setattr(settings, "EXTRACTION_WORKERS", 1)
+    return run(extract_and_resolve(TEXT, tool_name="test", **kwargs))
+
+
+class BrokenPool(Executor):
+    def submit(self, fn, /, *args, **kwargs):
+        future: Future = Future()
+        future.set_exception(BrokenExecutor("worker died"))
+        return future
+
+
+class TestExtractAndResolve:
+    @pytest.mark.parametrize("executor", ["inline", "thread", "process"])
+    def test_every_executor_resolves_the_same(self, executor, monkeypatch):
+        cites, resolutions = _extract(executor, monkeypatch)
+        assert [c.matched_text() for c in cites] == [
+            "347 U.S. 483",
+            "id.",
+            "576 U.S. 644",
+        ]
+        # Resolutions refer to the very citation objects returned.
+        resolved = [c for group in resolutions.values() for c in group]
+        assert {id(c) for c in resolved} == {id(c) for c in cites}
+
+    def test_resolve_false_skips_resolution(self, monkeypatch):
+        cites, resolutions = _extract("thread", monkeypatch, resolve=False)
+        assert len(cites) == 3
+        assert resolutions is None
+
+    def test_rejects_unknown_executor(self, monkeypatch):
+        with pytest.raises(ValueError, match="MCP_EXTRACTION_EXECUTOR"):
+            _extract("fork", monkeypatch)
+
+    def test_timeout_raises_tool_error(self, monkeypatch):
+        monkeypatch.setattr(settings, "EXTRACTION_TIMEOUT_SECONDS", 0.01)
+
+        def slow(text, resolve):
+            time.sleep(0.2)
+
+        with (
+            patch("courtlistener.mcp.extraction.extract_citations", slow),
+            pytest.raises(ExtractionTimeoutError, match="0.01 seconds"),
+        ):
+            _extract("thread", monkeypatch)
+
+    def test_broken_pool_is_replaced(self, monkeypatch):
+        broken = BrokenPool()
+        set_extraction_executor(broken)
+        with pytest.raises(BrokenExecutor):
+            _extract("thread", monkeypatch)
+        assert get_extraction_executor() is not broken
+
+    def test_workers_do_not_import_the_server(self):
+        # What a spawned worker imports to unpickle its job.
+        code = (
+            "import sys, courtlistener.mcp.eyecite_worker; "
+            "print('fastmcp' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "False"
+
+
+class TestTimeoutFingerprint:
+    def test_before_send_sets_fingerprint_and_tags(self):
+        exc = ExtractionTimeoutError("slow", tool_name="analyze_citations")
+        event = before_send({}, {"exc_info": (type(exc), exc, None)})
+        assert event["fingerprint"] == ["citation-extraction-timeout"]
+        assert event["tags"] == {"tool": "analyze_citations"}
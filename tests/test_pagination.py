@@ -4,11 +4,14 @@ The unit classes mirror tests/test_async_pagination.py one-for-one; keep
 the two in step so a generated sync client stays covered.
 """
 
+import gc
+import time
 import warnings
 from contextlib import contextmanager
 from unittest.mock import MagicMock
 
 import pytest
+from pydantic import ValidationError
 
 from courtlistener import CourtListener
 from courtlistener.sync_client.resource import ResourceIterator
@@ -32,10 +35,29 @@ def _page(results, next=None, previous=None, count=None):
     }
 
 
-def _iterator(pages) -> ResourceIterator:
+def _iterator(pages, prefetch=0) -> ResourceIterator:
     cl = CourtListener(api_token="tok")
     cl._request = MagicMock(side_effect=pages)
-    return cl.courts.list()
+    return cl.courts.list(prefetch=prefetch)
+
+
+def _chain(num_pages, per_page=2):
+    """Pages linked by distinct next cursors, ids numbered from 0."""
+    return [
+        _page(
+            [{"id": n * per_page + i} for i in range(per_page)],
+            next=f"{NEXT_URL}{n + 1}" if n + 1 < num_pages else None,
+        )
+        for n in range(num_pages)
+    ]
+
+
+def _settle(mock, expected_calls):
+    """Wait for background prefetch threads to make *expected_calls*."""
+    deadline = time.monotonic() + 2
+    while mock.call_count < expected_calls and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
 
 
 @pytest.mark.integration
@@ -161,6 +183,57 @@ class TestIteration:
         assert [item["id"] for item in it] == [3]
 
 
+class TestPrefetch:
+    def test_yields_every_result_in_order(self):
+        it = _iterator(_chain(5), prefetch=2)
+        assert [item["id"] for item in it] == list(range(10))
+        assert it._client._request.call_count == 5
+
+    def test_fetches_ahead_while_page_is_consumed(self):
+        it = _iterator(_chain(5), prefetch=2)
+        for _ in it:
+            break
+        _settle(it._client._request, 3)
+        # The first page plus two prefetched ones; the buffer is full.
+        assert it._client._request.call_count == 3
+
+    def test_resumed_iteration_uses_buffered_pages(self):
+        it = _iterator(_chain(3), prefetch=2)
+        collected = []
+        for item in it:
+            collected.append(item["id"])
+            if len(collected) == 3:
+                break
+        collected.extend(item["id"] for item in it)
+        assert collected == list(range(6))
+        assert it._client._request.call_count == 3
+
+    def test_fetch_error_surfaces_at_that_page(self):
+        pages = _chain(3)
+        pages[1] = RuntimeError("boom")
+        it = _iterator(pages, prefetch=2)
+        collected = []
+        with pytest.raises(RuntimeError, match="boom"):
+            for item in it:
+                collected.append(item["id"])
+        assert collected == [0, 1]
+
+    def test_dropping_the_iterator_stops_the_thread(self):
+        it = _iterator(_chain(5), prefetch=1)
+        for _ in it:
+            break
+        thread = it._prefetcher._thread
+        del it
+        gc.collect()
+        thread.join(timeout=2)
+        assert not thread.is_alive()
+
+    def test_negative_prefetch_rejected(self):
+        cl = CourtListener(api_token="tok")
+        with pytest.raises(ValueError, match="prefetch"):
+            cl.courts.list(prefetch=-1)
+
+
 class TestCount:
     def test_integer_count(self):
         it = _iterator([_page([{"id": 1}], count=42)])
@@ -196,7 +269,7 @@ class TestDumpLoad:
     def test_round_trip_uses_cached_page(self):
         it = _iterator([_page([{"id": 1}], count=7)])
         it.get_count()
-        state = it.dump()
+        state = it.dump(include_page=True)
 
         restored_client = CourtListener(api_token="tok")
         restored_client._request = MagicMock()
@@ -216,6 +289,30 @@ class TestDumpLoad:
         state = it.dump()
         assert state["page_result_index"] == 1
 
+    def test_compact_dump_refetches_current_page(self):
+        pages = _chain(3)
+        it = _iterator(pages)
+        it.next()
+        state = it.dump()
+        assert "current_page" not in state
+
+        restored_client = CourtListener(api_token="tok")
+        restored_client._request = MagicMock(side_effect=pages[1:])
+        restored = ResourceIterator.load(restored_client, state)
+        assert list(restored) == [{"id": i} for i in range(2, 6)]
+
+    def test_fetched_pages_are_not_revalidated(self):
+        page = _page([{"id": 1}])
+        it = _iterator([page])
+        assert it.get_current_page().results is page["results"]
+
+    def test_load_validates_dumped_page(self):
+        it = _iterator([_page([{"id": 1}])])
+        state = it.dump(include_page=True)
+        state["current_page"]["results"] = ["not a result"]
+        with pytest.raises(ValidationError):
+            ResourceIterator.load(CourtListener(api_token="t"), state)
+
 
 class TestDeprecatedProperties:
     """The property accessors are backwards-compat shims for the
@@ -0,0 +1,71 @@
+"""Tests for sizing choice lists in MCP tool schemas."""
+
+import pytest
+
+from courtlistener.mcp.tools import utils
+from courtlistener.mcp.tools.utils import prepare_choices_str
+
+
+def _choices(n, name="Choice"):
+    return [
+        {"value": f"v{i}", "display_name": f"{name} {i}"} for i in range(n)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def token_counts(monkeypatch):
+    """Counts tokenizer calls; every word is a token."""
+    calls = []
+
+    def count_tokens(text):
+        calls.append(text)
+        return len(text.split())
+
+    monkeypatch.setattr(utils, "count_tokens", count_tokens)
+    monkeypatch.setattr(utils, "_choice_token_counts", {})
+    return calls
+
+
+class TestPrepareChoicesStr:
+    def test_small_list_skips_tokenizer(self, token_counts):
+        result = prepare_choices_str(_choices(3), "courts", "jurisdiction")
+        assert result.startswith("Valid choices:")
+        assert token_counts == []
+
+    def test_huge_list_skips_tokenizer(self, token_counts):
+        result = prepare_choices_str(_choices(2000), "search", "court")
+        assert result.startswith("This field has 2000 valid choices.")
+        assert 'field_name="court"' in result
+        assert token_counts == []
+
+    def test_middle_list_is_counted_once_per_field(self, token_counts):
+        choices = _choices(60)
+        first = prepare_choices_str(choices, "courts", "fields")
+        assert prepare_choices_str(choices, "courts", "fields") == first
+        assert len(token_counts) == 1
+        prepare_choices_str(choices, "dockets", "fields")
+        assert len(token_counts) == 2
+
+    def test_unkeyed_lists_are_not_memoized(self, token_counts):
+        choices = _choices(60)
+        prepare_choices_str(choices)
+        prepare_choices_str(choices)
+        assert len(token_counts) == 2
+
+    def test_estimate_can_be_turned_off(self, token_counts):
+        prepare_choices_str(_choices(3), "courts", "x", estimate=False)
+        assert len(token_counts) == 1
+
+
+def test_encoding_is_loaded_once(monkeypatch):
+    loads = []
+    monkeypatch.setattr(
+        utils.tiktoken, "get_encoding", lambda name: loads.append(name)
+    )
+    utils.get_encoding.cache_clear()
+    try:
+        utils.get_encoding()
+        utils.get_encoding()
+    finally:
+        utils.get_encoding.cache_clear()
+    assert loads == ["cl100k_base"]
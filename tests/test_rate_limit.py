@@ -0,0 +1,252 @@
+"""Tests for the token-bucket RateLimiter and the MCP per-user limiter."""
+
+import threading
+from collections import OrderedDict
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from courtlistener import AsyncCourtListener, CourtListener, RateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch("courtlistener.rate_limit.time.monotonic", fake):
+        yield fake
+
+
+class TestRateLimiter:
+    def test_burst_is_free(self, clock):
+        limiter = RateLimiter(2, per=1.0, burst=3)
+        assert [limiter.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    def test_waits_are_queued_in_order(self, clock):
+        limiter = RateLimiter(2, per=1.0, burst=1)
+        assert limiter.reserve() == 0.0
+        assert limiter.reserve() == pytest.approx(0.5)
+        assert limiter.reserve() == pytest.approx(1.0)
+
+    def test_refills_over_time(self, clock):
+        limiter = RateLimiter(60, per=60, burst=1)
+        assert limiter.reserve() == 0.0
+        clock.now += 1.0
+        assert limiter.reserve() == 0.0
+
+    def test_refill_is_capped_at_burst(self, clock):
+        limiter = RateLimiter(10, per=1.0, burst=2)
+        clock.now += 3600
+        assert [limiter.reserve() for _ in range(2)] == [0.0, 0.0]
+        assert limiter.reserve() > 0
+
+    def test_burst_defaults_to_rate(self, clock):
+        assert RateLimiter(5000, per=3600).burst == 5000
+
+    def test_rejects_invalid_rates(self):
+        with pytest.raises(ValueError):
+            RateLimiter(0)
+        with pytest.raises(ValueError):
+            RateLimiter(1, burst=0)
+
+    def test_thread_safe_reservations(self, clock):
+        limiter = RateLimiter(1, per=1.0, burst=1)
+        delays = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(50):
+                delay = limiter.reserve()
+                with lock:
+                    delays.append(delay)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # Every reservation got its own slot: 0, 1, 2, ... 399 seconds.
+        assert sorted(delays) == [float(i) for i in range(400)]
+
+    def test_acquire_sleeps_for_reservation(self, clock):
+        limiter = RateLimiter(1, per=1.0, burst=1)
+        with patch("courtlistener.rate_limit.time.sleep") as mock_sleep:
+            limiter.acquire()
+            limiter.acquire()
+        mock_sleep.assert_called_once_with(1.0)
+
+    @pytest.mark.asyncio
+    async def test_aacquire_sleeps_for_reservation(self, clock):
+        limiter = RateLimiter(1, per=1.0, burst=1)
+        with patch(
+            "courtlistener.rate_limit.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            await limiter.aacquire()
+            await limiter.aacquire()
+        mock_sleep.assert_awaited_once_with(1.0)
+
+
+def _ok_transport():
+    return httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+
+
+class TestClientsUseLimiter:
+    @pytest.mark.asyncio
+    async def test_async_client_acquires_before_each_request(self):
+        limiter = MagicMock(spec=RateLimiter)
+        async with (
+            AsyncCourtListener(
+                api_token="a", transport=_ok_transport(), rate_limiter=limiter
+            ) as a,
+            AsyncCourtListener(
+                api_token="b", transport=_ok_transport(), rate_limiter=limiter
+            ) as b,
+        ):
+            await a._request("GET", "/courts/")
+            await b._request("GET", "/courts/")
+        assert limiter.aacquire.await_count == 2
+
+    def test_sync_client_acquires_before_each_request(self):
+        limiter = MagicMock(spec=RateLimiter)
+        with CourtListener(
+            api_token="a", transport=_ok_transport(), rate_limiter=limiter
+        ) as cl:
+            cl._request("GET", "/courts/")
+        limiter.acquire.assert_called_once_with()
+
+
+class TestMCPRateLimiter:
+    """Per-user limiters handed to MCP tool clients."""
+
+    @pytest.fixture(autouse=True)
+    def _mcp(self, monkeypatch):
+        from courtlistener.mcp import rate_limit, settings
+        from courtlistener.mcp.session import set_session
+
+        monkeypatch.setattr(settings, "RATE_LIMIT_PER_MINUTE", 120.0)
+        monkeypatch.setattr(settings, "RATE_LIMIT_BURST", None)
+        monkeypatch.setattr(rate_limit, "_limiters", OrderedDict())
+        set_session(None)
+        yield rate_limit
+        set_session(None)
+
+    def test_disabled_by_default(self, _mcp, monkeypatch):
+        from courtlistener.mcp import settings
+
+        monkeypatch.setattr(settings, "RATE_LIMIT_PER_MINUTE", 0.0)
+        client = AsyncCourtListener(api_token="tok")
+        assert _mcp.get_rate_limiter(client) is None
+
+    def test_in_memory_limiter_is_shared_per_user(self, _mcp):
+        from courtlistener.mcp.session import InMemorySession, set_session
+
+        set_session(InMemorySession())
+        first = _mcp.get_rate_limiter(AsyncCourtListener(api_token="tok"))
+        again = _mcp.get_rate_limiter(AsyncCourtListener(api_token="tok"))
+        other = _mcp.get_rate_limiter(AsyncCourtListener(api_token="tok2"))
+        assert first is again
+        assert first is not other
+        assert first.rate == pytest.approx(2.0)
+
+    def test_least_recently_active_users_are_dropped(self, _mcp, monkeypatch):
+        from courtlistener.mcp import settings
+        from courtlistener.mcp.session import (
+            InMemorySession,
+            hmac_hex,
+            set_session,
+        )
+
+        monkeypatch.setattr(settings, "RATE_LIMIT_MAX_USERS", 2)
+        set_session(InMemorySession())
+        for token in ("a", "b", "a", "c"):
+            _mcp.get_rate_limiter(AsyncCourtListener(api_token=token))
+        assert list(_mcp._limiters) == [
+            f"mcp:ratelimit:{hmac_hex('a')}",
+            f"mcp:ratelimit:{hmac_hex('c')}",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_redis_limiter_sleeps_for_the_scripted_delay(self, _mcp):
+        from courtlistener.mcp.session import (
+            RedisSession,
+            hmac_hex,
+            set_session,
+        )
+
+        session = RedisSession("redis://localhost:6379")
+        session._client = MagicMock()
+        script = session._client.register_script.return_value = AsyncMock(
+            return_value="0.25"
+        )
+        set_session(session)
+
+        limiter = _mcp.get_rate_limiter(AsyncCourtListener(api_token="tok"))
+        assert isinstance(limiter, _mcp.RedisRateLimiter)
+        with patch(
+            "courtlistener.mcp.rate_limit.asyncio.sleep",
+            new_callable=AsyncMock,
+        ) as mock_sleep:
+            await limiter.aacquire()
+        mock_sleep.assert_awaited_once_with(0.25)
+        assert script.await_args.kwargs["keys"] == [
+            f"mcp:ratelimit:{hmac_hex('tok')}"
+        ]
+        # Later requests reuse the limiter and its registered script.
+        again = _mcp.get_rate_limiter(AsyncCourtListener(api_token="tok"))
+        assert again is limiter
+        session._client.register_script.assert_called_once()
+
+    def test_redis_limiter_behind_the_local_session_cache(
+        self, _mcp, monkeypatch
+    ):
+        from courtlistener.mcp import settings
+        from courtlistener.mcp.session import TieredSession, get_session
+
+        monkeypatch.setattr(settings, "REDIS_URL", "redis://localhost:6379")
+        monkeypatch.setattr(settings, "SESSION_L1_TTL_SECONDS", 5.0)
+        assert isinstance(get_session(), TieredSession)
+        limiter = _mcp.get_rate_limiter(AsyncCourtListener(api_token="tok"))
+        assert isinstance(limiter, _mcp.RedisRateLimiter)
+
+    @pytest.mark.asyncio
+    async def test_redis_outage_does_not_throttle(self, _mcp):
+        from redis.exceptions import ConnectionError as RedisConnectionError
+
+        from courtlistener.mcp.session import RedisSession
+
+        session = RedisSession("redis://localhost:6379")
+        session._client = MagicMock()
+        session._client.register_script.return_value = AsyncMock(
+            side_effect=RedisConnectionError()
+        )
+        limiter = _mcp.RedisRateLimiter(session, "k", 1)
+        with patch(
+            "courtlistener.mcp.rate_limit.asyncio.sleep",
+            new_callable=AsyncMock,
+        ) as mock_sleep:
+            await limiter.aacquire()
+        mock_sleep.assert_not_awaited()
+
+    def test_redis_limiter_acquires_through_the_sync_client(self, _mcp):
+        from courtlistener.mcp.session import RedisSession
+
+        session = RedisSession("redis://localhost:6379")
+        session._client = MagicMock()
+        session._sync_client = MagicMock()
+        script = session._sync_client.register_script.return_value
+        script.return_value = "0.5"
+        limiter = _mcp.RedisRateLimiter(session, "k", 1)
+        with patch("courtlistener.rate_limit.time.sleep") as mock_sleep:
+            limiter.acquire()
+            limiter.acquire()
+        mock_sleep.assert_called_with(0.5)
+        assert script.call_args.kwargs["keys"] == ["k"]
+        session._sync_client.register_script.assert_called_once()
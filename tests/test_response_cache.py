@@ -0,0 +1,240 @@
+"""Tests for the revalidating response cache and its backends."""
+
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from courtlistener import AsyncCourtListener, CourtListener
+from courtlistener.cache import (
+    CachedResponse,
+    MemoryCache,
+    RedisCache,
+    SQLiteCache,
+    cache_key,
+)
+
+ETAG = '"v1"'
+BODY = {"id": 1, "name": "Supreme Court"}
+
+
+def _conditional_transport(seen, etag=ETAG, headers=None):
+    """Serves BODY with an ETag, and 304s a matching If-None-Match."""
+
+    def handler(request):
+        seen.append(request)
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(
+            200, json=BODY, headers={"ETag": etag, **(headers or {})}
+        )
+
+    return httpx.MockTransport(handler)
+
+
+class TestCachedResponse:
+    def test_needs_a_validator(self):
+        plain = httpx.Response(200, json=BODY)
+        assert CachedResponse.from_response(plain) is None
+
+    def test_no_store_is_respected(self):
+        response = httpx.Response(
+            200, json=BODY, headers={"ETag": ETAG, "Cache-Control": "no-store"}
+        )
+        assert CachedResponse.from_response(response) is None
+
+    def test_conditional_headers(self):
+        entry = CachedResponse(b"{}", ETAG, "Wed, 21 Oct 2015 07:28:00 GMT")
+        assert entry.conditional_headers() == {
+            "If-None-Match": ETAG,
+            "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+        }
+
+    def test_key_is_scoped_by_credential(self):
+        url = "https://example.com/api/rest/v4/courts/scotus/"
+        assert cache_key("Token a", url) != cache_key("Token b", url)
+        assert cache_key("Token a", url) == cache_key("Token a", url)
+
+
+class TestMemoryCache:
+    def test_evicts_least_recently_used_over_byte_cap(self):
+        cache = MemoryCache(max_bytes=30)
+        cache.set("a", CachedResponse(b"x" * 10, ETAG))
+        cache.set("b", CachedResponse(b"x" * 10, ETAG))
+        cache.get("a")
+        cache.set("c", CachedResponse(b"x" * 10, ETAG))
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.size <= 30
+
+    def test_oversized_entry_is_not_stored(self):
+        cache = MemoryCache(max_bytes=5)
+        cache.set("a", CachedResponse(b"x" * 10, ETAG))
+        assert len(cache) == 0
+        assert cache.size == 0
+
+    def test_replacing_an_entry_updates_size(self):
+        cache = MemoryCache()
+        cache.set("a", CachedResponse(b"x" * 10))
+        cache.set("a", CachedResponse(b"x" * 3))
+        assert cache.size == 3
+
+
+class TestSQLiteCache:
+    def test_round_trip_survives_reopen(self, tmp_path):
+        path = tmp_path / "responses.sqlite3"
+        cache = SQLiteCache(path)
+        cache.set("a", CachedResponse(b"{}", ETAG, None))
+        cache.close()
+        entry = SQLiteCache(path).get("a")
+        assert entry.body == b"{}"
+        assert entry.etag == ETAG
+        assert entry.last_modified is None
+
+    @pytest.mark.asyncio
+    async def test_async_methods(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "responses.sqlite3")
+        await cache.aset("a", CachedResponse(b"{}", ETAG))
+        assert (await cache.aget("a")).etag == ETAG
+        cache.clear()
+        assert await cache.aget("a") is None
+
+
+class TestRedisCache:
+    def test_round_trip(self):
+        cache = RedisCache("redis://localhost:6379", ttl=60)
+        cache._client = MagicMock()
+        cache._client.hgetall.return_value = {b"body": b"{}", b"etag": b"e"}
+        entry = cache.get("k")
+        assert (entry.body, entry.etag, entry.last_modified) == (
+            b"{}",
+            "e",
+            None,
+        )
+        cache._client.hgetall.assert_called_once_with(
+            "courtlistener:response:k"
+        )
+        cache.set("k", entry)
+        pipe = cache._client.pipeline.return_value
+        pipe.expire.assert_called_once_with("courtlistener:response:k", 60)
+
+    def test_outage_is_a_miss(self):
+        from redis.exceptions import ConnectionError as RedisConnectionError
+
+        cache = RedisCache("redis://localhost:6379")
+        cache._client = MagicMock()
+        cache._client.hgetall.side_effect = RedisConnectionError()
+        cache._client.pipeline.return_value.execute.side_effect = (
+            RedisConnectionError()
+        )
+        assert cache.get("k") is None
+        cache.set("k", CachedResponse(b"{}", ETAG))
+
+
+class TestClientRevalidation:
+    @pytest.mark.asyncio
+    async def test_async_304_is_served_from_cache(self):
+        seen = []
+        cache = MemoryCache()
+        async with AsyncCourtListener(
+            api_token="tok",
+            transport=_conditional_transport(seen),
+            cache=cache,
+        ) as cl:
+            assert await cl.courts.get("scotus") == BODY
+            assert await cl.courts.get("scotus") == BODY
+        assert "If-None-Match" not in seen[0].headers
+        assert seen[1].headers["If-None-Match"] == ETAG
+        assert len(cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_resource_replaces_entry(self):
+        seen = []
+        cache = MemoryCache()
+        async with AsyncCourtListener(
+            api_token="tok",
+            transport=_conditional_transport(seen),
+            cache=cache,
+        ) as cl:
+            await cl.courts.get("scotus")
+        async with AsyncCourtListener(
+            api_token="tok",
+            transport=_conditional_transport(seen, etag='"v2"'),
+            cache=cache,
+        ) as cl:
+            assert await cl.courts.get("scotus") == BODY
+        (entry,) = cache._entries.values()
+        assert entry.etag == '"v2"'
+
+    @pytest.mark.asyncio
+    async def test_other_credentials_do_not_share_entries(self):
+        seen = []
+        cache = MemoryCache()
+        for token in ("tok-a", "tok-b"):
+            async with AsyncCourtListener(
+                api_token=token,
+                transport=_conditional_transport(seen),
+                cache=cache,
+            ) as cl:
+                await cl.courts.get("scotus")
+        assert all("If-None-Match" not in r.headers for r in seen)
+        assert len(cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_only_gets_are_cached(self):
+        seen = []
+        cache = MemoryCache()
+        async with AsyncCourtListener(
+            api_token="tok",
+            transport=_conditional_transport(seen),
+            cache=cache,
+        ) as cl:
+            await cl._request("POST", "/alerts/", json={})
+        assert len(cache) == 0
+
+    def test_sync_304_is_served_from_cache(self, tmp_path):
+        seen = []
+        cache = SQLiteCache(tmp_path / "responses.sqlite3")
+        with CourtListener(
+            api_token="tok",
+            transport=_conditional_transport(seen),
+            cache=cache,
+        ) as cl:
+            assert cl.courts.get("scotus") == BODY
+            assert cl.courts.get("scotus") == BODY
+        assert seen[1].headers["If-None-Match"] == ETAG
+
+
+class TestMCPResponseCache:
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        from courtlistener.mcp.response_cache import set_response_cache
+
+        set_response_cache(None)
+        yield
+        set_response_cache(None)
+
+    def test_disabled_by_default(self):
+        from courtlistener.mcp.response_cache import get_response_cache
+
+        assert get_response_cache() is None
+
+    def test_in_memory_without_redis(self, monkeypatch):
+        from courtlistener.mcp import settings
+        from courtlistener.mcp.response_cache import get_response_cache
+
+        monkeypatch.setattr(settings, "RESPONSE_CACHE_ENABLED", True)
+        monkeypatch.setattr(settings, "REDIS_URL", None)
+        cache = get_response_cache()
+        assert isinstance(cache, MemoryCache)
+        assert get_response_cache() is cache
+
+    def test_redis_when_configured(self, monkeypatch):
+        from courtlistener.mcp import settings
+        from courtlistener.mcp.response_cache import get_response_cache
+
+        monkeypatch.setattr(settings, "RESPONSE_CACHE_ENABLED", True)
+        monkeypatch.setattr(settings, "REDIS_URL", "redis://localhost:6379")
+        cache = get_response_cache()
+        assert isinstance(cache, RedisCache)
+        assert cache.prefix == "mcp:response:"
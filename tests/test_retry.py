@@ -0,0 +1,223 @@
+"""Tests for RetryPolicy and the retry loop in both clients' _request."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from courtlistener import AsyncCourtListener, CourtListener, RetryPolicy
+from courtlistener.exceptions import CourtListenerAPIError
+from courtlistener.retry import parse_retry_after, server_requested_delay
+
+
+def _response(status_code, json=None, headers=None):
+    return httpx.Response(status_code, json=json, headers=headers)
+
+
+def _wait_until(seconds):
+    target = datetime.now(timezone.utc) + timedelta(seconds=seconds)
+    return {"wait_until": target.isoformat()}
+
+
+def _scripted_transport(outcomes, seen):
+    """A MockTransport that plays back responses or raises errors."""
+    outcomes = list(outcomes)
+
+    def handler(request):
+        seen.append(request.method)
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return httpx.MockTransport(handler)
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after("7") == 7.0
+
+    def test_http_date(self):
+        target = datetime.now(timezone.utc) + timedelta(seconds=30)
+        header = target.strftime("%a, %d %b %Y %H:%M:%S GMT")
+        assert 25 < parse_retry_after(header) <= 30
+
+    def test_garbage_and_missing(self):
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    def test_wait_until_body_fallback(self):
+        response = _response(429, json=_wait_until(10))
+        assert 8 < server_requested_delay(response) <= 10
+
+
+class TestRetryPolicy:
+    def test_gives_up_after_max_retries(self):
+        policy = RetryPolicy(max_retries=2)
+        response = _response(503)
+        assert policy.get_delay("GET", 1, 0.0, response=response) is not None
+        assert policy.get_delay("GET", 2, 0.0, response=response) is None
+
+    def test_backoff_is_jittered_and_capped(self):
+        policy = RetryPolicy(backoff_factor=1.0, max_backoff=4.0)
+        for attempt in range(10):
+            assert 0 <= policy.backoff(attempt) <= min(4.0, 2**attempt)
+
+    def test_throttle_honors_server_delay(self):
+        policy = RetryPolicy()
+        response = _response(429, headers={"Retry-After": "12"})
+        assert policy.get_delay("GET", 0, 0.0, response=response) == 12.0
+
+    def test_delay_beyond_budget_gives_up(self):
+        policy = RetryPolicy(max_total_wait=60.0)
+        response = _response(429, json=_wait_until(3600))
+        assert policy.get_delay("GET", 0, 0.0, response=response) is None
+
+    def test_budget_counts_prior_waits(self):
+        policy = RetryPolicy(max_total_wait=20.0)
+        response = _response(429, headers={"Retry-After": "10"})
+        assert policy.get_delay("GET", 1, 5.0, response=response) == 10.0
+        assert policy.get_delay("GET", 1, 15.0, response=response) is None
+
+    def test_client_errors_are_not_retried(self):
+        policy = RetryPolicy()
+        for status in (400, 401, 403, 404):
+            response = _response(status)
+            assert policy.get_delay("GET", 0, 0.0, response=response) is None
+
+    @pytest.mark.parametrize("method", ["POST", "PATCH"])
+    def test_server_error_not_retried_for_non_idempotent(self, method):
+        policy = RetryPolicy()
+        response = _response(502)
+        assert policy.get_delay(method, 0, 0.0, response=response) is None
+
+    @pytest.mark.parametrize("method", ["POST", "PATCH"])
+    def test_throttle_retried_for_non_idempotent(self, method):
+        """A 429 was rejected unprocessed, so repeating it is safe."""
+        policy = RetryPolicy()
+        response = _response(429, headers={"Retry-After": "1"})
+        assert policy.get_delay(method, 0, 0.0, response=response) == 1.0
+
+    def test_unsent_post_is_retried(self):
+        policy = RetryPolicy()
+        error = httpx.ConnectError("refused")
+        assert policy.get_delay("POST", 0, 0.0, error=error) is not None
+
+    def test_possibly_sent_post_is_not_retried(self):
+        policy = RetryPolicy()
+        error = httpx.ReadTimeout("slow")
+        assert policy.get_delay("POST", 0, 0.0, error=error) is None
+        assert policy.get_delay("GET", 0, 0.0, error=error) is not None
+
+
+class TestAsyncClientRetries:
+    @pytest.mark.asyncio
+    async def test_no_policy_raises_on_first_failure(self):
+        seen = []
+        transport = _scripted_transport([_response(503)], seen)
+        async with AsyncCourtListener(
+            api_token="tok", transport=transport
+        ) as cl:
+            with pytest.raises(CourtListenerAPIError):
+                await cl._request("GET", "/courts/")
+        assert seen == ["GET"]
+
+    @pytest.mark.asyncio
+    async def test_retries_until_success(self):
+        seen = []
+        transport = _scripted_transport(
+            [
+                _response(503),
+                httpx.ConnectError("refused"),
+                _response(429, headers={"Retry-After": "2"}),
+                _response(200, json={"ok": True}),
+            ],
+            seen,
+        )
+        async with AsyncCourtListener(
+            api_token="tok", transport=transport, retry=RetryPolicy()
+        ) as cl:
+            with patch(
+                "courtlistener.async_client.client.asyncio.sleep",
+                new_callable=AsyncMock,
+            ) as mock_sleep:
+                assert await cl._request("GET", "/courts/") == {"ok": True}
+        assert len(seen) == 4
+        assert mock_sleep.await_count == 3
+        assert mock_sleep.await_args_list[-1].args == (2.0,)
+
+    @pytest.mark.asyncio
+    async def test_exhausted_retries_raise_api_error(self):
+        seen = []
+        transport = _scripted_transport([_response(500)] * 3, seen)
+        async with AsyncCourtListener(
+            api_token="tok",
+            transport=transport,
+            retry=RetryPolicy(max_retries=2),
+        ) as cl:
+            with (
+                patch(
+                    "courtlistener.async_client.client.asyncio.sleep",
+                    new_callable=AsyncMock,
+                ),
+                pytest.raises(CourtListenerAPIError) as exc_info,
+            ):
+                await cl._request("GET", "/courts/")
+        assert exc_info.value.status_code == 500
+        assert len(seen) == 3
+
+    @pytest.mark.asyncio
+    async def test_post_server_error_not_retried(self):
+        seen = []
+        transport = _scripted_transport([_response(502)], seen)
+        async with AsyncCourtListener(
+            api_token="tok", transport=transport, retry=RetryPolicy()
+        ) as cl:
+            with pytest.raises(CourtListenerAPIError):
+                await cl._request("POST", "/alerts/", json={})
+        assert seen == ["POST"]
+
+    @pytest.mark.asyncio
+    async def test_exhausted_connection_errors_propagate(self):
+        seen = []
+        transport = _scripted_transport(
+            [httpx.ConnectError("refused")] * 2, seen
+        )
+        async with AsyncCourtListener(
+            api_token="tok",
+            transport=transport,
+            retry=RetryPolicy(max_retries=1),
+        ) as cl:
+            with (
+                patch(
+                    "courtlistener.async_client.client.asyncio.sleep",
+                    new_callable=AsyncMock,
+                ),
+                pytest.raises(httpx.ConnectError),
+            ):
+                await cl._request("GET", "/courts/")
+        assert len(seen) == 2
+
+
+class TestSyncClientRetries:
+    """Smoke test that the generated sync client sleeps with time.sleep."""
+
+    def test_retries_until_success(self):
+        seen = []
+        transport = _scripted_transport(
+            [
+                _response(429, json=_wait_until(1)),
+                _response(200, json={"ok": True}),
+            ],
+            seen,
+        )
+        with (
+            CourtListener(
+                api_token="tok", transport=transport, retry=RetryPolicy()
+            ) as cl,
+            patch("courtlistener.sync_client.client.time.sleep") as mock_sleep,
+        ):
+            assert cl._request("GET", "/courts/") == {"ok": True}
+        assert len(seen) == 2
+        mock_sleep.assert_called_once()
@@ -0,0 +1,74 @@
+"""Tests for the pluggable JSON backend in courtlistener.serialization."""
+
+import importlib
+import json
+from datetime import date, datetime, timezone
+
+import pytest
+
+from courtlistener import serialization
+
+
+def _json_default(obj):
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+
+@pytest.fixture(params=["json", "orjson", "msgspec"])
+def backend(request, monkeypatch):
+    """The serialization module reloaded with each installed backend."""
+    if request.param != "json":
+        pytest.importorskip(request.param)
+    monkeypatch.setenv("COURTLISTENER_JSON_BACKEND", request.param)
+    module = importlib.reload(serialization)
+    yield module
+    monkeypatch.delenv("COURTLISTENER_JSON_BACKEND")
+    importlib.reload(serialization)
+
+
+class TestBackends:
+    def test_selected_backend(self, backend):
+        assert backend.BACKEND in {"json", "orjson", "msgspec"}
+
+    def test_round_trip(self, backend):
+        value = {"id": 1, "name": "Brown v. Board", "tags": [1.5, None, True]}
+        encoded = backend.dumps(value)
+        assert isinstance(encoded, str)
+        assert backend.loads(encoded) == value
+        assert backend.loads(encoded.encode()) == value
+
+    def test_matches_stdlib_output_for_dates(self, backend):
+        value = {
+            "filed": date(2024, 1, 2),
+            "at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        }
+        encoded = backend.dumps(value, default=_json_default)
+        assert json.loads(encoded) == json.loads(
+            json.dumps(value, default=_json_default)
+        )
+
+    def test_non_string_keys_match_stdlib(self, backend):
+        assert backend.loads(backend.dumps({1: "a"})) == {"1": "a"}
+
+    def test_stdlib_only_input_falls_back(self, backend):
+        assert backend.loads('{"x": NaN}')["x"] != 0
+        assert backend.loads(backend.dumps(2**70)) == 2**70
+
+    def test_unserializable_raises_type_error(self, backend):
+        with pytest.raises(TypeError):
+            backend.dumps({"x": object()})
+
+    def test_invalid_json_raises_value_error(self, backend):
+        with pytest.raises(ValueError):
+            backend.loads("{not json")
+
+
+def test_unknown_backend_is_rejected(monkeypatch):
+    monkeypatch.setenv("COURTLISTENER_JSON_BACKEND", "simplejson")
+    try:
+        with pytest.raises(ValueError, match="simplejson"):
+            importlib.reload(serialization)
+    finally:
+        monkeypatch.delenv("COURTLISTENER_JSON_BACKEND")
+        importlib.reload(serialization)
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -20,6 +21,7 @@ from courtlistener.mcp.session import (
     InMemorySession,
     RedisSession,
     Session,
+    TieredSession,
     get_session,
     set_session,
     token_info_key,
@@ -83,6 +85,75 @@ class TestInMemorySession:
         _, expires_at = session._data["key"]
         assert before + 59 < expires_at <= time.monotonic() + 60
 
+    def test_evicts_least_recently_used_past_max_entries(self):
+        session = InMemorySession(max_entries=2)
+        run(session._set("a", "1", 60))
+        run(session._set("b", "2", 60))
+        run(session._get("a"))
+        run(session._set("c", "3", 60))
+        assert list(session._data) == ["a", "c"]
+        assert session.evictions == 1
+
+    def test_evicts_past_max_bytes_and_tracks_size(self):
+        session = InMemorySession(max_bytes=25)
+        run(session._set("a", "x" * 10, 60))
+        run(session._set("b", "x" * 10, 60))
+        assert session.size == 22
+        run(session._set("c", "x" * 10, 60))
+        assert list(session._data) == ["b", "c"]
+        assert session.size == 22
+        run(session._set("b", "x", 60))
+        run(session._delete("c"))
+        assert session.size == 2
+
+    def test_oversized_entry_is_not_stored(self):
+        session = InMemorySession(max_bytes=5)
+        run(session._set("key", "value", 60))
+        assert session._data == {}
+        assert session.size == 0
+
+    def test_counts_hits_and_misses(self):
+        session = InMemorySession()
+        run(session._set("key", "value", 60))
+        run(session._get("key"))
+        run(session._get("nope"))
+        assert session.stats() == {
+            "entries": 1,
+            "size": 8,
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0,
+        }
+
+    def test_sweep_drops_expired_entries(self):
+        import time
+
+        session = InMemorySession()
+        run(session._set("old", "value", 60))
+        run(session._set("new", "value", 60))
+        session._data["old"] = ("value", time.monotonic() - 1)
+        assert session.sweep() == 1
+        assert list(session._data) == ["new"]
+        assert session.size == 8
+
+    def test_background_sweep_runs_on_the_writing_loop(self):
+        import time
+
+        async def scenario():
+            session = InMemorySession(sweep_interval=0.01)
+            await session._set("key", "value", 60)
+            session._data["key"] = ("value", time.monotonic() - 1)
+            await asyncio.sleep(0.05)
+            return session
+
+        session = run(scenario())
+        assert session._data == {}
+        assert session._sweeper.done()
+
+    def test_negative_caps_are_rejected(self):
+        with pytest.raises(ValueError):
+            InMemorySession(max_entries=-1)
+
 
 class TestSessionDomainMethods:
     """Domain methods run against the in-memory backend, exercising the
@@ -295,3 +366,344 @@ class TestBaseSessionIsAbstract:
             run(session._set("k", "v", 1))
         with pytest.raises(NotImplementedError):
             run(session._delete("k"))
+
+
+class TestDocumentCompression:
+    @pytest.fixture(autouse=True)
+    def _settings(self, monkeypatch):
+        from courtlistener.mcp import settings
+        from courtlistener.mcp.documents import DOCUMENT_STATS
+
+        monkeypatch.setattr(settings, "DOCUMENT_COMPRESSION", "zlib")
+        monkeypatch.setattr(settings, "DOCUMENT_COMPRESSION_MIN_BYTES", 100)
+        monkeypatch.setattr(settings, "DOCUMENT_MAX_BYTES", 10_000)
+        DOCUMENT_STATS.reset()
+        yield DOCUMENT_STATS
+        DOCUMENT_STATS.reset()
+
+    def test_large_documents_are_compressed_under_the_same_key(self):
+        session = InMemorySession()
+        text = "<p>The court held that the statute applies.</p>\n" * 100
+        run(session.store_document("opinion", 1, text))
+        raw = run(session._get("mcp:doc:opinion:1"))
+        assert raw.startswith("\x00zlib:")
+        assert len(raw) < len(text) / 5
+        assert run(session.get_document("opinion", 1)) == text
+
+    def test_small_documents_are_stored_as_is(self, _settings):
+        session = InMemorySession()
+        run(session.store_document("opinion", 1, "short"))
+        assert run(session._get("mcp:doc:opinion:1")) == "short"
+        assert _settings.compressed == 0
+
+    def test_uncompressed_entries_still_read(self):
+        session = InMemorySession()
+        text = "x" * 1000
+        run(session._set("mcp:doc:recap_document:7", text, 60))
+        assert run(session.get_document("recap_document", 7)) == text
+
+    def test_oversized_documents_are_not_cached(self, monkeypatch, _settings):
+        from courtlistener.mcp import settings
+
+        monkeypatch.setattr(settings, "DOCUMENT_COMPRESSION", "none")
+        session = InMemorySession()
+        run(session.store_document("opinion", 1, "x" * 20_000))
+        assert run(session.get_document("opinion", 1)) is None
+        assert _settings.too_large == 1
+
+    def test_stats_track_the_compression_ratio(self, _settings):
+        session = InMemorySession()
+        run(session.store_document("opinion", 1, "abc " * 1000))
+        stats = _settings.as_dict()
+        assert stats["stored"] == stats["compressed"] == 1
+        assert stats["text_bytes"] == 4000
+        assert stats["compression_ratio"] > 10
+
+    def test_rejects_unknown_codecs(self, monkeypatch):
+        from courtlistener.mcp import settings
+
+        monkeypatch.setattr(settings, "DOCUMENT_COMPRESSION", "gzip")
+        session = InMemorySession()
+        with pytest.raises(ValueError, match="MCP_DOCUMENT_COMPRESSION"):
+            run(session.store_document("opinion", 1, "x" * 1000))
+
+    def test_long_documents_are_compressed_off_the_event_loop(
+        self, monkeypatch
+    ):
+        from courtlistener.mcp import settings
+
+        monkeypatch.setattr(settings, "DOCUMENT_COMPRESSION_THREAD_CHARS", 500)
+        session = InMemorySession()
+        with patch(
+            "courtlistener.mcp.documents.asyncio.to_thread",
+            side_effect=asyncio.to_thread,
+        ) as to_thread:
+            run(session.store_document("opinion", 1, "short"))
+            to_thread.assert_not_called()
+            run(session.store_document("opinion", 2, "abc " * 1000))
+            to_thread.assert_called_once()
+        assert run(session.get_document("opinion", 2)) == "abc " * 1000
+
+    def test_unreadable_entries_are_misses(self):
+        session = InMemorySession()
+        run(session._set("mcp:doc:opinion:1", "\x00zlib:not-base64!", 60))
+        run(session._set("mcp:doc:opinion:2", "\x00zstd:AAAA", 60))
+        assert run(session.get_document("opinion", 1)) is None
+        assert run(session.get_document("opinion", 2)) is None
+
+
+class TestDocumentSegments:
+    @pytest.fixture(autouse=True)
+    def _settings(self, monkeypatch):
+        from courtlistener.mcp import settings
+
+        monkeypatch.setattr(settings, "DOCUMENT_COMPRESSION", "zlib")
+        monkeypatch.setattr(settings, "DOCUMENT_COMPRESSION_MIN_BYTES", 100)
+        monkeypatch.setattr(settings, "DOCUMENT_SEGMENT_CHARS", 1000)
+
+    TEXT = "".join(f"{n:09d}\n" for n in range(450))  # 4500 chars
+
+    def _spy(self, session):
+        fetched: list[str] = []
+        get_many = session._get_many
+
+        async def spy(keys):
+            fetched.extend(keys)
+            return await get_many(keys)
+
+        session._get_many = spy
+        return fetched
+
+    def test_long_documents_are_split_under_sub_keys(self):
+        session = InMemorySession()
+        run(session.store_document("opinion", 1, self.TEXT))
+        assert run(session._get("mcp:doc:opinion:1")).startswith(
+            "\x00segments:"
+        )
+        assert run(session._get("mcp:doc:opinion:1:4")) is not None
+        assert run(session._get("mcp:doc:opinion:1:5")) is None
+        assert run(session.get_document("opinion", 1)) == self.TEXT
+
+    def test_ranges_fetch_only_covering_segments(self):
+        session = InMemorySession()
+        run(session.store_document("opinion", 1, self.TEXT))
+        fetched = self._spy(session)
+        found = run(
+            session.get_document_ranges(
+                "opinion", 1, [(1900, 2100), (4400, 9000), (5000, 6000)]
+            )
+        )
+        assert found == (
+            4500,
+            [self.TEXT[1900:2100], self.TEXT[4400:], ""],
+        )
+        assert fetched == [f"mcp:doc:opinion:1:{n}" for n in (1, 2, 4)]
+
+    def test_short_documents_need_no_segment_reads(self):
+        session = InMemorySession()
+        run(session.store_document("opinion", 1, "short text"))
+        fetched = self._spy(session)
+        found = run(session.get_document_ranges("opinion", 1, [(0, 5)]))
+        assert found == (10, ["short"])
+        assert fetched == []
+
+    def test_missing_segment_is_a_miss(self):
+        session = InMemorySession()
+        run(session.store_document("opinion", 1, self.TEXT))
+        run(session._delete("mcp:doc:opinion:1:2"))
+        assert run(session.get_document("opinion", 1)) is None
+        found = run(session.get_document_ranges("opinion", 1, [(0, 1000)]))
+        assert found == (4500, [self.TEXT[:1000]])
+
+    def test_size_cap_applies_to_the_whole_document(self, monkeypatch):
+        from courtlistener.mcp import settings
+
+        monkeypatch.setattr(settings, "DOCUMENT_COMPRESSION", "none")
+        monkeypatch.setattr(settings, "DOCUMENT_MAX_BYTES", 4000)
+        session = InMemorySession()
+        run(session.store_document("opinion", 1, self.TEXT))
+        assert session._data == {}
+
+    def test_redis_batches_segment_reads(self):
+        session = RedisSession("redis://example.test:6379")
+        session._client = MagicMock(
+            get=AsyncMock(
+                return_value='\x00segments:{"total_chars": 2500, '
+                '"segment_chars": 1000, "segments": 3}'
+            ),
+            mget=AsyncMock(return_value=["a" * 1000, "b" * 1000]),
+        )
+        found = run(session.get_document_ranges("opinion", 1, [(900, 1100)]))
+        assert found == (2500, ["a" * 100 + "b" * 100])
+        session._client.mget.assert_awaited_once_with(
+            ["mcp:doc:opinion:1:0", "mcp:doc:opinion:1:1"]
+        )
+
+    def test_redis_segment_read_outage_is_a_miss(self):
+        session = RedisSession("redis://example.test:6379")
+        session._client = MagicMock(
+            mget=AsyncMock(side_effect=RedisConnectionError())
+        )
+        assert run(session._get_many(["a", "b"])) == [None, None]
+
+    def test_read_document_chunk_reads_one_segment(self):
+        from courtlistener.mcp.tools.read_document_tool import (
+            ReadDocumentTool,
+        )
+
+        session = InMemorySession()
+        set_session(session)
+        run(session.store_document("recap_document", 7, self.TEXT))
+        fetched = self._spy(session)
+        client = MagicMock()
+        client.__aenter__.return_value = client
+        client.__aexit__.return_value = False
+        tool = ReadDocumentTool()
+        with patch.object(ReadDocumentTool, "get_client", return_value=client):
+            result = run(
+                tool(
+                    {
+                        "recap_document_id": 7,
+                        "chunk_index": [3],
+                        "chunk_size": 500,
+                    },
+                    None,
+                )
+            )
+        assert result["total_chars"] == 4500
+        assert result["total_chunks"] == 9
+        assert result["chunks"] == [
+            {"chunk_index": 3, "text": self.TEXT[1500:2000]}
+        ]
+        assert fetched == ["mcp:doc:recap_document:7:1"]
+        client.recap_documents.get.assert_not_called()
+
+
+class FakePubSub:
+    """Delivers the given messages, then ends the subscription."""
+
+    def __init__(self, messages):
+        self.messages = messages
+        self.closed = False
+
+    async def subscribe(self, channel):
+        self.channel = channel
+
+    async def listen(self):
+        yield {"type": "subscribe", "data": 1}
+        for message in self.messages:
+            yield {"type": "message", "data": message}
+
+    async def aclose(self):
+        self.closed = True
+
+
+class TestTieredSession:
+    def _tiered(self, invalidation=False, value="stored"):
+        backend = RedisSession("redis://example.test:6379")
+        backend._client = MagicMock(
+            get=AsyncMock(return_value=value),
+            set=AsyncMock(),
+            delete=AsyncMock(),
+            mget=AsyncMock(return_value=[value]),
+            publish=AsyncMock(),
+        )
+        return TieredSession(
+            backend, ttl_seconds=5, max_bytes=1024, invalidation=invalidation
+        )
+
+    def test_documents_are_served_locally_after_the_first_read(self):
+        session = self._tiered()
+        assert run(session._get("mcp:doc:opinion:1")) == "stored"
+        assert run(session._get("mcp:doc:opinion:1")) == "stored"
+        session.backend._client.get.assert_awaited_once()
+        assert session.local.hits == 1
+
+    def test_user_state_is_not_cached_without_invalidation(self):
+        session = self._tiered()
+        run(session._get("mcp:hash:query:abc"))
+        run(session._get("mcp:hash:query:abc"))
+        assert session.backend._client.get.await_count == 2
+
+    def test_writes_go_through_to_redis_and_the_local_cache(self):
+        session = self._tiered()
+        run(session._set("mcp:doc:opinion:1", "text", 600))
+        session.backend._client.set.assert_awaited_once_with(
+            "mcp:doc:opinion:1", "text", ex=600
+        )
+        assert run(session._get("mcp:doc:opinion:1")) == "text"
+        session.backend._client.get.assert_not_awaited()
+        _, expires_at = session.local._data["mcp:doc:opinion:1"]
+        assert expires_at - time.monotonic() <= 5
+
+    def test_token_info_is_not_cached_without_invalidation(self):
+        # Another worker may revoke the token at any time.
+        session = self._tiered()
+        key = token_info_key("tok", "oauth")
+        run(session._set(key, "{}", 600))
+        run(session._get(key))
+        assert key not in session.local._data
+        session.backend._client.get.assert_awaited_once_with(key)
+
+    def test_invalidate_token_drops_the_local_copy(self):
+        session = self._tiered(invalidation=True)
+        key = token_info_key("tok", "oauth")
+        run(session._set(key, "{}", 600))
+        run(session.invalidate_token("tok", "oauth"))
+        assert key not in session.local._data
+        session.backend._client.delete.assert_awaited_once_with(key)
+
+    def test_segment_reads_only_fetch_local_misses(self):
+        session = self._tiered()
+        run(session._set("mcp:doc:opinion:1:0", "cached", 60))
+        values = run(
+            session._get_many(["mcp:doc:opinion:1:0", "mcp:doc:opinion:1:1"])
+        )
+        assert values == ["cached", "stored"]
+        session.backend._client.mget.assert_awaited_once_with(
+            ["mcp:doc:opinion:1:1"]
+        )
+
+    def test_invalidation_publishes_writes_and_deletes(self):
+        session = self._tiered(invalidation=True)
+        session.backend._client.pubsub.return_value = FakePubSub([])
+
+        async def scenario():
+            await session._set("mcp:hash:query:abc", "{}", 60)
+            await session._delete("mcp:hash:query:abc")
+
+        run(scenario())
+        published = [
+            json.loads(call.args[1])
+            for call in session.backend._client.publish.await_args_list
+        ]
+        assert published == [
+            [session._id, ["mcp:hash:query:abc"]],
+            [session._id, ["mcp:hash:query:abc"]],
+        ]
+
+    def test_other_workers_writes_drop_the_local_copy(self):
+        session = self._tiered(invalidation=True)
+        own = json.dumps([session._id, ["mcp:hash:query:mine"]])
+        other = json.dumps(["other-worker", ["mcp:hash:query:abc"]])
+        pubsub = FakePubSub([own, other])
+        session.backend._client.pubsub.return_value = pubsub
+
+        async def scenario():
+            await session.local._set("mcp:hash:query:abc", "{}", 60)
+            await session.local._set("mcp:hash:query:mine", "{}", 60)
+            await session._listen()
+
+        run(scenario())
+        assert list(session.local._data) == ["mcp:hash:query:mine"]
+        assert pubsub.closed
+
+    def test_get_session_layers_the_local_cache_when_configured(self):
+        with (
+            patch("courtlistener.mcp.settings.REDIS_URL", "redis://x:1"),
+            patch("courtlistener.mcp.settings.SESSION_L1_TTL_SECONDS", 5),
+        ):
+            session = get_session()
+        assert isinstance(session, TieredSession)
+        assert isinstance(session.backend, RedisSession)
+        assert not session.invalidation
@@ -0,0 +1,205 @@
+"""Tests for range sharding and the list_parallel merge in both clients."""
+
+import asyncio
+import threading
+from datetime import date, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from courtlistener import AsyncCourtListener, CourtListener
+from courtlistener.sharding import split_range_filters
+
+NEXT_URL = "https://www.courtlistener.com/api/rest/v4/clusters/?cursor="
+
+
+class TestSplitRangeFilters:
+    def test_dates_split_into_contiguous_shards(self):
+        filters = {
+            "date_filed__gte": date(2020, 1, 1),
+            "date_filed__lt": date(2020, 1, 5),
+            "court": "scotus",
+        }
+        shards = split_range_filters(filters, "date_filed", 4)
+        assert [
+            (s.get("date_filed__gte"), s.get("date_filed__lt")) for s in shards
+        ] == [
+            (date(2020, 1, 1), date(2020, 1, 2)),
+            (date(2020, 1, 2), date(2020, 1, 3)),
+            (date(2020, 1, 3), date(2020, 1, 4)),
+            (date(2020, 1, 4), date(2020, 1, 5)),
+        ]
+        assert all(s["court"] == "scotus" for s in shards)
+
+    def test_outer_bounds_keep_their_lookups(self):
+        filters = {"id__gt": 0, "id__lte": 100}
+        first, last = split_range_filters(filters, "id", 2)
+        assert first == {"id__gt": 0, "id__lte": 100, "id__lt": 50}
+        assert last == {"id__gt": 0, "id__lte": 100, "id__gte": 50}
+
+    def test_range_lookup_is_a_bound(self):
+        filters = {"id__range": (10, 20)}
+        shards = split_range_filters(filters, "id", 2)
+        assert [s.get("id__gte") for s in shards] == [None, 15]
+        assert all(s["id__range"] == (10, 20) for s in shards)
+
+    def test_datetimes_split_evenly(self):
+        filters = {
+            "date_modified__gte": datetime(2024, 1, 1),
+            "date_modified__lt": datetime(2024, 1, 2),
+        }
+        shards = split_range_filters(filters, "date_modified", 2)
+        assert shards[1]["date_modified__gte"] == datetime(2024, 1, 1, 12)
+
+    def test_narrow_range_gets_fewer_shards(self):
+        filters = {"id__gte": 1, "id__lt": 3}
+        assert len(split_range_filters(filters, "id", 10)) == 2
+
+    def test_one_shard_is_the_original_query(self):
+        filters = {"id__gte": 1, "id__lt": 3}
+        assert split_range_filters(filters, "id", 1) == [filters]
+
+    @pytest.mark.parametrize(
+        "filters", [{"id__gte": 1}, {"id__lt": 5}, {"court": "scotus"}]
+    )
+    def test_unbounded_range_is_rejected(self, filters):
+        with pytest.raises(ValueError, match="needs a lower bound"):
+            split_range_filters(filters, "id", 2)
+
+    def test_zero_shards_is_rejected(self):
+        with pytest.raises(ValueError):
+            split_range_filters({"id__gte": 1, "id__lt": 3}, "id", 0)
+
+
+def _shard_pages(path, params=None):
+    """Two pages per shard, ids tagged by the shard's lower bound."""
+    if params is None:
+        shard, page = path.rsplit("=", 1)[1].split("-")
+        return {
+            "count": 4,
+            "next": None,
+            "previous": None,
+            "results": [{"id": f"{shard}-{page}-{i}"} for i in range(2)],
+        }
+    shard = params.get("id__gte", 0)
+    return {
+        "count": 4,
+        "next": f"{NEXT_URL}{shard}-1",
+        "previous": None,
+        "results": [{"id": f"{shard}-0-{i}"} for i in range(2)],
+    }
+
+
+EXPECTED_IDS = {
+    f"{shard}-{page}-{i}"
+    for shard in (0, 25, 50, 75)
+    for page in range(2)
+    for i in range(2)
+}
+
+
+class TestAsyncListParallel:
+    @pytest.mark.asyncio
+    async def test_merges_every_shard(self):
+        cl = AsyncCourtListener(api_token="tok")
+        cl._request = AsyncMock(
+            side_effect=lambda method, path, params=None: _shard_pages(
+                path, params
+            )
+        )
+        results = cl.clusters.list_parallel(
+            shard_by="id", shards=4, id__gte=0, id__lt=100
+        )
+        ids = [item["id"] async for item in results]
+        assert len(ids) == len(EXPECTED_IDS)
+        assert set(ids) == EXPECTED_IDS
+        assert await results.get_count() == 16
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        active = 0
+        peak = 0
+
+        async def request(method, path, params=None):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return _shard_pages(path, params)
+
+        cl = AsyncCourtListener(api_token="tok")
+        cl._request = request
+        results = cl.clusters.list_parallel(
+            shard_by="id", shards=4, concurrency=2, id__gte=0, id__lt=100
+        )
+        assert len([item async for item in results]) == 16
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_shard_error_propagates(self):
+        def request(method, path, params=None):
+            if params and params.get("id__gte") == 50:
+                raise RuntimeError("boom")
+            return _shard_pages(path, params)
+
+        cl = AsyncCourtListener(api_token="tok")
+        cl._request = AsyncMock(side_effect=request)
+        results = cl.clusters.list_parallel(
+            shard_by="id", shards=4, id__gte=0, id__lt=100
+        )
+        with pytest.raises(RuntimeError, match="boom"):
+            async for _ in results:
+                pass
+
+    def test_requires_bounds(self):
+        cl = AsyncCourtListener(api_token="tok")
+        with pytest.raises(ValueError, match="date_filed__gte"):
+            cl.clusters.list_parallel(
+                shard_by="date_filed", shards=4, date_filed__gte="2020-01-01"
+            )
+
+
+class TestSyncListParallel:
+    def test_merges_every_shard(self):
+        cl = CourtListener(api_token="tok")
+        cl._request = MagicMock(
+            side_effect=lambda method, path, params=None: _shard_pages(
+                path, params
+            )
+        )
+        results = cl.clusters.list_parallel(
+            shard_by="id", shards=4, id__gte=0, id__lt=100
+        )
+        ids = [item["id"] for item in results]
+        assert len(ids) == len(EXPECTED_IDS)
+        assert set(ids) == EXPECTED_IDS
+
+    def test_shards_run_in_worker_threads(self):
+        threads = set()
+
+        def request(method, path, params=None):
+            threads.add(threading.get_ident())
+            return _shard_pages(path, params)
+
+        cl = CourtListener(api_token="tok")
+        cl._request = request
+        results = cl.clusters.list_parallel(
+            shard_by="id", shards=4, concurrency=2, id__gte=0, id__lt=100
+        )
+        assert len(list(results)) == 16
+        assert threading.get_ident() not in threads
+
+    def test_shard_error_propagates_and_stops_workers(self):
+        def request(method, path, params=None):
+            if params and params.get("id__gte") == 50:
+                raise RuntimeError("boom")
+            return _shard_pages(path, params)
+
+        cl = CourtListener(api_token="tok")
+        cl._request = MagicMock(side_effect=request)
+        results = cl.clusters.list_parallel(
+            shard_by="id", shards=4, id__gte=0, id__lt=100
+        )
+        with pytest.raises(RuntimeError, match="boom"):
+            list(results)